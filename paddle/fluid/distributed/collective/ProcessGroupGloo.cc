@@ -27,9 +27,11 @@
 #include <gloo/broadcast.h>
 #include <gloo/reduce.h>
 #include <gloo/scatter.h>
+#include <gloo/transport/unbound_buffer.h>
 
 #include "paddle/fluid/distributed/collective/Common.h"
 #include "paddle/fluid/distributed/collective/ProcessGroupGloo.h"
+#include "paddle/fluid/distributed/collective/utils.h"
 #include "paddle/fluid/framework/fleet/gloo_wrapper.h"
 #include "paddle/fluid/platform/enforce.h"
 
@@ -578,6 +580,104 @@ std::shared_ptr<ProcessGroup::Task> ProcessGroupGloo::Scatter(
   return Scatter(&out_tensors[0], in_tensors[0], opts, true);
 }
 
+// NOTE: send and recv between a pair of ranks are matched in order on one
+// slot, the tags of the collectives can not be used as they are not counted
+// in the same way on the two ranks.
+constexpr uint64_t kSendRecvSlot = 0;
+
+class SendRecvGlooTask : public ProcessGroupGloo::GlooTask {
+ public:
+  SendRecvGlooTask(int rank,
+                   const std::shared_ptr<gloo::Context>& context,
+                   const phi::DenseTensor& tensor,
+                   int peer,
+                   CommType comm_type)
+      : ProcessGroupGloo::GlooTask(rank, {tensor}, comm_type),
+        _tensor(tensor),
+        _peer(peer) {
+    _buffer = context->createUnboundBuffer(
+        _tensor.data(), _tensor.numel() * phi::SizeOf(_tensor.dtype()));
+  }
+
+  // the buffer has to be kept until the transfer is done
+  ~SendRecvGlooTask() { Wait(kWaitTimeout); }
+
+  void Run() override {
+    if (comm_type_ == CommType::SEND) {
+      _buffer->send(_peer, kSendRecvSlot);
+    } else {
+      _buffer->recv(_peer, kSendRecvSlot);
+    }
+  }
+
+  // NOTE: the timeout of the gloo context is used
+  bool Wait(std::chrono::milliseconds timeout) override {
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (!is_completed_) {
+      if (comm_type_ == CommType::SEND) {
+        _buffer->waitSend();
+      } else {
+        _buffer->waitRecv();
+      }
+      is_completed_ = true;
+    }
+    return true;
+  }
+
+  bool IsCompleted() override { return is_completed_; }
+
+ private:
+  phi::DenseTensor _tensor;
+  int _peer;
+  std::unique_ptr<gloo::transport::UnboundBuffer> _buffer;
+};
+
+std::shared_ptr<ProcessGroup::Task> ProcessGroupGloo::Send(
+    const phi::DenseTensor& tensor,
+    int dst_rank,
+    int64_t offset,
+    int64_t numel,
+    bool sync_op) {
+  // numel > 0 indicates the tensor need to be sliced
+  const phi::DenseTensor& tensor_maybe_partial =
+      numel > 0 ? GetPartialTensor(tensor, offset, numel) : tensor;
+  auto task = std::make_shared<SendRecvGlooTask>(
+      rank_, get_context(), tensor_maybe_partial, dst_rank, CommType::SEND);
+  task->Run();
+  if (sync_op) {
+    task->Wait(kWaitTimeout);
+  }
+  return task;
+}
+
+std::shared_ptr<ProcessGroup::Task> ProcessGroupGloo::Recv(
+    phi::DenseTensor* tensor,
+    int src_rank,
+    int64_t offset,
+    int64_t numel,
+    bool sync_op) {
+  // numel > 0 indicates the tensor need to be sliced
+  phi::DenseTensor tensor_maybe_partial =
+      numel > 0 ? GetPartialTensor(*tensor, offset, numel) : *tensor;
+  auto task = std::make_shared<SendRecvGlooTask>(
+      rank_, get_context(), tensor_maybe_partial, src_rank, CommType::RECV);
+  task->Run();
+  if (sync_op) {
+    task->Wait(kWaitTimeout);
+  }
+  return task;
+}
+
+std::shared_ptr<ProcessGroup::Task> ProcessGroupGloo::Send(
+    std::vector<phi::DenseTensor>& inputs, int dst_rank) {  // NOLINT
+  return Send(inputs[0], dst_rank, 0, -1, true);
+}
+
+std::shared_ptr<ProcessGroup::Task> ProcessGroupGloo::Recv(
+    std::vector<phi::DenseTensor>& outputs, int src_rank) {  // NOLINT
+  return Recv(&outputs[0], src_rank, 0, -1, true);
+}
+
 std::shared_ptr<::gloo::transport::Device>
 ProcessGroupGloo::createDeviceForInterface(const std::string& ifname) {
   ::gloo::transport::tcp::attr attr;
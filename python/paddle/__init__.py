@@ -63,7 +63,6 @@ else:
 Tensor.__qualname__ = 'Tensor'  # noqa: F401
 import paddle.distributed  # noqa: F401
 import paddle.sysconfig  # noqa: F401
-import paddle.distribution  # noqa: F401
 import paddle.nn  # noqa: F401
 import paddle.distributed.fleet  # noqa: F401
 import paddle.optimizer  # noqa: F401
@@ -75,15 +74,10 @@ import paddle.device  # noqa: F401
 
 import paddle.jit  # noqa: F401
 import paddle.amp  # noqa: F401
-import paddle.dataset  # noqa: F401
 import paddle.inference  # noqa: F401
 import paddle.io  # noqa: F401
-import paddle.onnx  # noqa: F401
 import paddle.reader  # noqa: F401
 import paddle.static  # noqa: F401
-import paddle.vision  # noqa: F401
-import paddle.audio  # noqa: F401
-import paddle.geometric  # noqa: F401
 import paddle.sparse  # noqa: F401
 
 from .tensor.attribute import is_complex  # noqa: F401
@@ -341,6 +335,8 @@ from .autograd import set_grad_enabled  # noqa: F401
 from .autograd import is_grad_enabled  # noqa: F401
 from .framework import save  # noqa: F401
 from .framework import load  # noqa: F401
+from .framework import async_save  # noqa: F401
+from .framework import clear_async_save_task_queue  # noqa: F401
 from .framework import DataParallel  # noqa: F401
 
 from .framework import set_default_dtype  # noqa: F401
@@ -367,18 +363,36 @@ from .device import is_compiled_with_cuda  # noqa: F401
 from .device import is_compiled_with_rocm  # noqa: F401
 from .device import XPUPlace  # noqa: F401
 
-# high-level api
-from .hapi import Model  # noqa: F401
-from . import callbacks  # noqa: F401
-from .hapi import summary  # noqa: F401
-from .hapi import flops  # noqa: F401
-from . import hub  # noqa: F401
 from . import linalg  # noqa: F401
 from . import fft  # noqa: F401
 from . import signal  # noqa: F401
 
-import paddle.text  # noqa: F401
-import paddle.vision  # noqa: F401
+# NOTE: the high-level api and the domain packages below are heavy and not
+# needed by most inference scripts, so they are imported on first access,
+# e.g. `paddle.vision` or `paddle.Model`, see PEP 562.
+from .utils.lazy_import import lazy_module_getattr
+
+__getattr__, __dir__ = lazy_module_getattr(
+    __name__,
+    submodules=[
+        'audio',
+        'callbacks',
+        'dataset',
+        'distribution',
+        'geometric',
+        'hapi',
+        'hub',
+        'onnx',
+        'text',
+        'vision',
+    ],
+    attributes={
+        # high-level api
+        'Model': 'hapi',
+        'summary': 'hapi',
+        'flops': 'hapi',
+    },
+)
 
 from .tensor.random import check_shape  # noqa: F401
 
@@ -523,6 +537,8 @@ __all__ = [  # noqa
     'meshgrid',
     'arange',
     'load',
+    'async_save',
+    'clear_async_save_task_queue',
     'numel',
     'median',
     'nanmedian',
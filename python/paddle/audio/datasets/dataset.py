@@ -11,8 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import os
 from typing import List
 
+import numpy as np
+
 import paddle
 
 from ..features import MFCC, LogMelSpectrogram, MelSpectrogram, Spectrogram
@@ -25,6 +29,22 @@ feat_funcs = {
     'spectrogram': Spectrogram,
 }
 
+# Feature extractors cached by (feat_type, sample_rate, feat_config), building
+# them computes the fbank/dct matrices which is much more expensive than
+# applying them. Every DataLoader worker process holds its own cache.
+_feature_extractors = {}
+
+
+def _get_feature_extractor(feat_type, sample_rate, feat_config):
+    key = (feat_type, sample_rate, repr(sorted(feat_config.items())))
+    if key not in _feature_extractors:
+        feat_func = feat_funcs[feat_type]
+        if feat_type != 'spectrogram':
+            _feature_extractors[key] = feat_func(sr=sample_rate, **feat_config)
+        else:
+            _feature_extractors[key] = feat_func(**feat_config)
+    return _feature_extractors[key]
+
 
 class AudioClassificationDataset(paddle.io.Dataset):
     """
@@ -37,6 +57,7 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: List[int],
         feat_type: str = 'raw',
         sample_rate: int = None,
+        feat_cache_dir: str = None,
         **kwargs,
     ):
         """
@@ -45,6 +66,10 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extrace of an audio file.
+            feat_cache_dir (:obj:`str`, `optional`, defaults to `None`):
+                The directory to cache the extracted features. If set, the feature of an
+                audio file is saved as a `.npy` file at the first access and memory-mapped
+                at later accesses instead of decoding the audio file again.
         """
         super().__init__()
 
@@ -61,32 +86,62 @@ class AudioClassificationDataset(paddle.io.Dataset):
         self.feat_config = (
             kwargs  # Pass keyword arguments to customize feature config
         )
+        self.feat_cache_dir = feat_cache_dir
+        if feat_cache_dir is not None:
+            os.makedirs(feat_cache_dir, exist_ok=True)
 
     def _get_data(self, input_file: str):
         raise NotImplementedError
 
-    def _convert_to_record(self, idx):
-        file, label = self.files[idx], self.labels[idx]
+    def _feat_cache_path(self, file: str):
+        stat = os.stat(file)
+        key = repr(
+            (
+                os.path.abspath(file),
+                stat.st_size,
+                stat.st_mtime_ns,
+                self.feat_type,
+                sorted(self.feat_config.items()),
+            )
+        )
+        return os.path.join(
+            self.feat_cache_dir, hashlib.md5(key.encode()).hexdigest() + '.npy'
+        )
+
+    def _extract_feat(self, file: str):
         waveform, sample_rate = paddle.audio.load(file)
         self.sample_rate = sample_rate
 
-        feat_func = feat_funcs[self.feat_type]
-
-        record = {}
         if len(waveform.shape) == 2:
             waveform = waveform.squeeze(0)  # 1D input
         waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
-            waveform = waveform.unsqueeze(0)  # (batch_size, T)
-            if self.feat_type != 'spectrogram':
-                feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
-                )
-            else:
-                feature_extractor = feat_func(**self.feat_config)
-            record['feat'] = feature_extractor(waveform).squeeze(0)
+        if feat_funcs[self.feat_type] is None:
+            return waveform
+        waveform = waveform.unsqueeze(0)  # (batch_size, T)
+        feature_extractor = _get_feature_extractor(
+            self.feat_type, self.sample_rate, self.feat_config
+        )
+        return feature_extractor(waveform).squeeze(0)
+
+    def _convert_to_record(self, idx):
+        file, label = self.files[idx], self.labels[idx]
+
+        record = {}
+        if self.feat_cache_dir is None:
+            record['feat'] = self._extract_feat(file)
         else:
-            record['feat'] = waveform
+            cache_path = self._feat_cache_path(file)
+            if os.path.exists(cache_path):
+                feat = np.load(cache_path, mmap_mode='r')
+            else:
+                feat = self._extract_feat(file).numpy()
+                # write to a temporary file and rename it, so that other
+                # workers never read a partially written cache file
+                tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, feat)
+                os.replace(tmp_path, cache_path)
+            record['feat'] = paddle.to_tensor(np.asarray(feat))
         record['label'] = label
         return record
 
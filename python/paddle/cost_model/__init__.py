@@ -13,5 +13,6 @@
 # limitations under the License.
 
 from .cost_model import CostModel  # noqa: F401
+from .op_cost_db import OpCostDB  # noqa: F401
 
-__all__ = ['CostModel']
+__all__ = ['CostModel', 'OpCostDB']
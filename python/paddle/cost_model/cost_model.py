@@ -21,6 +21,8 @@ import paddle
 import paddle.static as static
 from paddle.fluid import core
 
+from .op_cost_db import OpCostDB
+
 
 class CostModel:
     def __init__(self):
@@ -71,9 +73,20 @@ class CostModel:
         with open(static_cost_data_path, 'r') as load_f:
             load_dict = json.load(load_f)
         self._static_cost_data = load_dict
+        self._build_static_cost_index()
         # return all static cost data
         return load_dict
 
+    def _build_static_cost_index(self):
+        # NOTE: group the records by op and memorize the lookups, so that a
+        # lookup does not scan all the records.
+        self._static_op_records = {}
+        self._static_op_index = {}
+        for op_data in self._static_cost_data:
+            self._static_op_records.setdefault(op_data["op"], []).append(
+                op_data
+            )
+
     def get_static_op_time(self, op_name, forward=True, dtype="float32"):
         # if forward is True, return op forward time, otherwise return op backward time.
         if op_name is None:
@@ -81,13 +94,28 @@ class CostModel:
                 'op_name should not be empty when you want to get static op time'
             )
 
+        key = (op_name, dtype)
+        if key not in self._static_op_index:
+            # the last record whose config contains dtype is used
+            op_data = None
+            for record in self._static_op_records.get(op_name, []):
+                if dtype in record["config"]:
+                    op_data = record
+            self._static_op_index[key] = op_data
+        op_data = self._static_op_index[key]
+
         op_cost = {}
-        for op_data in self._static_cost_data:
-            if (op_data["op"] == op_name) and (dtype in op_data["config"]):
-                if forward:
-                    op_cost["op_time"] = op_data["paddle_gpu_time"]
-                else:
-                    op_cost["op_time"] = op_data["paddle_gpu_time_backward"]
-                op_cost["config"] = op_data["config"]
+        if op_data is not None:
+            if forward:
+                op_cost["op_time"] = op_data["paddle_gpu_time"]
+            else:
+                op_cost["op_time"] = op_data["paddle_gpu_time_backward"]
+            op_cost["config"] = op_data["config"]
 
         return op_cost
+
+    def static_op_cost_db(self):
+        r"""
+        Return the static op benchmark data as an indexed OpCostDB.
+        """
+        return OpCostDB.from_static_benchmark(self._static_cost_data)
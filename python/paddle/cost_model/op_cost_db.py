@@ -0,0 +1,291 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import re
+import time
+
+import numpy as np
+
+import paddle
+from paddle.fluid.data_feeder import convert_dtype
+from paddle.fluid.layers.utils import flatten
+
+__all__ = []
+
+_VARIABLE_PATTERN = re.compile(r'dtype: (\w+), shape: \[([^\]]*)\]')
+
+
+def _normalize_inputs(inputs):
+    dtypes = []
+    shapes = []
+    for dtype, shape in inputs:
+        if not isinstance(dtype, str):
+            dtype = convert_dtype(dtype)
+        dtypes.append(dtype)
+        shapes.append(tuple(int(dim) for dim in shape))
+    return tuple(dtypes), tuple(shapes)
+
+
+def _parse_benchmark_config(config):
+    r'''
+    Parse the inputs of a static_op_benchmark.json config, e.g.
+    "x (Variable) - dtype: float32, shape: [16, 128]\naxis (int): 1\n".
+    '''
+    inputs = []
+    for line in config.split('\n'):
+        if 'Variable' not in line:
+            continue
+        for dtype, shape in _VARIABLE_PATTERN.findall(line):
+            shape = [int(dim) for dim in shape.split(',') if dim.strip()]
+            inputs.append((dtype, shape))
+    return inputs
+
+
+def _to_time(value):
+    # NOTE: times of the ops failed to benchmark are recorded as '--'
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def benchmark_op(api, inputs, repeat=20, warmup=5, backward=False):
+    r'''
+    Measure the time (in ms) of ``api`` on CPU, called with random tensors
+    of ``inputs``, a list of (dtype, shape). Return the median forward time
+    and the median backward time (None if ``backward`` is False).
+    '''
+    prev_device = paddle.get_device()
+    paddle.set_device('cpu')
+    try:
+        tensors = []
+        for dtype, shape in inputs:
+            dtype = convert_dtype(dtype)
+            if 'int' in dtype:
+                value = np.random.randint(0, 8, size=shape).astype(dtype)
+            else:
+                value = np.random.random(shape).astype(dtype)
+            tensor = paddle.to_tensor(value)
+            tensor.stop_gradient = not (backward and 'float' in dtype)
+            tensors.append(tensor)
+
+        forward_times = []
+        backward_times = []
+        for i in range(warmup + repeat):
+            start = time.perf_counter()
+            out = api(*tensors)
+            forward_time = time.perf_counter() - start
+            if backward:
+                loss = paddle.add_n([paddle.sum(x) for x in flatten(out)])
+                start = time.perf_counter()
+                loss.backward()
+                backward_time = time.perf_counter() - start
+                for tensor in tensors:
+                    tensor.clear_gradient()
+            if i >= warmup:
+                forward_times.append(forward_time * 1000)
+                if backward:
+                    backward_times.append(backward_time * 1000)
+    finally:
+        paddle.set_device(prev_device)
+    return (
+        float(np.median(forward_times)),
+        float(np.median(backward_times)) if backward else None,
+    )
+
+
+class OpCostDB:
+    r'''
+    Database of measured op times (in ms), which are indexed by the op type,
+    the dtypes and the shapes of the op's inputs.
+
+    An exact (op, dtypes, shapes) key is answered by a hash lookup. Other
+    shapes of the same op, dtypes and ranks are interpolated linearly by the
+    number of the input elements, and scaled proportionally out of the
+    measured range.
+
+    Examples:
+        .. code-block:: python
+
+            from paddle.cost_model import OpCostDB
+
+            db = OpCostDB()
+            db.add('abs', [('float32', [16, 128])], 0.01, 0.02)
+            db.add('abs', [('float32', [16, 512])], 0.03, 0.06)
+            print(db.query('abs', [('float32', [16, 256])]))  # 0.01666...
+    '''
+
+    def __init__(self):
+        self._records = {}
+        self._curves = None
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        op, inputs = key
+        return (op,) + _normalize_inputs(inputs) in self._records
+
+    def add(self, op, inputs, forward_time, backward_time=None):
+        r'''
+        Add (or replace) the measured times of ``op`` with ``inputs``, a list
+        of (dtype, shape).
+        '''
+        key = (op,) + _normalize_inputs(inputs)
+        self._records[key] = (forward_time, backward_time)
+        self._curves = None
+
+    def _build_curves(self):
+        grouped = {}
+        for (op, dtypes, shapes), times in self._records.items():
+            if any(dim < 0 for shape in shapes for dim in shape):
+                continue
+            curve_key = (op, dtypes, tuple(len(shape) for shape in shapes))
+            numel = sum(int(np.prod(shape)) for shape in shapes)
+            grouped.setdefault(curve_key, []).append((numel,) + times)
+        self._curves = {}
+        for curve_key, points in grouped.items():
+            points.sort(key=lambda point: point[0])
+            numels = np.array([point[0] for point in points], dtype='float64')
+            curve = [numels]
+            for i in [1, 2]:
+                measured = [p for p in points if p[i] is not None]
+                curve.append(
+                    (
+                        np.array([p[0] for p in measured], dtype='float64'),
+                        np.array([p[i] for p in measured], dtype='float64'),
+                    )
+                    if measured
+                    else None
+                )
+            self._curves[curve_key] = curve
+
+    def query(self, op, inputs, forward=True):
+        r'''
+        Return the forward (or backward) time of ``op`` with ``inputs``, or
+        None if there is no record to estimate it.
+        '''
+        dtypes, shapes = _normalize_inputs(inputs)
+        times = self._records.get((op, dtypes, shapes))
+        if times is not None and times[0 if forward else 1] is not None:
+            return times[0 if forward else 1]
+
+        if any(dim < 0 for shape in shapes for dim in shape):
+            return None
+        if self._curves is None:
+            self._build_curves()
+        curve = self._curves.get(
+            (op, dtypes, tuple(len(shape) for shape in shapes))
+        )
+        if curve is None or curve[1 if forward else 2] is None:
+            return None
+        numels, times = curve[1 if forward else 2]
+        numel = sum(int(np.prod(shape)) for shape in shapes)
+        if numels[0] <= numel <= numels[-1]:
+            return float(np.interp(numel, numels, times))
+        # NOTE: out of the measured range, time is proportional to the size
+        end = 0 if numel < numels[0] else -1
+        if numels[end] == 0:
+            return float(times[end])
+        return float(times[end] * numel / numels[end])
+
+    def query_desc(self, desc):
+        r'''
+        Query the time of an op description of auto parallel, i.e.
+        {"op": op_type, "inputs": {name: [(dtype, shape), ...]}, ...}. The
+        time of a grad op is the backward time of its forward op.
+        '''
+        op = desc["op"]
+        inputs = [var for item in desc["inputs"].values() for var in item]
+        time = self.query(op, inputs)
+        if time is None and op.endswith("_grad"):
+            # NOTE: the inputs of grad op are different from its forward op,
+            # only the ones with the same ranks are used.
+            time = self.query(op[: -len("_grad")], inputs, forward=False)
+        return time
+
+    def measure(self, op, api, inputs, repeat=20, warmup=5, backward=False):
+        r'''
+        Measure ``api`` on CPU with random ``inputs``, a list of (dtype,
+        shape), and add the times as the record of ``op``.
+        '''
+        forward_time, backward_time = benchmark_op(
+            api, inputs, repeat=repeat, warmup=warmup, backward=backward
+        )
+        self.add(op, inputs, forward_time, backward_time)
+        return forward_time, backward_time
+
+    def save(self, path):
+        records = [
+            {
+                "op": op,
+                "inputs": [
+                    [dtype, list(shape)] for dtype, shape in zip(dtypes, shapes)
+                ],
+                "forward_time": forward_time,
+                "backward_time": backward_time,
+            }
+            for (op, dtypes, shapes), (
+                forward_time,
+                backward_time,
+            ) in self._records.items()
+        ]
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": 1, "records": records}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        db = cls()
+        for record in data["records"]:
+            db.add(
+                record["op"],
+                record["inputs"],
+                record["forward_time"],
+                record["backward_time"],
+            )
+        return db
+
+    @classmethod
+    def from_static_benchmark(cls, records=None):
+        r'''
+        Build the database from the records of static_op_benchmark.json,
+        which is loaded if ``records`` is None.
+        '''
+        if records is None:
+            path = os.path.join(
+                os.path.dirname(__file__), "static_op_benchmark.json"
+            )
+            with open(path, 'r') as f:
+                records = json.load(f)
+        db = cls()
+        for record in records:
+            forward_time = _to_time(record.get("paddle_gpu_time"))
+            if forward_time is None:
+                continue
+            db.add(
+                record["op"],
+                _parse_benchmark_config(record["config"]),
+                forward_time,
+                _to_time(record.get("paddle_gpu_time_backward")),
+            )
+        return db
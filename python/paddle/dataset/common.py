@@ -18,12 +18,8 @@ import hashlib
 import importlib
 import os
 import pickle
-import shutil
-import sys
 import tempfile
 
-import requests
-
 import paddle
 import paddle.dataset
 
@@ -79,56 +75,11 @@ def download(url, module_name, md5sum, save_name=None):
         dirname, url.split('/')[-1] if save_name is None else save_name
     )
 
-    if os.path.exists(filename) and md5file(filename) == md5sum:
-        return filename
-
-    retry = 0
-    retry_limit = 3
-    while not (os.path.exists(filename) and md5file(filename) == md5sum):
-        if os.path.exists(filename):
-            sys.stderr.write("file %s  md5 %s\n" % (md5file(filename), md5sum))
-        if retry < retry_limit:
-            retry += 1
-        else:
-            raise RuntimeError(
-                "Cannot download {0} within retry limit {1}".format(
-                    url, retry_limit
-                )
-            )
-        sys.stderr.write(
-            "Cache file %s not found, downloading %s \n" % (filename, url)
-        )
-        sys.stderr.write("Begin to download\n")
-        try:
-            r = requests.get(url, stream=True)
-            total_length = r.headers.get('content-length')
-
-            if total_length is None:
-                with open(filename, 'wb') as f:
-                    shutil.copyfileobj(r.raw, f)
-            else:
-                with open(filename, 'wb') as f:
-                    chunk_size = 4096
-                    total_length = int(total_length)
-                    total_iter = total_length / chunk_size + 1
-                    log_interval = total_iter // 20 if total_iter > 20 else 1
-                    log_index = 0
-                    bar = paddle.hapi.progressbar.ProgressBar(
-                        total_iter, name='item'
-                    )
-                    for data in r.iter_content(chunk_size=chunk_size):
-                        f.write(data)
-                        log_index += 1
-                        bar.update(log_index, {})
-                        if log_index % log_interval == 0:
-                            bar.update(log_index)
-
-        except Exception as e:
-            # re-try
-            continue
-    sys.stderr.write("\nDownload finished\n")
-    sys.stdout.flush()
-    return filename
+    # NOTE: the download is resumable, verified while downloading, and
+    # shared by the processes of a machine, see paddle.utils.download
+    from paddle.utils.download import _download_file
+
+    return _download_file(url, filename, md5sum)
 
 
 def fetch_all():
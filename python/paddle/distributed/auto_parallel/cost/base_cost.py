@@ -32,6 +32,21 @@ COMM_OP_TYPE = [
 ]
 NON_COMP_TYPE = ["while"] + COMM_OP_TYPE
 _g_op_cost_factory = {}
+_g_op_cost_db = None
+
+
+def set_op_cost_db(op_cost_db):
+    """
+    Set the measured op cost database (paddle.cost_model.OpCostDB), which
+    gives the time of the computation ops whose calc_time is not modeled
+    yet. None means no database.
+    """
+    global _g_op_cost_db
+    _g_op_cost_db = op_cost_db
+
+
+def get_op_cost_db():
+    return _g_op_cost_db
 
 
 def build_comp_desc_from_op(op):
@@ -862,6 +877,20 @@ class CompOpCost(OpCost):
         self._cost = self.calc_cost()
         self.cluster = cluster
 
+    def calc_cost(self):
+        cost = super().calc_cost()
+        # NOTE: most calc_time are placeholders returning 0, the time is
+        # looked up in the measured op cost database if it is set.
+        if cost.time == 0 and _g_op_cost_db is not None:
+            desc = self.op_desc
+            if desc is None and self.op is not None:
+                desc = build_comp_desc_from_op(self.op)
+            if desc is not None:
+                time = _g_op_cost_db.query_desc(desc)
+                if time is not None:
+                    cost.time = time
+        return cost
+
     @classmethod
     def _check_comp_op_type(cls):
         if cls.OP_TYPE != "COMP":
@@ -37,7 +37,6 @@ from paddle.metric import Metric
 from paddle.static import InputSpec
 
 from ..utils.log_utils import get_logger
-from .callbacks import config_callbacks
 from .cluster import Cluster, get_default_cluster
 from .converter import Converter
 from .cost.estimate_cost import get_cost_from_engine
@@ -56,6 +55,14 @@ from .process_group import get_all_process_groups, new_process_group
 from .strategy import Strategy
 
 
+def _config_callbacks(*args, **kwargs):
+    # NOTE: the callbacks are built on paddle.hapi, which `import paddle`
+    # only loads on first access, so import them when they are needed.
+    from .callbacks import config_callbacks
+
+    return config_callbacks(*args, **kwargs)
+
+
 class Engine:
     """
     An Engine object can provide the full power of auto parallel to users.
@@ -905,7 +912,7 @@ class Engine:
 
         fetch_names, fetch_indices = self._prepare_fetch(None, mode=self._mode)
 
-        cbks = config_callbacks(
+        cbks = _config_callbacks(
             callbacks,
             engine=self,
             batch_size=batch_size,
@@ -1047,7 +1054,7 @@ class Engine:
 
         fetch_names, fetch_indices = self._prepare_fetch(None, mode=self._mode)
 
-        cbks = config_callbacks(
+        cbks = _config_callbacks(
             callbacks,
             engine=self,
             batch_size=batch_size,
@@ -1154,7 +1161,7 @@ class Engine:
         fetch_names, fetch_indices = self._prepare_fetch(None, mode=self._mode)
 
         outputs = []
-        cbks = config_callbacks(callbacks, engine=self, verbose=verbose)
+        cbks = _config_callbacks(callbacks, engine=self, verbose=verbose)
         test_steps = test_dataloader._steps
         cbks.on_begin('predict', {'steps': test_steps})
         logs = {}
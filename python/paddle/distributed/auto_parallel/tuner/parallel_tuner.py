@@ -16,6 +16,7 @@ import copy
 import hashlib
 import itertools
 import math
+import multiprocessing
 import time
 from collections import defaultdict
 
@@ -28,10 +29,21 @@ from ..dist_op import DistributedOperator
 from ..operators.common import find_compatible_distributed_operator_impls
 from ..parallelizer_v2 import Parallelizer
 from ..process_mesh import ProcessMesh
+from .search_algorithms import new_search_algorithm
 from .trial import Trial, TrialStatus
 from .tunable_space import TunableSpace
 from .tunable_variable import Boolean, IntRange
 
+# The tuner whose trials are evaluated by the forked workers
+_g_parallel_tuner = None
+
+
+def _evaluate_point_in_worker(point, budget):
+    tuner = _g_parallel_tuner
+    _, _, cost = tuner._evaluate_point(point, budget)
+    tuner._restore_dist_context()
+    return cost
+
 
 class ParallelTuner:
     def __init__(
@@ -43,6 +55,9 @@ class ParallelTuner:
         seed=None,
         logger=None,
         loop_count=10,
+        algorithm="random",
+        algorithm_configs=None,
+        num_workers=1,
     ):
         self._loop_count = loop_count
         self._estimator = None
@@ -72,13 +87,21 @@ class ParallelTuner:
             self._num_devices_per_machine,
             flush=True,
         )
-        self._seed_state = self._seed
         self._logger = logger
-        self._max_collisions = 3
-        self._tried_values = set()
         self._num_trials = 0
         self._rng = np.random.default_rng(self._seed)
 
+        # The search algorithm proposes the trials, see search_algorithms.py,
+        # and the trials are evaluated by num_workers forked processes.
+        self._algorithm = algorithm
+        self._algorithm_configs = algorithm_configs or {}
+        self._num_workers = num_workers
+        self._searcher = None
+        # The estimated time of the evaluated values and loop counts
+        self._cached_costs = {}
+        # The op to process mesh mapping of the evaluated partitions
+        self._cached_pipeline_partitions = {}
+
         # Search the op types in the include_op_types,
         # and will search all op types if it is empty.
         # Exclude the op types in the exclude_op_types
@@ -551,47 +574,15 @@ class ParallelTuner:
         s = "".join(str(k) + "=" + str(values[k]) for k in keys)
         return hashlib.sha256(s.encode("utf-8")).hexdigest()[:32]
 
-    def _random_values(self):
-        space = TunableSpace()
-        collisions = 0
-        while True:
-            for v in self._space.variables.values():
-                space._register(v)
-                space.values[v.name] = v.random(self._seed_state)
-                self._seed_state += 1
-            values = space.values
-            values_hash = self._compute_values_hash(values)
-            if values_hash in self._tried_values:
-                collisions += 1
-                if collisions > self._max_collisions:
-                    return None
-                continue
-            self._tried_values.add(values_hash)
-            break
-        return values
-
-    def _populate_space(self):
-        values = self._random_values()
-        if values is None:
-            return {"status": TrialStatus.STOPPED, "values": None}
-        return {"status": TrialStatus.RUNNING, "values": values}
-
-    def _create_trial(self):
+    def _create_trial(self, values):
         trial_id = "{{:0{}d}}".format(len(str(self._max_trials)))
         trial_id = trial_id.format(self._num_trials)
-
-        if self._max_trials and self._num_trials >= self._max_trials:
-            status = TrialStatus.STOPPED
-            values = None
-        else:
-            results = self._populate_space()
-            status = results["status"]
-            values = results["values"]
-
         space = TunableSpace()
         space.variables = self._space.variables
         space.values = values
-        trial = Trial(tunable_space=space, trial_id=trial_id, status=status)
+        trial = Trial(
+            tunable_space=space, trial_id=trial_id, status=TrialStatus.RUNNING
+        )
         self._num_trials += 1
         return trial
 
@@ -821,13 +812,27 @@ class ParallelTuner:
 
         inter_node_partition = trial.space.values["inter_node_partitions"]
         intra_node_partition = trial.space.values["intra_node_partitions"]
-        process_mesh_list = self._generate_process_mesh_list(
-            inter_node_partition, intra_node_partition
+        partitions_hash = self._compute_values_hash(
+            {
+                "inter_node_partitions": inter_node_partition,
+                "intra_node_partitions": intra_node_partition,
+            }
         )
+        if partitions_hash not in self._cached_pipeline_partitions:
+            process_mesh_list = self._generate_process_mesh_list(
+                inter_node_partition, intra_node_partition
+            )
+            # NOTE: the pipeline starts only depend on the process meshes,
+            # so the partition is shared by the trials of the same meshes.
+            self._cached_pipeline_partitions[partitions_hash] = (
+                process_mesh_list,
+                self._apply_pipeline_partition(process_mesh_list),
+            )
+        (
+            process_mesh_list,
+            op_id_to_process_mesh,
+        ) = self._cached_pipeline_partitions[partitions_hash]
         print("\tprocess_mesh list", process_mesh_list, flush=True)
-        op_id_to_process_mesh = self._apply_pipeline_partition(
-            process_mesh_list
-        )
         if op_id_to_process_mesh is None:
             print("Operators are less than pipeline stages", flush=True)
             return results
@@ -963,6 +968,32 @@ class ParallelTuner:
             global_cost = self._estimator.estimate(self._dist_context)
             return global_cost.time
 
+    def _evaluate_point(self, point, budget):
+        # The evaluated parallel strategy is left in the distributed context,
+        # which must be restored by the caller.
+        trial = self._create_trial(self._searcher.values(point))
+        # We need to backup the distributed context, because the evaluation of one trail will
+        # generate the backward and update parts which may change the context.
+        # However, the distributed information of the context aren't backup since a new one is used.
+        self._dist_context._backup(serial=True, dist=False)
+        # NOTE: the budget of a trial scales the loop count of the estimator
+        loop_count = self._loop_count
+        self._loop_count = max(1, int(round(loop_count * budget)))
+        try:
+            results = self._eval_trial(trial)
+        finally:
+            self._loop_count = loop_count
+        cost = math.inf if results is None else results["estimate_time"]
+        return trial, results, cost
+
+    def _restore_dist_context(self):
+        self._dist_context._restore(
+            serial=True,
+            serial_mode="to_backup",
+            dist=True,
+            dist_mode="to_default",
+        )
+
     def _store_init_parallel_strategy(self):
         # If there is no annotation information, use the dp as the initial parallel strategy.
         # TODO: we should need a better way to set up the initial parallel strategy.
@@ -1062,67 +1093,125 @@ class ParallelTuner:
             end_time - start_time,
             flush=True,
         )
-        create_trial_time = 0.0
-        eval_trial_time = 0.0
         self._sample_time = 0.0
         self._complete_time = 0.0
         self._estimate_time = 0.0
-        while True:
-            start_time = time.time()
-            trial = self._create_trial()
-            if self._num_trials == 0:
-                num_prev_trials = 0
-            else:
-                num_prev_trials = self._num_trials - 1
-            end_time = time.time()
-            cur_create_trial_time = end_time - start_time
-            create_trial_time = (
-                num_prev_trials * create_trial_time + cur_create_trial_time
-            ) / self._num_trials
-            print(
-                "create_trial time",
-                num_prev_trials,
-                self._num_trials,
-                create_trial_time,
-                cur_create_trial_time,
-                flush=True,
-            )
-            if trial.status == TrialStatus.STOPPED:
-                break
-            # We need to backup the distributed context, because the evaluation of one trail will
-            # generate the backward and update parts which may change the context.
-            # However, the distributed information of the context aren't backup since a new one is used.
-            self._dist_context._backup(serial=True, dist=False)
-
-            start_time = time.time()
-            results = self._eval_trial(trial)
-            end_time = time.time()
-            cur_eval_trial_time = end_time - start_time
-            eval_trial_time = (
-                num_prev_trials * eval_trial_time + cur_eval_trial_time
-            ) / self._num_trials
-            print(
-                "eval_trial time",
-                num_prev_trials,
-                self._num_trials,
-                eval_trial_time,
-                cur_eval_trial_time,
-                "\n",
-                flush=True,
-            )
-
-            cur_time = results["estimate_time"]
-            if cur_time < best_time:
-                self._update_trail(trial, results)
-                self._store_best_parallel_strategy()
-                best_time = cur_time
-            # We need to restore the distributed context and reset the distributed information to the default.
-            self._dist_context._restore(
-                serial=True,
-                serial_mode="to_backup",
-                dist=True,
-                dist_mode="to_default",
-            )
+        self._searcher = new_search_algorithm(
+            self._algorithm,
+            self._space,
+            seed=self._seed,
+            **self._algorithm_configs
+        )
+        pool = None
+        if (
+            self._num_workers > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            # NOTE: the workers are forked with the tuner and the reset
+            # distributed context, and only the candidate indexes of a point
+            # and the estimated time are sent between processes.
+            global _g_parallel_tuner
+            _g_parallel_tuner = self
+            pool = multiprocessing.get_context("fork").Pool(self._num_workers)
+        batch_size = self._num_workers if pool is not None else 1
+        num_asked = 0
+        # NOTE: max_trials is counted in the trials of full budget, e.g. a
+        # trial of budget 1/3 counts as 1/3 trial, so that a low budget
+        # trial of successive halving does not count as a full one.
+        used_trials = 0.0
+        try:
+            while not self._max_trials or used_trials < self._max_trials - 1e-6:
+                num = batch_size
+                if self._max_trials:
+                    num = min(
+                        num,
+                        int(math.ceil(self._max_trials - used_trials - 1e-6)),
+                    )
+                start_time = time.time()
+                asked = self._searcher.ask(num)
+                print(
+                    "ask time",
+                    num_asked,
+                    len(asked),
+                    time.time() - start_time,
+                    flush=True,
+                )
+                if not asked:
+                    break
+                num_asked += len(asked)
+                used_trials += sum(budget for _, budget in asked)
+
+                keys = [
+                    (
+                        self._compute_values_hash(self._searcher.values(point)),
+                        budget,
+                    )
+                    for point, budget in asked
+                ]
+                todo = [
+                    i
+                    for i, key in enumerate(keys)
+                    if key not in self._cached_costs
+                ]
+                start_time = time.time()
+                if pool is None:
+                    for i in todo:
+                        point, budget = asked[i]
+                        trial, results, cost = self._evaluate_point(
+                            point, budget
+                        )
+                        if budget >= 1.0 and cost < best_time:
+                            self._update_trail(trial, results)
+                            self._store_best_parallel_strategy()
+                            best_time = cost
+                        # We need to restore the distributed context and reset the distributed information to the default.
+                        self._restore_dist_context()
+                        self._cached_costs[keys[i]] = cost
+                else:
+                    costs = pool.starmap(
+                        _evaluate_point_in_worker, [asked[i] for i in todo]
+                    )
+                    for i, cost in zip(todo, costs):
+                        self._cached_costs[keys[i]] = cost
+                    best = min(
+                        (i for i in todo if asked[i][1] >= 1.0),
+                        key=lambda i: self._cached_costs[keys[i]],
+                        default=None,
+                    )
+                    if (
+                        best is not None
+                        and self._cached_costs[keys[best]] < best_time
+                    ):
+                        # Only the best of the batch is evaluated again here
+                        # to keep its parallel strategy.
+                        trial, results, cost = self._evaluate_point(
+                            *asked[best]
+                        )
+                        self._update_trail(trial, results)
+                        self._store_best_parallel_strategy()
+                        best_time = cost
+                        self._restore_dist_context()
+                print(
+                    "eval_trial time",
+                    num_asked,
+                    len(todo),
+                    time.time() - start_time,
+                    "best_time",
+                    best_time,
+                    "\n",
+                    flush=True,
+                )
+                self._searcher.tell(
+                    [
+                        (point, budget, self._cached_costs[key])
+                        for (point, budget), key in zip(asked, keys)
+                    ]
+                )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+                _g_parallel_tuner = None
         # Select the best parallel strategy
         self._dist_context._dist_tensors_for_program = (
             self._best_parallel_strategy[0]
@@ -0,0 +1,306 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+
+import numpy as np
+
+from .tunable_variable import Boolean, Choice, Fixed, FloatRange, IntRange
+
+
+def _candidates(tv):
+    if isinstance(tv, Choice):
+        return list(tv.values)
+    if isinstance(tv, Boolean):
+        return [True, False]
+    if isinstance(tv, Fixed):
+        return [tv.default]
+    if isinstance(tv, (IntRange, FloatRange)) and tv.step is not None:
+        stop = tv.stop + 1e-7 if tv.endpoint else tv.stop
+        values = np.arange(tv.start, stop, step=tv.step).tolist()
+        return [int(v) for v in values] if isinstance(tv, IntRange) else values
+    raise TypeError(
+        "The tunable variable {} can not be searched, as it has no finite "
+        "candidates.".format(tv)
+    )
+
+
+class SearchAlgorithmBase(ABC):
+    """
+    A search algorithm proposes the points of a tunable space to evaluate,
+    and learns from their costs, the lower the better.
+
+    A point is a tuple of the indexes of the candidate values of the tunable
+    variables, and is proposed with a budget in (0, 1], the fraction of the
+    full fidelity to evaluate it with. The points proposed by one ``ask``
+    must all be ``tell`` before the next ``ask``.
+    """
+
+    _REGISTERED_ALGORITHMS = {}
+
+    name = None
+
+    @staticmethod
+    def _register(algo_name, algo_class):
+        assert issubclass(algo_class, SearchAlgorithmBase)
+        SearchAlgorithmBase._REGISTERED_ALGORITHMS[algo_name] = algo_class
+
+    def __init__(self, space, seed=None, max_collisions=3):
+        self._names = list(space.variables.keys())
+        self._candidates = [
+            _candidates(space.variables[name]) for name in self._names
+        ]
+        self._sizes = [len(values) for values in self._candidates]
+        self._rng = np.random.default_rng(seed)
+        self._max_collisions = max_collisions
+        self._seen = set()
+        # (point, budget, cost) of the evaluated points
+        self._history = []
+
+    @property
+    def history(self):
+        return self._history[:]
+
+    def values(self, point):
+        """Return the values of the tunable variables at ``point``."""
+        return {
+            name: values[idx]
+            for name, values, idx in zip(self._names, self._candidates, point)
+        }
+
+    def _random_point(self):
+        return tuple(int(self._rng.integers(size)) for size in self._sizes)
+
+    def _new_points(self, propose, num):
+        # Propose at most num points which are not proposed before, and stop
+        # after max_collisions proposed points in a row are duplicated.
+        points = []
+        collisions = 0
+        while len(points) < num and collisions <= self._max_collisions:
+            point = propose()
+            if point in self._seen:
+                collisions += 1
+                continue
+            collisions = 0
+            self._seen.add(point)
+            points.append(point)
+        return points
+
+    @abstractmethod
+    def ask(self, num):
+        """Return at most num (point, budget) to evaluate, and an empty list
+        if the search is finished."""
+        pass
+
+    def tell(self, results):
+        """Update the algorithm with the (point, budget, cost) evaluated."""
+        self._history.extend(results)
+
+
+def register_search_algor(name):
+    def impl(cls):
+        SearchAlgorithmBase._register(name, cls)
+        cls.name = name
+        return cls
+
+    return impl
+
+
+def new_search_algorithm(name, space, seed=None, **kwargs):
+    algor_class = SearchAlgorithmBase._REGISTERED_ALGORITHMS.get(name)
+    assert algor_class is not None, "Algorithm {} is not defined.".format(name)
+    return algor_class(space, seed=seed, **kwargs)
+
+
+@register_search_algor("random")
+class RandomSearch(SearchAlgorithmBase):
+    def ask(self, num):
+        return [(p, 1.0) for p in self._new_points(self._random_point, num)]
+
+
+@register_search_algor("evolutionary")
+class EvolutionarySearch(SearchAlgorithmBase):
+    """
+    Regularized evolution: a child is a mutation of the best of
+    ``tournament_size`` points sampled from the latest ``population_size``
+    points evaluated, the initial population is sampled randomly.
+    """
+
+    def __init__(
+        self, space, seed=None, population_size=16, tournament_size=4, **kwargs
+    ):
+        super().__init__(space, seed=seed, **kwargs)
+        self._population = deque(maxlen=population_size)
+        self._tournament_size = tournament_size
+
+    def _mutate(self):
+        samples = self._rng.choice(
+            len(self._population),
+            size=min(self._tournament_size, len(self._population)),
+            replace=False,
+        )
+        parent = min(
+            (self._population[i] for i in samples), key=lambda p: p[1]
+        )[0]
+        child = list(parent)
+        mutable = [i for i, size in enumerate(self._sizes) if size > 1]
+        if not mutable:
+            return parent
+        # mutate each variable with the probability 1 / len(mutable), and at
+        # least one of them
+        mutated = [
+            i for i in mutable if self._rng.random() < 1.0 / len(mutable)
+        ] or [mutable[int(self._rng.integers(len(mutable)))]]
+        for i in mutated:
+            offset = int(self._rng.integers(1, self._sizes[i]))
+            child[i] = (child[i] + offset) % self._sizes[i]
+        return tuple(child)
+
+    def ask(self, num):
+        if len(self._population) < self._population.maxlen:
+            return [(p, 1.0) for p in self._new_points(self._random_point, num)]
+        return [(p, 1.0) for p in self._new_points(self._mutate, num)]
+
+    def tell(self, results):
+        super().tell(results)
+        for point, _, cost in results:
+            self._population.append((point, cost))
+
+
+@register_search_algor("tpe")
+class TPESearch(SearchAlgorithmBase):
+    """
+    Tree-structured Parzen Estimator: the evaluated points are split into
+    the best ``gamma`` of them and the others, a categorical distribution
+    of each variable is fitted to either part, and the point maximizing the
+    ratio of their likelihoods among ``num_candidates`` points sampled from
+    the best part is proposed.
+    """
+
+    def __init__(
+        self,
+        space,
+        seed=None,
+        num_startup_trials=10,
+        gamma=0.25,
+        num_candidates=24,
+        prior_weight=1.0,
+        **kwargs
+    ):
+        super().__init__(space, seed=seed, **kwargs)
+        self._num_startup_trials = num_startup_trials
+        self._gamma = gamma
+        self._num_candidates = num_candidates
+        self._prior_weight = prior_weight
+
+    def _fit(self, points):
+        dists = []
+        for i, size in enumerate(self._sizes):
+            counts = np.bincount(points[:, i], minlength=size).astype('float64')
+            counts += self._prior_weight
+            dists.append(counts / counts.sum())
+        return dists
+
+    def _propose(self, good_dists, bad_dists):
+        candidates = np.stack(
+            [
+                self._rng.choice(size, size=self._num_candidates, p=dist)
+                for size, dist in zip(self._sizes, good_dists)
+            ],
+            axis=1,
+        )
+        scores = np.zeros(self._num_candidates)
+        for i, (good, bad) in enumerate(zip(good_dists, bad_dists)):
+            scores += np.log(good[candidates[:, i]]) - np.log(
+                bad[candidates[:, i]]
+            )
+        for idx in np.argsort(-scores, kind='stable'):
+            point = tuple(int(v) for v in candidates[idx])
+            if point not in self._seen:
+                return point
+        return tuple(int(v) for v in candidates[np.argmax(scores)])
+
+    def ask(self, num):
+        if len(self._history) < self._num_startup_trials:
+            return [(p, 1.0) for p in self._new_points(self._random_point, num)]
+        points = np.array([p for p, _, _ in self._history], dtype='int64')
+        costs = np.array([c for _, _, c in self._history], dtype='float64')
+        order = np.argsort(costs, kind='stable')
+        num_good = max(1, int(math.ceil(self._gamma * len(order))))
+        good_dists = self._fit(points[order[:num_good]])
+        bad_dists = self._fit(points[order[num_good:]])
+        # NOTE: the distributions are not refitted within a batch, the
+        # collision check keeps the points of the batch different.
+        return [
+            (p, 1.0)
+            for p in self._new_points(
+                lambda: self._propose(good_dists, bad_dists), num
+            )
+        ]
+
+
+@register_search_algor("successive_halving")
+class SuccessiveHalvingSearch(SearchAlgorithmBase):
+    """
+    Successive halving: ``num_configs`` random points are evaluated with the
+    budget ``min_budget``, then the best 1 / ``eta`` of them are evaluated
+    again with ``eta`` times the budget, until the full budget. The last one
+    left is evaluated with the full budget at once. Brackets are repeated
+    until no new point can be sampled.
+    """
+
+    def __init__(
+        self, space, seed=None, num_configs=27, eta=3, min_budget=None, **kwargs
+    ):
+        super().__init__(space, seed=seed, **kwargs)
+        self._num_configs = num_configs
+        self._eta = eta
+        if min_budget is None:
+            num_rungs = max(
+                1, int(math.log(max(num_configs, 1), eta) + 1e-9) + 1
+            )
+            min_budget = float(eta) ** (1 - num_rungs)
+        self._min_budget = min_budget
+        self._rung = []
+        self._rung_budget = None
+        self._rung_results = []
+
+    def ask(self, num):
+        if self._rung_budget is not None and not self._rung:
+            # promote the best of the finished rung
+            results = sorted(self._rung_results, key=lambda r: r[2])
+            if self._rung_budget < 1.0:
+                num_keep = max(1, len(results) // self._eta)
+                self._rung = [point for point, _, _ in results[:num_keep]]
+                self._rung_budget = (
+                    1.0
+                    if num_keep == 1
+                    else min(1.0, self._rung_budget * self._eta)
+                )
+            else:
+                self._rung_budget = None
+            self._rung_results = []
+        if self._rung_budget is None:
+            self._rung = self._new_points(self._random_point, self._num_configs)
+            if not self._rung:
+                return []
+            self._rung_budget = self._min_budget
+        asked, self._rung = self._rung[:num], self._rung[num:]
+        return [(point, self._rung_budget) for point in asked]
+
+    def tell(self, results):
+        super().tell(results)
+        self._rung_results.extend(results)
@@ -12,10 +12,75 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import multiprocessing
 import sys
 
+import numpy as np
+
 __all__ = []
 
+# the generator running run_columns_from_stdin, inherited by the workers
+_g_data_generator = None
+
+
+def _process_columns_in_worker(lines):
+    return _g_data_generator._process_columns(lines)
+
+
+def _format_columns(columns):
+    """
+    Format the columnar slots of a batch, a list of (name, values, lengths),
+    into lines of ``[ids_num id1 id2 ...] ...``, where ``values`` are the
+    feasigns of all the samples concatenated and ``lengths`` are the numbers
+    of feasigns of each sample.
+    """
+    tokens = []
+    sample_ids = []
+    num_samples = None
+    for name, values, lengths in columns:
+        lengths = np.asarray(lengths, dtype='int64').reshape([-1])
+        if num_samples is None:
+            num_samples = len(lengths)
+        elif len(lengths) != num_samples:
+            raise ValueError(
+                "the numbers of samples of the slots are inconsistent, "
+                "slot %s has %d samples, but require %d."
+                % (name, len(lengths), num_samples)
+            )
+        if np.any(lengths <= 0):
+            raise ValueError(
+                "the elements of each field can not be empty, you need padding it in generate_columns()."
+            )
+        if lengths.sum() != len(values):
+            raise ValueError(
+                "the lengths of slot %s sum to %d, but it has %d values."
+                % (name, lengths.sum(), len(values))
+            )
+        # put each sample's length before its values
+        value_tokens = values.astype(str)
+        length_tokens = lengths.astype(str)
+        slot_tokens = np.empty(
+            len(values) + num_samples,
+            dtype=np.promote_types(value_tokens.dtype, length_tokens.dtype),
+        )
+        heads = np.cumsum(lengths) - lengths + np.arange(num_samples)
+        is_value = np.ones(len(slot_tokens), dtype=bool)
+        is_value[heads] = False
+        slot_tokens[heads] = length_tokens
+        slot_tokens[is_value] = value_tokens
+        tokens.append(slot_tokens)
+        sample_ids.append(np.repeat(np.arange(num_samples), lengths + 1))
+    if not num_samples:
+        return ""
+    sample_ids = np.concatenate(sample_ids)
+    # gather the tokens of each sample, keeping the order of the slots
+    order = np.argsort(sample_ids, kind='stable')
+    tokens = np.concatenate(tokens)[order]
+    seps = np.full(len(tokens), " ")
+    seps[np.cumsum(np.bincount(sample_ids, minlength=num_samples)) - 1] = "\n"
+    return "".join(np.char.add(tokens, seps).tolist())
+
 
 class DataGenerator:
     """
@@ -134,6 +199,97 @@ class DataGenerator:
             for sample in batch_iter():
                 sys.stdout.write(self._gen_str(sample))
 
+    def _process_columns(self, lines):
+        output = self._gen_columns_str(self.generate_columns(lines))
+        return output, self._proto_info
+
+    def _merge_proto_info(self, proto_info):
+        if self._proto_info is None or proto_info is None:
+            self._proto_info = self._proto_info or proto_info
+            return
+        if [name for name, _ in proto_info] != [
+            name for name, _ in self._proto_info
+        ]:
+            raise ValueError(
+                "the field names of two given batches are not match: require<%s>, get<%s>."
+                % (self._proto_info, proto_info)
+            )
+        self._proto_info = [
+            (name, "float" if "float" in (t1, t2) else t1)
+            for (name, t1), (_, t2) in zip(self._proto_info, proto_info)
+        ]
+
+    def run_columns_from_stdin(self, num_workers=1):
+        '''
+        This function reads the data rows from stdin by batches of the batch
+        size, parses each batch into columnar slots with the generate_columns
+        function, and writes them to stdout in the same format as
+        run_from_stdin. The batches are parsed by ``num_workers`` processes
+        if it is larger than 1, and written in order.
+
+        Args:
+            num_workers(int): the number of the processes to parse the batches.
+                Default 1.
+
+        Example:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle.distributed.fleet.data_generator as dg
+                class MyData(dg.MultiSlotDataGenerator):
+
+                    def generate_columns(self, lines):
+                        words = [[int(x) for x in line.split()] for line in lines]
+                        lengths = [len(w) for w in words]
+                        values = np.concatenate(words)
+                        return [("words", values, lengths)]
+
+                mydata = MyData()
+                mydata.set_batch(1024)
+                mydata.run_columns_from_stdin(num_workers=4)
+        '''
+        batches = iter(
+            lambda: list(itertools.islice(sys.stdin, self.batch_size_)), []
+        )
+        if num_workers <= 1:
+            results = map(self._process_columns, batches)
+            pool = None
+        else:
+            global _g_data_generator
+            # NOTE: the generator is inherited by the forked workers rather
+            # than pickled, only the lines are sent to them
+            _g_data_generator = self
+            pool = multiprocessing.get_context('fork').Pool(num_workers)
+            results = pool.imap(_process_columns_in_worker, batches)
+        try:
+            # NOTE: the proto_info inferred by each worker is merged
+            for output, proto_info in results:
+                sys.stdout.write(output)
+                self._merge_proto_info(proto_info)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+                _g_data_generator = None
+
+    def _gen_columns_str(self, columns):
+        '''
+        Further processing the output of the generate_columns() function
+        rewritten by user, outputting data that can be directly read by the
+        datafeed, and updating proto_info information.
+
+        Args:
+            columns(list): the output of the generate_columns() function
+                rewritten by user.
+
+        Returns:
+            Return a string data that can be read directly by the datafeed.
+        '''
+        raise NotImplementedError(
+            "pls use MultiSlotDataGenerator or MultiSlotStringDataGenerator"
+        )
+
     def _gen_str(self, line):
         '''
         Further processing the output of the process() function rewritten by
@@ -192,6 +348,34 @@ class DataGenerator:
             + "[(name, [feasign, ...]), ...] or ((name, [feasign, ...]), ...)"
         )
 
+    def generate_columns(self, lines):
+        '''
+        This function needs to be overridden by the user to process a batch
+        of the original data rows into columnar slots, which is used by
+        run_columns_from_stdin.
+
+        Args:
+            lines(list): the original data rows of a batch
+
+        Returns:
+            Returns the slots of the batch in a list:
+            [(name, values, lengths), ...]
+            where values is a 1-D numpy array of the feasigns of all the rows
+            concatenated, and lengths is the numbers of the feasigns of each
+            row.
+
+            For example, for the rows "1926 08 17" and "1 2":
+            [("words", np.array([1926, 8, 17, 1, 2]), [3, 2])]
+
+        Note:
+            The slot whose values are in a floating dtype will be processed
+            into a float slot.
+        '''
+        raise NotImplementedError(
+            "Please rewrite this function to return a list: "
+            + "[(name, values, lengths), ...]"
+        )
+
     def generate_batch(self, samples):
         '''
         This function needs to be overridden by the user to process the
@@ -238,6 +422,20 @@ class DataGenerator:
 # add more generalized DataGenerator that can adapt user-defined slot
 # for example, [(name, float_list), (name, str_list), (name, int_list)]
 class MultiSlotStringDataGenerator(DataGenerator):
+    def _gen_columns_str(self, columns):
+        '''
+        Format the output of the generate_columns() function rewritten by
+        user, which is in this format:
+            >>> [(name, values, lengths), ...]
+        into the same format as _gen_str.
+        '''
+        return _format_columns(
+            [
+                (name, np.asarray(values).reshape([-1]), lengths)
+                for name, values, lengths in columns
+            ]
+        )
+
     def _gen_str(self, line):
         '''
         Further processing the output of the process() function rewritten by
@@ -283,6 +481,61 @@ class MultiSlotStringDataGenerator(DataGenerator):
 
 
 class MultiSlotDataGenerator(DataGenerator):
+    def _gen_columns_str(self, columns):
+        '''
+        Format the output of the generate_columns() function rewritten by
+        user into the same format as _gen_str, and update proto_info
+        information by the dtypes of the slots.
+
+        The input columns will be in this format:
+            >>> [(name, values, lengths), ...]
+
+        For example, if the input is like this:
+            >>> [("words", np.array([1926, 8, 17, 1, 2]), [3, 2])]
+        the output will be:
+            >>> 3 1926 8 17
+            >>> 2 1 2
+        the proto_info will be:
+            >>> [("words", "uint64")]
+
+        Args:
+            columns(list): the output of the generate_columns() function
+                rewritten by user.
+
+        Returns:
+            Return a string data that can be read directly by the MultiSlotDataFeed.
+        '''
+        if not isinstance(columns, (list, tuple)):
+            raise ValueError(
+                "the output of generate_columns() must be in list or tuple type"
+                "Example: [('words', np.array([1926, 8, 17]), [3])]"
+            )
+        columns = [
+            (name, np.asarray(values).reshape([-1]), lengths)
+            for name, values, lengths in columns
+        ]
+        proto_info = []
+        for name, values, _ in columns:
+            if not isinstance(name, str):
+                raise ValueError("name%s must be in str type" % type(name))
+            if np.issubdtype(values.dtype, np.floating):
+                proto_info.append((name, "float"))
+            elif np.issubdtype(values.dtype, np.integer):
+                proto_info.append((name, "uint64"))
+            else:
+                raise ValueError(
+                    "the dtype of values%s must be int or float" % values.dtype
+                )
+        if self._proto_info is not None and len(proto_info) != len(
+            self._proto_info
+        ):
+            raise ValueError(
+                "the complete field set of two given line are inconsistent."
+            )
+        output = _format_columns(columns)
+        self._merge_proto_info(proto_info)
+        return output
+
     def _gen_str(self, line):
         '''
         Further processing the output of the process() function rewritten by
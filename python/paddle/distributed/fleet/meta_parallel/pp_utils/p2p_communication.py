@@ -17,6 +17,9 @@ import numpy as np
 import paddle
 import paddle.fluid.core as core
 from paddle import _legacy_C_ops
+from paddle.distributed.communication.batch_isend_irecv import (
+    _with_batch_p2p_guard,
+)
 from paddle.fluid.framework import _in_legacy_dygraph, in_dygraph_mode
 
 from ...utils.log_util import logger
@@ -25,13 +28,17 @@ from .utils import number_2_dtype, paddle_2_number
 _hcg = None
 _use_cache = False
 _enable_partial_send_recv = True
+_use_batch_p2p = True
 
 
-def initialize_p2p_groups(hcg, use_cache=True, enable_partial_send_recv=True):
-    global _hcg, _use_cache, _enable_partial_send_recv
+def initialize_p2p_groups(
+    hcg, use_cache=True, enable_partial_send_recv=True, use_batch_p2p=True
+):
+    global _hcg, _use_cache, _enable_partial_send_recv, _use_batch_p2p
     _hcg = hcg
     _use_cache = use_cache
     _enable_partial_send_recv = enable_partial_send_recv
+    _use_batch_p2p = use_batch_p2p
     (
         send_next_group,
         send_prev_group,
@@ -52,6 +59,39 @@ def initialize_p2p_groups(hcg, use_cache=True, enable_partial_send_recv=True):
     logger.info(debug_str)
 
 
+def _encode_meta(tensor):
+    # [tensor_type, num, (ndim, *shape, dtype, stop_gradient) * num]
+    if isinstance(tensor, (paddle.Tensor, core.eager.Tensor)):
+        tensor_type, tensors = 0, (tensor,)
+    else:
+        tensor_type, tensors = 1, tensor
+    message = [tensor_type, len(tensors)]
+    for d in tensors:
+        assert isinstance(d, (paddle.Tensor, core.eager.Tensor))
+        message.append(len(d.shape))
+        message.extend(d.shape)
+        message.append(paddle_2_number(d.dtype))
+        message.append(int(d.stop_gradient))
+    return message
+
+
+def _decode_meta(message):
+    tensor_type, num = message[0], message[1]
+    shapes = []
+    dtypes = []
+    stop_grads = []
+    pos = 2
+    for i in range(num):
+        dims = message[pos]
+        shapes.append(list(message[pos + 1 : pos + 1 + dims]))
+        dtypes.append(message[pos + 1 + dims])
+        stop_grads.append(bool(message[pos + 2 + dims]))
+        pos += dims + 3
+    if tensor_type == 0:
+        return shapes[0], dtypes[0], stop_grads[0]
+    return tuple(shapes), tuple(dtypes), tuple(stop_grads)
+
+
 class SendRecvMeta:
     """Mainly used to help p2p communication context information"""
 
@@ -66,96 +106,50 @@ class SendRecvMeta:
         self.has_send_meta = False
         self.has_recv_meta = False
 
-    def _recv_shape_dtype(self, group):
-        # recv len(shape)
-        dims = paddle.to_tensor([0])
-        src_rank = _hcg._get_p2p_prev_rank()
-
-        paddle.distributed.recv(dims, src=src_rank, group=group)
-        dims = dims.item()
-
-        # recv shape
-        shape = paddle.to_tensor([0] * dims)
-        paddle.distributed.recv(shape, src=src_rank, group=group)
-
-        # recv dtype
-        dtype = paddle.to_tensor([0])
-        paddle.distributed.recv(dtype, src=src_rank, group=group)
-
-        # recv stop_gradient
-        stop_grad = paddle.to_tensor([0])
-        paddle.distributed.recv(stop_grad, src=src_rank, group=group)
-        return shape.numpy().tolist(), dtype.item(), stop_grad.item()
+        # NOTE: the meta of every shape signature is sent once, later ones
+        # are sent as the index of the signature, which both sides cache.
+        self._send_signatures = {}
+        self._recv_signatures = []
 
     def recv_meta(self, group):
-        tensor_type = paddle.to_tensor([0])
         src_rank = _hcg._get_p2p_prev_rank()
 
-        paddle.distributed.recv(tensor_type, src=src_rank, group=group)
-        tensor_type = tensor_type.item()
-
-        if tensor_type == 0:
-            shape, dtype, stop_grad = self._recv_shape_dtype(group)
-            self.recv_shape_message = shape
-            self.recv_dtype_message = dtype
-            self.recv_stop_gradient = bool(stop_grad)
-
-        elif tensor_type == 1:
-            num = paddle.to_tensor([0])
-            paddle.distributed.recv(num, src=src_rank, group=group)
-            num = num.item()
-            shapes = []
-            dtypes = []
-            stop_grads = []
-            for i in range(num):
-                shape, dtype, stop_grad = self._recv_shape_dtype(group)
-                shapes.append(shape)
-                dtypes.append(dtype)
-                stop_grads.append(bool(stop_grad))
-
-            self.recv_shape_message = tuple(shapes)
-            self.recv_dtype_message = tuple(dtypes)
-            self.recv_stop_gradient = tuple(stop_grads)
-
-    def _send_dims_shape_dtype(self, tensor, group):
-        # send len(shape)
-        dims = paddle.to_tensor(len(tensor.shape))
-        dst_rank = _hcg._get_p2p_next_rank()
-
-        paddle.distributed.send(dims, dst=dst_rank, group=group)
+        # the index of a cached signature, or minus the length of a new one
+        header = paddle.to_tensor([0])
+        paddle.distributed.recv(header, src=src_rank, group=group)
+        header = header.item()
 
-        # send shape
-        shape = paddle.to_tensor(tensor.shape)
-        paddle.distributed.send(shape, dst=dst_rank, group=group)
-
-        # send dtype
-        dtype = paddle.to_tensor(paddle_2_number(tensor.dtype))
-        paddle.distributed.send(dtype, dst=dst_rank, group=group)
+        if header >= 0:
+            message = self._recv_signatures[header]
+        else:
+            message = paddle.to_tensor([0] * -header)
+            paddle.distributed.recv(message, src=src_rank, group=group)
+            message = message.numpy().tolist()
+            self._recv_signatures.append(message)
 
-        # send trainable
-        stop_grad = paddle.to_tensor(int(tensor.stop_gradient))
-        paddle.distributed.send(stop_grad, dst=dst_rank, group=group)
+        (
+            self.recv_shape_message,
+            self.recv_dtype_message,
+            self.recv_stop_gradient,
+        ) = _decode_meta(message)
 
     def send_meta(self, tensor, group):
         dst_rank = _hcg._get_p2p_next_rank()
 
-        if isinstance(tensor, (paddle.Tensor, core.eager.Tensor)):
-            tensor_type = paddle.to_tensor([0])
-            # send tensor type
-            paddle.distributed.send(tensor_type, dst=dst_rank, group=group)
-
-            self._send_dims_shape_dtype(tensor, group)
-        elif isinstance(tensor, tuple):
-            tensor_type = paddle.to_tensor([1])
-            # send tensor type
-            paddle.distributed.send(tensor_type, dst=dst_rank, group=group)
-
-            nums = paddle.to_tensor(len(tensor))
-            paddle.distributed.send(nums, dst=dst_rank, group=group)
-
-            for d in tensor:
-                assert isinstance(d, (paddle.Tensor, core.eager.Tensor))
-                self._send_dims_shape_dtype(d, group=group)
+        message = _encode_meta(tensor)
+        signature = tuple(message)
+        index = self._send_signatures.get(signature)
+        if index is not None:
+            header = paddle.to_tensor([index])
+            paddle.distributed.send(header, dst=dst_rank, group=group)
+            return
+
+        self._send_signatures[signature] = len(self._send_signatures)
+        header = paddle.to_tensor([-len(message)])
+        paddle.distributed.send(header, dst=dst_rank, group=group)
+        paddle.distributed.send(
+            paddle.to_tensor(message), dst=dst_rank, group=group
+        )
 
     def set_send_message(self, tensor):
         if isinstance(tensor, (paddle.Tensor, core.eager.Tensor)):
@@ -347,6 +341,126 @@ def allgather_partial(
     )
 
 
+def _dtype_groups(dtypes):
+    # indexes of the tensors of each dtype, in the order of first appearance
+    groups = {}
+    for idx, dtype in enumerate(dtypes):
+        groups.setdefault(dtype, []).append(idx)
+    return list(groups.values())
+
+
+def _coalesce_tensors(tensors):
+    """Return the buffers to send ``tensors``, the tensors of a tuple with the
+    same dtype are flattened into one buffer."""
+    if not isinstance(tensors, tuple):
+        return [tensors]
+    buffers = []
+    for group in _dtype_groups([d.dtype for d in tensors]):
+        if len(group) == 1:
+            buffers.append(tensors[group[0]])
+        else:
+            buffers.append(
+                paddle.concat(
+                    [tensors[idx].detach().reshape([-1]) for idx in group]
+                )
+            )
+    return buffers
+
+
+def _empty_buffers(shapes, dtypes):
+    """Allocate the buffers to receive the tensors of ``shapes`` and
+    ``dtypes``, in the layout of ``_coalesce_tensors``."""
+    if not isinstance(shapes, tuple):
+        return [paddle.empty(shape=shapes, dtype=number_2_dtype(dtypes))]
+    buffers = []
+    for group in _dtype_groups(dtypes):
+        if len(group) == 1:
+            shape = shapes[group[0]]
+        else:
+            shape = [sum(int(np.prod(shapes[idx])) for idx in group)]
+        buffers.append(
+            paddle.empty(shape=shape, dtype=number_2_dtype(dtypes[group[0]]))
+        )
+    return buffers
+
+
+def _split_buffers(buffers, shapes, dtypes, stop_gradients=None):
+    if not isinstance(shapes, tuple):
+        tensor = buffers[0]
+        if stop_gradients is not None:
+            tensor.stop_gradient = stop_gradients
+        return tensor
+    tensors = [None] * len(shapes)
+    for group, buffer in zip(_dtype_groups(dtypes), buffers):
+        if len(group) == 1:
+            tensors[group[0]] = buffer
+            continue
+        parts = paddle.split(
+            buffer, [int(np.prod(shapes[idx])) for idx in group]
+        )
+        for idx, part in zip(group, parts):
+            tensors[idx] = part.reshape(shapes[idx])
+    if stop_gradients is not None:
+        for tensor, stop_gradient in zip(tensors, stop_gradients):
+            tensor.stop_gradient = stop_gradient
+    return tuple(tensors)
+
+
+def _wait_before_send(buffer):
+    # only the calc stream of a device has to be synced before sending
+    if not buffer.place.is_cpu_place():
+        paddle.distributed.wait(buffer, use_calc_stream=True)
+
+
+def _batch_p2p(send_prev, recv_prev, send_next, recv_next):
+    # send / recv all the buffers in one batch like batch_isend_irecv, and
+    # wait for all of them. The ops are issued here rather than by
+    # batch_isend_irecv, as it drops the None tasks and the tasks returned
+    # can not be matched with the ops.
+    ops = []
+    for buffers, op, rank, group in (
+        (
+            send_prev,
+            paddle.distributed.isend,
+            _hcg._get_p2p_prev_rank(),
+            _hcg.send_prev_group,
+        ),
+        (
+            recv_prev,
+            paddle.distributed.irecv,
+            _hcg._get_p2p_prev_rank(),
+            _hcg.recv_prev_group,
+        ),
+        (
+            send_next,
+            paddle.distributed.isend,
+            _hcg._get_p2p_next_rank(),
+            _hcg.send_next_group,
+        ),
+        (
+            recv_next,
+            paddle.distributed.irecv,
+            _hcg._get_p2p_next_rank(),
+            _hcg.recv_next_group,
+        ),
+    ):
+        for buffer in buffers:
+            if op is paddle.distributed.isend:
+                _wait_before_send(buffer)
+                buffer = buffer.detach()
+            ops.append(paddle.distributed.P2POp(op, buffer, rank, group))
+    if not ops:
+        return
+    with _with_batch_p2p_guard(ops[0].group.backend):
+        tasks = [
+            p2p_op.op(p2p_op.tensor, p2p_op.peer, p2p_op.group)
+            for p2p_op in ops
+        ]
+    for task in tasks:
+        if task is not None:
+            task.wait()
+
+
 def _p2p_helper(
     tensor_send_next, tensor_send_prev, recv_prev, recv_next, sync_recv=True
 ):
@@ -368,57 +482,49 @@ def _p2p_helper(
     mp_degree = _hcg.get_model_parallel_world_size()
     mp_rank = _hcg.get_model_parallel_rank()
 
-    if recv_prev:
-        if isinstance(recv_shape_msg, tuple):
-            tensor_recv_prev = []
-            for idx, shape in enumerate(recv_shape_msg):
-                tmp = paddle.empty(
-                    shape=shape, dtype=number_2_dtype(recv_dtype_msg[idx])
-                )
-                tmp.stop_gradient = recv_stop_gradient[idx]
-                tensor_recv_prev.append(tmp)
-            tensor_recv_prev = tuple(tensor_recv_prev)
-        else:
-
-            tensor_recv_prev = paddle.empty(
-                shape=recv_shape_msg, dtype=number_2_dtype(recv_dtype_msg)
-            )
-            tensor_recv_prev.stop_gradient = recv_stop_gradient
-
-    if recv_next:
-        if isinstance(send_shape_msg, tuple):
-            tensor_recv_next = []
-            for idx, shape in enumerate(send_shape_msg):
-                tensor_recv_next.append(
-                    paddle.empty(
-                        shape=shape, dtype=number_2_dtype(send_dtype_msg[idx])
-                    )
-                )
-            tensor_recv_next = tuple(tensor_recv_next)
-        else:
-            tensor_recv_next = paddle.empty(
-                shape=send_shape_msg, dtype=number_2_dtype(send_dtype_msg)
-            )
+    # NOTE: the tensors of a tuple are coalesced into one buffer per dtype,
+    # so that they are sent by one transfer.
+    send_prev_buffers = (
+        _coalesce_tensors(tensor_send_prev)
+        if tensor_send_prev is not None
+        else []
+    )
+    send_next_buffers = (
+        _coalesce_tensors(tensor_send_next)
+        if tensor_send_next is not None
+        else []
+    )
+    recv_prev_buffers = (
+        _empty_buffers(recv_shape_msg, recv_dtype_msg) if recv_prev else []
+    )
+    recv_next_buffers = (
+        _empty_buffers(send_shape_msg, send_dtype_msg) if recv_next else []
+    )
+    recv_buffers = recv_prev_buffers + recv_next_buffers
 
-    # TODO(Yuang Liu): use batch_isend_irecv replace all these comm ops
-    tasks = []
-    # start to p2p communicate
-    if tensor_send_prev is not None:
-        if isinstance(tensor_send_prev, tuple):
-            for d in tensor_send_prev:
-                paddle.distributed.wait(d, use_calc_stream=True)
-                send_partial(
-                    d,
-                    dst=0,
-                    nranks=mp_degree,
-                    rank_id=mp_rank,
-                    group=_hcg.send_prev_group,
-                    use_calc_stream=False,
-                )
-        else:
-            paddle.distributed.wait(tensor_send_prev, use_calc_stream=True)
+    if _use_batch_p2p and in_dygraph_mode():
+        all_buffers = send_prev_buffers + send_next_buffers + recv_buffers
+        use_batch_p2p = not any(
+            _is_valid_send_recv_partial(buffer, mp_degree)
+            for buffer in all_buffers
+        )
+    else:
+        use_batch_p2p = False
+
+    if use_batch_p2p:
+        _batch_p2p(
+            send_prev_buffers,
+            recv_prev_buffers,
+            send_next_buffers,
+            recv_next_buffers,
+        )
+    else:
+        tasks = []
+        # start to p2p communicate
+        for buffer in send_prev_buffers:
+            _wait_before_send(buffer)
             send_partial(
-                tensor_send_prev,
+                buffer,
                 dst=0,
                 nranks=mp_degree,
                 rank_id=mp_rank,
@@ -426,30 +532,9 @@ def _p2p_helper(
                 use_calc_stream=False,
             )
 
-    if tensor_recv_prev is not None:
-        if isinstance(tensor_recv_prev, tuple):
-            for d in tensor_recv_prev:
-                task = recv_partial(
-                    d,
-                    src=0,
-                    nranks=mp_degree,
-                    rank_id=mp_rank,
-                    group=_hcg.recv_prev_group,
-                    use_calc_stream=sync_recv,
-                )
-                if sync_recv:
-                    allgather_partial(
-                        d,
-                        nranks=mp_degree,
-                        rank_id=mp_rank,
-                        group=mp_group,
-                        use_calc_stream=True,
-                    )
-                else:
-                    tasks.append(task)
-        else:
+        for buffer in recv_prev_buffers:
             task = recv_partial(
-                tensor_recv_prev,
+                buffer,
                 src=0,
                 nranks=mp_degree,
                 rank_id=mp_rank,
@@ -458,7 +543,7 @@ def _p2p_helper(
             )
             if sync_recv:
                 allgather_partial(
-                    tensor_recv_prev,
+                    buffer,
                     nranks=mp_degree,
                     rank_id=mp_rank,
                     group=mp_group,
@@ -467,22 +552,10 @@ def _p2p_helper(
             else:
                 tasks.append(task)
 
-    if tensor_send_next is not None:
-        if isinstance(tensor_send_next, tuple):
-            for d in tensor_send_next:
-                paddle.distributed.wait(d, use_calc_stream=True)
-                send_partial(
-                    d,
-                    dst=1,
-                    nranks=mp_degree,
-                    rank_id=mp_rank,
-                    group=_hcg.send_next_group,
-                    use_calc_stream=False,
-                )
-        else:
-            paddle.distributed.wait(tensor_send_next, use_calc_stream=True)
+        for buffer in send_next_buffers:
+            _wait_before_send(buffer)
             send_partial(
-                tensor_send_next,
+                buffer,
                 dst=1,
                 nranks=mp_degree,
                 rank_id=mp_rank,
@@ -490,31 +563,9 @@ def _p2p_helper(
                 use_calc_stream=False,
             )
 
-    if tensor_recv_next is not None:
-        if isinstance(tensor_recv_next, tuple):
-            for d in tensor_recv_next:
-                task = recv_partial(
-                    d,
-                    src=1,
-                    nranks=mp_degree,
-                    rank_id=mp_rank,
-                    group=_hcg.recv_next_group,
-                    use_calc_stream=sync_recv,
-                )
-                if sync_recv:
-                    allgather_partial(
-                        d,
-                        nranks=mp_degree,
-                        rank_id=mp_rank,
-                        group=mp_group,
-                        use_calc_stream=True,
-                    )
-                else:
-                    tasks.append(task)
-
-        else:
+        for buffer in recv_next_buffers:
             task = recv_partial(
-                tensor_recv_next,
+                buffer,
                 src=1,
                 nranks=mp_degree,
                 rank_id=mp_rank,
@@ -523,7 +574,7 @@ def _p2p_helper(
             )
             if sync_recv:
                 allgather_partial(
-                    tensor_recv_next,
+                    buffer,
                     nranks=mp_degree,
                     rank_id=mp_rank,
                     group=mp_group,
@@ -532,35 +583,33 @@ def _p2p_helper(
             else:
                 tasks.append(task)
 
-    if not sync_recv:
-        if in_dygraph_mode():
-            # wait irecv tasks in eager dygraph mode with new comm library
-            for task in tasks:
-                assert task is not None
-                task.wait()
-
-        tensors_for_all_gather = []
-        if tensor_recv_prev is not None:
-            if isinstance(tensor_recv_prev, tuple):
-                for d in tensor_recv_prev:
-                    tensors_for_all_gather.append(d)
-            else:
-                tensors_for_all_gather.append(tensor_recv_prev)
-        if tensor_recv_next is not None:
-            if isinstance(tensor_recv_next, tuple):
-                for d in tensor_recv_next:
-                    tensors_for_all_gather.append(d)
-            else:
-                tensors_for_all_gather.append(tensor_recv_next)
+        if not sync_recv:
+            if in_dygraph_mode():
+                # wait irecv tasks in eager dygraph mode with new comm library
+                for task in tasks:
+                    assert task is not None
+                    task.wait()
 
-        for tensor in tensors_for_all_gather:
-            allgather_partial(
-                tensor,
-                nranks=mp_degree,
-                rank_id=mp_rank,
-                group=mp_group,
-                use_calc_stream=True,
-            )
+            for buffer in recv_buffers:
+                allgather_partial(
+                    buffer,
+                    nranks=mp_degree,
+                    rank_id=mp_rank,
+                    group=mp_group,
+                    use_calc_stream=True,
+                )
+
+    if recv_prev:
+        tensor_recv_prev = _split_buffers(
+            recv_prev_buffers,
+            recv_shape_msg,
+            recv_dtype_msg,
+            recv_stop_gradient,
+        )
+    if recv_next:
+        tensor_recv_next = _split_buffers(
+            recv_next_buffers, send_shape_msg, send_dtype_msg
+        )
 
     return tensor_recv_prev, tensor_recv_next
 
@@ -155,7 +155,9 @@ class HTTPMaster(Master):
                 time.sleep(0.1)
                 continue
 
-            rjson = self.client.get_prefix(prefix)
+            # long polling instead of querying periodically, the server
+            # responses as soon as all the peers are registered
+            rjson = self.client.wait_prefix(prefix, size, timeout=5)
             self.ctx.logger.debug("sync peers {}".format(rjson))
             if rjson and len(rjson) == size:
                 if rank < 0:
@@ -169,8 +171,11 @@ class HTTPMaster(Master):
                     for k, v in rjson.items():
                         ret[int(k.split('/')[-1])] = v
                     return ret, rank
-            else:
+            elif rjson and len(rjson) > size:
                 time.sleep(0.5)
+            elif not rjson:
+                # the request failed rather than timed out
+                time.sleep(0.1)
         return [], 0
 
 
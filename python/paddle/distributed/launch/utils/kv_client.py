@@ -24,12 +24,14 @@ class KVClient:
             if endpoint.startswith("http://")
             else "http://{}".format(endpoint)
         )
+        # a session keeps the connections alive and reuses them among requests
+        self.session = requests.Session()
 
     def put(self, key, value):
         key = key if key.startswith('/') else "/{}".format(key)
         u = "{}{}".format(self.endpoint, key)
         try:
-            r = requests.post(u, data=value, timeout=3)
+            r = self.session.post(u, data=value, timeout=3)
             if r.status_code == 200:
                 return True
             else:
@@ -41,7 +43,7 @@ class KVClient:
         key = key if key.startswith('/') else "/{}".format(key)
         u = "{}{}".format(self.endpoint, key)
         try:
-            r = requests.get(u, timeout=3)
+            r = self.session.get(u, timeout=3)
             if r.status_code == 200:
                 ret = r.json()
                 return ret.get(key, '')
@@ -54,17 +56,56 @@ class KVClient:
         key = key if key.startswith('/') else "/{}".format(key)
         u = "{}{}".format(self.endpoint, key)
         try:
-            r = requests.get(u, timeout=3)
+            r = self.session.get(u, timeout=3)
             if r.status_code == 200:
                 return r.json()
         except:
             return ""
 
+    def wait_prefix(self, key, size, timeout=30):
+        '''
+        Block until there are at least `size` keys under prefix `key` or
+        `timeout` seconds elapse, return the key-values under the prefix.
+        '''
+        key = key if key.startswith('/') else "/{}".format(key)
+        u = "{}{}".format(self.endpoint, key)
+        try:
+            r = self.session.get(
+                u,
+                params={'wait': size, 'timeout': timeout},
+                timeout=timeout + 3,
+            )
+            if r.status_code == 200:
+                return r.json()
+        except:
+            return ""
+
+    def watch_prefix(self, key, revision, timeout=30):
+        '''
+        Block until the store is modified after `revision` or `timeout`
+        seconds elapse, return (key-values under prefix `key`, revision).
+        Pass revision -1 to return immediately.
+        '''
+        key = key if key.startswith('/') else "/{}".format(key)
+        u = "{}{}".format(self.endpoint, key)
+        try:
+            r = self.session.get(
+                u,
+                params={'revision': revision, 'timeout': timeout},
+                timeout=timeout + 3,
+            )
+            new_revision = int(r.headers.get('X-KV-Revision', revision))
+            if r.status_code == 200:
+                return r.json(), new_revision
+            return {}, new_revision
+        except:
+            return "", revision
+
     def delete(self, key):
         key = key if key.startswith('/') else "/{}".format(key)
         u = "{}{}".format(self.endpoint, key)
         try:
-            r = requests.delete(u, timeout=3)
+            r = self.session.delete(u, timeout=3)
             if r.status_code == 200:
                 return True
             else:
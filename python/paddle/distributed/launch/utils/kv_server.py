@@ -12,24 +12,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import http.server as SimpleHTTPServer
 import json
 import threading
-from http.server import HTTPServer
+from http.server import ThreadingHTTPServer
 from multiprocessing import Process
+from urllib.parse import parse_qs, urlsplit
+
+# upper bound of the time a long polling request is held by the server
+MAX_WAIT_TIMEOUT = 60
 
 
 class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+    # keep-alive connections, so that clients can reuse them among requests
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self):
-        with self.server.kv_lock:
-            ret = {}
-            for k, v in self.server.kv.items():
-                if k.startswith(self.path):
-                    ret[k] = v.decode(encoding="utf-8")
-            if ret:
-                self.output(200, json.dumps(ret).encode("utf-8"))
-            else:
-                self.output(404)
+        '''
+        GET /prefix returns all the key-values under prefix.
+
+        Long polling is supported by the query parameters:
+          wait=N: block until there are at least N keys under prefix.
+          revision=R: block until the store is modified after revision R.
+          timeout=T: the max seconds to block, 30 by default.
+        The revision of the returned result is set in the X-KV-Revision header.
+        '''
+        url = urlsplit(self.path)
+        prefix = url.path
+        query = parse_qs(url.query)
+        try:
+            wait = int(query.get('wait', [0])[0])
+            revision = int(query.get('revision', [-1])[0])
+            timeout = min(
+                float(query.get('timeout', [30])[0]), MAX_WAIT_TIMEOUT
+            )
+        except ValueError:
+            self.output(400)
+            return
+
+        server = self.server
+        with server.kv_cond:
+            if wait > 0 or revision >= 0:
+                server.kv_cond.wait_for(
+                    lambda: server.revision > revision
+                    and server.count_prefix(prefix) >= wait,
+                    timeout=timeout,
+                )
+            ret = {
+                k: server.kv[k].decode(encoding="utf-8")
+                for k in server.keys_with_prefix(prefix)
+            }
+            current_revision = server.revision
+        if ret:
+            self.output(200, json.dumps(ret).encode("utf-8"), current_revision)
+        else:
+            self.output(404, revision=current_revision)
 
     def do_PUT(self):
         self.do_POST()
@@ -38,25 +76,23 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         content_length = int(self.headers['Content-Length'] or 0)
         try:
             value = self.rfile.read(content_length)
-            with self.server.kv_lock:
-                self.server.kv[self.path] = value
-                self.output(200)
-                return
+            self.server.put(self.path, value)
+            self.output(200)
         except:
             self.output(500)
 
     def do_DELETE(self):
-        with self.server.kv_lock:
-            if self.path in self.server.kv:
-                del self.server.kv[self.path]
-                self.output(200)
-            else:
-                self.output(404)
-
-    def output(self, code, value=''):
+        if self.server.delete(self.path):
+            self.output(200)
+        else:
+            self.output(404)
+
+    def output(self, code, value='', revision=None):
         self.send_response(code)
         self.send_header("Content-Length", len(value))
         self.send_header("Content-Type", "application/json; charset=utf8")
+        if revision is not None:
+            self.send_header("X-KV-Revision", revision)
         self.end_headers()
         if value:
             self.wfile.write(value)
@@ -65,15 +101,54 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         return
 
 
-class KVServer(HTTPServer):
+class KVServer(ThreadingHTTPServer):
+    daemon_threads = True
+
     def __init__(self, port):
         super().__init__(('', port), KVHandler)
         self.kv_lock = threading.Lock()
+        self.kv_cond = threading.Condition(self.kv_lock)
         self.kv = {'/healthy': b'ok'}
+        # sorted keys, makes prefix lookup O(log n + k)
+        self.sorted_keys = ['/healthy']
+        # increased on every modification, used by watching requests
+        self.revision = 0
         self.port = port
         self.stopped = False
         self.started = False
 
+    def _prefix_range(self, prefix):
+        lo = bisect.bisect_left(self.sorted_keys, prefix)
+        hi = bisect.bisect_left(self.sorted_keys, prefix + '\U0010ffff', lo)
+        return lo, hi
+
+    # NOTE: the following methods should be called with kv_lock held
+    def keys_with_prefix(self, prefix):
+        lo, hi = self._prefix_range(prefix)
+        return self.sorted_keys[lo:hi]
+
+    def count_prefix(self, prefix):
+        lo, hi = self._prefix_range(prefix)
+        return hi - lo
+
+    def put(self, key, value):
+        with self.kv_cond:
+            if key not in self.kv:
+                bisect.insort(self.sorted_keys, key)
+            self.kv[key] = value
+            self.revision += 1
+            self.kv_cond.notify_all()
+
+    def delete(self, key):
+        with self.kv_cond:
+            if key not in self.kv:
+                return False
+            del self.kv[key]
+            del self.sorted_keys[bisect.bisect_left(self.sorted_keys, key)]
+            self.revision += 1
+            self.kv_cond.notify_all()
+            return True
+
     def start(self):
         self.listen_thread = threading.Thread(target=self.serve_forever)
         self.listen_thread.start()
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import logging
-import math
 import numpy as np
 from ....log_helper import get_logger
 
@@ -24,32 +23,38 @@ _logger = get_logger(
 __all__ = ['cal_kl_threshold']
 
 
+def _merged_bin_bounds(num_bins, num_quantized_bins):
+    '''
+    The [start, end) of the bins merged into every quantized bin, the last
+    quantized bin takes the remaining bins.
+    '''
+    num_merged_bins = int(num_bins / num_quantized_bins)
+    starts = np.arange(num_quantized_bins) * num_merged_bins
+    ends = starts + num_merged_bins
+    ends[-1] = num_bins
+    return starts, ends
+
+
+def _segment_sum(values, starts, ends):
+    cumsum = np.concatenate([[0], np.cumsum(values)])
+    return cumsum[ends] - cumsum[starts]
+
+
 def expand_quantized_bins(quantized_bins, reference_bins):
     '''
     Expand hist bins.
     '''
-    expanded_quantized_bins = [0] * len(reference_bins)
-    num_merged_bins = int(len(reference_bins) / len(quantized_bins))
-    j_start = 0
-    j_end = num_merged_bins
-    for idx in range(len(quantized_bins)):
-        zero_count = reference_bins[j_start:j_end].count(0)
-        num_merged_bins = j_end - j_start
-        if zero_count == num_merged_bins:
-            avg_bin_ele = 0
-        else:
-            avg_bin_ele = quantized_bins[idx] / (
-                num_merged_bins - zero_count + 0.0
-            )
-        for idx1 in range(j_start, j_end):
-            expanded_quantized_bins[idx1] = (
-                0 if reference_bins[idx1] == 0 else avg_bin_ele
-            )
-        j_start += num_merged_bins
-        j_end += num_merged_bins
-        if (idx + 1) == len(quantized_bins) - 1:
-            j_end = len(reference_bins)
-    return expanded_quantized_bins
+    quantized_bins = np.asarray(quantized_bins)
+    reference_bins = np.asarray(reference_bins)
+    starts, ends = _merged_bin_bounds(len(reference_bins), len(quantized_bins))
+    nonzero = reference_bins != 0
+    nonzero_count = _segment_sum(nonzero, starts, ends)
+    avg_bin_ele = np.where(
+        nonzero_count > 0,
+        quantized_bins / np.maximum(nonzero_count, 1),
+        0.0,
+    )
+    return np.where(nonzero, np.repeat(avg_bin_ele, ends - starts), 0.0)
 
 
 def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
@@ -57,24 +62,21 @@ def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
     Calculate the entropy.
     '''
     assert len(reference_distr_P) == len(candidate_distr_Q)
-    tmp_sum1 = 0
-    tmp_sum2 = 0
-    for idx in range(len(reference_distr_P)):
-        p_idx = reference_distr_P[idx]
-        q_idx = candidate_distr_Q[idx]
-        if p_idx == 0:
-            tmp_sum1 += 0
-            tmp_sum2 += 0
-        else:
-            if q_idx == 0:
-                _logger.error(
-                    "Fatal error!, idx = "
-                    + str(idx)
-                    + " qindex = 0! p_idx = "
-                    + str(p_idx)
-                )
-            tmp_sum1 += p_idx * (math.log(Q_sum * p_idx))
-            tmp_sum2 += p_idx * (math.log(P_sum * q_idx))
+    reference_distr_P = np.asarray(reference_distr_P)
+    candidate_distr_Q = np.asarray(candidate_distr_Q)
+    nonzero = reference_distr_P != 0
+    p = reference_distr_P[nonzero]
+    q = candidate_distr_Q[nonzero]
+    if not q.all():
+        idx = np.flatnonzero(nonzero)[np.argmin(q != 0)]
+        _logger.error(
+            "Fatal error!, idx = "
+            + str(idx)
+            + " qindex = 0! p_idx = "
+            + str(reference_distr_P[idx])
+        )
+    tmp_sum1 = np.sum(p * np.log(Q_sum * p))
+    tmp_sum2 = np.sum(p * np.log(P_sum * q))
     return (tmp_sum1 - tmp_sum2) / P_sum
 
 
@@ -93,34 +95,22 @@ def cal_kl_threshold(hist, bin_width, bits):
     quant_range = 2 ** (bits - 1) - 1
 
     P_sum = np.sum(np.array(hist).ravel())
+    hist_cumsum = np.concatenate([[0], np.cumsum(hist)])
     min_kl_divergence = 0
     min_kl_index = 0
     kl_inited = False
 
     for i in range(starting_iter, hist_bins):
-        reference_distr_P = hist[0:i].tolist()
-        outliers_count = sum(hist[i:])
-        if reference_distr_P[i - 1] == 0:
+        if hist[i - 1] == 0:
             continue
-        reference_distr_P[i - 1] += outliers_count
-        reference_distr_bins = reference_distr_P[:]
-        candidate_distr_Q = hist[0:i].tolist()
-        num_merged_bins = int(i / quant_range)
-        candidate_distr_Q_quantized = [0] * quant_range
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(quant_range):
-            candidate_distr_Q_quantized[idx] = sum(
-                candidate_distr_Q[j_start:j_end]
-            )
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == quant_range - 1:
-                j_end = i
+        reference_distr_P = hist[0:i].astype('float64')
+        reference_distr_P[i - 1] += hist_cumsum[-1] - hist_cumsum[i]
+        starts, ends = _merged_bin_bounds(i, quant_range)
+        candidate_distr_Q_quantized = hist_cumsum[ends] - hist_cumsum[starts]
         candidate_distr_Q = expand_quantized_bins(
-            candidate_distr_Q_quantized, reference_distr_bins
+            candidate_distr_Q_quantized, reference_distr_P
         )
-        Q_sum = sum(candidate_distr_Q)
+        Q_sum = np.sum(candidate_distr_Q)
         kl_divergence = safe_entropy(
             reference_distr_P, P_sum, candidate_distr_Q, Q_sum
         )
@@ -18,6 +18,7 @@ import math
 import shutil
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from tqdm import tqdm
@@ -151,6 +152,8 @@ class PostTrainingQuantization:
         cache_dir=None,
         scale_dict=None,
         return_graph=False,
+        calibration_num_workers=None,
+        calibration_sample_size=None,
     ):
         '''
         Constructor.
@@ -240,6 +243,15 @@ class PostTrainingQuantization:
                 quantization. Default False.
             is_use_cache_file(bool, optional): This param is deprecated.
             cache_dir(str, optional): This param is deprecated.
+            calibration_num_workers(int, optional): The number of threads which
+                compute the histograms and search the thresholds of different
+                activations in parallel. If None, use min(cpu_count, 8).
+                Default is None.
+            calibration_sample_size(int, optional): If set, the activations
+                with more elements are randomly subsampled to this number of
+                elements before computing the histogram (algo='KL' or 'hist')
+                or searching the threshold (algo='mse' or 'emd'). The abs max
+                value is always computed from the whole tensor. Default is None.
         Returns:
             None
 
@@ -327,6 +339,9 @@ class PostTrainingQuantization:
                 ),
             ), "data_loader only accepts `paddle.io.DataLoader` or Generator instance."
         assert batch_size > 0, "The batch_size should be greater than 0."
+        assert (
+            calibration_sample_size is None or calibration_sample_size > 0
+        ), "The calibration_sample_size should be greater than 0."
         assert (
             algo in self._support_algo_type
         ), "The algo should be KL, hist, mse, avg, abs_max, min_max or ptf."
@@ -405,6 +420,11 @@ class PostTrainingQuantization:
         self._freeze_model = freeze_model
         self._scale_dict = scale_dict
         self._return_graph = return_graph
+        if calibration_num_workers is None:
+            calibration_num_workers = min(os.cpu_count() or 1, 8)
+        self._calibration_num_workers = calibration_num_workers
+        self._calibration_sample_size = calibration_sample_size
+        self._sampling_step = 0
         self.FLAG = False
         if self._program is not None:
             self.FLAG = True
@@ -721,62 +741,22 @@ class PostTrainingQuantization:
             self._sample_ptf()
         elif self._algo in ["KL", "hist"]:
             self._sample_histogram()
+        self._sampling_step += 1
 
     def _sample_mse(self):
-        if self._quantized_threshold == {}:
-            for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
         _logger.info("MSE searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if not var_tensor.any():
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                mse_loss = ((var_tensor - quant_dequant_var) ** 2).mean()
-                if mse_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = mse_loss
-                    self._quantized_threshold[var_name] = scale
+        self._search_act_threshold('mse')
 
     def _sample_emd(self):
+        _logger.info("EMD searching stage ...")
+        self._search_act_threshold('emd')
+
+    def _search_act_threshold(self, loss_type):
+        '''
+        Search the threshold of activations which makes the quantization
+        loss minimal. All candidate scales of a tensor are evaluated in one
+        pass, and the tensors are spread over the calibration workers.
+        '''
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
                 var_tensor = utils.load_variable_data(self._scope, var_name)
@@ -798,39 +778,65 @@ class PostTrainingQuantization:
                                 float(np.max(np.abs(var_tensor[i])))
                             )
                 self._quantized_threshold[var_name] = abs_max_value
-        _logger.info("EMD searching stage ...")
-        for var_name in self._quantized_act_var_name:
+
+        def _search(var_name):
             var_tensor = utils.load_variable_data(self._scope, var_name)
             if not var_tensor.any():
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
+                return None
             abs_max_value = float(np.max(np.abs(var_tensor)))
             abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
+            scales = utils.candidate_scales(abs_max_value)
+            losses = utils.quant_dequant_losses(
+                self._subsample(var_tensor),
+                scales,
+                self._activation_bits,
+                self._onnx_format,
+                loss_type,
+            )
+            return scales, losses
+
+        for var_name, result in self._map_act_vars(_search):
+            if result is None:
+                self._zero_size_var_names.add(var_name)
+                continue
+            scales, losses = result
             if var_name not in self._best_calibration_loss:
                 self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                emd_loss = np.abs(
-                    np.mean(var_tensor) - np.mean(quant_dequant_var)
-                ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var))
-                if emd_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = emd_loss
-                    self._quantized_threshold[var_name] = scale
+            valid = ~np.isnan(losses)
+            if not valid.any():
+                continue
+            # NOTE: same as trying the scales one by one and keeping the
+            # scale whenever `loss <= best_loss`, i.e. the last minimum wins.
+            min_loss = np.min(losses[valid])
+            if min_loss <= self._best_calibration_loss[var_name]:
+                idx = np.flatnonzero(losses == min_loss)[-1]
+                self._best_calibration_loss[var_name] = min_loss
+                self._quantized_threshold[var_name] = float(scales[idx])
+
+    def _map_act_vars(self, func):
+        '''
+        Return the list of (var_name, func(var_name)) for the quantized
+        activations, func is called by the calibration worker threads.
+        '''
+        var_names = sorted(self._quantized_act_var_name)
+        if self._calibration_num_workers > 1 and len(var_names) > 1:
+            # NOTE: numpy releases the GIL in the heavy computation, so the
+            # threads run in parallel without pickling the activations.
+            with ThreadPoolExecutor(self._calibration_num_workers) as pool:
+                return list(zip(var_names, pool.map(func, var_names)))
+        return [(var_name, func(var_name)) for var_name in var_names]
+
+    def _subsample(self, var_tensor):
+        '''
+        Flatten the tensor, and randomly pick calibration_sample_size
+        elements of it if it is larger.
+        '''
+        var_tensor = var_tensor.ravel()
+        sample_size = self._calibration_sample_size
+        if sample_size is None or var_tensor.size <= sample_size:
+            return var_tensor
+        rng = np.random.RandomState([self._sampling_step, var_tensor.size])
+        return var_tensor[rng.randint(0, var_tensor.size, sample_size)]
 
     def _sample_avg(self):
         if self._quantized_threshold == {}:
@@ -948,16 +954,25 @@ class PostTrainingQuantization:
                 self._quantized_var_max[var_name] = max_value
 
     def _sample_histogram(self):
-        for var_name in self._quantized_act_var_name:
+        def _histogram(var_name):
             var_tensor = utils.load_variable_data(self._scope, var_name)
             if (not var_tensor.any()) or (
                 var_name not in self._sampling_act_histogram
             ):
+                return None
+            var_tensor_abs = np.abs(self._subsample(var_tensor))
+            bins = self._sampling_act_histogram[var_name][1]
+            # NOTE: the bins are uniform, passing the number and the range
+            # of them takes the fast path of np.histogram.
+            hist, _ = np.histogram(
+                var_tensor_abs, bins=len(bins) - 1, range=(bins[0], bins[-1])
+            )
+            return hist
+
+        for var_name, hist in self._map_act_vars(_histogram):
+            if hist is None:
                 self._zero_size_var_names.add(var_name)
                 continue
-            var_tensor_abs = np.abs(var_tensor)
-            bins = self._sampling_act_histogram[var_name][1]
-            hist, _ = np.histogram(var_tensor_abs, bins=bins)
             self._sampling_act_histogram[var_name][0] += hist
 
     def _sample_ptf(self):
@@ -1467,6 +1482,8 @@ class PostTrainingQuantizationProgram(PostTrainingQuantization):
         cache_dir=None,
         scale_dict=None,
         return_graph=True,
+        calibration_num_workers=None,
+        calibration_sample_size=None,
     ):
         super().__init__(
             executor,
@@ -1499,6 +1516,8 @@ class PostTrainingQuantizationProgram(PostTrainingQuantization):
             cache_dir,
             scale_dict,
             return_graph,
+            calibration_num_workers,
+            calibration_sample_size,
         )
         self.FLAG = False
         self._program = program
@@ -494,3 +494,89 @@ class tqdm:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         sys.stderr.write('\n')
+
+
+# NOTE: the number of (scale, element) pairs evaluated at once by
+# quant_dequant_losses, small enough for the working set to stay in cache.
+_LOSS_CHUNK_ELEMENTS = 1 << 18
+
+
+def candidate_scales(abs_max_value, start=0.3, end=1.0, step=0.02):
+    '''
+    The candidate scales searched by the mse and emd calibration, the float
+    accumulation of `s += step` is kept so the candidates do not change.
+    '''
+    scales = []
+    s = start
+    while s <= end:
+        scales.append(s * abs_max_value)
+        s += step
+    return np.array(scales)
+
+
+def quant_dequant_losses(
+    tensor, scales, bits=8, onnx_format=False, loss_type='mse'
+):
+    '''
+    Quant-dequant the tensor with every scale of scales and return the loss
+    for each of them. All scales are evaluated in one broadcasted pass over
+    chunks of the tensor.
+
+    Args:
+        tensor(numpy.ndarray): The tensor to quantize.
+        scales(numpy.ndarray): The 1-D candidate scales.
+        bits(int): The quantization bit number.
+        onnx_format(bool): Quantize symmetrically as the ONNX format does,
+            otherwise the tensor is clipped to [0, scale].
+        loss_type(str): 'mse' for the mean squared error, 'emd' for the
+            difference of the mean plus the difference of the std.
+    Returns:
+        The float64 loss array with the same length as scales.
+    '''
+    assert loss_type in ['mse', 'emd'], "The loss_type should be mse or emd."
+    tensor = tensor.ravel()
+    scales = np.asarray(scales, dtype=tensor.dtype).reshape([-1, 1])
+    bins = 2 ** (bits - 1) - 1
+    chunk_size = max(_LOSS_CHUNK_ELEMENTS // scales.shape[0], 1)
+    buffer = np.empty(
+        [scales.shape[0], min(chunk_size, tensor.size)], dtype=tensor.dtype
+    )
+    # the sum of squared errors for mse, the mean and the sum of squared
+    # deviations of quant_dequant for emd, which are merged chunk by chunk
+    # as Chan et al. to avoid the cancellation of E[x^2] - E[x]^2.
+    sum_square = np.zeros([scales.shape[0]])
+    mean = np.zeros([scales.shape[0]])
+    for start in range(0, tensor.size, chunk_size):
+        chunk = tensor[start : start + chunk_size].reshape([1, -1])
+        quant_dequant = buffer[:, : chunk.shape[1]]
+        if onnx_format:
+            np.divide(chunk, scales, out=quant_dequant)
+            quant_dequant *= bins
+            np.round(quant_dequant, out=quant_dequant)
+            np.clip(quant_dequant, -bins - 1, bins, out=quant_dequant)
+        else:
+            np.clip(chunk, 0.0, scales, out=quant_dequant)
+            quant_dequant /= scales
+            quant_dequant *= bins
+            np.round(quant_dequant, out=quant_dequant)
+        quant_dequant /= bins
+        quant_dequant *= scales
+        if loss_type == 'mse':
+            quant_dequant -= chunk
+            np.square(quant_dequant, out=quant_dequant)
+            sum_square += np.sum(quant_dequant, axis=1, dtype='float64')
+            continue
+        chunk_mean = np.mean(quant_dequant, axis=1, dtype='float64')
+        quant_dequant -= chunk_mean.reshape([-1, 1])
+        np.square(quant_dequant, out=quant_dequant)
+        ratio = chunk.shape[1] / (start + chunk.shape[1])
+        delta = chunk_mean - mean
+        mean += delta * ratio
+        sum_square += np.sum(quant_dequant, axis=1, dtype='float64')
+        sum_square += np.square(delta) * start * ratio
+    if loss_type == 'mse':
+        return sum_square / tensor.size
+    std = np.sqrt(sum_square / tensor.size)
+    return np.abs(np.mean(tensor, dtype='float64') - mean) + np.abs(
+        np.std(tensor, dtype='float64') - std
+    )
@@ -0,0 +1,150 @@
+#   Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+
+import numpy as np
+
+from paddle.fluid.contrib.slim.quantization import utils
+from paddle.fluid.contrib.slim.quantization.cal_kl_threshold import (
+    cal_kl_threshold,
+)
+
+
+def kl_threshold_loop(hist, bin_width, bits):
+    # the former pure python implementation of cal_kl_threshold
+    hist_bins = hist.shape[0]
+    starting_iter = int((hist_bins - 1) * 0.5)
+    quant_range = 2 ** (bits - 1) - 1
+    P_sum = np.sum(hist)
+    min_kl_divergence = 0
+    min_kl_index = 0
+    kl_inited = False
+    for i in range(starting_iter, hist_bins):
+        P = hist[0:i].tolist()
+        if P[i - 1] == 0:
+            continue
+        P[i - 1] += sum(hist[i:])
+        num_merged_bins = int(i / quant_range)
+        Q_quantized = []
+        for idx in range(quant_range):
+            start = idx * num_merged_bins
+            end = i if idx == quant_range - 1 else start + num_merged_bins
+            Q_quantized.append(sum(hist[start:end].tolist()))
+        Q = [0] * i
+        for idx in range(quant_range):
+            start = idx * num_merged_bins
+            end = i if idx == quant_range - 1 else start + num_merged_bins
+            nonzero = sum(1 for p in P[start:end] if p != 0)
+            for j in range(start, end):
+                if P[j] != 0:
+                    Q[j] = Q_quantized[idx] / float(nonzero)
+        Q_sum = sum(Q)
+        kl = 0.0
+        for p, q in zip(P, Q):
+            if p != 0:
+                kl += p * math.log(Q_sum * p) - p * math.log(P_sum * q)
+        kl /= P_sum
+        if not kl_inited or kl < min_kl_divergence:
+            min_kl_divergence = kl
+            min_kl_index = i
+            kl_inited = True
+    if min_kl_index == 0:
+        while starting_iter > 0 and hist[starting_iter] == 0:
+            starting_iter -= 1
+        min_kl_index = starting_iter
+    return (min_kl_index + 0.5) * bin_width
+
+
+def quant_dequant_losses_loop(tensor, scales, bits, onnx_format, loss_type):
+    # quant-dequant in the dtype of the tensor as the former loop does, and
+    # reduce in float64
+    bins = 2 ** (bits - 1) - 1
+    losses = []
+    for scale in scales.astype(tensor.dtype):
+        if onnx_format:
+            quant = np.clip(np.round(tensor / scale * bins), -bins - 1, bins)
+            quant_dequant = quant / bins * scale
+        else:
+            quant = np.round(np.clip(tensor, 0.0, scale) / scale * bins)
+            quant_dequant = quant / bins * scale
+        quant_dequant = quant_dequant.astype('float64')
+        if loss_type == 'mse':
+            losses.append(np.mean((tensor - quant_dequant) ** 2))
+        else:
+            losses.append(
+                np.abs(
+                    np.mean(tensor, dtype='float64') - np.mean(quant_dequant)
+                )
+                + np.abs(
+                    np.std(tensor, dtype='float64') - np.std(quant_dequant)
+                )
+            )
+    return np.array(losses)
+
+
+class TestCalKLThreshold(unittest.TestCase):
+    def test_kl_threshold(self):
+        rng = np.random.RandomState(2022)
+        for bits in [4, 8]:
+            for power in [0.5, 1.0, 3.0]:
+                data = np.abs(rng.standard_normal(20000)) ** power
+                data[rng.rand(data.size) < 0.3] = 0.0
+                hist, edges = np.histogram(data, bins=512)
+                bin_width = edges[1] - edges[0]
+                self.assertAlmostEqual(
+                    cal_kl_threshold(hist, bin_width, bits),
+                    kl_threshold_loop(hist, bin_width, bits),
+                )
+
+    def test_sparse_hist(self):
+        hist = np.zeros([256], dtype='int64')
+        hist[[3, 10, 200]] = [5, 1, 1]
+        self.assertAlmostEqual(
+            cal_kl_threshold(hist, 0.1, 8), kl_threshold_loop(hist, 0.1, 8)
+        )
+
+
+class TestQuantDequantLosses(unittest.TestCase):
+    def test_candidate_scales(self):
+        scales = utils.candidate_scales(2.0)
+        self.assertEqual(len(scales), 35)
+        self.assertAlmostEqual(scales[0], 0.6)
+        self.assertAlmostEqual(scales[-1], 1.96)
+
+    def test_losses(self):
+        rng = np.random.RandomState(2022)
+        for loss_type in ['mse', 'emd']:
+            for onnx_format in [False, True]:
+                for offset in [0.0, 2.0]:
+                    # larger than a chunk, so the partial sums are merged
+                    tensor = (rng.standard_normal(50000) + offset).astype(
+                        'float32'
+                    )
+                    scales = utils.candidate_scales(np.max(np.abs(tensor)))
+                    np.testing.assert_allclose(
+                        utils.quant_dequant_losses(
+                            tensor, scales, 8, onnx_format, loss_type
+                        ),
+                        quant_dequant_losses_loop(
+                            tensor, scales, 8, onnx_format, loss_type
+                        ),
+                        rtol=1e-5,
+                        atol=1e-7,
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,7 @@
 import paddle
 import numbers
 import numpy as np
-from ..framework import _non_static_mode
+from ..framework import _non_static_mode, convert_np_dtype_to_dtype_
 from .. import core, layers
 
 from collections.abc import Sequence, Mapping
@@ -79,6 +79,99 @@ def default_collate_fn(batch):
     )
 
 
+class _SchemaMismatchError(Exception):
+    pass
+
+
+def _build_schema(sample):
+    if isinstance(sample, np.ndarray):
+        if sample.dtype == np.object_ or sample.size == 0:
+            return ('other',)
+        return ('ndarray', sample.shape, sample.dtype)
+    elif isinstance(sample, Mapping):
+        return ('dict', {key: _build_schema(sample[key]) for key in sample})
+    elif isinstance(sample, Sequence) and not isinstance(sample, (str, bytes)):
+        return ('list', [_build_schema(field) for field in sample])
+    return ('other',)
+
+
+def _empty_lodtensor(shape, dtype):
+    t = core.LoDTensor()
+    t._set_dims(list(shape))
+    t._mutable_data(core.CPUPlace(), convert_np_dtype_to_dtype_(dtype))
+    return t
+
+
+def _collate_by_schema(schema, batch):
+    kind = schema[0]
+    if kind == 'ndarray':
+        _, shape, dtype = schema
+        out = _empty_lodtensor((len(batch),) + shape, dtype)
+        # np.asarray shares memory with the LoDTensor, samples are copied
+        # into the batch tensor directly without np.stack and tensor.set
+        out_array = np.asarray(out)
+        for i, field in enumerate(batch):
+            if (
+                not isinstance(field, np.ndarray)
+                or field.shape != shape
+                or field.dtype != dtype
+            ):
+                raise _SchemaMismatchError()
+            out_array[i] = field
+        return out
+    elif kind == 'dict':
+        keys = schema[1].keys()
+        if not all(isinstance(d, Mapping) and d.keys() == keys for d in batch):
+            raise _SchemaMismatchError()
+        return {
+            key: _collate_by_schema(field_schema, [d[key] for d in batch])
+            for key, field_schema in schema[1].items()
+        }
+    elif kind == 'list':
+        field_schemas = schema[1]
+        if not all(len(sample) == len(field_schemas) for sample in batch):
+            raise _SchemaMismatchError()
+        return [
+            _collate_by_schema(field_schema, fields)
+            for field_schema, fields in zip(field_schemas, zip(*batch))
+        ]
+    return default_collate_fn(batch)
+
+
+class _SchemaCollateFn:
+    """
+    Batch collating function used by :code:`paddle.io.DataLoader` when
+    :attr:`collate_fn` is not set, it returns the same batch data as
+    :code:`default_collate_fn` except that numpy array fields are
+    returned as LoDTensor.
+
+    The batch schema (data structure, shape and dtype of every numpy array
+    field) is taken from the first sample of each batch, so the shapes may
+    change between batches, e.g. with a bucketing batch sampler. A batch
+    matching the schema is collated by writing each sample into a LoDTensor
+    allocated with the batch shape, which removes the intermediate
+    :code:`np.stack` result and the copy from it into LoDTensor. Batches
+    whose samples do not share the schema fall back to
+    :code:`default_collate_fn`, and after :code:`max_misses` such batches
+    in a row the schema path is disabled.
+    """
+
+    def __init__(self, max_misses=3):
+        self._max_misses = max_misses
+        self._misses = 0
+
+    def __call__(self, batch):
+        if self._misses >= self._max_misses:
+            return default_collate_fn(batch)
+        try:
+            out = _collate_by_schema(_build_schema(batch[0]), batch)
+        except _SchemaMismatchError:
+            self._misses += 1
+            return default_collate_fn(batch)
+        self._misses = 0
+        return out
+
+
 def default_convert_fn(batch):
     """
     Default batch converting function for :code:`paddle.io.DataLoader`.
@@ -43,7 +43,11 @@ from ..multiprocess_utils import (
 )
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .batch_sampler import _InfiniteIterableSampler
-from .collate import default_collate_fn, default_convert_fn
+from .collate import (
+    _SchemaCollateFn,
+    default_collate_fn,
+    default_convert_fn,
+)
 from .worker import (
     ParentWatchDog,
     get_worker_info,
@@ -119,7 +123,15 @@ class _DataLoaderIterBase:
 
         self._sampler_iter = iter(self._index_sampler)
         if self._auto_collate_batch:
-            self._collate_fn = loader.collate_fn or default_collate_fn
+            if loader.collate_fn is not None:
+                self._collate_fn = loader.collate_fn
+            elif self._num_workers == 0 or self._use_shared_memory:
+                # LoDTensor not in shared memory is not serializable, so
+                # only collate to LoDTensor directly in main process or
+                # in workers with shared memory
+                self._collate_fn = _SchemaCollateFn()
+            else:
+                self._collate_fn = default_collate_fn
         else:
             self._collate_fn = loader.collate_fn or default_convert_fn
 
@@ -36,7 +36,12 @@ def _flatten_batch(batch):
             for field in batch:
                 if isinstance(
                     field,
-                    (np.ndarray, paddle.Tensor, paddle.fluid.core.eager.Tensor),
+                    (
+                        np.ndarray,
+                        paddle.Tensor,
+                        paddle.fluid.core.eager.Tensor,
+                        paddle.fluid.core.LoDTensor,
+                    ),
                 ):
                     structure.append('{}{}'.format(FIELD_PREFIX, field_idx))
                     flat_batch.append(field)
@@ -59,7 +64,12 @@ def _flatten_batch(batch):
             for k, field in batch.items():
                 if isinstance(
                     field,
-                    (np.ndarray, paddle.Tensor, paddle.fluid.core.eager.Tensor),
+                    (
+                        np.ndarray,
+                        paddle.Tensor,
+                        paddle.fluid.core.eager.Tensor,
+                        paddle.fluid.core.LoDTensor,
+                    ),
                 ):
                     structure[k] = '{}{}'.format(FIELD_PREFIX, field_idx)
                     flat_batch.append(field)
@@ -382,6 +382,8 @@ def _worker_loop(
                     tensor_list = [
                         numpy2lodtensor(b)
                         if isinstance(b, np.ndarray)
+                        else b
+                        if isinstance(b, core.LoDTensor)
                         else b.value().get_tensor()
                         for b in batch
                     ]
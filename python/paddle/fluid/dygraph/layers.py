@@ -61,6 +61,9 @@ __all__ = ['Layer']
 _first_cap_re = re.compile('(.)([A-Z][a-z]+)')
 _all_cap_re = re.compile('([a-z])([A-Z])')
 
+# Sentinel for Layer.__getattr__, since parameters/buffers may be None.
+_MISSING = object()
+
 
 def _scope_dist2single(dist_scope):
     mapping = {
@@ -105,6 +108,59 @@ class HookRemoveHelper:
             del hooks[self._hook_id]
 
 
+class _HookDict(collections.OrderedDict):
+    """
+    An OrderedDict holding the forward hooks of a Layer.
+
+    It caches its values as a tuple so that ``Layer.__call__`` does not walk
+    the OrderedDict on every call. The cache is dropped on every mutation,
+    including the ones made directly on ``_forward_pre_hooks`` and
+    ``_forward_post_hooks`` outside of the ``register_*`` methods.
+    """
+
+    _hooks = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._hooks = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._hooks = None
+
+    def pop(self, *args):
+        self._hooks = None
+        return super().pop(*args)
+
+    def popitem(self, last=True):
+        self._hooks = None
+        return super().popitem(last)
+
+    def setdefault(self, key, default=None):
+        self._hooks = None
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._hooks = None
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self._hooks = None
+        super().clear()
+
+    def move_to_end(self, key, last=True):
+        self._hooks = None
+        super().move_to_end(key, last)
+
+    def hooks(self):
+        # NOTE: return a snapshot, so hooks that remove themselves while
+        # running (e.g. set_op_customized_attrs_post_hook) are safe.
+        hooks = self._hooks
+        if hooks is None:
+            hooks = self._hooks = tuple(self.values())
+        return hooks
+
+
 class Layer:
     """
     Dynamic graph Layer based on OOD, includes the parameters of the layer, the structure of the forward graph and so on.
@@ -166,8 +222,8 @@ class Layer:
         self._op_recorder = LayerOpsRecoder(ops=[], hooks=[])
         self._customized_attrs = {}
 
-        self._forward_pre_hooks = collections.OrderedDict()
-        self._forward_post_hooks = collections.OrderedDict()
+        self._forward_pre_hooks = _HookDict()
+        self._forward_post_hooks = _HookDict()
 
         self._casted_by_pure_fp16 = False
 
@@ -969,7 +1025,7 @@ class Layer:
         pass
 
     def _dygraph_call_func(self, *inputs, **kwargs):
-        for forward_pre_hook in self._forward_pre_hooks.values():
+        for forward_pre_hook in self._forward_pre_hooks.hooks():
             hook_result = forward_pre_hook(self, inputs)
             if hook_result is not None:
                 if not isinstance(hook_result, tuple):
@@ -1001,7 +1057,7 @@ class Layer:
         else:
             outputs = self.forward(*inputs, **kwargs)
 
-        for forward_post_hook in self._forward_post_hooks.values():
+        for forward_post_hook in self._forward_post_hooks.hooks():
             hook_result = forward_post_hook(self, inputs, outputs)
             if hook_result is not None:
                 outputs = hook_result
@@ -1009,13 +1065,15 @@ class Layer:
         return outputs
 
     def __call__(self, *inputs, **kwargs):
+        # NOTE: the cheap attribute checks go first so the common case
+        # does not pay for the global mode queries.
         if (
-            (not in_declarative_mode())
-            and (not self._forward_pre_hooks)
+            (not self._forward_pre_hooks)
             and (not self._forward_post_hooks)
             and (not self._built)
             and in_dygraph_mode()
             and (not in_profiler_mode())
+            and (not in_declarative_mode())
         ):
             self._build_once(*inputs, **kwargs)
             return self.forward(*inputs, **kwargs)
@@ -1220,24 +1278,36 @@ class Layer:
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        # NOTE: Layers pickled by older versions hold plain OrderedDicts.
+        for hooks_name in ('_forward_pre_hooks', '_forward_post_hooks'):
+            hooks = self.__dict__.get(hooks_name, None)
+            if hooks is not None and not isinstance(hooks, _HookDict):
+                self.__dict__[hooks_name] = _HookDict(hooks)
 
     def __getattr__(self, name):
-        if '_parameters' in self.__dict__:
-            _parameters = self.__dict__['_parameters']
-            if name in self._parameters:
+        # NOTE: __getattr__ is only reached when the normal lookup fails, which
+        # is the case for every parameter, buffer and sublayer access, so keep
+        # it to a single __dict__ fetch and one dict lookup per container.
+        layer_dict = self.__dict__
+        _parameters = layer_dict.get('_parameters', None)
+        if _parameters is not None:
+            param = _parameters.get(name, _MISSING)
+            if param is not _MISSING:
                 if in_declarative_mode():
-                    return _convert_into_variable(self._parameters[name])
-                return self._parameters[name]
-        if '_sub_layers' in self.__dict__:
-            _sub_layers = self.__dict__['_sub_layers']
-            if name in self._sub_layers:
-                return self._sub_layers[name]
-        if '_buffers' in self.__dict__:
-            _buffers = self.__dict__['_buffers']
-            if name in _buffers:
+                    return _convert_into_variable(param)
+                return param
+        _sub_layers = layer_dict.get('_sub_layers', None)
+        if _sub_layers is not None:
+            sublayer = _sub_layers.get(name, _MISSING)
+            if sublayer is not _MISSING:
+                return sublayer
+        _buffers = layer_dict.get('_buffers', None)
+        if _buffers is not None:
+            buffer = _buffers.get(name, _MISSING)
+            if buffer is not _MISSING:
                 if in_declarative_mode():
-                    return _convert_into_variable(_buffers[name])
-                return _buffers[name]
+                    return _convert_into_variable(buffer)
+                return buffer
         return object.__getattribute__(self, name)
 
     def __setattr__(self, name, value):
@@ -166,6 +166,49 @@ class TestParallelTunerTrain(unittest.TestCase):
         flag = True
         self.assertTrue(flag)
 
+    def test_tune_with_successive_halving(self):
+        set_default_distributed_context(DistributedContext())
+        (
+            train_program,
+            start_program,
+            dataloader,
+            loss,
+            optimizer,
+            feed_vars,
+            fetch_vars,
+        ) = get_program_v3()
+        cluster = Cluster()
+        cluster.gen_default_config_cluster(node_count=1, device_count=8)
+        dist_context = DistributedContext(
+            train_program,
+            start_program,
+            optimizer,
+            loss,
+            feed_vars,
+            fetch_vars,
+            cluster,
+        )
+        dist_context.initialize()
+        parallel_tuner = ParallelTuner(
+            dist_context,
+            max_trials=3,
+            mode="train",
+            algorithm="successive_halving",
+            algorithm_configs={"num_configs": 4, "eta": 2},
+        )
+        budgets = []
+        evaluate_point = parallel_tuner._evaluate_point
+
+        def record_budget(point, budget):
+            budgets.append(budget)
+            return evaluate_point(point, budget)
+
+        parallel_tuner._evaluate_point = record_budget
+        parallel_tuner.tune()
+        # max_trials is counted in full budget, so a bracket is finished
+        self.assertIn(1.0, budgets)
+        self.assertLessEqual(sum(budgets), 3.0 + 1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from paddle.distributed.auto_parallel.tuner import search_algorithms as sa
+from paddle.distributed.auto_parallel.tuner import tunable_space as ts
+
+
+def build_space():
+    space = ts.TunableSpace()
+    space.choice("a", [1, 2, 4, 8], default=1)
+    space.choice("b", [1, 2, 4, 8], default=1)
+    space.int_range("c", start=0, stop=6, default=0)
+    space.boolean("d")
+    space.fixed("e", default=3)
+    return space
+
+
+def cost(values, budget=1.0):
+    # minimized at a=4, b=2, c=3, d=True, and noisy with a low budget
+    noise = 0.5 * (1.0 - budget) * (values["c"] % 2)
+    return (
+        abs(values["a"] - 4)
+        + abs(values["b"] - 2)
+        + abs(values["c"] - 3)
+        + (0 if values["d"] else 1)
+        + noise
+    )
+
+
+def run(searcher, max_trials, batch_size=4, cost=cost):
+    best = float("inf")
+    num_trials = 0
+    while num_trials < max_trials:
+        asked = searcher.ask(batch_size)
+        if not asked:
+            break
+        num_trials += len(asked)
+        results = [
+            (point, budget, cost(searcher.values(point), budget))
+            for point, budget in asked
+        ]
+        searcher.tell(results)
+        best = min([best] + [c for _, b, c in results if b >= 1.0])
+    return best, num_trials
+
+
+class TestSearchAlgorithms(unittest.TestCase):
+    def test_values(self):
+        searcher = sa.new_search_algorithm("random", build_space(), seed=1)
+        self.assertEqual(
+            searcher.values((2, 1, 3, 0, 0)),
+            {"a": 4, "b": 2, "c": 3, "d": True, "e": 3},
+        )
+
+    def test_random_exhausted(self):
+        space = ts.TunableSpace()
+        space.choice("a", [1, 2, 3])
+        searcher = sa.new_search_algorithm(
+            "random", space, seed=1, max_collisions=100
+        )
+        best, num_trials = run(searcher, 10, cost=lambda v, b: v["a"])
+        self.assertEqual(num_trials, 3)
+        self.assertEqual(best, 1)
+        self.assertEqual(searcher.ask(1), [])
+
+    def test_evolutionary(self):
+        searcher = sa.new_search_algorithm(
+            "evolutionary", build_space(), seed=2022, population_size=8
+        )
+        best, _ = run(searcher, 100)
+        self.assertLessEqual(best, 1)
+
+    def test_tpe(self):
+        searcher = sa.new_search_algorithm("tpe", build_space(), seed=2022)
+        best, _ = run(searcher, 60)
+        self.assertLessEqual(best, 1)
+
+    def test_successive_halving(self):
+        searcher = sa.new_search_algorithm(
+            "successive_halving", build_space(), seed=2022, num_configs=27
+        )
+        budgets = []
+        for _ in range(4):
+            asked = searcher.ask(30)
+            budgets.append((len(asked), asked[0][1]))
+            searcher.tell(
+                [(p, b, cost(searcher.values(p), b)) for p, b in asked]
+            )
+        self.assertEqual(len(budgets), 4)
+        for (num, budget), (expected_num, expected_budget) in zip(
+            budgets, [(27, 1.0 / 27), (9, 1.0 / 9), (3, 1.0 / 3), (1, 1.0)]
+        ):
+            self.assertEqual(num, expected_num)
+            self.assertAlmostEqual(budget, expected_budget)
+        # the next bracket
+        self.assertEqual(len(searcher.ask(30)), 27)
+
+    def test_successive_halving_small_space(self):
+        # the last point left is promoted to the full budget
+        space = ts.TunableSpace()
+        space.choice("a", [1, 2])
+        searcher = sa.new_search_algorithm(
+            "successive_halving", space, seed=2022, max_collisions=100
+        )
+        budgets = []
+        while True:
+            asked = searcher.ask(30)
+            if not asked:
+                break
+            budgets.append([b for _, b in asked])
+            searcher.tell([(p, b, searcher.values(p)["a"]) for p, b in asked])
+        self.assertEqual(len(budgets), 2)
+        self.assertAlmostEqual(budgets[0][0], 1.0 / 27)
+        self.assertEqual(budgets[1], [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -716,6 +716,91 @@ class TestHessianBatchFirst(unittest.TestCase):
         self.func_out_not_single()
 
 
+class TestJacobianEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.x = paddle.rand((3, 4), dtype='float32')
+        self.y = paddle.rand((3, 2), dtype='float32')
+        self.weight = paddle.rand((6, 5), dtype='float32')
+
+    def func(self, x, y):
+        return paddle.tanh(
+            paddle.matmul(paddle.concat((x, y), axis=1), self.weight)
+        )
+
+    def test_chunk(self):
+        # evaluated row by row
+        jac = paddle.incubate.autograd.Jacobian(
+            self.func, (self.x, self.y), is_batched=True
+        )
+        expected = np.stack([jac[:, i, :].numpy() for i in range(5)], 1)
+        for chunk_size, memory_budget in ((2, None), (3, None), (8, 600)):
+            jac = paddle.incubate.autograd.Jacobian(
+                self.func,
+                (self.x, self.y),
+                is_batched=True,
+                chunk_size=chunk_size,
+                memory_budget=memory_budget,
+            )
+            np.testing.assert_allclose(
+                jac[:, 1:, :].numpy(), expected[:, 1:, :], rtol=1e-5, atol=1e-6
+            )
+            np.testing.assert_allclose(
+                jac[:].numpy(), expected, rtol=1e-5, atol=1e-6
+            )
+
+    def test_by_columns(self):
+        # 10 rows are more than 7 columns
+        def func(x, y):
+            return paddle.tanh(x.unsqueeze(-1) * y.unsqueeze(-2))
+
+        def batched_func(x, y):
+            return func(x, y).reshape((x.shape[0], -1))
+
+        for is_batched, f, xs in (
+            (False, func, (self.weight[0, :], self.y[0, :])),
+            (True, batched_func, (self.y, self.weight[:3, :])),
+        ):
+            jac = paddle.incubate.autograd.Jacobian(f, xs, is_batched)
+            if is_batched:
+                expected = np.stack(
+                    [jac[:, i, :].numpy() for i in range(10)], 1
+                )
+            else:
+                expected = np.stack([jac[i, :].numpy() for i in range(10)], 0)
+
+            for mode in ('auto', 'columns'):
+                jac = paddle.incubate.autograd.Jacobian(
+                    f, xs, is_batched, mode=mode
+                )
+                # the rows are not evaluated one by one
+                jac._jacobian._evaluate = None
+                np.testing.assert_allclose(
+                    jac[:].numpy(), expected, rtol=1e-5, atol=1e-6
+                )
+
+            # evaluated by rows by default
+            jac = paddle.incubate.autograd.Jacobian(f, xs, is_batched)
+            jac._jacobian._evaluate_by_columns = None
+            np.testing.assert_allclose(
+                jac[:].numpy(), expected, rtol=1e-5, atol=1e-6
+            )
+
+        with self.assertRaises(ValueError):
+            paddle.incubate.autograd.Jacobian(func, xs, mode='forward')
+
+    def test_hessian_chunk(self):
+        def func(x):
+            return paddle.sum(paddle.tanh(x * x), axis=1, keepdim=True)
+
+        expected = paddle.incubate.autograd.Hessian(func, self.x, True)[:]
+        actual = paddle.incubate.autograd.Hessian(
+            func, self.x, is_batched=True, chunk_size=4
+        )[:]
+        np.testing.assert_allclose(
+            actual.numpy(), expected.numpy(), rtol=1e-5, atol=1e-6
+        )
+
+
 if __name__ == "__main__":
     np.random.seed(2022)
     unittest.main()
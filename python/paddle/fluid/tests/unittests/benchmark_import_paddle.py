@@ -0,0 +1,92 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the time taken by `import paddle` in a fresh interpreter, e.g.
+#
+#     python benchmark_import_paddle.py --repeat 5 --max-seconds 3.0
+#
+# It reports the median wall time, the number of imported modules and the
+# slowest top level packages reported by `python -X importtime`. With
+# --max-seconds it exits with a non-zero code when the median is above the
+# threshold, so it can be used to catch import time regressions.
+
+import argparse
+import collections
+import statistics
+import subprocess
+import sys
+
+_IMPORT_CODE = (
+    'import time, sys; start = time.perf_counter(); import paddle; '
+    'print(time.perf_counter() - start, len(sys.modules))'
+)
+
+
+def run_once():
+    out = subprocess.check_output(
+        [sys.executable, '-c', _IMPORT_CODE], universal_newlines=True
+    )
+    seconds, num_modules = out.strip().splitlines()[-1].split()
+    return float(seconds), int(num_modules)
+
+
+def slowest_packages(topk):
+    # `-X importtime` writes lines as: "import time: self | cumulative | name"
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import paddle'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    self_time = collections.Counter()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        fields = line[len('import time:') :].split('|')
+        if not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        if name.startswith('paddle.'):
+            name = '.'.join(name.split('.')[:2])
+        else:
+            name = name.split('.')[0]
+        self_time[name] += int(fields[0])
+    return self_time.most_common(topk)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--topk', type=int, default=15)
+    parser.add_argument('--max-seconds', type=float, default=None)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.repeat)]
+    median = statistics.median(r[0] for r in results)
+    print(
+        'import paddle: {:.3f} s (median of {}), {} modules'.format(
+            median, args.repeat, results[-1][1]
+        )
+    )
+    print('slowest packages (self time):')
+    for name, us in slowest_packages(args.topk):
+        print('  {:<40s}{:>10.1f} ms'.format(name, us / 1000.0))
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print('import paddle is slower than {:.3f} s'.format(args.max_seconds))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
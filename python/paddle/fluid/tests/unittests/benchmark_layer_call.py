@@ -0,0 +1,87 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro benchmark of the Python overhead of paddle.nn.Layer.__call__ and of
+# parameter/sublayer attribute lookups, e.g.
+#
+#     python benchmark_layer_call.py --iters 100000
+#
+# The forward of the benchmarked layers does no computation, so the reported
+# time is the per-call dispatch overhead only.
+
+import argparse
+import time
+
+import paddle
+
+
+class EmptyLayer(paddle.nn.Layer):
+    def forward(self, x):
+        return x
+
+
+class ParamLayer(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.w = self.create_parameter([1])
+        self.sub = EmptyLayer()
+
+    def forward(self, x):
+        self.w
+        self.sub
+        return x
+
+
+def noop_pre_hook(layer, input):
+    return None
+
+
+def noop_post_hook(layer, input, output):
+    return None
+
+
+def timeit(func, iters):
+    func()
+    start = time.perf_counter()
+    for _ in range(iters):
+        func()
+    return (time.perf_counter() - start) / iters * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iters', type=int, default=100000)
+    args = parser.parse_args()
+
+    paddle.disable_static()
+    x = paddle.ones([1])
+
+    plain = EmptyLayer()
+    hooked = EmptyLayer()
+    hooked.register_forward_pre_hook(noop_pre_hook)
+    hooked.register_forward_post_hook(noop_post_hook)
+    with_param = ParamLayer()
+
+    cases = [
+        ('forward only', lambda: plain.forward(x)),
+        ('__call__ without hooks', lambda: plain(x)),
+        ('__call__ with 2 hooks', lambda: hooked(x)),
+        ('__call__ with 2 attribute lookups', lambda: with_param(x)),
+    ]
+    for name, func in cases:
+        print('{:<36s}{:>10.3f} us/call'.format(name, timeit(func, args.iters)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of paddle.metric.Auc/Precision/Recall update + accumulate against
+# the former per-sample python loops, e.g.
+#
+#     python benchmark_metrics.py --sizes 1000000 10000000 --batch-size 65536
+#
+# The python loops are slow, --skip-loop-above skips them for large sizes.
+
+import argparse
+import time
+
+import numpy as np
+
+import paddle
+
+
+def loop_auc(preds, labels, num_thresholds=4095):
+    stat_pos = np.zeros(num_thresholds + 1)
+    stat_neg = np.zeros(num_thresholds + 1)
+    for i, lbl in enumerate(labels):
+        bin_idx = int(preds[i, 1] * num_thresholds)
+        if lbl:
+            stat_pos[bin_idx] += 1.0
+        else:
+            stat_neg[bin_idx] += 1.0
+    tot_pos, tot_neg, auc = 0.0, 0.0, 0.0
+    idx = num_thresholds
+    while idx >= 0:
+        tot_pos_prev, tot_neg_prev = tot_pos, tot_neg
+        tot_pos += stat_pos[idx]
+        tot_neg += stat_neg[idx]
+        auc += abs(tot_neg - tot_neg_prev) * (tot_pos + tot_pos_prev) / 2.0
+        idx -= 1
+    return auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+
+
+def loop_precision(preds, labels):
+    tp, fp = 0, 0
+    preds = np.floor(preds + 0.5).astype("int32")
+    for i in range(labels.shape[0]):
+        if preds[i] == 1:
+            if preds[i] == labels[i]:
+                tp += 1
+            else:
+                fp += 1
+    return float(tp) / (tp + fp) if tp + fp != 0 else 0.0
+
+
+def run_metric(metric, preds, labels, batch_size, to_tensor):
+    for start in range(0, len(labels), batch_size):
+        pred = preds[start : start + batch_size]
+        label = labels[start : start + batch_size]
+        if to_tensor:
+            pred, label = paddle.to_tensor(pred), paddle.to_tensor(label)
+        metric.update(pred, label)
+    return metric.accumulate()
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1000000, 10000000]
+    )
+    parser.add_argument('--batch-size', type=int, default=65536)
+    parser.add_argument('--skip-loop-above', type=int, default=1000000)
+    args = parser.parse_args()
+
+    paddle.disable_static()
+    for size in args.sizes:
+        preds = np.random.random((size, 2)).astype('float32')
+        labels = np.random.randint(2, size=(size, 1)).astype('int64')
+
+        cases = [
+            (
+                'Auc numpy',
+                lambda: run_metric(
+                    paddle.metric.Auc(), preds, labels, args.batch_size, False
+                ),
+            ),
+            (
+                'Auc on_device',
+                lambda: run_metric(
+                    paddle.metric.Auc(on_device=True),
+                    preds,
+                    labels,
+                    args.batch_size,
+                    True,
+                ),
+            ),
+            (
+                'Precision numpy',
+                lambda: run_metric(
+                    paddle.metric.Precision(),
+                    preds[:, 1:],
+                    labels,
+                    args.batch_size,
+                    False,
+                ),
+            ),
+        ]
+        if size <= args.skip_loop_above:
+            cases += [
+                ('Auc python loop', lambda: loop_auc(preds, labels)),
+                (
+                    'Precision python loop',
+                    lambda: loop_precision(preds[:, 1:], labels),
+                ),
+            ]
+
+        print('samples: {}'.format(size))
+        for name, func in cases:
+            seconds, result = timeit(func)
+            print(
+                '  {:<24s}{:>10.3f} s  result {:.6f}'.format(
+                    name, seconds, result
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
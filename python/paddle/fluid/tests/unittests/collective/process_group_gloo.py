@@ -180,6 +180,22 @@ class TestProcessGroupFp32(unittest.TestCase):
             assert np.array_equal(tensor_y, out2)
         print("test scatter api ok\n")
 
+        # test send and recv
+        x = np.random.random(self.shape).astype(self.dtype)
+        tensor_x = paddle.to_tensor(x)
+        tensor_y = paddle.zeros(self.shape, dtype=self.dtype)
+        if pg.rank() == 0:
+            # rank 0 sends x and receives 2 * x from rank 1
+            task = pg.send(tensor_x, 1, False)
+            pg.recv(tensor_y, 1, True)
+            task.wait()
+            np.testing.assert_array_equal(tensor_y, 2 * x)
+        else:
+            pg.recv(tensor_y, 0, True)
+            np.testing.assert_array_equal(tensor_y, x)
+            pg.send(tensor_y * 2, 0, True)
+        print("test send api ok\n")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 from collections import Counter
+from unittest import mock
 
 import numpy as np
 from test_fetch_feed import Linear, Pool2D
@@ -23,6 +26,11 @@ import paddle.fluid as fluid
 from paddle.jit import ProgramTranslator
 from paddle.jit.api import declarative
 from paddle.jit.dy2static import convert_to_static
+from paddle.jit.dy2static.origin_info import global_origin_info_map
+from paddle.jit.dy2static.program_translator import (
+    CACHE_DIR_ENV_NAME,
+    FunctionCache,
+)
 
 
 class TestCacheProgram(unittest.TestCase):
@@ -170,5 +178,44 @@ class TestToOutputWithCache(unittest.TestCase):
             self.assertEqual(ret.numpy(), 5050)
 
 
+class TestPersistentCodeCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(
+            os.environ, {CACHE_DIR_ENV_NAME: self.temp_dir.name}
+        )
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.temp_dir.cleanup()
+
+    def test_cache(self):
+        static_func = FunctionCache().convert_with_cache(sum_under_while)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        # A new FunctionCache (like a new process) loads the transformed
+        # code from disk without running the AST transformers.
+        function_cache = FunctionCache()
+        with mock.patch.object(
+            function_cache._dygraph_to_static,
+            'get_static_ast',
+            side_effect=AssertionError("should hit the persistent cache"),
+        ):
+            cached_func = function_cache.convert_with_cache(sum_under_while)
+
+        self.assertEqual(
+            paddle.jit.dy2static.utils.func_to_source_code(static_func),
+            paddle.jit.dy2static.utils.func_to_source_code(cached_func),
+        )
+        cached_file = cached_func.__code__.co_filename
+        self.assertTrue(
+            any(loc[0] == cached_file for loc in global_origin_info_map)
+        )
+        with fluid.dygraph.guard():
+            ret = declarative(sum_under_while)(100)
+            self.assertEqual(ret.numpy(), 5050)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,8 +10,12 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
+import io
+import sys
 import unittest
 
+import numpy as np
+
 import paddle.distributed.fleet as fleet
 
 
@@ -186,5 +190,53 @@ class TestMultiSlotDataGeneratorZip(unittest.TestCase):
         my_ms_dg.run_from_memory()
 
 
+class MyMultiSlotColumnsDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_columns(self, lines):
+        words = [[int(x) for x in line.split()] for line in lines]
+        return [
+            ("words", np.concatenate(words), [len(w) for w in words]),
+            ("label", np.array([len(w) / 2 for w in words]), [1] * len(words)),
+        ]
+
+
+class TestMultiSlotDataGeneratorColumns(unittest.TestCase):
+    def setUp(self):
+        self.lines = ["1 2 3\n", "4\n", "5 6\n"]
+
+    def test_gen_columns_str(self):
+        my_ms_dg = MyMultiSlotColumnsDataGenerator()
+        output = my_ms_dg._gen_columns_str(
+            my_ms_dg.generate_columns(self.lines)
+        )
+        self.assertEqual(output, "3 1 2 3 1 1.5\n1 4 1 0.5\n2 5 6 1 1.0\n")
+        self.assertEqual(
+            my_ms_dg._proto_info, [("words", "uint64"), ("label", "float")]
+        )
+
+        with self.assertRaises(ValueError):
+            my_ms_dg._gen_columns_str([("words", np.array([1, 2]), [2, 0])])
+        with self.assertRaises(ValueError):
+            my_ms_dg._gen_columns_str([("words", np.array([1, 2]), [1])])
+
+    def test_run_columns_from_stdin(self):
+        stdin, stdout = sys.stdin, sys.stdout
+        for num_workers in [1, 2]:
+            my_ms_dg = MyMultiSlotColumnsDataGenerator()
+            my_ms_dg.set_batch(2)
+            sys.stdin, sys.stdout = (
+                io.StringIO("".join(self.lines)),
+                io.StringIO(),
+            )
+            try:
+                my_ms_dg.run_columns_from_stdin(num_workers=num_workers)
+                output = sys.stdout.getvalue()
+            finally:
+                sys.stdin, sys.stdout = stdin, stdout
+            self.assertEqual(output, "3 1 2 3 1 1.5\n1 4 1 0.5\n2 5 6 1 1.0\n")
+            self.assertEqual(
+                my_ms_dg._proto_info, [("words", "uint64"), ("label", "float")]
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
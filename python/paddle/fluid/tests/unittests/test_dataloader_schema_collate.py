@@ -0,0 +1,127 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid import core
+from paddle.fluid.dataloader.collate import _SchemaCollateFn, default_collate_fn
+from paddle.io import DataLoader, Dataset
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([3, 8, 8]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return {'image': image, 'meta': [label, 'name', idx]}
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestSchemaCollateFn(unittest.TestCase):
+    def test_collate(self):
+        dataset = RandomDataset(8)
+        batch = [dataset[i] for i in range(4)]
+        collate_fn = _SchemaCollateFn()
+        out = collate_fn(batch)
+        expect = default_collate_fn(batch)
+
+        self.assertTrue(isinstance(out['image'], core.LoDTensor))
+        np.testing.assert_array_equal(np.array(out['image']), expect['image'])
+        np.testing.assert_array_equal(
+            np.array(out['meta'][0]), expect['meta'][0]
+        )
+        self.assertEqual(out['meta'][1], expect['meta'][1])
+        np.testing.assert_array_equal(out['meta'][2], expect['meta'][2])
+
+        out = collate_fn([dataset[i] for i in range(4, 8)])
+        np.testing.assert_array_equal(
+            np.array(out['meta'][0]).flatten(), np.arange(4, 8)
+        )
+
+    def test_shape_change_between_batches(self):
+        collate_fn = _SchemaCollateFn()
+        for length in [2, 4, 3]:
+            out = collate_fn(
+                [
+                    np.ones([length, 3], 'float32'),
+                    np.ones([length, 3], 'float32'),
+                ]
+            )
+            self.assertTrue(isinstance(out, core.LoDTensor))
+            self.assertEqual(out.shape(), [2, length, 3])
+
+    def test_schema_mismatch(self):
+        collate_fn = _SchemaCollateFn(max_misses=2)
+        mixed = [np.ones([2, 3], 'float32'), np.ones([2, 3], 'float64')]
+        for _ in range(2):
+            out = collate_fn(mixed)
+            self.assertTrue(isinstance(out, np.ndarray))
+            self.assertEqual(out.shape, (2, 2, 3))
+        # the schema path is disabled after max_misses mismatched batches
+        out = collate_fn([np.ones([2, 3], 'float32')] * 2)
+        self.assertTrue(isinstance(out, np.ndarray))
+
+    def test_extra_keys(self):
+        collate_fn = _SchemaCollateFn()
+        collate_fn([{'x': np.ones([3], 'float32')}] * 2)
+        out = collate_fn([{'x': np.ones([3], 'float32'), 'y': 1}] * 2)
+        self.assertEqual(sorted(out.keys()), ['x', 'y'])
+        np.testing.assert_array_equal(out['y'], [1, 1])
+
+        # samples with different keys fall back to default_collate_fn
+        batch = [
+            {'x': np.ones([3], 'float32')},
+            {'x': np.ones([3], 'float32'), 'y': 1},
+        ]
+        out = collate_fn(batch)
+        self.assertTrue(isinstance(out['x'], np.ndarray))
+        self.assertEqual(list(out.keys()), ['x'])
+
+
+class TestDataLoaderWithSchemaCollate(unittest.TestCase):
+    def run_main(self, num_workers):
+        paddle.disable_static(paddle.CPUPlace())
+        dataset = RandomDataset(16)
+        loader = DataLoader(dataset, batch_size=4, num_workers=num_workers)
+        for i, data in enumerate(loader):
+            expect = default_collate_fn(
+                [dataset[j] for j in range(i * 4, i * 4 + 4)]
+            )
+            np.testing.assert_array_equal(
+                data['image'].numpy(), expect['image']
+            )
+            np.testing.assert_array_equal(
+                data['meta'][0].numpy(), expect['meta'][0]
+            )
+
+    def test_single_process(self):
+        self.run_main(0)
+
+    def test_multi_process(self):
+        # DataLoader with multi-process mode is not supported on MacOs and Windows currently
+        if sys.platform != 'darwin' and sys.platform != 'win32':
+            self.run_main(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
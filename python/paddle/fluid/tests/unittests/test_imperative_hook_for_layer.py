@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import unittest
 
 import numpy as np
 from test_imperative_lod_tensor_to_selected_rows import SimpleNet
 
+import paddle
 import paddle.fluid as fluid
 import paddle.fluid.core as core
 import paddle.fluid.dygraph.base as base
@@ -218,5 +220,68 @@ class Test_Forward_Hook(unittest.TestCase):
         self.func_forward_hook_return_value()
 
 
+class TestLayerCallHooksCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.x = paddle.ones([2, 4], dtype='float32')
+
+    def tearDown(self):
+        paddle.enable_static()
+
+    def test_direct_mutation(self):
+        linear = paddle.nn.Linear(4, 4)
+        base_out = linear(self.x).numpy()
+        helper = linear.register_forward_post_hook(forward_post_hook1)
+        np.testing.assert_allclose(linear(self.x).numpy(), base_out * 2)
+        # modify the hooks without going through HookRemoveHelper
+        del linear._forward_post_hooks[helper._hook_id]
+        np.testing.assert_allclose(linear(self.x).numpy(), base_out)
+
+    def test_move_to_end(self):
+        linear = paddle.nn.Linear(4, 4)
+        base_out = linear(self.x).numpy()
+        linear.register_forward_post_hook(forward_post_hook1)
+        helper = linear.register_forward_post_hook(
+            lambda layer, input, output: output + 1
+        )
+        np.testing.assert_allclose(linear(self.x).numpy(), base_out * 2 + 1)
+        linear._forward_post_hooks.move_to_end(helper._hook_id, last=False)
+        np.testing.assert_allclose(
+            linear(self.x).numpy(), (base_out + 1) * 2, rtol=1e-6
+        )
+
+    def test_hook_removes_itself(self):
+        linear = paddle.nn.Linear(4, 4)
+        helpers = []
+
+        def remove_hooks(layer, input, output):
+            for helper in helpers:
+                helper.remove()
+
+        helpers.append(linear.register_forward_post_hook(remove_hooks))
+        helpers.append(linear.register_forward_post_hook(forward_post_hook1))
+        linear(self.x)
+        self.assertEqual(len(linear._forward_post_hooks), 0)
+
+    def test_getattr(self):
+        layer = paddle.nn.Layer()
+        layer.add_parameter('w', None)
+        layer.register_buffer('buf', None)
+        self.assertIsNone(layer.w)
+        self.assertIsNone(layer.buf)
+        with self.assertRaises(AttributeError):
+            layer.not_exist
+
+    def test_copy(self):
+        linear = paddle.nn.Linear(4, 4)
+        base_out = linear(self.x).numpy()
+        linear.register_forward_post_hook(forward_post_hook1)
+        linear(self.x)
+        copied = copy.deepcopy(linear)
+        del linear._forward_post_hooks[next(iter(linear._forward_post_hooks))]
+        np.testing.assert_allclose(linear(self.x).numpy(), base_out)
+        np.testing.assert_allclose(copied(self.x).numpy(), base_out * 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -470,6 +470,75 @@ class TestSaveInferenceModelNew(unittest.TestCase):
             None,
         )
 
+    def test_save_and_load_persistables_by_tensor(self):
+        program, init_program = Program(), Program()
+        with program_guard(program, init_program):
+            x = paddle.static.data(name='x', shape=[None, 2], dtype='float32')
+            y = paddle.static.nn.fc(x, 3)
+            y = paddle.static.nn.fc(y, 1)
+
+        place = core.CPUPlace()
+        exe = executor.Executor(place)
+        exe.run(init_program)
+        params = sorted(p.name for p in program.all_parameters())
+        values = {
+            name: np.array(fluid.global_scope().find_var(name).get_tensor())
+            for name in params
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path_prefix = os.path.join(temp_dir, 'model')
+            paddle.static.save_inference_model(
+                path_prefix, [x], [y], exe, program=program, save_index=True
+            )
+            params_path = path_prefix + '.pdiparams'
+            # the same format as serialize_persistables
+            self.assertEqual(
+                paddle.static.load_from_file(params_path),
+                paddle.static.serialize_persistables(
+                    [x], [y], exe, program=program
+                ),
+            )
+            self.assertTrue(os.path.exists(params_path + '.index'))
+
+            def check_load(names):
+                scope = core.Scope()
+                with fluid.scope_guard(scope):
+                    paddle.static.load_inference_model(
+                        path_prefix, exe, params_names=names
+                    )
+                for name in names or params:
+                    np.testing.assert_array_equal(
+                        np.array(scope.find_var(name).get_tensor()),
+                        values[name],
+                    )
+                if names is not None:
+                    for name in set(params) - set(names):
+                        self.assertIsNone(scope.find_var(name))
+
+            check_load(None)
+            check_load(params[:1])
+
+            # the index of an earlier save is removed
+            paddle.static.save_inference_model(
+                path_prefix, [x], [y], exe, program=program
+            )
+            self.assertFalse(os.path.exists(params_path + '.index'))
+            check_load(params[-1:])
+
+            # the index is ignored if it does not match the file
+            paddle.static.save_inference_model(
+                path_prefix, [x], [y], exe, program=program, save_index=True
+            )
+            with open(params_path, 'ab') as f:
+                f.write(b'\0')
+            check_load(params[-1:])
+
+            with self.assertRaises(ValueError):
+                paddle.static.load_inference_model(
+                    path_prefix, exe, params_names=['not_a_param']
+                )
+
     def test_normalize_program(self):
         init_program = fluid.default_startup_program()
         program = fluid.default_main_program()
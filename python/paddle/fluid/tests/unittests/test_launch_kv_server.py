@@ -0,0 +1,93 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import time
+import unittest
+
+from paddle.distributed.launch.utils.kv_client import KVClient
+from paddle.distributed.launch.utils.kv_server import KVServer
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+class TestKVServer(unittest.TestCase):
+    def setUp(self):
+        port = get_free_port()
+        self.server = KVServer(port)
+        self.server.start()
+        self.client = KVClient("127.0.0.1:{}".format(port))
+        self.assertTrue(self.client.wait_server_ready(timeout=10))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_put_get_delete(self):
+        data = {"/workers/1": "rank1", "/workers/2": "rank2", "/w": "other"}
+        for k, v in data.items():
+            self.assertTrue(self.client.put(k, v))
+        self.assertEqual(
+            self.client.get_prefix("/workers"),
+            {"/workers/1": "rank1", "/workers/2": "rank2"},
+        )
+        self.assertEqual(self.client.get("/w"), "other")
+        self.assertTrue(self.client.delete("/workers/1"))
+        self.assertFalse(self.client.delete("/workers/1"))
+        self.assertEqual(
+            self.client.get_prefix("/workers"), {"/workers/2": "rank2"}
+        )
+        self.assertEqual(self.server.sorted_keys, sorted(self.server.kv))
+
+    def test_wait_prefix(self):
+        self.client.put("/peers/a", "0")
+
+        def put_later():
+            time.sleep(0.5)
+            KVClient(self.client.endpoint).put("/peers/b", "1")
+
+        thread = threading.Thread(target=put_later)
+        thread.start()
+        ret = self.client.wait_prefix("/peers", 2, timeout=10)
+        thread.join()
+        self.assertEqual(ret, {"/peers/a": "0", "/peers/b": "1"})
+
+        # returns the partial result when timeout
+        start = time.time()
+        ret = self.client.wait_prefix("/peers", 3, timeout=0.5)
+        self.assertGreaterEqual(time.time() - start, 0.5)
+        self.assertEqual(len(ret), 2)
+
+    def test_watch_prefix(self):
+        ret, revision = self.client.watch_prefix("/job", -1)
+        self.assertEqual(ret, {})
+
+        def put_later():
+            time.sleep(0.5)
+            KVClient(self.client.endpoint).put("/job/status", "done")
+
+        thread = threading.Thread(target=put_later)
+        thread.start()
+        ret, new_revision = self.client.watch_prefix("/job", revision)
+        thread.join()
+        self.assertEqual(ret, {"/job/status": "done"})
+        self.assertGreater(new_revision, revision)
+
+
+if __name__ == '__main__':
+    unittest.main()
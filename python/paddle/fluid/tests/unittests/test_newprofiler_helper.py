@@ -14,6 +14,8 @@
 
 import unittest
 
+import numpy as np
+
 import paddle.profiler.statistic_helper as statistic_helper
 
 
@@ -130,6 +132,55 @@ class TestStatisticHelper(unittest.TestCase):
         dst = statistic_helper.subtract_ranges(src1, src2)
         self.assertEqual(dst, [(10, 11)])
 
+    def test_union_ranges(self):
+        src = [(5, 12), (1, 1), (2, 3), (4, 7), (3, 3)]
+        starts, ends = statistic_helper.list_to_ranges(src)
+        dst = statistic_helper.ranges_to_list(
+            *statistic_helper.union_ranges(starts, ends)
+        )
+        self.assertEqual(dst, statistic_helper.merge_self_ranges(src))
+        self.assertEqual(dst, [(1, 1), (2, 3), (4, 12)])
+        starts, ends = statistic_helper.list_to_ranges([])
+        self.assertEqual(
+            statistic_helper.ranges_to_list(
+                *statistic_helper.union_ranges(starts, ends)
+            ),
+            [],
+        )
+
+    def test_intersect_ranges(self):
+        src1 = [(1, 7), (9, 9), (14, 18), (20, 20)]
+        src2 = [(3, 8), (9, 13), (15, 15), (17, 20)]
+        dst = statistic_helper.ranges_to_list(
+            *statistic_helper.intersect_ranges(
+                *statistic_helper.list_to_ranges(src1),
+                *statistic_helper.list_to_ranges(src2),
+            )
+        )
+        self.assertEqual(
+            dst, statistic_helper.intersection_ranges(src1, src2, True)
+        )
+        self.assertEqual(dst, [(3, 7), (9, 9), (15, 15), (17, 18)])
+
+    def test_group_by(self):
+        groups = statistic_helper.GroupBy([5, 3, 5, 7, 3, 5])
+        self.assertEqual(groups.keys.tolist(), [5, 3, 7])
+        self.assertEqual(groups.first.tolist(), [0, 1, 3])
+        self.assertEqual(groups.inverse.tolist(), [0, 1, 0, 2, 1, 0])
+        values = np.array([1, 2, 3, 4, 5, 6])
+        self.assertEqual(groups.count().tolist(), [3, 2, 1])
+        self.assertEqual(groups.sum(values).tolist(), [10, 7, 4])
+        self.assertEqual(groups.max(values).tolist(), [6, 5, 4])
+        self.assertEqual(groups.min(values).tolist(), [1, 2, 4])
+        groups = statistic_helper.GroupBy([])
+        self.assertEqual(groups.size, 0)
+        self.assertEqual(groups.sum([]).tolist(), [])
+
+    def test_ragged_arange(self):
+        index, owner = statistic_helper.ragged_arange([3, 0, 7], [2, 0, 3])
+        self.assertEqual(index.tolist(), [3, 4, 7, 8, 9])
+        self.assertEqual(owner.tolist(), [0, 0, 2, 2, 2])
+
 
 if __name__ == '__main__':
     unittest.main()
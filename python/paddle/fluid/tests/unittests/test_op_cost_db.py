@@ -0,0 +1,145 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+
+import paddle
+import paddle.distributed.auto_parallel.cost as auto_parallel_cost
+from paddle.cost_model import CostModel, OpCostDB
+
+
+class TestOpCostDB(unittest.TestCase):
+    def setUp(self):
+        self.db = OpCostDB()
+        self.db.add('abs', [('float32', [16, 128])], 1.0, 2.0)
+        self.db.add('abs', [('float32', [16, 512])], 3.0, 6.0)
+        self.db.add('abs', [('float16', [16, 128])], 0.5)
+
+    def test_query(self):
+        self.assertEqual(self.db.query('abs', [('float32', [16, 128])]), 1.0)
+        self.assertEqual(
+            self.db.query('abs', [(paddle.float32, [16, 512])], forward=False),
+            6.0,
+        )
+        # interpolated and extrapolated by the number of elements
+        self.assertAlmostEqual(
+            self.db.query('abs', [('float32', [16, 256])]), 5.0 / 3
+        )
+        self.assertAlmostEqual(
+            self.db.query('abs', [('float32', [32, 512])]), 6.0
+        )
+        self.assertAlmostEqual(
+            self.db.query('abs', [('float32', [16, 64])]), 0.5
+        )
+        self.assertIsNone(self.db.query('abs', [('float32', [16])]))
+        self.assertIsNone(
+            self.db.query('abs', [('float16', [16, 128])], forward=False)
+        )
+        self.assertIsNone(self.db.query('relu', [('float32', [16, 128])]))
+
+        desc = {
+            'op': 'abs_grad',
+            'inputs': OrderedDict(X=[(paddle.float32, [16, 128])]),
+        }
+        self.assertEqual(self.db.query_desc(desc), 2.0)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'db', 'op_cost.json')
+            self.db.save(path)
+            db = OpCostDB.load(path)
+        self.assertEqual(len(db), 3)
+        self.assertIn(('abs', [('float16', [16, 128])]), db)
+        self.assertAlmostEqual(
+            db.query('abs', [('float32', [16, 256])], forward=False), 10.0 / 3
+        )
+
+    def test_measure(self):
+        forward_time, backward_time = self.db.measure(
+            'relu',
+            paddle.nn.functional.relu,
+            [('float32', [8, 16])],
+            repeat=3,
+            warmup=1,
+            backward=True,
+        )
+        self.assertGreater(forward_time, 0)
+        self.assertGreater(backward_time, 0)
+        self.assertEqual(
+            self.db.query('relu', [('float32', [8, 16])]), forward_time
+        )
+
+    def test_comp_op_cost(self):
+        desc = {
+            'op': 'elementwise_add',
+            'inputs': OrderedDict(
+                X=[(paddle.float32, [16, 128])], Y=[(paddle.float32, [16, 128])]
+            ),
+            'outputs': OrderedDict(Out=[(paddle.float32, [16, 128])]),
+            'attrs': {},
+        }
+        self.db.add(
+            'elementwise_add',
+            [('float32', [16, 128]), ('float32', [16, 128])],
+            4.0,
+        )
+        op_cost_class = auto_parallel_cost._g_op_cost_factory['elementwise_add']
+        self.assertEqual(op_cost_class(op_desc=desc).time, 0)
+        auto_parallel_cost.set_op_cost_db(self.db)
+        try:
+            self.assertEqual(op_cost_class(op_desc=desc).time, 4.0)
+        finally:
+            auto_parallel_cost.set_op_cost_db(None)
+
+
+class TestStaticOpCostIndex(unittest.TestCase):
+    def test_get_static_op_time(self):
+        cost_model = CostModel()
+        records = cost_model.static_cost_data()
+        for op_name in ['abs', 'conv2d', 'cast', 'histogram']:
+            for dtype in ['float32', 'float16', 'int32']:
+                for forward in [True, False]:
+                    # the former linear scan
+                    expected = {}
+                    for op_data in records:
+                        if (
+                            op_data['op'] == op_name
+                            and dtype in op_data['config']
+                        ):
+                            expected['op_time'] = op_data[
+                                'paddle_gpu_time'
+                                if forward
+                                else 'paddle_gpu_time_backward'
+                            ]
+                            expected['config'] = op_data['config']
+                    self.assertEqual(
+                        cost_model.get_static_op_time(
+                            op_name, forward=forward, dtype=dtype
+                        ),
+                        expected,
+                    )
+
+        db = cost_model.static_op_cost_db()
+        self.assertGreater(len(db), 0)
+        self.assertAlmostEqual(
+            db.query('abs', [('float32', [16, 128, 257, 257])]),
+            1.3211645008562505,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
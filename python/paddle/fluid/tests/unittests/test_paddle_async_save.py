@@ -0,0 +1,106 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+
+
+class TestAsyncSave(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        paddle.clear_async_save_task_queue()
+        self.temp_dir.cleanup()
+
+    def test_snapshot(self):
+        layer = paddle.nn.Linear(10, 10)
+        state_dict = layer.state_dict()
+        expected = {k: v.numpy() for k, v in state_dict.items()}
+        path = os.path.join(self.temp_dir.name, 'linear.pdparams')
+
+        future = paddle.async_save(state_dict, path)
+        # updating parameters after async_save returns must not change
+        # the saved checkpoint
+        for param in layer.parameters():
+            param.set_value(np.zeros(param.shape, dtype='float32'))
+        future.result()
+
+        self.assertFalse(os.path.exists(path + '.tmp'))
+        load_dict = paddle.load(path)
+        for key, value in expected.items():
+            np.testing.assert_array_equal(load_dict[key].numpy(), value)
+            self.assertEqual(load_dict[key].name, state_dict[key].name)
+
+    def test_many_tasks(self):
+        paths = []
+        for i in range(5):
+            path = os.path.join(
+                self.temp_dir.name, 'step_{}.pdtensor'.format(i)
+            )
+            paddle.async_save(
+                {'step': paddle.full([3], i, dtype='int64')},
+                path,
+                max_inflight=1,
+            )
+            paths.append(path)
+        paddle.clear_async_save_task_queue()
+        for i, path in enumerate(paths):
+            np.testing.assert_array_equal(
+                paddle.load(path)['step'].numpy(), np.full([3], i)
+            )
+
+    def test_mmap_format(self):
+        path = os.path.join(self.temp_dir.name, 'obj.pdparams')
+        obj = {'w': paddle.randn([4, 4]), 'epoch': 1}
+        paddle.async_save(obj, path, use_mmap_format=True).result()
+        load_obj = paddle.load(path, mmap=True)
+        np.testing.assert_array_equal(load_obj['w'].numpy(), obj['w'].numpy())
+        self.assertEqual(load_obj['epoch'], 1)
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            paddle.async_save({'w': paddle.ones([2])}, BytesIO())
+        with self.assertRaises(ValueError):
+            paddle.async_save(
+                {'w': paddle.ones([2])},
+                os.path.join(self.temp_dir.name, 'w'),
+                max_inflight=0,
+            )
+        with self.assertRaises(ValueError):
+            paddle.async_save(
+                {'w': paddle.ones([2])},
+                os.path.join(self.temp_dir.name, 'w'),
+                unknown_config=True,
+            )
+
+        # errors raised in the background thread are propagated
+        future = paddle.async_save(
+            paddle.nn.Linear(2, 2), os.path.join(self.temp_dir.name, 'layer')
+        )
+        with self.assertRaises(ValueError):
+            future.result()
+        with self.assertRaises(ValueError):
+            paddle.clear_async_save_task_queue()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+
+
+class TestSaveLoadMmapFormat(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_state_dict(self):
+        layer = paddle.nn.Linear(13, 7)
+        state_dict = layer.state_dict()
+        path = os.path.join(self.temp_dir.name, 'linear.pdparams')
+        paddle.save(state_dict, path, use_mmap_format=True)
+
+        for use_mmap in [True, False]:
+            load_dict = paddle.load(path, mmap=use_mmap)
+            self.assertEqual(sorted(load_dict.keys()), sorted(state_dict))
+            for key, value in state_dict.items():
+                self.assertTrue(isinstance(load_dict[key], paddle.Tensor))
+                self.assertEqual(load_dict[key].name, value.name)
+                np.testing.assert_array_equal(
+                    load_dict[key].numpy(), value.numpy()
+                )
+
+        layer.set_state_dict(paddle.load(path, mmap=True))
+
+    def test_nested_object(self):
+        obj = {
+            'model': {'w': paddle.randn([4, 5]), 'empty': paddle.zeros([0])},
+            'arr': np.arange(10, dtype='int64'),
+            'epoch': 3,
+            'names': ['a', 'b'],
+        }
+        path = os.path.join(self.temp_dir.name, 'obj.pdckpt')
+        paddle.save(obj, path, use_mmap_format=True)
+
+        load_obj = paddle.load(path, mmap=True, return_numpy=True)
+        np.testing.assert_array_equal(
+            load_obj['model']['w'], obj['model']['w'].numpy()
+        )
+        self.assertEqual(load_obj['model']['empty'].shape, (0,))
+        np.testing.assert_array_equal(load_obj['arr'], obj['arr'])
+        self.assertEqual(load_obj['epoch'], 3)
+        self.assertEqual(load_obj['names'], ['a', 'b'])
+
+        # the file is mapped copy-on-write, updating the loaded
+        # array must not modify the saved file
+        load_obj['arr'][0] = 100
+        np.testing.assert_array_equal(
+            paddle.load(path, return_numpy=True)['arr'], obj['arr']
+        )
+
+    def test_blob_alignment(self):
+        path = os.path.join(self.temp_dir.name, 'aligned.pdparams')
+        paddle.save(
+            {'a': paddle.ones([3]), 'b': paddle.ones([5])},
+            path,
+            use_mmap_format=True,
+        )
+        load_dict = paddle.load(path, mmap=True, return_numpy=True)
+        for value in load_dict.values():
+            self.assertEqual(
+                value.offset % paddle.framework.io._MMAP_FORMAT_ALIGNMENT, 0
+            )
+
+    def test_shared_tensor(self):
+        w = paddle.randn([4, 5])
+        arr = np.arange(6, dtype='float32')
+        path = os.path.join(self.temp_dir.name, 'shared.pdckpt')
+        paddle.save(
+            {'a': w, 'b': w, 'c': [arr, arr]}, path, use_mmap_format=True
+        )
+        header = paddle.framework.io._MMAP_FORMAT_HEADER
+        with open(path, 'rb') as f:
+            _, index_offset = header.unpack(f.read(header.size))
+            f.seek(index_offset)
+            # every shared tensor is written only once
+            self.assertEqual(len(pickle.load(f)['tensors']), 2)
+
+        load_obj = paddle.load(path)
+        self.assertIs(load_obj['a'], load_obj['b'])
+        self.assertIs(load_obj['c'][0], load_obj['c'][1])
+        np.testing.assert_array_equal(load_obj['a'].numpy(), w.numpy())
+
+    def test_overwrite_mapped_file(self):
+        path = os.path.join(self.temp_dir.name, 'overwrite.pdparams')
+        paddle.save({'w': paddle.ones([1024, 8])}, path, use_mmap_format=True)
+        load_dict = paddle.load(path, mmap=True, return_numpy=True)
+        paddle.save(
+            {'w': paddle.zeros([16]), 'b': paddle.ones([2])},
+            path,
+            use_mmap_format=True,
+        )
+        # the former mapping is still valid after the file is replaced
+        np.testing.assert_array_equal(load_dict['w'], np.ones([1024, 8]))
+        np.testing.assert_array_equal(
+            paddle.load(path, return_numpy=True)['w'], np.zeros([16])
+        )
+        self.assertEqual(os.listdir(self.temp_dir.name), ['overwrite.pdparams'])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            paddle.save(
+                {'w': paddle.ones([2])}, BytesIO(), use_mmap_format=True
+            )
+        with self.assertRaises(TypeError):
+            paddle.save(
+                {'w': paddle.ones([2])},
+                os.path.join(self.temp_dir.name, 'w'),
+                use_mmap_format=1,
+            )
+        with self.assertRaises(ValueError):
+            paddle.save(
+                paddle.nn.Linear(2, 2),
+                os.path.join(self.temp_dir.name, 'layer'),
+                use_mmap_format=True,
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.distributed.fleet.meta_parallel.pp_utils import (
+    p2p_communication as p2p,
+)
+from paddle.distributed.fleet.meta_parallel.pp_utils.utils import (
+    paddle_2_number,
+)
+
+
+class LoopbackHcg:
+    def _get_p2p_prev_rank(self):
+        return 0
+
+    def _get_p2p_next_rank(self):
+        return 0
+
+
+class TestSendRecvMeta(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.x = paddle.rand([2, 3, 4])
+        self.y = paddle.ones([5], dtype='int64')
+        self.x.stop_gradient = False
+
+    def test_encode_decode(self):
+        shape, dtype, stop_grad = p2p._decode_meta(p2p._encode_meta(self.x))
+        self.assertEqual(shape, [2, 3, 4])
+        self.assertEqual(dtype, paddle_2_number(self.x.dtype))
+        self.assertFalse(stop_grad)
+
+        shapes, dtypes, stop_grads = p2p._decode_meta(
+            p2p._encode_meta((self.x, self.y))
+        )
+        self.assertEqual(shapes, ([2, 3, 4], [5]))
+        self.assertEqual(
+            dtypes,
+            (paddle_2_number(self.x.dtype), paddle_2_number(self.y.dtype)),
+        )
+        self.assertEqual(stop_grads, (False, True))
+
+    def test_signature_cache(self):
+        messages = []
+
+        def send(tensor, dst=0, group=None):
+            messages.append(tensor.numpy())
+
+        def recv(tensor, src=0, group=None):
+            tensor.set_value(messages.pop(0))
+
+        sender = p2p.SendRecvMeta()
+        receiver = p2p.SendRecvMeta()
+        z = paddle.rand([7, 3])
+        with mock.patch.object(p2p, '_hcg', LoopbackHcg()), mock.patch(
+            'paddle.distributed.send', send
+        ), mock.patch('paddle.distributed.recv', recv):
+            num_messages = []
+            for tensor in [(self.x, self.y), z, (self.x, self.y), z]:
+                sender.send_meta(tensor, None)
+                num_messages.append(len(messages))
+                receiver.recv_meta(None)
+                expected = p2p._decode_meta(p2p._encode_meta(tensor))
+                self.assertEqual(
+                    (
+                        receiver.recv_shape_message,
+                        receiver.recv_dtype_message,
+                        receiver.recv_stop_gradient,
+                    ),
+                    expected,
+                )
+        # the header and the meta of a new signature, only the header later
+        self.assertEqual(num_messages, [2, 2, 1, 1])
+
+
+class TestCoalesce(unittest.TestCase):
+    def test_coalesce_split(self):
+        paddle.disable_static()
+        tensors = (
+            paddle.rand([2, 3]),
+            paddle.arange(6, dtype='int64').reshape([3, 2]),
+            paddle.rand([4]),
+            paddle.rand([1, 2, 2]),
+        )
+        shapes = tuple(t.shape for t in tensors)
+        dtypes = tuple(paddle_2_number(t.dtype) for t in tensors)
+
+        buffers = p2p._coalesce_tensors(tensors)
+        self.assertEqual([b.shape for b in buffers], [[14], [3, 2]])
+
+        recv_buffers = p2p._empty_buffers(shapes, dtypes)
+        self.assertEqual(
+            [b.shape for b in recv_buffers], [b.shape for b in buffers]
+        )
+        for buffer, recv_buffer in zip(buffers, recv_buffers):
+            recv_buffer.set_value(buffer.numpy())
+
+        stop_gradients = (False, True, True, False)
+        received = p2p._split_buffers(
+            recv_buffers, shapes, dtypes, stop_gradients
+        )
+        for tensor, expected, stop_gradient in zip(
+            received, tensors, stop_gradients
+        ):
+            np.testing.assert_array_equal(tensor.numpy(), expected.numpy())
+            self.assertEqual(tensor.stop_gradient, stop_gradient)
+
+        single = paddle.rand([3])
+        self.assertIs(p2p._coalesce_tensors(single)[0], single)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+import paddle.distributed as dist
+from paddle.distributed.communication.group import _get_global_group
+from paddle.distributed.fleet.meta_parallel.pp_utils import (
+    p2p_communication as p2p,
+)
+
+
+class TwoStageHcg:
+    """The p2p groups of a pipeline with two stages and no model parallel."""
+
+    def __init__(self):
+        self.send_next_group = _get_global_group()
+        self.send_prev_group = self.send_next_group
+        self.recv_next_group = self.send_next_group
+        self.recv_prev_group = self.send_next_group
+        self._peer = 1 - dist.get_rank()
+
+    def get_p2p_groups(self):
+        return (
+            self.send_next_group,
+            self.send_prev_group,
+            self.recv_next_group,
+            self.recv_prev_group,
+        )
+
+    def _get_p2p_prev_rank(self):
+        return self._peer
+
+    def _get_p2p_next_rank(self):
+        return self._peer
+
+    def get_model_parallel_group(self):
+        return None
+
+    def get_model_parallel_world_size(self):
+        return 1
+
+    def get_model_parallel_rank(self):
+        return 0
+
+
+def forward_tensors():
+    x = paddle.arange(6, dtype='float32').reshape([2, 3])
+    ids = paddle.arange(4, dtype='int64')
+    z = paddle.full([3], 0.5, dtype='float32')
+    x.stop_gradient = False
+    z.stop_gradient = False
+    return x, ids, z
+
+
+def run_p2p():
+    paddle.set_device('cpu')
+    dist.init_parallel_env()
+    x, ids, z = forward_tensors()
+    # the second round sends the cached meta
+    for use_batch_p2p in [True, False, True]:
+        p2p.initialize_p2p_groups(TwoStageHcg(), use_batch_p2p=use_batch_p2p)
+        if dist.get_rank() == 0:
+            p2p.send_forward((x, ids, z), pp_last_stage=False)
+            grads = p2p.recv_backward(pp_last_stage=False)
+            # only the tensors requiring grad have grads
+            assert len(grads) == 2
+            np.testing.assert_array_equal(grads[0].numpy(), x.numpy() * 2)
+            np.testing.assert_array_equal(grads[1].numpy(), z.numpy() * 2)
+        else:
+            received = p2p.recv_forward(pp_first_stage=False)
+            for tensor, expected in zip(received, (x, ids, z)):
+                assert tensor.dtype == expected.dtype
+                assert tensor.stop_gradient == expected.stop_gradient
+                np.testing.assert_array_equal(tensor.numpy(), expected.numpy())
+            p2p.send_backward(
+                (received[0] * 2, received[2] * 2), pp_first_stage=False
+            )
+
+
+class TestP2pCommunicationGloo(unittest.TestCase):
+    def test_p2p_helper(self):
+        dist.spawn(run_p2p, backend='gloo', nprocs=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1044,6 +1044,194 @@ class TestProfilerStatistic(unittest.TestCase):
                 )
             )
 
+    def build_window(self, offset):
+        root_node = HostPythonNode(
+            'Root Node',
+            profiler.TracerEventType.UserDefined,
+            0,
+            float('inf'),
+            1000,
+            1001,
+        )
+        profilerstep_node = HostPythonNode(
+            'ProfileStep#1',
+            profiler.TracerEventType.ProfileStep,
+            offset,
+            offset + 100,
+            1000,
+            1001,
+        )
+        matmul_node = HostPythonNode(
+            'matmul',
+            profiler.TracerEventType.Operator,
+            offset + 10,
+            offset + 60,
+            1000,
+            1001,
+        )
+        matmul_compute = HostPythonNode(
+            'matmul::compute',
+            profiler.TracerEventType.OperatorInner,
+            offset + 20,
+            offset + 50,
+            1000,
+            1001,
+        )
+        matmul_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 30,
+            offset + 35,
+            1000,
+            1001,
+        )
+        matmul_kernel = DevicePythonNode(
+            'gemm_kernel',
+            profiler.TracerEventType.Kernel,
+            offset + 40,
+            offset + 70,
+            0,
+            0,
+            0,
+        )
+        allreduce_node = HostPythonNode(
+            'c_allreduce_sum',
+            profiler.TracerEventType.Operator,
+            offset + 65,
+            offset + 90,
+            1000,
+            1001,
+        )
+        allreduce_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 70,
+            offset + 75,
+            1000,
+            1001,
+        )
+        allreduce_kernel = DevicePythonNode(
+            'ncclAllReduce',
+            profiler.TracerEventType.Kernel,
+            offset + 60,
+            offset + 80,
+            0,
+            0,
+            1,
+        )
+        mem_node = MemPythonNode(
+            offset + 15,
+            0,
+            profiler_statistic.TracerMemEventType.Allocate,
+            1000,
+            1001,
+            20,
+            'place(gpu:0)',
+            200,
+            200,
+            800 + offset,
+            800,
+        )
+        root_node.children_node.append(profilerstep_node)
+        profilerstep_node.children_node.extend([matmul_node, allreduce_node])
+        matmul_node.children_node.append(matmul_compute)
+        matmul_node.mem_node.append(mem_node)
+        matmul_compute.runtime_node.append(matmul_launchkernel)
+        matmul_launchkernel.device_node.append(matmul_kernel)
+        allreduce_node.runtime_node.append(allreduce_launchkernel)
+        allreduce_launchkernel.device_node.append(allreduce_kernel)
+        return {'thread1001': root_node}
+
+    def test_event_table(self):
+        thread_tree = self.build_window(0)
+        table = profiler_statistic.EventTable(thread_tree)
+        _, thread2nodes = profiler_statistic.wrap_tree(thread_tree)
+        nodes = thread2nodes['thread1001']
+        rows = table.host_rows_mask().nonzero()[0]
+        self.assertEqual(len(rows), len(nodes) - 1)
+        for row, node in zip(rows, nodes[1:]):
+            self.assertEqual(table.names.values[table.name[row]], node.name)
+            for attr in [
+                'cpu_time',
+                'self_cpu_time',
+                'gpu_time',
+                'self_gpu_time',
+                'general_gpu_time',
+                'self_general_gpu_time',
+            ]:
+                self.assertEqual(getattr(table, attr)[row], getattr(node, attr))
+
+    def test_statistic_merge(self):
+        extra_info = {
+            'Process Cpu Utilization': '1.02',
+            'System Cpu Utilization': '0.68',
+        }
+        statistic_data = profiler_statistic.StatisticData(
+            self.build_window(0), extra_info
+        )
+        statistic_data.merge(
+            profiler_statistic.StatisticData(
+                self.build_window(1000), extra_info
+            )
+        )
+        time_range_summary = statistic_data.time_range_summary
+        self.assertEqual(
+            time_range_summary.get_cpu_range_sum(
+                profiler.TracerEventType.ProfileStep
+            ),
+            200,
+        )
+        self.assertEqual(
+            time_range_summary.get_gpu_range_sum(
+                0, profiler.TracerEventType.Kernel
+            ),
+            80,
+        )
+        self.assertEqual(
+            time_range_summary.call_times[profiler.TracerEventType.Kernel], 4
+        )
+        event_summary = statistic_data.event_summary
+        matmul = event_summary.items['matmul']
+        self.assertEqual(matmul.call, 2)
+        self.assertEqual(matmul.cpu_time, 100)
+        self.assertEqual(matmul.gpu_time, 60)
+        self.assertEqual(matmul.operator_inners['matmul::compute'].call, 2)
+        self.assertEqual(
+            matmul.operator_inners['matmul::compute']
+            .devices['gemm_kernel']
+            .gpu_time,
+            60,
+        )
+        self.assertEqual(event_summary.kernel_items['ncclAllReduce'].call, 2)
+        self.assertEqual(
+            event_summary.model_perspective_items['ProfileStep'].cpu_time, 200
+        )
+        distributed_summary = statistic_data.distributed_summary
+        self.assertEqual(
+            distributed_summary.communication_range,
+            [(60, 90), (1060, 1090)],
+        )
+        self.assertEqual(
+            distributed_summary.overlap_range, [(60, 70), (1060, 1070)]
+        )
+        self.assertEqual(distributed_summary.gpu_calls, 2)
+        memory_summary = statistic_data.memory_summary
+        item = memory_summary.allocated_items['place(gpu:0)']['matmul']
+        self.assertEqual(item.allocation_count, 2)
+        self.assertEqual(item.increase_size, 40)
+        self.assertEqual(
+            memory_summary.peak_allocation_values['place(gpu:0)'], 1800
+        )
+        print(
+            profiler_statistic._build_table(
+                statistic_data,
+                sorted_by=profiler.SortedKeys.CPUTotal,
+                op_detail=True,
+                thread_sep=False,
+                time_unit='ms',
+            )
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
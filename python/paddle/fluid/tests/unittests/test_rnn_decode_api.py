@@ -392,5 +392,141 @@ class TestBeamSearch(ModuleApiTest):
         self.func_check_output()
 
 
+class _CountdownCell(Layer):
+    # The logits depend on the input token and the `bias` keyword argument,
+    # and the end token is emitted by all the beams of a batch entry after
+    # the number of steps in its state.
+    def __init__(self, vocab_size, end_token):
+        super().__init__()
+        table = np.random.RandomState(2022).rand(vocab_size, vocab_size) * 3
+        table[:, end_token] = -100
+        self.table = paddle.to_tensor(table.astype("float32"))
+        self.end_mask = paddle.nn.functional.one_hot(
+            paddle.to_tensor([end_token]), vocab_size
+        )
+
+    def forward(self, inputs, states, bias):
+        logits = paddle.gather(self.table, inputs) + bias
+        end = paddle.cast(states <= 0, "float32") * self.end_mask * 200
+        return logits + end, states - 1
+
+
+class TestBeamSearchOptions(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        paddle.set_default_dtype("float32")
+        self.vocab_size, self.end_token, self.beam_size = 10, 1, 3
+
+    def tearDown(self):
+        paddle.enable_static()
+
+    def decoder(self, **kwargs):
+        return BeamSearchDecoder(
+            _CountdownCell(self.vocab_size, self.end_token),
+            start_token=0,
+            end_token=self.end_token,
+            beam_size=self.beam_size,
+            **kwargs
+        )
+
+    def test_compact_finished(self):
+        # the batch entries finish at different steps
+        steps = paddle.to_tensor([[1.0], [4.0], [2.0], [6.0]])
+        bias = BeamSearchDecoder.tile_beam_merge_with_batch(
+            paddle.rand([4, self.vocab_size]), self.beam_size
+        )
+        results = []
+        for compact_finished in [False, True]:
+            decoder = self.decoder(compact_finished=compact_finished)
+            outputs, final_states, lengths = dynamic_decode(
+                decoder,
+                inits=steps,
+                max_step_num=10,
+                is_test=True,
+                return_length=True,
+                bias=bias,
+            )
+            results.append(
+                [
+                    outputs.numpy(),
+                    final_states.log_probs.numpy(),
+                    final_states.lengths.numpy(),
+                    lengths.numpy(),
+                ]
+            )
+        for expected, actual in zip(*results):
+            np.testing.assert_allclose(actual, expected, rtol=1e-6)
+        np.testing.assert_array_equal(results[0][3][:, 0], [2, 5, 3, 7])
+        # only the last entry is left in the cell's batch
+        self.assertEqual(decoder._active_index.numpy().tolist(), [3])
+
+    def test_gather(self):
+        decoder = self.decoder()
+        indices = paddle.to_tensor([[2, 0, 0], [1, 2, 1]], dtype="int64")
+        batch_pos = paddle.tile(
+            paddle.arange(0, 2, 1, dtype="int64").unsqueeze([1]), [1, 3]
+        )
+        coordinates = paddle.stack([batch_pos, indices], axis=2)
+        for x in [paddle.rand([2, 3, 4]), paddle.rand([2, 3]) > 0.5]:
+            # the same as the gather_nd of static graph
+            expected = paddle.gather_nd(paddle.cast(x, "float32"), coordinates)
+            actual = decoder._gather(x, indices, paddle.shape(x)[0])
+            self.assertEqual(actual.dtype, x.dtype)
+            np.testing.assert_array_equal(
+                paddle.cast(actual, "float32").numpy(), expected.numpy()
+            )
+
+    def beam_search_step(self, decoder):
+        # beam 0 has finished with the higher log probability, while beam 1
+        # is much longer and almost surely continues with token 2
+        decoder.initialize(paddle.zeros([1, 1]))
+        beam_state = decoder.StateWrapper(
+            paddle.zeros([1, 2, 1]),
+            paddle.to_tensor([[-1.0, -1.2]]),
+            paddle.to_tensor([[True, False]]),
+            paddle.to_tensor([[1, 5]], dtype="int64"),
+        )
+        logits = paddle.to_tensor([[[0.0, 0.0, 0.0], [0.0, -10.0, 10.0]]])
+        return decoder._beam_search_step(
+            paddle.zeros([1], dtype="int64"),
+            logits,
+            paddle.zeros([1, 2, 1]),
+            beam_state,
+        )
+
+    def test_length_penalty(self):
+        self.beam_size = 2
+        output, state = self.beam_search_step(self.decoder())
+        self.assertEqual(output.predicted_ids.numpy().tolist(), [[1, 2]])
+        self.assertEqual(output.parent_ids.numpy().tolist(), [[0, 1]])
+
+        # ranked by log_probs / ((5 + length) / 6) ** alpha, the longer beam
+        # outranks the finished one
+        output, state = self.beam_search_step(self.decoder(length_penalty=1.0))
+        self.assertEqual(output.predicted_ids.numpy().tolist(), [[2, 1]])
+        self.assertEqual(output.parent_ids.numpy().tolist(), [[1, 0]])
+        log_probs = -1.2 + np.log(1.0 / (1.0 + np.exp(-10.0) + np.exp(-20.0)))
+        np.testing.assert_allclose(
+            output.scores.numpy(), [[log_probs / (11.0 / 6.0), -1.0]], rtol=1e-5
+        )
+        # the states keep the log probabilities without penalty
+        np.testing.assert_allclose(
+            state.log_probs.numpy(), [[log_probs, -1.0]], rtol=1e-5
+        )
+        self.assertEqual(state.lengths.numpy().tolist(), [[6, 1]])
+
+    def test_early_stopping(self):
+        self.beam_size = 2
+        _, state = self.beam_search_step(self.decoder())
+        self.assertEqual(state.finished.numpy().tolist(), [[True, False]])
+        # the top beam has finished, which finishes the batch entry
+        _, state = self.beam_search_step(self.decoder(early_stopping=True))
+        self.assertEqual(state.finished.numpy().tolist(), [[True, True]])
+        _, state = self.beam_search_step(
+            self.decoder(early_stopping=True, length_penalty=1.0)
+        )
+        self.assertEqual(state.finished.numpy().tolist(), [[False, True]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -771,6 +771,80 @@ class TestTransformer(unittest.TestCase):
                 paddle.to_tensor(memory_mask),
             )
 
+    def test_decoder_preallocated_cache(self):
+        batch_size, d_model, n_head, target_length = 3, 8, 2, 5
+        tgt = np.random.rand(batch_size, target_length, d_model).astype(
+            "float32"
+        )
+        memory = np.random.rand(batch_size, 4, d_model).astype("float32")
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            decoder_layer = TransformerDecoderLayer(
+                d_model, n_head, 16, dropout=0.0
+            )
+            decoder = TransformerDecoder(decoder_layer, 2)
+            decoder.eval()
+            memory = paddle.to_tensor(memory)
+
+            cache = decoder.gen_cache(memory)
+            max_length = target_length + 2
+            prealloc_cache = decoder.gen_cache(memory, max_length=max_length)
+            self.assertIsInstance(
+                prealloc_cache[0][0], MultiHeadAttention.PreallocatedCache
+            )
+            buffers = [layer_cache[0].k for layer_cache in prealloc_cache]
+            for i in range(target_length):
+                step = paddle.to_tensor(tgt[:, i : i + 1, :])
+                # the mask of the valid positions is padded to max_length
+                tgt_mask = None
+                if i % 2:
+                    tgt_mask = paddle.to_tensor(
+                        -np.random.rand(batch_size, n_head, 1, i + 1).astype(
+                            "float32"
+                        )
+                    )
+                output, cache = decoder(step, memory, tgt_mask, None, cache)
+                prealloc_output, prealloc_cache = decoder(
+                    step, memory, tgt_mask, None, prealloc_cache
+                )
+                np.testing.assert_allclose(
+                    prealloc_output.numpy(), output.numpy(), rtol=1e-5
+                )
+            for layer_cache, prealloc_layer_cache, k in zip(
+                cache, prealloc_cache, buffers
+            ):
+                self.assertEqual(prealloc_layer_cache[0].pos, target_length)
+                # written in place
+                self.assertIs(prealloc_layer_cache[0].k, k)
+                np.testing.assert_allclose(
+                    prealloc_layer_cache[0].k.numpy()[:, :, :target_length],
+                    layer_cache[0].k.numpy(),
+                    rtol=1e-5,
+                )
+
+            # overflow the buffers
+            with self.assertRaises(ValueError):
+                decoder(
+                    paddle.to_tensor(tgt[:, :3, :]),
+                    memory,
+                    None,
+                    None,
+                    prealloc_cache,
+                )
+
+            # reorder the beams
+            index = paddle.to_tensor([2, 0, 0])
+            self_attn = decoder.layers[0].self_attn
+            reordered = self_attn.reorder_cache(cache[0][0], index)
+            prealloc_reordered = self_attn.reorder_cache(
+                prealloc_cache[0][0], index
+            )
+            self.assertIs(prealloc_reordered.k, buffers[0])
+            np.testing.assert_allclose(
+                prealloc_reordered.v.numpy()[:, :, :target_length],
+                reordered.v.numpy(),
+                rtol=1e-5,
+            )
+
     def test_transformer(self):
         (
             batch_size,
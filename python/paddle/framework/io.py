@@ -16,9 +16,13 @@ import collections
 import copyreg
 import os
 import pickle
+import struct
 import sys
+import threading
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import numpy as np
 
@@ -40,6 +44,7 @@ from paddle.fluid.framework import (
     Variable,
     _current_expected_place,
     _dygraph_tracer,
+    _in_eager_without_dygraph_check,
     _non_static_mode,
     _varbase_creator,
 )
@@ -222,6 +227,7 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
     ]
 
     # input check
@@ -238,12 +244,17 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_mmap_format',
+    ]
 
     # input check
     for key in configs:
@@ -257,6 +268,7 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_mmap_format = configs.get('use_mmap_format', False)
 
     return inner_config
 
@@ -341,6 +353,205 @@ def _pickle_save(obj, f, protocol):
         pickler.dump(obj)
 
 
+# NOTE: [ Memory-mapped save format ]
+# The mmap format stores an object as a fixed-size file header, page-aligned
+# raw tensor blobs and a trailing index:
+#
+#   | magic(8) | index offset(8) | pad | blob 0 | pad | blob 1 | ... | index |
+#
+# The index is a pickled dict which holds the meta (name, dtype, shape,
+# offset) of every blob and the pickled object skeleton, in which every
+# Tensor/ndarray is replaced by a persistent id pointing into the meta list.
+# Tensors are written one by one straight from their numpy view, so saving
+# does not hold the whole pickled state_dict in memory, and loading can map
+# the blobs with `np.memmap` instead of unpickling them.
+_MMAP_FORMAT_MAGIC = b'PDMMAP01'
+_MMAP_FORMAT_ALIGNMENT = 4096
+_MMAP_FORMAT_HEADER = struct.Struct('<8sQ')
+
+
+class _MmapPickler(pickle.Pickler):
+    def __init__(self, f, protocol, write_blob):
+        super().__init__(f, protocol)
+        self._write_blob = write_blob
+        # NOTE: persistent_id is called before the memo lookup of pickle, so
+        # the objects referenced more than once are memoized here to keep
+        # them shared after loading. The objects are held to keep ids valid.
+        self._blobs = {}
+
+    def persistent_id(self, obj):
+        blob = self._blobs.get(id(obj))
+        if blob is not None:
+            return blob[0]
+        pid = self._persistent_id(obj)
+        if pid is not None:
+            self._blobs[id(obj)] = (pid, obj)
+        return pid
+
+    def _persistent_id(self, obj):
+        if isinstance(obj, fluid.Layer):
+            raise ValueError(
+                "paddle do not support saving `paddle.nn.Layer` object."
+            )
+        if isinstance(obj, core.SelectedRows):
+            raise NotImplementedError(
+                "`paddle.save` do not support saving 'SelectedRows'."
+            )
+        if isinstance(obj, (core.VarBase, core.eager.Tensor)):
+            return ('tensor', self._write_blob(obj.numpy(), obj.name))
+        if isinstance(obj, core.LoDTensor):
+            return ('lodtensor', self._write_blob(np.array(obj), None))
+        if type(obj) is np.ndarray and obj.dtype != np.object_:
+            return ('ndarray', self._write_blob(obj, None))
+        return None
+
+
+class _MmapUnpickler(pickle.Unpickler):
+    def __init__(self, f, load_blob):
+        super().__init__(f, encoding='latin1')
+        self._load_blob = load_blob
+        self._loaded = {}
+
+    def persistent_load(self, pid):
+        if pid not in self._loaded:
+            kind, index = pid
+            self._loaded[pid] = self._load_blob(kind, index)
+        return self._loaded[pid]
+
+
+def _align_to(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _mmap_save(obj, path, protocol):
+    if not _is_file_path(path):
+        raise ValueError(
+            "`use_mmap_format=True` only supports saving objects to file, but got {}".format(
+                type(path)
+            )
+        )
+
+    # NOTE: write to a temporary file and replace the target at last, as the
+    # target may be mapped by a tensor loaded with `mmap=True`, truncating it
+    # in place would break the mapping.
+    tmp_path = '{}.tmp{}'.format(path, os.getpid())
+    try:
+        _mmap_save_to(obj, tmp_path, protocol)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _mmap_save_to(obj, path, protocol):
+    with open(path, 'wb') as f:
+        f.write(_MMAP_FORMAT_HEADER.pack(_MMAP_FORMAT_MAGIC, 0))
+        metas = []
+
+        def write_blob(ndarray, name):
+            ndarray = np.ascontiguousarray(ndarray)
+            offset = _align_to(f.tell(), _MMAP_FORMAT_ALIGNMENT)
+            f.write(b'\0' * (offset - f.tell()))
+            # write through a memoryview to avoid another copy of the tensor
+            f.write(memoryview(ndarray.reshape(-1)).cast('B'))
+            metas.append(
+                {
+                    'name': name,
+                    'dtype': ndarray.dtype.str,
+                    'shape': ndarray.shape,
+                    'offset': offset,
+                }
+            )
+            return len(metas) - 1
+
+        skeleton = BytesIO()
+        _MmapPickler(skeleton, protocol, write_blob).dump(obj)
+
+        index_offset = f.tell()
+        pickle.dump(
+            {
+                'alignment': _MMAP_FORMAT_ALIGNMENT,
+                'tensors': metas,
+                'skeleton': skeleton.getvalue(),
+            },
+            f,
+            protocol=protocol,
+        )
+        f.seek(0)
+        f.write(_MMAP_FORMAT_HEADER.pack(_MMAP_FORMAT_MAGIC, index_offset))
+
+
+def _is_mmap_format(path):
+    if not _is_file_path(path):
+        return False
+    with open(path, 'rb') as f:
+        header = f.read(_MMAP_FORMAT_HEADER.size)
+    return (
+        len(header) == _MMAP_FORMAT_HEADER.size
+        and _MMAP_FORMAT_HEADER.unpack(header)[0] == _MMAP_FORMAT_MAGIC
+    )
+
+
+def _mmap_load(path, use_mmap, return_numpy):
+    with open(path, 'rb') as f:
+        _, index_offset = _MMAP_FORMAT_HEADER.unpack(
+            f.read(_MMAP_FORMAT_HEADER.size)
+        )
+        f.seek(index_offset)
+        index = pickle.load(f, encoding='latin1')
+
+        def read_ndarray(meta):
+            dtype = np.dtype(meta['dtype'])
+            shape = tuple(meta['shape'])
+            count = int(np.prod(shape, dtype=np.int64))
+            if count == 0:
+                return np.empty(shape, dtype=dtype)
+            if use_mmap:
+                # copy-on-write mapping: pages are read lazily on first access
+                # and writes to the returned tensor never reach the file.
+                return np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode='c',
+                    offset=meta['offset'],
+                    shape=shape,
+                )
+            f.seek(meta['offset'])
+            return np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+
+        def load_blob(kind, index_id):
+            meta = index['tensors'][index_id]
+            ndarray = read_ndarray(meta)
+            if kind == 'ndarray' or return_numpy:
+                return ndarray
+            if not _non_static_mode():
+                return _to_LodTensor(ndarray)
+            if use_mmap:
+                # share the mapped buffer instead of copying it into a new
+                # allocation, only CPUPlace supports zero copy.
+                if _in_eager_without_dygraph_check():
+                    tensor = core.eager.Tensor(
+                        value=ndarray,
+                        place=core.CPUPlace(),
+                        persistable=False,
+                        zero_copy=True,
+                    )
+                else:
+                    tensor = core.VarBase(
+                        value=ndarray,
+                        place=core.CPUPlace(),
+                        persistable=False,
+                        zero_copy=True,
+                    )
+            else:
+                tensor = paddle.to_tensor(ndarray)
+            if meta['name'] is not None:
+                tensor.name = meta['name']
+            return tensor
+
+        return _MmapUnpickler(BytesIO(index['skeleton']), load_blob).load()
+
+
 def _contain_x(obj, condition_func):
     if isinstance(obj, core.SelectedRows):
         raise NotImplementedError(
@@ -662,6 +873,9 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_mmap_format(bool): If True, save the object in the memory-mapped format: every Tensor is written as a page-aligned
+          raw blob after a small index header, so that ``paddle.load(path, mmap=True)`` can map the tensors lazily instead of
+          unpickling them. Only supports saving to a file path. Default: False
 
     Returns:
         None
@@ -796,8 +1010,21 @@ def save(obj, path, protocol=4, **configs):
             )
         )
 
+    if not isinstance(config.use_mmap_format, bool):
+        raise TypeError(
+            "Type of `use_mmap_format` should be bool, but received {}.".format(
+                type(config.use_mmap_format)
+            )
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
+    elif config.use_mmap_format:
+        if isinstance(obj, Program):
+            raise NotImplementedError(
+                "`use_mmap_format=True` do not support saving `Program`."
+            )
+        _mmap_save(obj, path, protocol)
     else:
         # `protocol` need to be used, `pickle_protocol` is a deprecated arg.
         if config.pickle_protocol is not None:
@@ -821,6 +1048,140 @@ def save(obj, path, protocol=4, **configs):
                 _pickle_save(obj, f, protocol)
 
 
+_async_save_executor = None
+_async_save_pending = []
+_async_save_lock = threading.Lock()
+
+
+def _snapshot_to_host(obj):
+    if isinstance(obj, (core.VarBase, core.eager.Tensor)):
+        if obj.place.is_gpu_place():
+            snapshot = obj._copy_to(core.CUDAPinnedPlace(), True)
+        else:
+            snapshot = obj._copy_to(core.CPUPlace(), True)
+        snapshot.name = obj.name
+        return snapshot
+    elif isinstance(obj, core.LoDTensor):
+        snapshot = core.LoDTensor()
+        snapshot.set(np.array(obj), core.CPUPlace())
+        return snapshot
+    elif isinstance(obj, np.ndarray):
+        return obj.copy()
+    elif type(obj) in (dict, collections.OrderedDict):
+        return type(obj)((k, _snapshot_to_host(v)) for k, v in obj.items())
+    elif type(obj) in (list, tuple):
+        return type(obj)(_snapshot_to_host(v) for v in obj)
+    return obj
+
+
+def _save_and_fsync(obj, path, protocol, configs):
+    # write to a temporary file first, so that a crash in the middle of saving
+    # never leaves a truncated checkpoint at `path`.
+    tmp_path = path + '.tmp'
+    save(obj, tmp_path, protocol, **configs)
+    with open(tmp_path, 'rb+') as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def async_save(obj, path, protocol=4, max_inflight=2, **configs):
+    '''
+    Save an object to the specified path asynchronously.
+
+    The Tensors in ``obj`` are snapshotted to host memory (pinned memory for
+    GPU Tensors) before this API returns, so it is safe to keep updating them.
+    The serialization and ``fsync`` run in a background thread, and the saved
+    file appears at ``path`` atomically once the task succeeds.
+
+    Args:
+        obj(Object) : The object to be saved, the same as ``paddle.save`` .
+        path(str) : The file path of the object to be saved.
+        protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
+                                 Default: 4
+        max_inflight(int, optional): The max number of unfinished saving tasks. If there are already
+            ``max_inflight`` unfinished tasks, this API blocks until the oldest one finishes, which bounds
+            the host memory held by snapshots. Default: 2
+        **configs(dict, optional): optional keyword arguments, the same as ``paddle.save`` .
+
+    Returns:
+        concurrent.futures.Future: The future of the saving task, the exception raised while saving
+        is re-raised by ``Future.result()`` .
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            future = paddle.async_save(linear.state_dict(), "example/linear.pdparams")
+            # ... training continues while saving ...
+            future.result()
+    '''
+    global _async_save_executor
+
+    if not _is_file_path(path):
+        raise ValueError(
+            "`paddle.async_save` only supports saving objects to file, but got {}".format(
+                type(path)
+            )
+        )
+    if not isinstance(max_inflight, int) or max_inflight < 1:
+        raise ValueError(
+            "`max_inflight` should be a positive integer, but received {}.".format(
+                max_inflight
+            )
+        )
+    # check configs before the task is committed, so that the error is raised
+    # in the caller instead of the background thread
+    _parse_save_config(configs)
+
+    with _async_save_lock:
+        if _async_save_executor is None:
+            # a single worker keeps the saving tasks to the same path in order
+            _async_save_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='paddle_async_save'
+            )
+        # keep the failed tasks, `clear_async_save_task_queue` re-raises them
+        _async_save_pending[:] = [
+            f
+            for f in _async_save_pending
+            if not f.done() or f.exception() is not None
+        ]
+        running = [f for f in _async_save_pending if not f.done()]
+        waiting = running[: max(len(running) - max_inflight + 1, 0)]
+    for future in waiting:
+        future.exception()
+
+    snapshot = _snapshot_to_host(obj)
+    with _async_save_lock:
+        future = _async_save_executor.submit(
+            _save_and_fsync, snapshot, path, protocol, configs
+        )
+        _async_save_pending.append(future)
+    return future
+
+
+def clear_async_save_task_queue():
+    '''
+    Wait until all the saving tasks committed by ``paddle.async_save`` finish.
+    The first exception raised by the tasks is re-raised.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            paddle.async_save(linear.state_dict(), "example/linear.pdparams")
+            paddle.clear_async_save_task_queue()
+    '''
+    with _async_save_lock:
+        pending = list(_async_save_pending)
+        _async_save_pending.clear()
+    for future in pending:
+        future.result()
+
+
 def _legacy_save(obj, path, protocol=2):
     # 1. input check
     if not isinstance(obj, dict):
@@ -923,6 +1284,9 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only works for files saved with ``use_mmap_format=True`` . If True, tensors are backed by
+            ``np.memmap`` of the file and shared with CPU Tensor without copy, the data is read lazily when it is accessed.
+            Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1041,10 +1405,28 @@ def load(path, **configs):
             # load state_dict
             dict_load = paddle.load(byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            # example 6: load tensors lazily with memory map
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            path = "example/linear.pdparams"
+            paddle.save(linear.state_dict(), path, use_mmap_format=True)
+            state_dict = paddle.load(path, mmap=True)
+
     '''
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        if _is_mmap_format(path):
+            return _mmap_load(path, config.mmap, config.return_numpy)
+        if config.mmap:
+            warnings.warn(
+                "`mmap=True` only works for the file saved with `use_mmap_format=True`, "
+                "the file {} will be loaded without mmap.".format(path)
+            )
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
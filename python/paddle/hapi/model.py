@@ -747,6 +747,8 @@ class DynamicGraphAdapter:
         self._amp_configs = {}
         self._amp_custom_lists = {}
         self._use_fp16_guard = True
+        # outputs of metric.compute kept on device by `defer_sync` mode
+        self._deferred_metric_outs = []
 
         if self._nranks > 1:
             dist.init_parallel_env()
@@ -809,6 +811,24 @@ class DynamicGraphAdapter:
                 self.model._optimizer.minimize(final_loss)
                 self.model.network.clear_gradients()
 
+        if self.model._defer_sync:
+            # NOTE: keep losses and the outputs of metric.compute on device
+            # to avoid a device to host synchronization every step, they
+            # are materialized by `sync_deferred_metrics` periodically.
+            self._deferred_metric_outs.append(
+                [
+                    [
+                        m.detach()
+                        for m in to_list(
+                            metric.compute(*(to_list(outputs) + labels))
+                        )
+                    ]
+                    for metric in self.model._metrics
+                ]
+            )
+            losses = [l.detach() for l in losses]
+            return (losses, []) if len(self.model._metrics) > 0 else losses
+
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
@@ -821,6 +841,34 @@ class DynamicGraphAdapter:
             else [to_numpy(l) for l in losses]
         )
 
+    def sync_deferred_metrics(self):
+        if not self._deferred_metric_outs:
+            return
+        # NOTE: the buffered outputs of every step are concatenated on device
+        # and copied to host once, then split back to feed metric.update step
+        # by step, as the metrics are not required to be additive.
+        steps = len(self._deferred_metric_outs)
+        host_outs = [[[] for _ in range(steps)] for _ in self.model._metrics]
+        for i in range(len(self.model._metrics)):
+            for j in range(len(self._deferred_metric_outs[0][i])):
+                outs = [
+                    step_outs[i][j] for step_outs in self._deferred_metric_outs
+                ]
+                if any(
+                    len(out.shape) == 0 or out.shape[1:] != outs[0].shape[1:]
+                    for out in outs
+                ):
+                    values = [to_numpy(out) for out in outs]
+                else:
+                    sections = np.cumsum([out.shape[0] for out in outs])[:-1]
+                    values = np.split(to_numpy(paddle.concat(outs)), sections)
+                for step in range(steps):
+                    host_outs[i][step].append(values[step])
+        for step in range(steps):
+            for metric, outs in zip(self.model._metrics, host_outs):
+                metric.update(*outs[step])
+        self._deferred_metric_outs = []
+
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
         self.mode = 'eval'
@@ -1124,6 +1172,8 @@ class Model:
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        self._defer_sync = False
+        self._sync_freq = 1
 
         if not _non_static_mode():
             if not isinstance(inputs, (list, tuple, dict, Input)):
@@ -1710,6 +1760,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        defer_sync=False,
     ):
         """
 
@@ -1758,6 +1809,11 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            defer_sync (bool, optional): Whether to keep the training losses and metric outputs
+                on device and only copy them to host every `log_freq` steps and at the end of
+                epoch. It avoids a device to host synchronization every step, while the `logs`
+                passed to `Callback.on_train_batch_end` are only updated every `log_freq` steps.
+                Only works in dynamic graph mode. Default: False.
 
         Returns:
             None
@@ -1895,6 +1951,8 @@ class Model:
         self._test_dataloader = eval_loader
 
         self._accumulate = accumulate_grad_batches
+        self._defer_sync = defer_sync and fluid._non_static_mode()
+        self._sync_freq = log_freq
 
         steps = self._len_data_loader(train_loader)
         self.num_iters = num_iters
@@ -1943,6 +2001,7 @@ class Model:
 
         cbks.on_end('train', logs)
         self._test_dataloader = None
+        self._defer_sync = False
 
     def evaluate(
         self,
@@ -2104,7 +2163,7 @@ class Model:
                         self.return_label = return_label
 
                     def __getitem__(self, idx):
-                        img = np.reshape(self.images[idx], [1, 28, 28])
+                        img = np.reshape(self.images[idx], [1, 28, 28]).astype('float32')
                         if self.return_label:
                             return img, np.array(self.labels[idx]).astype('int64')
                         return img,
@@ -2237,6 +2296,31 @@ class Model:
                 params_filename=params_filename,
             )
 
+    def _update_metric_logs(self, outs, logs):
+        if self._metrics and self._loss:
+            metrics = [[l[0] for l in outs[0]]]
+        elif self._loss:
+            metrics = [[l[0] for l in outs]]
+        else:
+            metrics = []
+
+        # metrics
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
+    def _sync_deferred_logs(self, outs, logs):
+        self._adapter.sync_deferred_metrics()
+        if self._metrics and self._loss:
+            outs = ([to_numpy(l) for l in outs[0]], outs[1])
+        elif self._loss:
+            outs = [to_numpy(l) for l in outs]
+        self._update_metric_logs(outs, logs)
+
     def _run_one_epoch(
         self,
         data_loader,
@@ -2245,6 +2329,11 @@ class Model:
         logs={},
     ):
         outputs = []
+        deferred_outs = None
+        if mode == 'train' and self._defer_sync:
+            # NOTE: the length is unknown for iterable dataset, the outputs
+            # left are synchronized after the loop then.
+            num_steps = self._len_data_loader(data_loader)
         for step, data in enumerate(data_loader):
             # data might come from different types of data_loader and have
             # different format, as following:
@@ -2279,21 +2368,15 @@ class Model:
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
 
-                if self._metrics and self._loss:
-                    metrics = [[l[0] for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[l[0] for l in outs]]
+                if mode == 'train' and self._defer_sync:
+                    deferred_outs = outs
+                    if (
+                        step + 1
+                    ) % self._sync_freq == 0 or step + 1 == num_steps:
+                        self._sync_deferred_logs(deferred_outs, logs)
+                        deferred_outs = None
                 else:
-                    metrics = []
-
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
-
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    self._update_metric_logs(outs, logs)
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2318,6 +2401,8 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if mode == 'train' and self._defer_sync and deferred_outs is not None:
+            self._sync_deferred_logs(deferred_outs, logs)
         self._reset_metrics()
 
         if mode == 'predict':
@@ -14,8 +14,10 @@
 
 import typing
 
+import numpy as np
+
 import paddle
-from paddle.fluid import framework
+from paddle.fluid import core, framework
 from paddle.incubate.autograd import primapi, utils
 
 
@@ -182,6 +184,12 @@ class Jacobian:
     submatrix is lazily evaluated along row axis, and will be cached once
     evaluated.
 
+    When many rows are retrieved at once, they are evaluated in chunks of
+    ``chunk_size`` rows with batch, each chunk by one backward pass. With
+    ``mode='columns'`` , the whole matrix is evaluated column by column in
+    forward mode instead, which is cheaper when the inputs are fewer than the
+    outputs, but requires the double grad of every operator in ``func`` .
+
     For examples, supposing ``is_batched=True``, you can retrieve the submatrix
     by following methods:
 
@@ -208,6 +216,17 @@ class Jacobian:
         xs (Tensor|Sequence[Tensor]): The input to the function ``func`` .
         is_batched (bool): If true, the first axis is batch axis. Defaults to
             False.
+        chunk_size (int, optional): The number of rows evaluated by one
+            backward pass, only used when ``is_batched`` is True, in which
+            case ``func`` is called with the inputs repeated ``chunk_size``
+            times along the batch axis. Defaults to 1.
+        memory_budget (int, optional): The upper bound in bytes of the
+            repeated inputs and outputs of ``func`` for a chunk, which reduces
+            ``chunk_size`` if exceeded. Defaults to None, no bound.
+        mode (str, optional): How the matrix is evaluated, ``'rows'`` by
+            backward passes of rows, ``'columns'`` by forward mode of
+            columns, or ``'auto'`` to pick the one with less passes. Forward
+            mode is not used in static prim mode. Defaults to ``'rows'`` .
 
     Returns:
 
@@ -242,11 +261,31 @@ class Jacobian:
 
     """
 
-    def __init__(self, func, xs, is_batched=False):
+    def __init__(
+        self,
+        func,
+        xs,
+        is_batched=False,
+        chunk_size=1,
+        memory_budget=None,
+        mode='rows',
+    ):
+        if mode not in ('auto', 'rows', 'columns'):
+            raise ValueError(
+                "mode should be 'auto', 'rows' or 'columns', but got {}.".format(
+                    mode
+                )
+            )
         if not is_batched:
-            self._jacobian = _JacobianNoBatch(func, xs)
+            self._jacobian = _JacobianNoBatch(func, xs, mode=mode)
         else:
-            self._jacobian = _JacobianBatchFirst(func, xs)
+            self._jacobian = _JacobianBatchFirst(
+                func,
+                xs,
+                chunk_size=chunk_size,
+                memory_budget=memory_budget,
+                mode=mode,
+            )
 
     def __getitem__(self, indexes):
         return self._jacobian[indexes]
@@ -279,6 +318,15 @@ class Hessian:
             the function ``func``.
         is_batched (bool): If true, the first axis is batch axis. Defaults to
             False.
+        chunk_size (int, optional): The number of rows evaluated by one
+            backward pass with batch. See details ``Jacobian`` . Defaults
+            to 1.
+        memory_budget (int, optional): The upper bound in bytes of the
+            repeated inputs and outputs for a chunk. See details
+            ``Jacobian`` . Defaults to None.
+        mode (str, optional): How the matrix is evaluated, ``'rows'`` ,
+            ``'columns'`` or ``'auto'`` . See details ``Jacobian`` .
+            Defaults to ``'rows'`` .
 
     Returns:
 
@@ -306,7 +354,15 @@ class Hessian:
         #         [0., 0., 0., 2.]])
     """
 
-    def __init__(self, func, xs, is_batched=False):
+    def __init__(
+        self,
+        func,
+        xs,
+        is_batched=False,
+        chunk_size=1,
+        memory_budget=None,
+        mode='rows',
+    ):
         def _jac_func(*xs):
             jac = Jacobian(func, xs, is_batched=is_batched)
             if (is_batched and jac.shape[1] != 1) or (
@@ -317,7 +373,14 @@ class Hessian:
                 )
             return jac[:, 0, :] if is_batched else jac[0, :]
 
-        self.symbolic = Jacobian(_jac_func, xs, is_batched=is_batched)
+        self.symbolic = Jacobian(
+            _jac_func,
+            xs,
+            is_batched=is_batched,
+            chunk_size=chunk_size,
+            memory_budget=memory_budget,
+            mode=mode,
+        )
 
     def __getitem__(self, indexes):
         return self.symbolic[indexes]
@@ -340,6 +403,9 @@ class _Jacobian:
         * ``_flatten(xs)``, flattens the inputs ``xs``.
         * ``_evaluate(index)``, evaluates one slice along ``_lazy_axis`` .
 
+    and optionally ``_evaluate_chunk(indexes)``, which evaluates
+    ``chunk_size`` slices at once.
+
     Notes:
 
         Because currently PaddlePaddle only support reverse differentiation by
@@ -349,16 +415,23 @@ class _Jacobian:
 
     """
 
-    def __init__(self, func, xs):
+    def __init__(self, func, xs, chunk_size=1, memory_budget=None, mode='rows'):
         # Skip separating in prim mode temporarily, as detach and clone are not
         # primitive operators.
-        if not paddle.fluid._non_static_mode() and utils.prim_enabled():
+        self._prim = (
+            not paddle.fluid._non_static_mode() and utils.prim_enabled()
+        )
+        if self._prim:
             self._xs = xs
         else:
             self._xs = _separate(xs)
+        self._func = func
         self._ys = func(*utils.as_tensors(self._xs))
         self._flatten_xs = self._flatten(utils.as_tensors(self._xs))
         self._flatten_ys = self._flatten(utils.as_tensors(self._ys))
+        self._chunk_size = chunk_size
+        self._memory_budget = memory_budget
+        self._mode = mode
         self._cache = {}
 
     @property
@@ -403,12 +476,13 @@ class _Jacobian:
                 other_indexes
             ]
         lazy_indexes = self._lazy_indexes(indexes)
+        self._evaluate_missing(lazy_indexes)
         # Using concat and reshape to replace stack operator temporarily, as
         # it is not a primitive operator.
         shape = list(self.shape)
         shape[self._lazy_axis] = len(lazy_indexes)
         part_jac = paddle.concat(
-            [self._cached_evaluate(i) for i in lazy_indexes],
+            [self._cache[i] for i in lazy_indexes],
             axis=self._lazy_axis,
         ).reshape(shape)
         return part_jac[self._shifted_indexes(indexes, len(lazy_indexes))]
@@ -420,10 +494,63 @@ class _Jacobian:
             self._cache[k] = v
         return v
 
+    def _evaluate_missing(self, indexes):
+        """Evaluate the slices of ``indexes`` not cached, in chunks or by
+        columns."""
+        missing = sorted({i for i in indexes if i not in self._cache})
+        if not missing:
+            return
+        chunk_size = self._max_chunk_size()
+        num_chunks = (len(missing) + chunk_size - 1) // chunk_size
+        # NOTE: evaluating by columns costs one more backward pass to build
+        # the transposed graph, see ``_double_backward_trick`` .
+        if not self._prim and (
+            self._mode == 'columns'
+            or (self._mode == 'auto' and self.shape[-1] + 1 < num_chunks)
+        ):
+            self._evaluate_by_columns()
+            return
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            if len(chunk) == 1:
+                self._cache[chunk[0]] = self._evaluate(chunk[0])
+            else:
+                self._cache.update(zip(chunk, self._evaluate_chunk(chunk)))
+
+    def _max_chunk_size(self):
+        if self._prim:
+            return 1
+        chunk_size = self._chunk_size
+        if self._memory_budget is not None:
+            replica_bytes = _nbytes(self._flatten_xs) + _nbytes(
+                self._flatten_ys
+            )
+            chunk_size = min(chunk_size, self._memory_budget // replica_bytes)
+        return max(int(chunk_size), 1)
+
+    def _evaluate_by_columns(self):
+        """Evaluate all slices along lazy axis by the Jacobian-Vector products
+        of the columns, which are computed by double backward trick."""
+        ys_grad = _zeros_like_with_grad(self._flatten_ys)
+        xs_grad = self._flatten(
+            utils.as_tensors(_grad(self._flatten_ys, self._xs, ys_grad))
+        )
+        columns = [
+            _grad(column_grad, ys_grad)
+            for column_grad in paddle.split(xs_grad, xs_grad.shape[-1], axis=-1)
+        ]
+        jac = paddle.stack(columns, axis=-1)
+        for i, row in enumerate(paddle.unbind(jac, axis=self._lazy_axis)):
+            self._cache[i] = row
+
     def _evaluate(self, index):
         """Evaluate one slice at along lazy axis."""
         raise NotImplementedError
 
+    def _evaluate_chunk(self, indexes):
+        """Evaluate the slices of ``indexes`` along lazy axis at once."""
+        raise NotImplementedError
+
 
 class _JacobianNoBatch(_Jacobian):
     """Compute Jacobian matrix without batch dimension.
@@ -431,8 +558,8 @@ class _JacobianNoBatch(_Jacobian):
     ``(N, M)`` .
     """
 
-    def __init__(self, func, xs):
-        super().__init__(func, xs)
+    def __init__(self, func, xs, mode='rows'):
+        super().__init__(func, xs, mode=mode)
 
     @property
     def shape(self):
@@ -460,8 +587,14 @@ class _JacobianBatchFirst(_Jacobian):
     ``(B, N, M)`` .
     """
 
-    def __init__(self, func, xs):
-        super().__init__(func, xs)
+    def __init__(self, func, xs, chunk_size=1, memory_budget=None, mode='rows'):
+        super().__init__(
+            func,
+            xs,
+            chunk_size=chunk_size,
+            memory_budget=memory_budget,
+            mode=mode,
+        )
 
     @property
     def shape(self):
@@ -483,6 +616,37 @@ class _JacobianBatchFirst(_Jacobian):
     def _evaluate(self, row_index):
         return self._flatten(_grad(self._flatten_ys[:, row_index], self._xs))
 
+    def _evaluate_chunk(self, row_indexes):
+        # As the samples of a batch are independent, the rows are evaluated
+        # by one backward pass of the inputs repeated along batch axis, with
+        # the cotangent of the k'th replica selecting the k'th row.
+        num_rows = len(row_indexes)
+        xs = tuple(
+            paddle.tile(x, [num_rows] + [1] * (len(x.shape) - 1))
+            for x in utils.as_tensors(self._xs)
+        )
+        ys = self._flatten(utils.as_tensors(self._func(*xs)))
+        ys_grad = paddle.nn.functional.one_hot(
+            paddle.assign(np.array(row_indexes, dtype='int64')), ys.shape[-1]
+        ).astype(ys.dtype)
+        ys_grad = ys_grad.unsqueeze(1) * paddle.ones_like(
+            ys.reshape((num_rows, -1, ys.shape[-1]))
+        )
+        xs_grad = self._flatten(
+            utils.as_tensors(_grad(ys, xs, ys_grad.reshape(ys.shape)))
+        )
+        return paddle.unbind(
+            xs_grad.reshape((num_rows, -1, xs_grad.shape[-1])), axis=0
+        )
+
+
+def _nbytes(x):
+    # the unknown dimensions in static graph are counted as 1
+    numel = 1
+    for dim in x.shape:
+        numel *= max(dim, 1)
+    return numel * core.size_of_dtype(x.dtype)
+
 
 def _multi_index(indexes, shape):
     """A tool for parsing N-dimensional index into a standard format.
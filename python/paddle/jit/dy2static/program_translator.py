@@ -13,11 +13,15 @@
 # limitations under the License.
 
 import collections
+import hashlib
 import inspect
+import os
+import pickle
 import textwrap
 import threading
 import weakref
 
+import paddle
 from paddle.fluid import _non_static_mode, framework
 from paddle.fluid.data_feeder import check_type
 from paddle.fluid.dygraph import layers
@@ -36,6 +40,7 @@ from .function_spec import (
 from .origin_info import (
     attach_origin_info,
     create_and_update_origin_info_map,
+    global_origin_info_map,
     update_op_callstack_with_origin_info,
 )
 from .partial_program import partial_program_from
@@ -46,6 +51,7 @@ from .utils import (
     func_to_source_code,
     input_specs_compatible,
     make_hashable,
+    source_to_func,
     type_name,
     unwrap,
 )
@@ -56,6 +62,75 @@ __all__ = []
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# Set the environment variable to a directory to persist the transformed code
+# of dygraph functions among processes, see `PersistentCodeCache`.
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+# Bump it when the transformed code of the same source may change.
+CODE_CACHE_VERSION = 1
+
+
+class PersistentCodeCache:
+    """
+    Persists the transformed code of dygraph functions on disk, so that a new
+    process converting the same unchanged function skips parsing and all the
+    AST transformers.
+
+    Each entry is keyed by the source code and location of the function, the
+    paddle version and the transformation flags. It holds the transformed
+    source code and the origin info (used by error messages) of each line.
+    """
+
+    def __init__(self, cache_dir):
+        self._cache_dir = cache_dir
+
+    def _path(self, func, source_code):
+        filepath = inspect.getsourcefile(func)
+        _, begin_lineno = inspect.getsourcelines(func)
+        key = repr(
+            (
+                CODE_CACHE_VERSION,
+                paddle.__version__,
+                getattr(paddle, '__git_commit__', None),
+                str(os.environ.get('FLAGS_optim_transformation')),
+                filepath,
+                begin_lineno,
+                source_code,
+            )
+        )
+        return os.path.join(
+            self._cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.pkl'
+        )
+
+    def load(self, func, source_code):
+        """
+        Returns (transformed_source, origin_infos) or None if not cached.
+        """
+        try:
+            with open(self._path(func, source_code), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def save(self, func, source_code, transformed_source, origin_infos):
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            path = self._path(func, source_code)
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((transformed_source, origin_infos), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging_utils.warn(
+                "Failed to save the transformed code of {} to cache: {}".format(
+                    func.__name__, e
+                )
+            )
+
+
+def _get_persistent_code_cache():
+    cache_dir = os.environ.get(CACHE_DIR_ENV_NAME)
+    return PersistentCodeCache(cache_dir) if cache_dir else None
+
 
 class FunctionCache:
     """
@@ -106,6 +181,23 @@ class FunctionCache:
         func = unwrap(func)
         source_code = func_to_source_code(func)
 
+        persistent_cache = _get_persistent_code_cache()
+        if (
+            persistent_cache is not None
+            and source_code not in self._code_to_ast_caches
+        ):
+            cached = persistent_cache.load(func, source_code)
+            if cached is not None:
+                transformed_source, origin_infos = cached
+                static_func, file_name = source_to_func(
+                    transformed_source, func
+                )
+                # origin infos are keyed by line of the transformed code,
+                # rebuild the map with the new temporary file name.
+                for lineno, origin_info in origin_infos.items():
+                    global_origin_info_map[(file_name, lineno)] = origin_info
+                return static_func
+
         # TODO(liym27):
         #  Consider this case: source_code in self._code_to_ast_caches,
         #  but actually they are methods in different classes.
@@ -121,7 +213,18 @@ class FunctionCache:
         # Get static function from AST
         static_func, file_name = ast_to_func(root_wrapper.node, func)
 
-        create_and_update_origin_info_map(root_wrapper.node, static_func)
+        origin_info_map = create_and_update_origin_info_map(
+            root_wrapper.node, static_func, is_global=False
+        )
+        if persistent_cache is not None:
+            with open(file_name, 'r', encoding='utf-8') as f:
+                transformed_source = f.read()
+            persistent_cache.save(
+                func,
+                source_code,
+                transformed_source,
+                {loc[1]: info for loc, info in origin_info_map.items()},
+            )
         return static_func
 
     def exist(self, func):
@@ -30,6 +30,20 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _is_tensor_(var):
+    return isinstance(var, (paddle.Tensor, paddle.fluid.core.eager.Tensor))
+
+
+def _to_numpy_(var, name):
+    if _is_tensor_(var):
+        return var.numpy()
+    elif not _is_numpy_(var):
+        raise ValueError(
+            "The '{}' must be a numpy ndarray or Tensor.".format(name)
+        )
+    return var
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -347,6 +361,9 @@ class Precision(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        on_device (bool, optional): Whether to accumulate the statistics of
+            Tensor inputs on their device, and only copy them to host in
+            `accumulate`. Default is False.
 
     Example by standalone:
 
@@ -401,11 +418,14 @@ class Precision(Metric):
           model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='precision', *args, **kwargs):
+    def __init__(self, name='precision', on_device=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fp = 0  # false positive
         self._name = name
+        self._on_device = on_device
+        self._device_tp = None
+        self._device_fp = None
 
     def update(self, preds, labels):
         """
@@ -419,27 +439,34 @@ class Precision(Metric):
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+        if self._on_device and _is_tensor_(preds) and _is_tensor_(labels):
+            # NOTE: same as np.floor(preds + 0.5) == 1
+            preds = preds.reshape([-1])
+            pred_pos = paddle.logical_and(preds >= 0.5, preds < 1.5)
+            label_pos = labels.reshape([-1]) == 1
+            tp = paddle.logical_and(pred_pos, label_pos).astype('int64').sum()
+            fp = pred_pos.astype('int64').sum() - tp
+            if self._device_tp is None:
+                self._device_tp, self._device_fp = tp, fp
+            else:
+                self._device_tp += tp
+                self._device_fp += fp
+            return
 
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        preds = _to_numpy_(preds, 'preds')
+        labels = _to_numpy_(labels, 'labels')
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+        pred_pos = np.floor(preds + 0.5).astype("int32").reshape(-1) == 1
+        tp = int(np.count_nonzero(pred_pos & (labels.reshape(-1) == 1)))
+        self.tp += tp
+        self.fp += int(np.count_nonzero(pred_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+    def _sync_device_stats(self):
+        if self._device_tp is not None:
+            self.tp += int(self._device_tp)
+            self.fp += int(self._device_fp)
+            self._device_tp = None
+            self._device_fp = None
 
     def reset(self):
         """
@@ -447,6 +474,8 @@ class Precision(Metric):
         """
         self.tp = 0
         self.fp = 0
+        self._device_tp = None
+        self._device_fp = None
 
     def accumulate(self):
         """
@@ -455,6 +484,7 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
+        self._sync_device_stats()
         ap = self.tp + self.fp
         return float(self.tp) / ap if ap != 0 else 0.0
 
@@ -480,6 +510,9 @@ class Recall(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        on_device (bool, optional): Whether to accumulate the statistics of
+            Tensor inputs on their device, and only copy them to host in
+            `accumulate`. Default is False.
 
     Example by standalone:
 
@@ -534,11 +567,14 @@ class Recall(Metric):
           model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='recall', *args, **kwargs):
+    def __init__(self, name='recall', on_device=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fn = 0  # false negative
         self._name = name
+        self._on_device = on_device
+        self._device_tp = None
+        self._device_fn = None
 
     def update(self, preds, labels):
         """
@@ -552,27 +588,35 @@ class Recall(Metric):
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        if self._on_device and _is_tensor_(preds) and _is_tensor_(labels):
+            # NOTE: same as np.rint(preds) == 1, which rounds half to even
+            preds = preds.reshape([-1])
+            pred_pos = paddle.logical_and(preds > 0.5, preds < 1.5)
+            label_pos = labels.reshape([-1]) == 1
+            tp = paddle.logical_and(pred_pos, label_pos).astype('int64').sum()
+            fn = label_pos.astype('int64').sum() - tp
+            if self._device_tp is None:
+                self._device_tp, self._device_fn = tp, fn
+            else:
+                self._device_tp += tp
+                self._device_fn += fn
+            return
+
+        preds = _to_numpy_(preds, 'preds')
+        labels = _to_numpy_(labels, 'labels')
+
+        label_pos = labels.reshape(-1) == 1
+        pred_pos = np.rint(preds).astype("int32").reshape(-1) == 1
+        tp = int(np.count_nonzero(pred_pos & label_pos))
+        self.tp += tp
+        self.fn += int(np.count_nonzero(label_pos)) - tp
+
+    def _sync_device_stats(self):
+        if self._device_tp is not None:
+            self.tp += int(self._device_tp)
+            self.fn += int(self._device_fn)
+            self._device_tp = None
+            self._device_fn = None
 
     def accumulate(self):
         """
@@ -581,6 +625,7 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
+        self._sync_device_stats()
         recall = self.tp + self.fn
         return float(self.tp) / recall if recall != 0 else 0.0
 
@@ -590,6 +635,8 @@ class Recall(Metric):
         """
         self.tp = 0
         self.fn = 0
+        self._device_tp = None
+        self._device_fn = None
 
     def name(self):
         """
@@ -602,7 +649,6 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -620,6 +666,9 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
+        on_device (bool, optional): Whether to accumulate the histograms of
+            Tensor inputs on their device, and only copy them to host in
+            `accumulate`. Default is False.
 
     "NOTE: only implement the ROC curve type via Python now."
 
@@ -681,7 +730,13 @@ class Auc(Metric):
     """
 
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        on_device=False,
+        *args,
+        **kwargs
     ):
         super().__init__(*args, **kwargs)
         self._curve = curve
@@ -691,6 +746,9 @@ class Auc(Metric):
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
         self._name = name
+        self._on_device = on_device
+        self._device_stat_pos = None
+        self._device_stat_total = None
 
     def update(self, preds, labels):
         """
@@ -704,24 +762,53 @@ class Auc(Metric):
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        if self._on_device and _is_tensor_(preds) and _is_tensor_(labels):
+            self._update_on_device(preds, labels)
+            return
+
+        labels = _to_numpy_(labels, 'labels')
+        preds = _to_numpy_(preds, 'preds')
+
+        # NOTE: astype truncates towards zero like int()
+        values = preds[:, 1].astype('float64') * self._num_thresholds
+        bin_idx = values.astype('int64')
+        if bin_idx.size > 0:
+            assert bin_idx.max() <= self._num_thresholds
+        is_pos = labels.reshape(-1) != 0
+        _num_pred_buckets = self._num_thresholds + 1
+        self._stat_pos += np.bincount(
+            bin_idx[is_pos], minlength=_num_pred_buckets
+        )
+        self._stat_neg += np.bincount(
+            bin_idx[~is_pos], minlength=_num_pred_buckets
+        )
+
+    def _update_on_device(self, preds, labels):
+        # keep the histograms on the device of preds, they are only copied to
+        # host in accumulate
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype('int64')
+        is_pos = (labels.reshape([-1]) != 0).astype('int64')
+        _num_pred_buckets = self._num_thresholds + 1
+        stat_pos = paddle.bincount(
+            bin_idx, weights=is_pos, minlength=_num_pred_buckets
+        )
+        stat_total = paddle.bincount(bin_idx, minlength=_num_pred_buckets)
+        if self._device_stat_pos is None:
+            self._device_stat_pos = stat_pos
+            self._device_stat_total = stat_total
+        else:
+            self._device_stat_pos += stat_pos
+            self._device_stat_total += stat_total
+
+    def _sync_device_stats(self):
+        if self._device_stat_pos is not None:
+            stat_pos = self._device_stat_pos.numpy()
+            stat_total = self._device_stat_total.numpy()
+            assert stat_total.shape[0] == self._num_thresholds + 1
+            self._stat_pos += stat_pos
+            self._stat_neg += stat_total - stat_pos
+            self._device_stat_pos = None
+            self._device_stat_total = None
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -734,21 +821,23 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        self._sync_device_stats()
+
+        # cumulative positives/negatives from the highest threshold down
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = np.concatenate([[0.0], tot_pos[:-1]])
+        tot_neg_prev = np.concatenate([[0.0], tot_neg[:-1]])
+        auc = float(
+            np.sum(
+                self.trapezoid_area(
+                    tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+                )
             )
-            idx -= 1
+        )
 
+        tot_pos = tot_pos[-1]
+        tot_neg = tot_neg[-1]
         return (
             auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
         )
@@ -760,6 +849,8 @@ class Auc(Metric):
         _num_pred_buckets = self._num_thresholds + 1
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
+        self._device_stat_pos = None
+        self._device_stat_total = None
 
     def name(self):
         """
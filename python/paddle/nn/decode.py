@@ -153,6 +153,14 @@ class BeamSearchDecoder(Decoder):
         :code:`BeamSearchDecoder.tile_beam_merge_with_batch` . The most common case
         for this is the encoder output in attention mechanism.
 
+    Note:
+        With `compact_finished` in dynamic graph mode, the batch entries whose
+        beams are all finished are removed from the cell's batch, and the
+        tensors of the keyword arguments of `dynamic_decode` whose first
+        dimension is `batch_size * beam_size` are compacted accordingly. The
+        `cell_states` of the final states then only include the entries
+        active at the last step.
+
     Returns:
         BeamSearchDecoder: An instance of decoder which can be used in \
             `paddle.nn.dynamic_decode` to implement decoding.
@@ -185,6 +193,9 @@ class BeamSearchDecoder(Decoder):
         beam_size,
         embedding_fn=None,
         output_fn=None,
+        length_penalty=0.0,
+        early_stopping=False,
+        compact_finished=False,
     ):
         """
         Constructor of BeamSearchDecoder.
@@ -201,6 +212,17 @@ class BeamSearchDecoder(Decoder):
                 `cell.call`. Default None.
             output_fn(optional): A callable to apply to the cell's output prior to
                 calculate scores and select candidate token ids. Default None.
+            length_penalty(float, optional): The exponent `alpha` of the length
+                penalty `((5 + length) / 6) ** alpha`, which the log probabilities
+                are divided by to rank the candidates. Default 0.0, which means
+                no length penalty.
+            early_stopping(bool, optional): Whether a batch entry finishes as
+                soon as its best beam, ranked by the length normalized score,
+                is finished. Otherwise it finishes when all its beams are
+                finished. Default False.
+            compact_finished(bool, optional): Whether to remove the finished
+                batch entries from the cell's batch in dynamic graph mode. It
+                has no effect in static graph mode. Default False.
         """
         self.cell = cell
         self.embedding_fn = embedding_fn
@@ -208,6 +230,9 @@ class BeamSearchDecoder(Decoder):
         self.start_token = start_token
         self.end_token = end_token
         self.beam_size = beam_size
+        self.length_penalty = length_penalty
+        self.early_stopping = early_stopping
+        self.compact_finished = compact_finished
 
     @staticmethod
     def tile_beam_merge_with_batch(x, beam_size):
@@ -342,6 +367,20 @@ class BeamSearchDecoder(Decoder):
             Tensor: A tensor with the same shape and data type as `x`, \
                 representing the gathered tensor.
         """
+        if paddle.in_dynamic_mode():
+            # select the rows of `x` merged as `[batch_size * x.shape[1], ...]`
+            # directly, instead of stacking the coordinates for gather_nd
+            batch_pos = paddle.arange(
+                0, int(batch_size), 1, dtype=indices.dtype
+            ) * int(x.shape[1])
+            flat_indices = paddle.reshape(
+                indices + paddle.unsqueeze(batch_pos, [1]), [-1]
+            )
+            x = self._index_select(
+                paddle.reshape(x, [-1] + list(x.shape[2:])), flat_indices
+            )
+            return paddle.reshape(x, list(indices.shape) + list(x.shape[1:]))
+
         # TODO: compatibility of int32 and int64
         batch_size = (
             paddle.cast(batch_size, indices.dtype)
@@ -359,6 +398,24 @@ class BeamSearchDecoder(Decoder):
         topk_coordinates.stop_gradient = True
         return paddle.gather_nd(x, topk_coordinates)
 
+    @staticmethod
+    def _index_select(x, index):
+        # NOTE: index_select has no kernel for bool
+        if x.dtype == paddle.bool:
+            x = paddle.index_select(paddle.cast(x, "int32"), index)
+            return paddle.cast(x, "bool")
+        return paddle.index_select(x, index)
+
+    @staticmethod
+    def _scatter(x, index, updates):
+        # NOTE: scatter has no kernel for bool
+        if x.dtype == paddle.bool:
+            x = paddle.scatter(
+                paddle.cast(x, "int32"), index, paddle.cast(updates, "int32")
+            )
+            return paddle.cast(x, "bool")
+        return paddle.scatter(x, index, updates)
+
     class OutputWrapper(
         collections.namedtuple(
             "OutputWrapper", ("scores", "predicted_ids", "parent_ids")
@@ -407,6 +464,10 @@ class BeamSearchDecoder(Decoder):
         self.kinf = 1e9
         state = flatten(initial_cell_states)[0]
         self.batch_size = paddle.shape(state)[0]
+        # the original indices of the batch entries in the cell's batch, and
+        # None means all of them
+        self._active_index = None
+        self._active_kwargs = None
 
         self.start_token_tensor = paddle.full(
             shape=[1], dtype="int64", fill_value=self.start_token
@@ -494,6 +555,9 @@ class BeamSearchDecoder(Decoder):
                 self.noend_mask_tensor, "float64"
             )
 
+        # NOTE: the batch may be compacted, use the batch size of logits
+        batch_size = paddle.shape(logits)[0]
+
         step_log_probs = paddle.log(paddle.nn.functional.softmax(logits))
         step_log_probs = self._mask_probs(step_log_probs, beam_state.finished)
 
@@ -501,8 +565,18 @@ class BeamSearchDecoder(Decoder):
             step_log_probs, beam_state.log_probs.unsqueeze([2])
         )
 
-        # TODO: length penalty
         scores = log_probs
+        if self.length_penalty:
+            # the lengths after this step, finished beams keep their lengths
+            lengths = beam_state.lengths + paddle.cast(
+                paddle.logical_not(beam_state.finished),
+                beam_state.lengths.dtype,
+            )
+            penalty = paddle.pow(
+                (paddle.cast(lengths, log_probs.dtype) + 5.0) / 6.0,
+                self.length_penalty,
+            )
+            scores = paddle.divide(scores, penalty.unsqueeze([2]))
         scores = paddle.reshape(scores, [-1, self.beam_size * self.vocab_size])
         # TODO: add grad for topk then this beam search can be used to train
         topk_scores, topk_indices = paddle.topk(x=scores, k=self.beam_size)
@@ -511,17 +585,17 @@ class BeamSearchDecoder(Decoder):
         next_log_probs = self._gather(
             paddle.reshape(log_probs, [-1, self.beam_size * self.vocab_size]),
             topk_indices,
-            self.batch_size,
+            batch_size,
         )
         next_cell_states = map_structure(
-            lambda x: self._gather(x, beam_indices, self.batch_size),
+            lambda x: self._gather(x, beam_indices, batch_size),
             next_cell_states,
         )
         next_finished = self._gather(
-            beam_state.finished, beam_indices, self.batch_size
+            beam_state.finished, beam_indices, batch_size
         )
         next_lengths = self._gather(
-            beam_state.lengths, beam_indices, self.batch_size
+            beam_state.lengths, beam_indices, batch_size
         )
         next_lengths = next_lengths + paddle.cast(
             paddle.logical_not(next_finished), beam_state.lengths.dtype
@@ -530,6 +604,13 @@ class BeamSearchDecoder(Decoder):
             next_finished,
             paddle.equal(token_indices, self.end_token_tensor),
         )
+        if self.early_stopping:
+            # NOTE: the best finished beam outranks the alive ones by the
+            # normalized scores of this step, which finishes the batch entry
+            next_finished = paddle.logical_or(
+                next_finished,
+                paddle.tile(next_finished[:, :1], [1, self.beam_size]),
+            )
 
         beam_search_output = self.OutputWrapper(
             topk_scores, token_indices, beam_indices
@@ -567,8 +648,21 @@ class BeamSearchDecoder(Decoder):
                 `[batch_size, beam_size]` with data type `float32, int64, int64`. \
                 `finished` is a `bool` tensor with shape `[batch_size, beam_size]`.
         """
+        compacting = self.compact_finished and paddle.in_dynamic_mode()
+        beam_state = states
+        if compacting and self._active_index is not None:
+            if self._active_kwargs is None:
+                self._active_kwargs = self._compact_kwargs(kwargs)
+            kwargs = self._active_kwargs
+            beam_state = self.StateWrapper(
+                states.cell_states,
+                *[self._index_select(x, self._active_index) for x in states[1:]]
+            )
+
         inputs = map_structure(self._merge_batch_beams, inputs)
-        cell_states = map_structure(self._merge_batch_beams, states.cell_states)
+        cell_states = map_structure(
+            self._merge_batch_beams, beam_state.cell_states
+        )
         cell_outputs, next_cell_states = self.cell(
             inputs, cell_states, **kwargs
         )
@@ -584,17 +678,120 @@ class BeamSearchDecoder(Decoder):
             time=time,
             logits=cell_outputs,
             next_cell_states=next_cell_states,
-            beam_state=states,
+            beam_state=beam_state,
         )
-        finished = beam_search_state.finished
         sample_ids = beam_search_output.predicted_ids
         sample_ids.stop_gradient = True
         next_inputs = (
             self.embedding_fn(sample_ids) if self.embedding_fn else sample_ids
         )
+        if compacting:
+            beam_search_output, beam_search_state, next_inputs = self._compact(
+                beam_search_output, beam_search_state, next_inputs, states
+            )
+        finished = beam_search_state.finished
 
         return (beam_search_output, beam_search_state, next_inputs, finished)
 
+    def _compact_kwargs(self, kwargs):
+        r"""
+        Select the rows of the active batch entries from the tensors in
+        `kwargs` shaped `[batch_size * beam_size, ...]`.
+        """
+        num_rows = int(self.batch_size) * self.beam_size
+        rows = paddle.reshape(
+            paddle.unsqueeze(self._active_index * self.beam_size, [1])
+            + paddle.arange(0, self.beam_size, 1, dtype="int64"),
+            [-1],
+        )
+
+        def _select(x):
+            if isinstance(x, paddle.Tensor) and x.shape[:1] == [num_rows]:
+                return self._index_select(x, rows)
+            return x
+
+        return map_structure(_select, kwargs)
+
+    def _compact(self, output, state, next_inputs, states):
+        r"""
+        Write the step results of the active batch entries back into the
+        tensors of the whole batch, and remove the batch entries finished at
+        this step from the cell states and the next inputs.
+
+        Parameters:
+            output(OutputWrapper): The step output of the active entries.
+            state(StateWrapper): The step state of the active entries.
+            next_inputs(Tensor): The next inputs of the active entries.
+            states(StateWrapper): The states of the whole batch before this
+                step, with the cell states of the active entries.
+
+        Returns:
+            tuple: A tuple( :code:`(output, state, next_inputs)` ), where \
+                `output` and the fields of `state` other than `cell_states` \
+                have the shape `[batch_size, beam_size]`.
+        """
+        if self._active_index is None:
+            self._scores = output.scores
+        else:
+            index = self._active_index
+            batch_size = int(self.batch_size)
+            # NOTE: the finished entries only select their own beams and the
+            # end tokens, and keep their scores
+            self._scores = self._scatter(self._scores, index, output.scores)
+            finished_ids = paddle.full(
+                [batch_size, self.beam_size],
+                self.end_token,
+                dtype=output.predicted_ids.dtype,
+            )
+            finished_parents = paddle.tile(
+                paddle.arange(
+                    0, self.beam_size, 1, dtype=output.parent_ids.dtype
+                ).unsqueeze([0]),
+                [batch_size, 1],
+            )
+            output = self.OutputWrapper(
+                self._scores,
+                self._scatter(finished_ids, index, output.predicted_ids),
+                self._scatter(finished_parents, index, output.parent_ids),
+            )
+            state = self.StateWrapper(
+                state.cell_states,
+                *[
+                    self._scatter(x, index, y)
+                    for x, y in zip(states[1:], state[1:])
+                ]
+            )
+
+        active_finished = paddle.all(state.finished, axis=1)
+        if self._active_index is not None:
+            active_finished = self._index_select(
+                active_finished, self._active_index
+            )
+        keep = paddle.nonzero(paddle.logical_not(active_finished))
+        num_active = (
+            int(self.batch_size)
+            if self._active_index is None
+            else int(self._active_index.shape[0])
+        )
+        if 0 < keep.shape[0] < num_active:
+            keep = paddle.reshape(keep, [-1])
+            self._active_index = (
+                keep
+                if self._active_index is None
+                else paddle.index_select(self._active_index, keep)
+            )
+            self._active_kwargs = None
+            state = self.StateWrapper(
+                map_structure(
+                    lambda x: self._index_select(x, keep), state.cell_states
+                ),
+                *state[1:]
+            )
+            next_inputs = map_structure(
+                lambda x: self._index_select(x, keep), next_inputs
+            )
+        return output, state, next_inputs
+
     def finalize(self, outputs, final_states, sequence_lengths):
         r"""
         Use `gather_tree` to backtrace along the beam search tree and construct
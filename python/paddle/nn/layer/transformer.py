@@ -154,6 +154,9 @@ class MultiHeadAttention(Layer):
 
     Cache = collections.namedtuple("Cache", ["k", "v"])
     StaticCache = collections.namedtuple("StaticCache", ["k", "v"])
+    PreallocatedCache = collections.namedtuple(
+        "PreallocatedCache", ["k", "v", "pos"]
+    )
 
     def __init__(
         self,
@@ -220,24 +223,29 @@ class MultiHeadAttention(Layer):
                 is a tensor with shape `[batch_size, value_length, vdim]`.
                 The data type should be float32 or float64. If None, use `query` as
                 `value`.
-            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache, optional):
+            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache|MultiHeadAttention.PreallocatedCache, optional):
                 It is a namedtuple with `k` and `v` as fields, and stores tensors
                 shaped `[batch_size, num_heads, length, embed_dim]` which are results
                 of linear projection, reshape and transpose calculations in
                 MultiHeadAttention. If is an instance of `Cache`, `k` and `v`
                 fields reserve intermediate results of previous positions, which
                 mostly used for decoder self attention. If it is an instance of
-                `StaticCache`, `key` and `value` args would be ignored, `k` and
-                `v` fields would be used as calculated results on `key` and
-                `value`, which mostly used for decoder-encoder cross attention.
-                It is only used for inference and should be None for training.
-                Default None.
+                `PreallocatedCache`, it is the same as `Cache` except that `k` and
+                `v` are buffers of `max_length` positions, and the results of the
+                current positions are written into them at `pos` in place. If it
+                is an instance of `StaticCache`, `key` and `value` args would be
+                ignored, `k` and `v` fields would be used as calculated results on
+                `key` and `value`, which mostly used for decoder-encoder cross
+                attention. It is only used for inference and should be None for
+                training. Default None.
 
         Returns:
             tuple: A tuple including linear projected keys and values. These two \
                 tensors have shapes `[batch_size, n_head, sequence_length, d_key]` \
                 and `[batch_size, n_head, sequence_length, d_value]` separately, \
-                and their data types are same as inputs.
+                and their data types are same as inputs. If `cache` is \
+                `PreallocatedCache`, they are the whole buffers of `max_length` \
+                positions.
         """
         q = self.q_proj(query)
         q = tensor.reshape(x=q, shape=[0, 0, self.num_heads, self.head_dim])
@@ -254,6 +262,24 @@ class MultiHeadAttention(Layer):
             k = tensor.concat([cache.k, k], axis=2)
             v = tensor.concat([cache.v, v], axis=2)
             cache = self.Cache(k, v)
+        elif isinstance(cache, self.PreallocatedCache):
+            # for decoder self-attention in inference, write the current
+            # positions into the buffers in place and attend to the whole
+            # buffers, the positions after `pos` are masked out in `forward`.
+            # NOTE: slicing the valid prefix would copy it every step.
+            end = cache.pos + k.shape[2]
+            max_length = cache.k.shape[2]
+            if end > max_length:
+                raise ValueError(
+                    "The PreallocatedCache of max_length {} overflows, as {} "
+                    "positions are cached and {} more are given.".format(
+                        max_length, cache.pos, k.shape[2]
+                    )
+                )
+            cache.k[:, :, cache.pos : end, :] = k
+            cache.v[:, :, cache.pos : end, :] = v
+            k, v = cache.k, cache.v
+            cache = self.PreallocatedCache(cache.k, cache.v, end)
 
         return (q, k, v) if cache is None else (q, k, v, cache)
 
@@ -289,11 +315,12 @@ class MultiHeadAttention(Layer):
         v = tensor.transpose(x=v, perm=[0, 2, 1, 3])
         return k, v
 
-    def gen_cache(self, key, value=None, type=Cache):
+    def gen_cache(self, key, value=None, type=Cache, max_length=None):
         """
         Generates cache for `forward` usage in inference accroding to arguments.
-        The generated cache is an instance of `MultiHeadAttention.Cache` or an
-        instance of `MultiHeadAttention.StaticCache`.
+        The generated cache is an instance of `MultiHeadAttention.Cache`, an
+        instance of `MultiHeadAttention.StaticCache` or an instance of
+        `MultiHeadAttention.PreallocatedCache`.
 
         `Cache` or `StaticCache` is namedtuple with `k` and `v` as fields,
         and it stores tensors shaped `[batch_size, num_heads, length, embed_dim]`
@@ -323,6 +350,12 @@ class MultiHeadAttention(Layer):
         3. If `type` is `Cache` and `value` is not None, use `key`, `value` to create
         an instance of `Cache`.
 
+        4. If `type` is `PreallocatedCache`, generate zero tensors shaped
+        `[batch_size, num_heads, max_length, embed_dim // num_heads]`, and if
+        `value` is not None, write `key`, `value` into their prefix. The
+        results and the length of the prefix are used to create an instance of
+        `PreallocatedCache`.
+
         Parameters:
             key (Tensor): The keys for multi-head attention. It is
                 a tensor with shape `[batch_size, key_length, kdim]`. The
@@ -332,15 +365,42 @@ class MultiHeadAttention(Layer):
                 is a tensor with shape `[batch_size, value_length, vdim]`.
                 The data type should be float32 or float64. If None, `key` is only
                 for batch size reference. Default None.
-            type (type): It should be `MultiHeadAttention.StaticCache` or
-                `MultiHeadAttention.Cache` to indicate the cache type to generate.
+            type (type): It should be `MultiHeadAttention.StaticCache`,
+                `MultiHeadAttention.Cache` or `MultiHeadAttention.PreallocatedCache`
+                to indicate the cache type to generate.
+            max_length (int, optional): The number of positions of the buffers
+                of `PreallocatedCache`. It is required if `type` is
+                `PreallocatedCache`. Default None.
 
         Returns:
-            namedtuple: an instance of `Cache` or `StaticCache` accordingly.
+            namedtuple: an instance of `Cache`, `StaticCache` or `PreallocatedCache` accordingly.
         """
         if type == MultiHeadAttention.StaticCache:  # static_kv
             k, v = self.compute_kv(key, value)
             return self.StaticCache(k, v)
+        elif type == MultiHeadAttention.PreallocatedCache:
+            assert (
+                max_length is not None and max_length > 0
+            ), "max_length should be a positive int for PreallocatedCache"
+            k = layers.fill_constant_batch_size_like(
+                input=key,
+                shape=[-1, self.num_heads, max_length, self.head_dim],
+                dtype=key.dtype,
+                value=0,
+            )
+            v = layers.fill_constant_batch_size_like(
+                input=key,
+                shape=[-1, self.num_heads, max_length, self.head_dim],
+                dtype=key.dtype,
+                value=0,
+            )
+            pos = 0
+            if value is not None:
+                # incremental_state with initial value, mainly for usage like UniLM
+                pos = key.shape[2]
+                k[:, :, :pos, :] = key
+                v[:, :, :pos, :] = value
+            return self.PreallocatedCache(k, v, pos)
         elif value is None:  # incremental_state
             k = layers.fill_constant_batch_size_like(
                 input=key,
@@ -359,6 +419,29 @@ class MultiHeadAttention(Layer):
             # incremental_state with initial value, mainly for usage like UniLM
             return self.Cache(key, value)
 
+    def reorder_cache(self, cache, index):
+        """
+        Reorders the batch of an incremental cache by `index` (e.g. the parent
+        beams in beam search). The buffers of `PreallocatedCache` are updated
+        in place.
+
+        Parameters:
+            cache (MultiHeadAttention.Cache|MultiHeadAttention.PreallocatedCache):
+                The cache to reorder.
+            index (Tensor): A 1-D int32 or int64 tensor with the indices of
+                the batch to gather.
+
+        Returns:
+            namedtuple: The reordered cache of the same type as `cache`.
+        """
+        k = paddle.index_select(cache.k, index, axis=0)
+        v = paddle.index_select(cache.v, index, axis=0)
+        if isinstance(cache, self.PreallocatedCache):
+            paddle.assign(k, cache.k)
+            paddle.assign(v, cache.v)
+            return cache
+        return type(cache)(k, v)
+
     def forward(self, query, key=None, value=None, attn_mask=None, cache=None):
         r"""
         Applies multi-head attention to map queries and a set of key-value pairs
@@ -386,18 +469,24 @@ class MultiHeadAttention(Layer):
                 values. When the data type is float, the unwanted positions have
                 `-INF` values and the others have 0 values. It can be None when
                 nothing wanted or needed to be prevented attention to. Default None.
-            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache, optional):
+            cache (MultiHeadAttention.Cache|MultiHeadAttention.StaticCache|MultiHeadAttention.PreallocatedCache, optional):
                 It is a namedtuple with `k` and `v` as fields, and stores tensors
                 shaped `[batch_size, num_heads, length, embed_dim]` which are results
                 of linear projection, reshape and transpose calculations in
                 MultiHeadAttention. If it is an instance of `Cache`, `k` and `v`
                 fields reserve intermediate results of previous positions, which
                 mostly used for decoder self attention. If it is an instance of
-                `StaticCache`, `key` and `value` args would be ignored, `k` and
-                `v` fields would be used as calculated results on `key` and
-                `value`, which mostly used for decoder-encoder cross attention.
-                It is only used for inference and should be None for training.
-                Default None.
+                `PreallocatedCache`, it is the same as `Cache` except that `k` and
+                `v` are buffers of `max_length` positions, and the results of the
+                current positions are written into them at `pos` in place, the
+                attention then covers the whole buffers with the positions not
+                written masked out, and `attn_mask` can cover either the valid
+                or all the `max_length` positions. If it
+                is an instance of `StaticCache`, `key` and `value` args would be
+                ignored, `k` and `v` fields would be used as calculated results on
+                `key` and `value`, which mostly used for decoder-encoder cross
+                attention. It is only used for inference and should be None for
+                training. Default None.
 
         Returns:
             Tensor|tuple: It is a tensor that has the same shape and data type \
@@ -409,7 +498,9 @@ class MultiHeadAttention(Layer):
                 having the same type as `cache`, and if it is `StaticCache`, it \
                 is same as the input `cache`, if it is `Cache`, the new cache \
                 reserves tensors concatanating raw tensors with intermediate \
-                results of current query.
+                results of current query, if it is `PreallocatedCache`, the new \
+                cache shares the buffers with `cache` and has the `pos` after \
+                current query.
         """
         key = query if key is None else key
         value = query if value is None else value
@@ -426,7 +517,30 @@ class MultiHeadAttention(Layer):
         if attn_mask is not None:
             # Support bool or int mask
             attn_mask = _convert_attention_mask(attn_mask, product.dtype)
+            if (
+                isinstance(cache, self.PreallocatedCache)
+                and attn_mask.shape[-1] == cache.pos
+                and cache.pos != k.shape[2]
+            ):
+                # the mask of the valid prefix is padded to the buffers, and
+                # the padded positions are masked out below
+                attn_mask = tensor.concat(
+                    [
+                        attn_mask,
+                        paddle.full(
+                            attn_mask.shape[:-1] + [k.shape[2] - cache.pos],
+                            0,
+                            dtype=attn_mask.dtype,
+                        ),
+                    ],
+                    axis=-1,
+                )
             product = product + attn_mask
+        if isinstance(cache, self.PreallocatedCache):
+            # mask out the positions of the buffers after `pos`
+            product = product + (paddle.arange(k.shape[2]) >= cache.pos).astype(
+                product.dtype
+            ) * (-1e9)
         weights = F.softmax(product)
         if self.dropout:
             weights = F.dropout(
@@ -993,7 +1107,7 @@ class TransformerDecoderLayer(Layer):
             tgt if cache is None else (tgt, (incremental_cache, static_cache))
         )
 
-    def gen_cache(self, memory):
+    def gen_cache(self, memory, max_length=None):
         r"""
         Generates cache for `forward` usage. The generated cache is a tuple
         composed of an instance of `MultiHeadAttention.Cache` and an instance
@@ -1003,6 +1117,9 @@ class TransformerDecoderLayer(Layer):
             memory (Tensor): The output of Transformer encoder. It is a tensor
                 with shape `[batch_size, source_length, d_model]`. The data type
                 should be float32 or float64.
+            max_length (int, optional): If it is not None, `incremental_cache`
+                is an instance of `MultiHeadAttention.PreallocatedCache` with
+                buffers of `max_length` positions instead. Default None.
 
         Returns:
             tuple: It is a tuple( :code:`(incremental_cache, static_cache)` ). \
@@ -1015,9 +1132,16 @@ class TransformerDecoderLayer(Layer):
                 See `MultiHeadAttention.gen_cache` and `MultiHeadAttention.forward` \
                 for more details.
         """
-        incremental_cache = self.self_attn.gen_cache(
-            memory, type=self.self_attn.Cache
-        )
+        if max_length is None:
+            incremental_cache = self.self_attn.gen_cache(
+                memory, type=self.self_attn.Cache
+            )
+        else:
+            incremental_cache = self.self_attn.gen_cache(
+                memory,
+                type=self.self_attn.PreallocatedCache,
+                max_length=max_length,
+            )
         static_cache = self.cross_attn.gen_cache(
             memory, memory, type=self.cross_attn.StaticCache
         )
@@ -1150,7 +1274,7 @@ class TransformerDecoder(Layer):
 
         return output if cache is None else (output, new_caches)
 
-    def gen_cache(self, memory, do_zip=False):
+    def gen_cache(self, memory, do_zip=False, max_length=None):
         r"""
         Generates cache for `forward` usage. The generated cache is a list, and
         each element in it is a tuple( :code:`(incremental_cache, static_cache)` )
@@ -1165,6 +1289,9 @@ class TransformerDecoder(Layer):
                 should be float32 or float64.
             do_zip (bool, optional): Indicate whether to apply `zip` on the tuples.
                 If True, return a list with two elements. Default False
+            max_length (int, optional): If it is not None, the incremental caches
+                are instances of `MultiHeadAttention.PreallocatedCache` with
+                buffers of `max_length` positions. Default None.
 
         Returns:
             list: It is a list, and each element in the list is a tuple produced \
@@ -1172,7 +1299,10 @@ class TransformerDecoder(Layer):
                 for more details. If `do_zip` is True, apply `zip` on these tuples \
                 and return a list with two elements.
         """
-        cache = [layer.gen_cache(memory) for layer in self.layers]
+        cache = [
+            layer.gen_cache(memory, max_length=max_length)
+            for layer in self.layers
+        ]
         if do_zip:
             cache = list(zip(*cache))
         return cache
@@ -358,6 +358,8 @@ class Profiler:
         profile_memory (bool, optional): If it is True, collect tensor memory allocation and release information. Default: False.
         custom_device_types (list, optional): If targets contain profiler.ProfilerTarget.CUSTOM_DEVICE, custom_device_types select the custom device type for profiling. The default value represents all custom devices will be selected.
         with_flops (bool, optional): If it is True, the flops of the op will be calculated. Default: False.
+        incremental_summary (bool, optional): If it is True, the statistic data of every profiling window is analysed as soon as it returns, and accumulated,
+            so :ref:`summary <api_paddle_profiler_profiler_summary>` prints the summary of all windows instead of the last one. Default: False.
 
     Examples:
         1. profiling range [2, 5).
@@ -480,6 +482,7 @@ class Profiler:
         emit_nvtx: Optional[bool] = False,
         custom_device_types: Optional[list] = [],
         with_flops: Optional[bool] = False,
+        incremental_summary: Optional[bool] = False,
     ):
         supported_targets = _get_supported_targets()
         if targets:
@@ -544,6 +547,8 @@ class Profiler:
         self.profile_memory = profile_memory
         self.with_flops = with_flops
         self.emit_nvtx = emit_nvtx
+        self.incremental_summary = incremental_summary
+        self._statistic_data = None
 
     def __enter__(self):
         self.start()
@@ -642,7 +647,7 @@ class Profiler:
             self.current_state == ProfilerState.RECORD
             or self.current_state == ProfilerState.RECORD_AND_RETURN
         ):
-            self.profiler_result = self.profiler.stop()
+            self._update_profiler_result(self.profiler.stop())
             if self.on_trace_ready:
                 self.on_trace_ready(self)
         utils._is_profiler_used = False
@@ -786,27 +791,38 @@ class Profiler:
             if (
                 self.current_state == ProfilerState.CLOSED
             ):  # RECORD_AND_RETURN -> CLOSED
-                self.profiler_result = self.profiler.stop()
+                self._update_profiler_result(self.profiler.stop())
             if (
                 self.current_state == ProfilerState.READY
             ):  # RECORD_AND_RETURN -> READY
-                self.profiler_result = self.profiler.stop()
+                self._update_profiler_result(self.profiler.stop())
                 self.profiler.prepare()
             if (
                 self.current_state == ProfilerState.RECORD
             ):  # RECORD_AND_RETURN -> RECORD
-                self.profiler_result = self.profiler.stop()
+                self._update_profiler_result(self.profiler.stop())
                 self.profiler.prepare()
                 self.profiler.start()
             if (
                 self.current_state == ProfilerState.RECORD_AND_RETURN
             ):  # RECORD_AND_RETURN -> RECORD_AND_RETURN
-                self.profiler_result = self.profiler.stop()
+                self._update_profiler_result(self.profiler.stop())
                 self.profiler.prepare()
                 self.profiler.start()
             if self.on_trace_ready:
                 self.on_trace_ready(self)
 
+    def _update_profiler_result(self, profiler_result):
+        self.profiler_result = profiler_result
+        if self.incremental_summary and profiler_result:
+            statistic_data = StatisticData(
+                profiler_result.get_data(), profiler_result.get_extra_info()
+            )
+            if self._statistic_data is None:
+                self._statistic_data = statistic_data
+            else:
+                self._statistic_data.merge(statistic_data)
+
     def export(self, path="", format="json"):
         r"""
         Exports the tracing data to file.
@@ -874,10 +890,13 @@ class Profiler:
             views = [views]
 
         if self.profiler_result:
-            statistic_data = StatisticData(
-                self.profiler_result.get_data(),
-                self.profiler_result.get_extra_info(),
-            )
+            if self.incremental_summary:
+                statistic_data = self._statistic_data
+            else:
+                statistic_data = StatisticData(
+                    self.profiler_result.get_data(),
+                    self.profiler_result.get_extra_info(),
+                )
             print(
                 _build_table(
                     statistic_data,
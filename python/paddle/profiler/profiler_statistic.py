@@ -15,14 +15,20 @@ import collections
 import re
 from enum import Enum
 
+import numpy as np
+
 from paddle.fluid.core import TracerEventType, TracerMemEventType
 from paddle.utils.flops import flops
 
 from .statistic_helper import (
-    intersection_ranges,
+    GroupBy,
+    intersect_ranges,
+    list_to_ranges,
     merge_ranges,
-    merge_self_ranges,
+    ragged_arange,
+    ranges_to_list,
     sum_ranges,
+    union_ranges,
 )
 
 _AllTracerEventType = [
@@ -336,6 +342,344 @@ def wrap_tree(nodetrees):
     return node_statistic_tree, newresults
 
 
+class _Interner:
+    r'''
+    Map hashable values to consecutive ids.
+    '''
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def __call__(self, value):
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.ids[value] = idx
+            self.values.append(value)
+        return idx
+
+    def get(self, value):
+        return self.ids.get(value, -1)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class EventTable:
+    r'''
+    Columnar, numpy backed view of the profiler node trees.
+
+    Host events (including the runtime events of host nodes) are the rows of
+    the host columns, rows are numbered in the order traverse_tree visits the
+    nodes. Device events and memory events have their own columns, and refer
+    to the host row they belong to. Names, event types, threads and places
+    are stored as ids of the corresponding interners.
+
+    The statistic metrics of HostStatisticNode (cpu_time, self_cpu_time,
+    gpu_time, ...) are computed for all host rows at once.
+    '''
+
+    def __init__(self, nodetrees):
+        self.names = _Interner()
+        self.types = _Interner()
+        self.threads = _Interner()
+        self.places = _Interner()
+        self.mem_types = _Interner()
+
+        host_rows = []
+        device_rows = []
+        mem_rows = []
+
+        def add_host(node, tree, parent, depth, sibling, is_runtime):
+            row = len(host_rows)
+            node_type = node.type
+            node_flops = 0
+            if (
+                not is_runtime
+                and node_type == TracerEventType.Operator
+                and hasattr(node, 'input_shapes')
+            ):
+                node_flops = flops(
+                    _nodename2opname(node.name),
+                    node.input_shapes,
+                    node.attributes,
+                )
+            # NOTE: root nodes are placeholders, their time range (maybe
+            # infinite) is never used.
+            host_rows.append(
+                (
+                    tree,
+                    self.names(node.name),
+                    self.types(node_type),
+                    self.threads(node.thread_id),
+                    node.start_ns if depth else 0,
+                    node.end_ns if depth else 0,
+                    parent,
+                    depth,
+                    sibling,
+                    is_runtime,
+                    node_flops,
+                )
+            )
+            for devicenode in node.device_node:
+                device_rows.append(
+                    (
+                        self.names(devicenode.name),
+                        self.types(devicenode.type),
+                        devicenode.device_id,
+                        devicenode.stream_id,
+                        devicenode.start_ns,
+                        devicenode.end_ns,
+                        row,
+                    )
+                )
+            return row
+
+        for tree, rootnode in enumerate(nodetrees.values()):
+            stack = [(rootnode, -1, 0, 0)]
+            while stack:
+                node, parent, depth, sibling = stack.pop()
+                row = add_host(node, tree, parent, depth, sibling, False)
+                for i, runtimenode in enumerate(node.runtime_node):
+                    add_host(runtimenode, tree, row, depth + 1, i, True)
+                for memnode in node.mem_node:
+                    mem_rows.append(
+                        (
+                            row,
+                            self.mem_types(memnode.type),
+                            self.places(memnode.place),
+                            memnode.increase_bytes,
+                            memnode.peak_allocated,
+                            memnode.peak_reserved,
+                        )
+                    )
+                for i, childnode in enumerate(node.children_node):
+                    stack.append((childnode, row, depth + 1, i))
+
+        def to_columns(rows, dtypes):
+            columns = list(zip(*rows)) or [[]] * len(dtypes)
+            return [
+                np.array(column, dtype=dtype)
+                for column, dtype in zip(columns, dtypes)
+            ]
+
+        (
+            self.tree,
+            self.name,
+            self.type,
+            self.thread,
+            self.start_ns,
+            self.end_ns,
+            self.parent,
+            self.depth,
+            self.sibling,
+            self.is_runtime,
+            self.node_flops,
+        ) = to_columns(host_rows, ['int64'] * 9 + ['bool', 'int64'])
+        (
+            self.device_name,
+            self.device_type,
+            self.device_id,
+            self.device_stream_id,
+            self.device_start_ns,
+            self.device_end_ns,
+            self.device_host,
+        ) = to_columns(device_rows, ['int64'] * 7)
+        (
+            self.mem_host,
+            self.mem_type,
+            self.mem_place,
+            self.mem_increase_bytes,
+            self.mem_peak_allocated,
+            self.mem_peak_reserved,
+        ) = to_columns(mem_rows, ['int64'] * 6)
+
+        self._build_index()
+        self._cal_statistic()
+
+    @property
+    def num_rows(self):
+        return len(self.name)
+
+    def type_id(self, event_type):
+        return self.types.get(event_type)
+
+    def type_mask(self, types, event_types):
+        r'''
+        Mask of the entries of types (host or device type ids) which are one
+        of event_types.
+        '''
+        ids = [self.type_id(event_type) for event_type in event_types]
+        return np.isin(types, [idx for idx in ids if idx >= 0])
+
+    def name_mask(self, func):
+        r'''
+        Evaluate func on every distinct name, return a bool array indexed by
+        name id.
+        '''
+        return np.array(
+            [bool(func(name)) for name in self.names.values], dtype='bool'
+        )
+
+    def host_rows_mask(self):
+        r'''
+        Mask of the host rows except the root and the runtime rows.
+        '''
+        return (self.depth > 0) & ~self.is_runtime
+
+    def _build_index(self):
+        # children (including runtime rows) of every row, sorted by row and
+        # by the position in children_node / runtime_node
+        has_parent = np.flatnonzero(self.parent >= 0)
+        order = np.lexsort(
+            (
+                self.sibling[has_parent],
+                self.is_runtime[has_parent],
+                self.parent[has_parent],
+            )
+        )
+        self._children = has_parent[order]
+        counts = np.bincount(self.parent[has_parent], minlength=self.num_rows)
+        self._children_offsets = np.concatenate([[0], np.cumsum(counts)])
+        # device rows of every host row, in the order of device_node
+        order = np.argsort(self.device_host, kind='stable')
+        self._devices = order
+        counts = np.bincount(self.device_host, minlength=self.num_rows)
+        self._devices_offsets = np.concatenate([[0], np.cumsum(counts)])
+        # rows grouped by depth, for the level by level traversals
+        order = np.argsort(self.depth, kind='stable')
+        counts = np.bincount(self.depth) if self.num_rows else []
+        self._levels = np.split(order, np.cumsum(counts)[:-1])
+
+    def children(self, rows):
+        r'''
+        Return the children rows (host children first, then runtime rows) of
+        rows, and the position in rows of the parent of every child.
+        '''
+        rows = np.asarray(rows, dtype='int64')
+        starts = self._children_offsets[rows]
+        index, owner = ragged_arange(
+            starts, self._children_offsets[rows + 1] - starts
+        )
+        return self._children[index], owner
+
+    def devices(self, rows):
+        r'''
+        Return the device rows of host rows, and the position in rows of the
+        host row of every device row.
+        '''
+        rows = np.asarray(rows, dtype='int64')
+        starts = self._devices_offsets[rows]
+        index, owner = ragged_arange(
+            starts, self._devices_offsets[rows + 1] - starts
+        )
+        return self._devices[index], owner
+
+    def runtime_devices(self, rows):
+        r'''
+        Return the device rows called by the runtime rows of host rows, which
+        are in the order of runtime_node then device_node, and the position
+        in rows of their host row.
+        '''
+        children, owner = self.children(rows)
+        runtime = self.is_runtime[children]
+        devices, device_owner = self.devices(children[runtime])
+        return devices, owner[runtime][device_owner]
+
+    def _cal_statistic(self):
+        num_rows = self.num_rows
+        duration = self.end_ns - self.start_ns
+        device_duration = self.device_end_ns - self.device_start_ns
+        kernel = self.type_mask(self.device_type, [TracerEventType.Kernel])
+
+        def scatter_add(index, values):
+            result = np.zeros([num_rows], dtype='int64')
+            np.add.at(result, index, values)
+            return result
+
+        has_parent = self.parent >= 0
+        self.cpu_time = duration
+        self.self_cpu_time = duration - scatter_add(
+            self.parent[has_parent], duration[has_parent]
+        )
+        self.gpu_time = scatter_add(
+            self.device_host[kernel], device_duration[kernel]
+        )
+        self.general_gpu_time = scatter_add(self.device_host, device_duration)
+        self.flops = self.node_flops.copy()
+        # runtime rows have no children, their gpu time is the time of their
+        # own device events
+        runtime = np.flatnonzero(self.is_runtime)
+        self.self_gpu_time = self.gpu_time + scatter_add(
+            self.parent[runtime], self.gpu_time[runtime]
+        )
+        self.self_general_gpu_time = self.general_gpu_time + scatter_add(
+            self.parent[runtime], self.general_gpu_time[runtime]
+        )
+        # accumulate the children bottom up, level by level
+        for rows in reversed(self._levels[1:]):
+            parent = self.parent[rows]
+            np.add.at(self.gpu_time, parent, self.gpu_time[rows])
+            np.add.at(
+                self.general_gpu_time, parent, self.general_gpu_time[rows]
+            )
+            host_rows = rows[~self.is_runtime[rows]]
+            np.add.at(self.flops, self.parent[host_rows], self.flops[host_rows])
+
+    def bfs_order(self, rows):
+        r'''
+        Sort rows in the order of a breadth first traversal of every tree.
+        '''
+        rank = np.zeros([self.num_rows], dtype='int64')
+        for level in self._levels[1:]:
+            order = np.lexsort(
+                (
+                    self.sibling[level],
+                    self.is_runtime[level],
+                    rank[self.parent[level]],
+                )
+            )
+            rank[level[order]] = np.arange(len(level))
+        rows = np.asarray(rows, dtype='int64')
+        return rows[np.lexsort((rank[rows], self.depth[rows], self.tree[rows]))]
+
+    def propagate_down(self, flags, through):
+        r'''
+        Return flags OR-ed with the value of any ancestor whose through is
+        True, i.e. result[i] = flags[i] or any(through[a] for a in
+        ancestors(i)) where ancestors stop at the root (excluded).
+        '''
+        result = flags.copy()
+        inherit = np.zeros([self.num_rows], dtype='bool')
+        for rows in self._levels[2:]:
+            parent = self.parent[rows]
+            inherit[rows] = inherit[parent] | through[parent]
+        return result | inherit
+
+
+def _as_event_table(nodetrees):
+    if isinstance(nodetrees, EventTable):
+        return nodetrees
+    return EventTable(nodetrees)
+
+
+def _merge_ranges_list(ranges1, ranges2):
+    starts1, ends1 = list_to_ranges(ranges1)
+    starts2, ends2 = list_to_ranges(ranges2)
+    return ranges_to_list(
+        *union_ranges(
+            np.concatenate([starts1, starts2]), np.concatenate([ends1, ends2])
+        )
+    )
+
+
+def _num_unique_ranges(starts, ends):
+    if len(starts) == 0:
+        return 0
+    return len(np.unique(np.stack([starts, ends], axis=1), axis=0))
+
+
 class TimeRangeSummary:
     r"""
     Analyse time ranges for each TracerEventType, and summarize the time.
@@ -356,48 +700,57 @@ class TimeRangeSummary:
         r"""
         Analysis node trees in profiler result, and get time range for different tracer event type.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            CPUTimeRange = collections.defaultdict(list)
-            GPUTimeRange = collections.defaultdict(
-                lambda: collections.defaultdict(
-                    lambda: collections.defaultdict(list)
+        table = _as_event_table(nodetrees)
+        # skip root node and the runtime nodes of root node
+        rows = np.flatnonzero(
+            (table.depth > 0) & ~(table.is_runtime & (table.depth == 1))
+        )
+        devices, _ = table.devices(rows[table.is_runtime[rows]])
+
+        groups = GroupBy(table.type[rows])
+        for i, type_id in enumerate(groups.keys.tolist()):
+            group_rows = rows[groups.inverse == i]
+            self.CPUTimeRange[table.types.values[type_id]] = ranges_to_list(
+                *union_ranges(
+                    table.start_ns[group_rows], table.end_ns[group_rows]
                 )
-            )  # device_id/type/stream_id
-            for hostnode in hostnodes[1:]:  # skip root node
+            )
 
-                CPUTimeRange[hostnode.type].append(
-                    (hostnode.start_ns, hostnode.end_ns)
-                )
-                self.call_times[hostnode.type] += 1
-                for runtimenode in hostnode.runtime_node:
-                    CPUTimeRange[runtimenode.type].append(
-                        (runtimenode.start_ns, runtimenode.end_ns)
-                    )
-                    self.call_times[runtimenode.type] += 1
-                    for devicenode in runtimenode.device_node:
-                        GPUTimeRange[devicenode.device_id][devicenode.type][
-                            devicenode.stream_id
-                        ].append((devicenode.start_ns, devicenode.end_ns))
-                        self.call_times[devicenode.type] += 1
-
-            for event_type, time_ranges in CPUTimeRange.items():
-                time_ranges = merge_self_ranges(time_ranges, is_sorted=False)
-                self.CPUTimeRange[event_type] = merge_ranges(
-                    self.CPUTimeRange[event_type], time_ranges, is_sorted=True
+        num_types = len(table.types)
+        groups = GroupBy(
+            table.device_id[devices] * num_types + table.device_type[devices]
+        )
+        for i, key in enumerate(groups.keys.tolist()):
+            device_id, type_id = divmod(key, num_types)
+            group_devices = devices[groups.inverse == i]
+            self.GPUTimeRange[device_id][
+                table.types.values[type_id]
+            ] = ranges_to_list(
+                *union_ranges(
+                    table.device_start_ns[group_devices],
+                    table.device_end_ns[group_devices],
                 )
-            for device_id, device_time_ranges in GPUTimeRange.items():
-                for event_type, event_time_ranges in device_time_ranges.items():
-                    for stream_id, time_ranges in event_time_ranges.items():
-                        time_ranges = merge_self_ranges(
-                            time_ranges, is_sorted=False
-                        )
-                        self.GPUTimeRange[device_id][event_type] = merge_ranges(
-                            self.GPUTimeRange[device_id][event_type],
-                            time_ranges,
-                            is_sorted=True,
-                        )
+            )
 
+        # count the events in the order they are visited, device events
+        # follow the runtime event which launches them
+        order = np.argsort(
+            np.concatenate([rows * 2, table.device_host[devices] * 2 + 1]),
+            kind='stable',
+        )
+        groups = GroupBy(
+            np.concatenate([table.type[rows], table.device_type[devices]])[
+                order
+            ]
+        )
+        for type_id, count in zip(
+            groups.keys.tolist(), groups.count().tolist()
+        ):
+            self.call_times[table.types.values[type_id]] += count
+
+        self._update_range_sum()
+
+    def _update_range_sum(self):
         for event_type, time_ranges in self.CPUTimeRange.items():
             self.CPUTimeRangeSum[event_type] = sum_ranges(time_ranges)
         for device_id, device_time_ranges in self.GPUTimeRange.items():
@@ -406,6 +759,23 @@ class TimeRangeSummary:
                     time_ranges
                 )
 
+    def merge(self, other):
+        r"""
+        Merge the summary of another profiling window into this one.
+        """
+        for event_type, time_ranges in other.CPUTimeRange.items():
+            self.CPUTimeRange[event_type] = _merge_ranges_list(
+                self.CPUTimeRange[event_type], time_ranges
+            )
+        for device_id, device_time_ranges in other.GPUTimeRange.items():
+            for event_type, time_ranges in device_time_ranges.items():
+                self.GPUTimeRange[device_id][event_type] = _merge_ranges_list(
+                    self.GPUTimeRange[device_id][event_type], time_ranges
+                )
+        for event_type, count in other.call_times.items():
+            self.call_times[event_type] += count
+        self._update_range_sum()
+
     def get_gpu_devices(self):
         return self.GPUTimeRange.keys()
 
@@ -435,72 +805,115 @@ class DistributedSummary:
         '''
         Collect all communication and computation time ranges.
         '''
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            for hostnode in hostnodes[1:]:  # skip root node
-                # case 1: TracerEventType is Communication
-                if hostnode.type == TracerEventType.Communication:
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
-
-                # case 2: TracerEventType is Operator but is communication op
-                elif hostnode.type == TracerEventType.Operator and any(
-                    [
-                        name in hostnode.name.lower()
-                        for name in _CommunicationOpName
-                    ]
-                ):
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
-
-                # case 3: Others, filter kernels named with nccl
-                else:
-                    for runtimenode in hostnode.runtime_node:
-                        for devicenode in runtimenode.device_node:
-                            if devicenode.type == TracerEventType.Kernel:
-                                if 'nccl' in devicenode.name.lower():
-                                    self.gpu_communication_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-                                else:
-                                    self.computation_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-        self.cpu_calls = len(set(self.cpu_communication_range))
-        self.gpu_calls = len(set(self.gpu_communication_range))
-        self.cpu_communication_range = merge_self_ranges(
-            self.cpu_communication_range, is_sorted=False
+        table = _as_event_table(nodetrees)
+        operator = table.type_mask(table.type, [TracerEventType.Operator])
+        communication_op = table.name_mask(
+            lambda name: any(
+                [op_name in name.lower() for op_name in _CommunicationOpName]
+            )
         )
-        self.gpu_communication_range = merge_self_ranges(
-            self.gpu_communication_range, is_sorted=False
+        # case 1: TracerEventType is Communication
+        # case 2: TracerEventType is Operator but is communication op
+        communication = table.host_rows_mask() & (
+            table.type_mask(table.type, [TracerEventType.Communication])
+            | (operator & communication_op[table.name])
         )
-        self.communication_range = merge_ranges(
-            self.cpu_communication_range,
-            self.gpu_communication_range,
-            is_sorted=True,
+        # kernels called in the time range of a communication node
+        in_communication = table.propagate_down(communication, communication)
+
+        kernels = np.flatnonzero(
+            table.type_mask(table.device_type, [TracerEventType.Kernel])
+            & table.is_runtime[table.device_host]
         )
-        self.computation_range = merge_self_ranges(
-            self.computation_range, is_sorted=False
+        runtime = table.device_host[kernels]
+        host = table.parent[runtime]
+        nccl = table.name_mask(lambda name: 'nccl' in name.lower())[
+            table.device_name[kernels]
+        ]
+        # case 3: Others, filter kernels named with nccl
+        others = (table.depth[host] > 0) & ~communication[host]
+        gpu_communication = kernels[in_communication[runtime] | (others & nccl)]
+        computation = kernels[others & ~nccl]
+
+        rows = np.flatnonzero(communication)
+        self.cpu_calls = _num_unique_ranges(
+            table.start_ns[rows], table.end_ns[rows]
         )
-        self.overlap_range = intersection_ranges(
-            self.communication_range, self.computation_range, is_sorted=True
+        self.gpu_calls = _num_unique_ranges(
+            table.device_start_ns[gpu_communication],
+            table.device_end_ns[gpu_communication],
+        )
+        self._update_ranges(
+            union_ranges(table.start_ns[rows], table.end_ns[rows]),
+            union_ranges(
+                table.device_start_ns[gpu_communication],
+                table.device_end_ns[gpu_communication],
+            ),
+            union_ranges(
+                table.device_start_ns[computation],
+                table.device_end_ns[computation],
+            ),
+        )
+
+    def _update_ranges(
+        self,
+        cpu_communication_range,
+        gpu_communication_range,
+        computation_range,
+    ):
+        communication_range = union_ranges(
+            np.concatenate(
+                [cpu_communication_range[0], gpu_communication_range[0]]
+            ),
+            np.concatenate(
+                [cpu_communication_range[1], gpu_communication_range[1]]
+            ),
+        )
+        overlap_range = intersect_ranges(
+            *communication_range, *computation_range
+        )
+        self.cpu_communication_range = ranges_to_list(*cpu_communication_range)
+        self.gpu_communication_range = ranges_to_list(*gpu_communication_range)
+        self.communication_range = ranges_to_list(*communication_range)
+        self.computation_range = ranges_to_list(*computation_range)
+        self.overlap_range = ranges_to_list(*overlap_range)
+
+    def merge(self, other):
+        r"""
+        Merge the summary of another profiling window into this one.
+        """
+
+        def merged(ranges1, ranges2):
+            return list_to_ranges(_merge_ranges_list(ranges1, ranges2))
+
+        self.cpu_calls += other.cpu_calls
+        self.gpu_calls += other.gpu_calls
+        self._update_ranges(
+            merged(self.cpu_communication_range, other.cpu_communication_range),
+            merged(self.gpu_communication_range, other.gpu_communication_range),
+            merged(self.computation_range, other.computation_range),
         )
 
 
+def _group_times(groups, times):
+    r'''
+    Return the sum, max and min of times in every group as python lists.
+    '''
+    return (
+        groups.sum(times).tolist(),
+        groups.max(times).tolist(),
+        groups.min(times).tolist(),
+    )
+
+
+def _merge_items(items, other_items):
+    for name, item in other_items.items():
+        if name in items:
+            items[name].merge(item)
+        else:
+            items[name] = item
+
+
 class EventSummary:
     r"""
     Analyse operator event in profiling data, correlate with its device event.
@@ -569,6 +982,29 @@ class EventSummary:
         def add_item(self, node):
             raise NotImplementedError
 
+        def merge(self, other):
+            r'''
+            Merge the statistic of other, an item with the same name, into
+            this item. The children items of other are reused.
+            '''
+            self.call += other.call
+            self.cpu_time += other.cpu_time
+            self.max_cpu_time = max(self.max_cpu_time, other.max_cpu_time)
+            self.min_cpu_time = min(self.min_cpu_time, other.min_cpu_time)
+            self.gpu_time += other.gpu_time
+            self.max_gpu_time = max(self.max_gpu_time, other.max_gpu_time)
+            self.min_gpu_time = min(self.min_gpu_time, other.min_gpu_time)
+            self.general_gpu_time += other.general_gpu_time
+            self.max_general_gpu_time = max(
+                self.max_general_gpu_time, other.max_general_gpu_time
+            )
+            self.min_general_gpu_time = min(
+                self.min_general_gpu_time, other.min_general_gpu_time
+            )
+            self._flops += other._flops
+            _merge_items(self.devices, other.devices)
+            _merge_items(self.operator_inners, other.operator_inners)
+
     class DeviceItem(ItemBase):
         def add_item(self, node):
             self.call += 1
@@ -635,54 +1071,214 @@ class EventSummary:
         r"""
         Analysis operator event in the nodetress.
         """
-        node_statistic_trees, thread2host_statistic_nodes = wrap_tree(nodetrees)
-        for (
-            threadid,
-            host_statistic_nodes,
-        ) in thread2host_statistic_nodes.items():
-            for host_statistic_node in host_statistic_nodes[
-                1:
-            ]:  # skip root node
-                if host_statistic_node.type == TracerEventType.Operator:
-                    self.add_operator_item(host_statistic_node)
-                if (
-                    host_statistic_node.type == TracerEventType.UserDefined
-                    or host_statistic_node.type
-                    == TracerEventType.PythonUserDefined
-                ):
-                    if (
-                        'memcpy' in host_statistic_node.name.lower()
-                        or 'memorycopy' in host_statistic_node.name.lower()
-                        or 'memset' in host_statistic_node.name.lower()
-                    ):
-                        self.add_memory_manipulation_item(host_statistic_node)
-                    else:
-                        if (
-                            host_statistic_node.type
-                            == TracerEventType.PythonUserDefined
-                        ):
-                            self.add_userdefined_item(host_statistic_node)
-            self.add_kernel_item(host_statistic_nodes[0])
-
-        for threadid, root_statistic_node in node_statistic_trees.items():
-            deque = collections.deque()
-            deque.append(root_statistic_node)
-            while deque:
-                current_node = deque.popleft()
-                for child in current_node.children_node:
-                    if (
-                        child.type == TracerEventType.Forward
-                        or child.type == TracerEventType.Dataloader
-                        or child.type == TracerEventType.Backward
-                        or child.type == TracerEventType.Optimization
-                    ):
-                        self.add_model_perspective_item(
-                            child
-                        )  # find first model perspective node
-                    else:
-                        if child.type == TracerEventType.ProfileStep:
-                            self.add_model_perspective_item(child)
-                        deque.append(child)
+        table = _as_event_table(nodetrees)
+        host = table.host_rows_mask()
+
+        rows = np.flatnonzero(
+            host & table.type_mask(table.type, [TracerEventType.Operator])
+        )
+        self.items.update(self._operator_items(table, rows))
+        self._add_thread_items(
+            self.thread_items, table, rows, self._operator_items
+        )
+
+        userdefined = host & table.type_mask(
+            table.type,
+            [TracerEventType.UserDefined, TracerEventType.PythonUserDefined],
+        )
+        memory_manipulation = table.name_mask(
+            lambda name: 'memcpy' in name.lower()
+            or 'memorycopy' in name.lower()
+            or 'memset' in name.lower()
+        )[table.name]
+        rows = np.flatnonzero(userdefined & memory_manipulation)
+        self.memory_manipulation_items.update(self._general_items(table, rows))
+        rows = np.flatnonzero(
+            userdefined
+            & ~memory_manipulation
+            & table.type_mask(table.type, [TracerEventType.PythonUserDefined])
+        )
+        self.userdefined_items.update(self._general_items(table, rows))
+        self._add_thread_items(
+            self.userdefined_thread_items, table, rows, self._general_items
+        )
+
+        # find first model perspective node
+        model_types = [
+            TracerEventType.Forward,
+            TracerEventType.Dataloader,
+            TracerEventType.Backward,
+            TracerEventType.Optimization,
+        ]
+        model = table.type_mask(table.type, model_types)
+        nested = table.propagate_down(np.zeros_like(model), model)
+        model_types.append(TracerEventType.ProfileStep)
+        rows = table.bfs_order(
+            np.flatnonzero(
+                host & ~nested & table.type_mask(table.type, model_types)
+            )
+        )
+        model_names = {
+            TracerEventType.Forward: 'Forward',
+            TracerEventType.Backward: 'Backward',
+            TracerEventType.Optimization: 'Optimization',
+            TracerEventType.Dataloader: 'Dataloader',
+            TracerEventType.ProfileStep: 'ProfileStep',
+        }
+        self.model_perspective_items.update(
+            self._general_items(
+                table,
+                rows,
+                keys=table.type[rows],
+                key_names=[
+                    model_names.get(event_type)
+                    for event_type in table.types.values
+                ],
+            )
+        )
+
+        devices = np.flatnonzero(
+            table.type_mask(table.device_type, [TracerEventType.Kernel])
+            & table.is_runtime[table.device_host]
+        )
+        self.kernel_items.update(self._device_items(table, devices))
+
+    @staticmethod
+    def _add_thread_items(thread_items, table, rows, get_items):
+        groups = GroupBy(table.thread[rows])
+        for i, thread in enumerate(groups.keys.tolist()):
+            thread_items[table.threads.values[thread]].update(
+                get_items(table, rows[groups.inverse == i])
+            )
+
+    @staticmethod
+    def _set_host_statistic(items, groups, table, rows):
+        calls = groups.count().tolist()
+        cpu_times = _group_times(groups, table.cpu_time[rows])
+        gpu_times = _group_times(groups, table.gpu_time[rows])
+        general_gpu_times = _group_times(groups, table.general_gpu_time[rows])
+        for i, item in enumerate(items):
+            item.call = calls[i]
+            item.cpu_time, item.max_cpu_time, item.min_cpu_time = [
+                times[i] for times in cpu_times
+            ]
+            item.gpu_time, item.max_gpu_time, item.min_gpu_time = [
+                times[i] for times in gpu_times
+            ]
+            (
+                item.general_gpu_time,
+                item.max_general_gpu_time,
+                item.min_general_gpu_time,
+            ) = [times[i] for times in general_gpu_times]
+
+    @staticmethod
+    def _general_items(table, rows, keys=None, key_names=None):
+        r'''
+        Build GeneralItem for rows grouped by keys (default to the name id),
+        key_names maps a key to the name of its item.
+        '''
+        if keys is None:
+            keys = table.name[rows]
+            key_names = table.names.values
+        groups = GroupBy(keys)
+        items = [
+            EventSummary.GeneralItem(key_names[key])
+            for key in groups.keys.tolist()
+        ]
+        EventSummary._set_host_statistic(items, groups, table, rows)
+        return {item.name: item for item in items}
+
+    @staticmethod
+    def _device_items(table, devices, owners=None):
+        r'''
+        Build DeviceItem for device rows grouped by name, or by owner group
+        and name if owners is given. Return the groups and the items.
+        '''
+        keys = table.device_name[devices]
+        if owners is not None:
+            keys = owners * len(table.names) + keys
+        groups = GroupBy(keys)
+        durations = (
+            table.device_end_ns[devices] - table.device_start_ns[devices]
+        )
+        calls = groups.count().tolist()
+        gpu_times = _group_times(groups, durations)
+        items = []
+        for i, key in enumerate(groups.keys.tolist()):
+            item = EventSummary.DeviceItem(
+                table.names.values[key % len(table.names)]
+            )
+            item.call = calls[i]
+            item.gpu_time, item.max_gpu_time, item.min_gpu_time = [
+                times[i] for times in gpu_times
+            ]
+            items.append(item)
+        if owners is not None:
+            return groups, items
+        return {item.name: item for item in items}
+
+    @staticmethod
+    def _operator_items(table, rows, owners=None):
+        r'''
+        Build OperatorItem for rows grouped by name, or by owner group and
+        name if owners is given, together with their devices and operator
+        inners. Return the groups and the items if owners is given.
+        '''
+        num_names = len(table.names)
+        keys = table.name[rows]
+        if owners is not None:
+            keys = owners * num_names + keys
+        groups = GroupBy(keys)
+        items = [
+            EventSummary.OperatorItem(table.names.values[key % num_names])
+            for key in groups.keys.tolist()
+        ]
+        EventSummary._set_host_statistic(items, groups, table, rows)
+        flops = groups.sum(table.flops[rows]).tolist()
+        for item, item_flops in zip(items, flops):
+            item._flops = item_flops
+
+        devices, device_owners = table.runtime_devices(rows)
+        device_groups, device_items = EventSummary._device_items(
+            table, devices, groups.inverse[device_owners]
+        )
+        for key, device_item in zip(device_groups.keys.tolist(), device_items):
+            items[key // num_names].devices[device_item.name] = device_item
+
+        children, child_owners = table.children(rows)
+        inner = ~table.is_runtime[children] & ~table.type_mask(
+            table.type[children], [TracerEventType.Operator]
+        )
+        if np.any(inner):
+            inner_groups, inner_items = EventSummary._operator_items(
+                table, children[inner], groups.inverse[child_owners[inner]]
+            )
+            for key, inner_item in zip(inner_groups.keys.tolist(), inner_items):
+                items[key // num_names].operator_inners[
+                    inner_item.name
+                ] = inner_item
+
+        if owners is not None:
+            return groups, items
+        return {item.name: item for item in items}
+
+    def merge(self, other):
+        r"""
+        Merge the summary of another profiling window into this one.
+        """
+        _merge_items(self.items, other.items)
+        for thread_id, items in other.thread_items.items():
+            _merge_items(self.thread_items[thread_id], items)
+        _merge_items(self.userdefined_items, other.userdefined_items)
+        for thread_id, items in other.userdefined_thread_items.items():
+            _merge_items(self.userdefined_thread_items[thread_id], items)
+        _merge_items(
+            self.model_perspective_items, other.model_perspective_items
+        )
+        _merge_items(
+            self.memory_manipulation_items, other.memory_manipulation_items
+        )
+        _merge_items(self.kernel_items, other.kernel_items)
 
     def add_forward_item(self, operator_node):
         pass
@@ -793,6 +1389,13 @@ class MemorySummary:
                 print("No corresponding type.")
             self.increase_size = self.allocation_size - self.free_size
 
+        def merge(self, other):
+            self.allocation_count += other.allocation_count
+            self.allocation_size += other.allocation_size
+            self.free_count += other.free_count
+            self.free_size += other.free_size
+            self.increase_size = self.allocation_size - self.free_size
+
     def __init__(self):
         self.allocated_items = collections.defaultdict(
             dict
@@ -839,19 +1442,119 @@ class MemorySummary:
                 self.peak_reserved_values[memnode.place], memnode.peak_reserved
             )
 
+    def _add_memory_items(
+        self, items, memory_type, table, mems, names, allocate_type, free_type
+    ):
+        places = table.mem_place[mems]
+        groups = GroupBy(places * len(table.names) + names)
+        allocate = table.mem_type[mems] == table.mem_types.get(allocate_type)
+        free = table.mem_type[mems] == table.mem_types.get(free_type)
+        sizes = table.mem_increase_bytes[mems]
+        allocation_count = groups.sum(allocate.astype('int64')).tolist()
+        allocation_size = groups.sum(np.where(allocate, sizes, 0)).tolist()
+        free_count = groups.sum(free.astype('int64')).tolist()
+        free_size = (-groups.sum(np.where(free, sizes, 0))).tolist()
+        for i, key in enumerate(groups.keys.tolist()):
+            place, name = divmod(key, len(table.names))
+            place = table.places.values[place]
+            item = MemorySummary.MemoryItem(
+                table.names.values[name], place, memory_type
+            )
+            item.allocation_count = allocation_count[i]
+            item.allocation_size = allocation_size[i]
+            item.free_count = free_count[i]
+            item.free_size = free_size[i]
+            item.increase_size = item.allocation_size - item.free_size
+            items[place][item.event_name] = item
+
     def parse(self, nodetrees):
         r"""
         Analyse memory event in the nodetress.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, host_nodes in thread2hostnodes.items():
-            for host_node in host_nodes[1:]:  # skip root node
-                if host_node.type == TracerEventType.OperatorInner:
-                    continue
-                if host_node.type == TracerEventType.Operator:
-                    for child in host_node.children_node:
-                        self._analyse_node_memory(host_node.name, child)
-                self._analyse_node_memory(host_node.name, host_node)
+        table = _as_event_table(nodetrees)
+        mems = np.arange(len(table.mem_host))
+        host = table.mem_host
+        parent = table.parent[host]
+        # the memory events of a node are attributed to the node itself,
+        # except for OperatorInner, and to its parent if it is an Operator
+        own = table.host_rows_mask()[host] & ~table.type_mask(
+            table.type[host], [TracerEventType.OperatorInner]
+        )
+        by_parent = (table.depth[host] > 1) & table.type_mask(
+            table.type[parent], [TracerEventType.Operator]
+        )
+        visit = np.concatenate([parent[by_parent], host[own]])
+        kind = np.repeat([0, 1], [np.sum(by_parent), np.sum(own)])
+        sibling = np.concatenate(
+            [table.sibling[host[by_parent]], np.zeros([np.sum(own)], 'int64')]
+        )
+        mems = np.concatenate([mems[by_parent], mems[own]])
+        order = np.lexsort((mems, sibling, kind, visit))
+        visit, mems = visit[order], mems[order]
+        names = table.name[visit]
+
+        places = table.mem_place[mems]
+        groups = GroupBy(places)
+        peak_allocated = groups.max(table.mem_peak_allocated[mems]).tolist()
+        peak_reserved = groups.max(table.mem_peak_reserved[mems]).tolist()
+        for i, place in enumerate(groups.keys.tolist()):
+            place = table.places.values[place]
+            self.peak_allocation_values[place] = max(
+                self.peak_allocation_values[place], peak_allocated[i]
+            )
+            self.peak_reserved_values[place] = max(
+                self.peak_reserved_values[place], peak_reserved[i]
+            )
+
+        for items, memory_type, allocate_type, free_type in [
+            (
+                self.allocated_items,
+                'Allocated',
+                TracerMemEventType.Allocate,
+                TracerMemEventType.Free,
+            ),
+            (
+                self.reserved_items,
+                'Reserved',
+                TracerMemEventType.ReservedAllocate,
+                TracerMemEventType.ReservedFree,
+            ),
+        ]:
+            selected = np.isin(
+                table.mem_type[mems],
+                [
+                    table.mem_types.get(allocate_type),
+                    table.mem_types.get(free_type),
+                ],
+            )
+            self._add_memory_items(
+                items,
+                memory_type,
+                table,
+                mems[selected],
+                names[selected],
+                allocate_type,
+                free_type,
+            )
+
+    def merge(self, other):
+        r"""
+        Merge the summary of another profiling window into this one.
+        """
+        for self_items, other_items in [
+            (self.allocated_items, other.allocated_items),
+            (self.reserved_items, other.reserved_items),
+        ]:
+            for place, items in other_items.items():
+                _merge_items(self_items[place], items)
+        for place, value in other.peak_allocation_values.items():
+            self.peak_allocation_values[place] = max(
+                self.peak_allocation_values[place], value
+            )
+        for place, value in other.peak_reserved_values.items():
+            self.peak_reserved_values[place] = max(
+                self.peak_reserved_values[place], value
+            )
 
 
 class StatisticData:
@@ -866,10 +1569,25 @@ class StatisticData:
         self.event_summary = EventSummary()
         self.distributed_summary = DistributedSummary()
         self.memory_summary = MemorySummary()
-        self.time_range_summary.parse(node_trees)
-        self.event_summary.parse(node_trees)
-        self.distributed_summary.parse(node_trees)
-        self.memory_summary.parse(node_trees)
+        # NOTE: the node trees are flattened into the columnar table once and
+        # shared by all summaries.
+        event_table = EventTable(node_trees)
+        self.time_range_summary.parse(event_table)
+        self.event_summary.parse(event_table)
+        self.distributed_summary.parse(event_table)
+        self.memory_summary.parse(event_table)
+
+    def merge(self, other):
+        r"""
+        Merge the analysed results of another profiling window, which is
+        used to accumulate the summary across several windows.
+        """
+        self.node_trees = other.node_trees
+        self.extra_info = other.extra_info
+        self.time_range_summary.merge(other.time_range_summary)
+        self.event_summary.merge(other.event_summary)
+        self.distributed_summary.merge(other.distributed_summary)
+        self.memory_summary.merge(other.memory_summary)
 
 
 def _build_table(
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 
 
 def sum_ranges(ranges):
@@ -226,3 +227,107 @@ def subtract_ranges(range_list1, range_list2, is_sorted=False):
             if indx1 != len1:
                 range1 = range_list1[indx1]
     return result_range
+
+
+def ragged_arange(starts, lengths):
+    r'''
+    Concatenate arange(starts[i], starts[i] + lengths[i]) for all i, and
+    return it with the index i of every element.
+    '''
+    lengths = np.asarray(lengths, dtype='int64')
+    owner = np.repeat(np.arange(len(lengths)), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    index = np.arange(owner.size) - offsets[owner] + np.asarray(starts)[owner]
+    return index, owner
+
+
+class GroupBy:
+    r'''
+    Vectorized group by of integer keys, the groups are numbered by the first
+    appearance of their keys, so they keep the order of the former dict
+    insertion. The reductions return one value per group.
+    '''
+
+    def __init__(self, keys):
+        keys = np.asarray(keys, dtype='int64')
+        uniq, first, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        appearance = np.argsort(first, kind='stable')
+        rank = np.empty_like(appearance)
+        rank[appearance] = np.arange(len(appearance))
+        self.keys = uniq[appearance]
+        self.first = first[appearance]
+        self.inverse = rank[inverse.reshape(-1)]
+        self.size = len(self.keys)
+        self._order = np.argsort(self.inverse, kind='stable')
+        self._counts = np.bincount(self.inverse, minlength=self.size)
+        self._starts = np.cumsum(self._counts) - self._counts
+
+    def count(self):
+        return self._counts
+
+    def _reduce(self, ufunc, values):
+        values = np.asarray(values)
+        if self.size == 0:
+            return values[:0]
+        return ufunc.reduceat(values[self._order], self._starts)
+
+    def sum(self, values):
+        return self._reduce(np.add, values)
+
+    def max(self, values):
+        return self._reduce(np.maximum, values)
+
+    def min(self, values):
+        return self._reduce(np.minimum, values)
+
+
+def union_ranges(starts, ends):
+    r'''
+    Numpy version of merge_self_ranges, merge the (starts[i], ends[i]) ranges
+    and return the starts and ends of the sorted disjoint result.
+    '''
+    starts = np.asarray(starts, dtype='int64')
+    ends = np.asarray(ends, dtype='int64')
+    if starts.size == 0:
+        return starts, ends
+    order = np.argsort(starts, kind='stable')
+    starts = starts[order]
+    ends = ends[order]
+    max_ends = np.maximum.accumulate(ends)
+    new_range = np.empty(starts.shape, dtype='bool')
+    new_range[0] = True
+    new_range[1:] = starts[1:] > max_ends[:-1]
+    first = np.flatnonzero(new_range)
+    return starts[first], np.maximum.reduceat(ends, first)
+
+
+def intersect_ranges(starts1, ends1, starts2, ends2):
+    r'''
+    Numpy version of intersection_ranges for two sorted disjoint range lists
+    as returned by union_ranges.
+    '''
+    # the ranges of list2 which overlap with range i of list1 are [lo, hi),
+    # as intersection_ranges does, an empty range is kept if it lies in the
+    # other range, or coincides with its start
+    lo = np.searchsorted(ends2, starts1, side='right')
+    hi = np.maximum(
+        np.searchsorted(starts2, ends1, side='left'),
+        np.searchsorted(starts2, starts1, side='right'),
+    )
+    index2, index1 = ragged_arange(lo, np.maximum(hi - lo, 0))
+    starts = np.maximum(starts1[index1], starts2[index2])
+    ends = np.minimum(ends1[index1], ends2[index2])
+    return starts, ends
+
+
+def ranges_to_list(starts, ends):
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def list_to_ranges(ranges):
+    if len(ranges) == 0:
+        return np.zeros([0], dtype='int64'), np.zeros([0], dtype='int64')
+    starts, ends = np.asarray(ranges, dtype='int64').T
+    return starts, ends
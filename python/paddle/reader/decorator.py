@@ -17,13 +17,23 @@ import logging
 import multiprocessing
 import random
 import sys
+import threading
+import traceback
 import warnings
 from itertools import zip_longest
-from queue import Queue
+from queue import Empty, Queue
 from threading import Thread
 
+import numpy as np
+
 from paddle.fluid.reader import QUEUE_GET_TIMEOUT
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # NOTE: shared_memory is new in Python 3.8
+    resource_tracker, shared_memory = None, None
+
 __all__ = []
 
 # On macOS, the 'spawn' start method is now the default in Python3.8 multiprocessing,
@@ -403,98 +413,256 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+# the arrays smaller than it are pickled, as creating shared memory costs more
+_SHARED_MEMORY_MIN_BYTES = 1 << 16
+
+
+class _SharedArray:
+    """
+    A numpy array copied into a shared memory block, which is pickled as
+    the name of the block.
     """
-    Use multi-threads to map samples from reader by a mapper defined by user.
+
+    def __init__(self, array):
+        self.shape = array.shape
+        self.dtype = array.dtype
+        shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        self.name = shm.name
+        shm.close()
+
+    def load(self):
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            return np.ndarray(
+                self.shape, dtype=self.dtype, buffer=shm.buf
+            ).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def release(self):
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+
+def _map_arrays(func, sample):
+    if isinstance(sample, (list, tuple)):
+        return type(sample)(_map_arrays(func, x) for x in sample)
+    if isinstance(sample, dict):
+        return {k: _map_arrays(func, v) for k, v in sample.items()}
+    return func(sample)
+
+
+def _to_shared_memory(sample):
+    def _share(x):
+        if (
+            isinstance(x, np.ndarray)
+            and x.dtype != np.object_
+            and x.nbytes >= _SHARED_MEMORY_MIN_BYTES
+        ):
+            return _SharedArray(x)
+        return x
+
+    return _map_arrays(_share, sample)
+
+
+def _from_shared_memory(sample):
+    return _map_arrays(
+        lambda x: x.load() if isinstance(x, _SharedArray) else x, sample
+    )
+
+
+def _release_shared_memory(sample):
+    _map_arrays(
+        lambda x: x.release() if isinstance(x, _SharedArray) else x, sample
+    )
+
+
+class _XmapWorkerError:
+    # NOTE: the exception of a thread worker is kept and raised again, as
+    # the exception types may not be constructed from a message, while only
+    # the formatted traceback is sent back from a process worker.
+    def __init__(self, keep_exception):
+        exc_type, exc_value, exc_tb = sys.exc_info()
+        self.exc_value = exc_value if keep_exception else None
+        self.exc_name = exc_type.__name__
+        self.exc_msg = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_tb)
+        )
+
+    def reraise(self):
+        if self.exc_value is not None:
+            raise self.exc_value
+        raise RuntimeError(
+            "xmap_readers mapper caught {} with message:\n{}".format(
+                self.exc_name, self.exc_msg
+            )
+        )
+
+
+def xmap_readers(
+    mapper, reader, process_num, buffer_size, order=False, use_process=False
+):
+    """
+    Use multi-threads or multi-processes to map samples from reader by a
+    mapper defined by user.
+
+    At most ``buffer_size + process_num`` samples are read but not yielded
+    yet, thus reading blocks when the mapped samples are not consumed, and
+    when ``order`` is True, the samples mapped ahead of their turn wait in a
+    reorder buffer of the same bound.
 
     Args:
         mapper (callable): a function to map the data from reader.
         reader (callable): a data reader which yields the data.
-        process_num (int): thread number to handle original sample.
+        process_num (int): thread (or process) number to handle original sample.
         buffer_size (int): size of the queue to read data in.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process (bool): whether to map samples in processes rather than
+            threads, which is not supported on windows. The samples are
+            pickled to the processes, and the numpy arrays in the mapped
+            samples are carried back through shared memory if supported.
+            Default False.
 
     Returns:
         callable: a decorated reader with data mapping.
     """
+    if use_process and sys.platform == 'win32':
+        raise NotImplementedError(
+            "xmap_readers with use_process=True is not supported on windows."
+        )
+    use_shared_memory = use_process and shared_memory is not None
     end = XmapEndSignal()
 
-    # define a worker to read samples from reader to in_queue
-    def read_worker(reader, in_queue):
-        for i in reader():
-            in_queue.put(i)
-        in_queue.put(end)
-
-    # define a worker to read samples from reader to in_queue with order flag
-    def order_read_worker(reader, in_queue):
-        in_order = 0
-        for i in reader():
-            in_queue.put((in_order, i))
-            in_order += 1
-        in_queue.put(end)
+    # define a worker to read samples from reader to in_queue, which holds
+    # a slot for each sample until the mapped sample is yielded
+    def read_worker(reader, in_queue, slots, stop, errors):
+        try:
+            for i, sample in enumerate(reader()):
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                in_queue.put((i, sample))
+        except Exception:
+            errors.append(sys.exc_info())
+        finally:
+            for _ in range(process_num):
+                in_queue.put(end)
 
     # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue
+    # and put mapped samples into out_queue with their orders
     def handle_worker(in_queue, out_queue, mapper):
-        sample = in_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            r = mapper(sample)
-            out_queue.put(r)
-            sample = in_queue.get()
-        in_queue.put(end)
-        out_queue.put(end)
-
-    # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
         ins = in_queue.get()
         while not isinstance(ins, XmapEndSignal):
-            order, sample = ins
-            r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+            i, sample = ins
+            try:
+                r = mapper(sample)
+                if use_shared_memory:
+                    r = _to_shared_memory(r)
+            except Exception:
+                r = _XmapWorkerError(keep_exception=not use_process)
+            out_queue.put((i, r))
             ins = in_queue.get()
-        in_queue.put(end)
         out_queue.put(end)
 
     def xreader():
-        in_queue = Queue(buffer_size)
-        out_queue = Queue(buffer_size)
-        out_order = [0]
-        # start a read worker in a thread
-        target = order_read_worker if order else read_worker
-        t = Thread(target=target, args=(reader, in_queue))
-        t.daemon = True
-        t.start()
+        if use_process:
+            if use_shared_memory:
+                # NOTE: start the resource tracker before forking, to share
+                # it with the workers which create the shared memory
+                resource_tracker.ensure_running()
+            in_queue = fork_context.Queue()
+            out_queue = fork_context.Queue()
+            worker_class = fork_context.Process
+        else:
+            in_queue = Queue()
+            out_queue = Queue()
+            worker_class = Thread
+        slots = threading.Semaphore(buffer_size + process_num)
+        stop = threading.Event()
+        errors = []
         # start several handle_workers
-        target = order_handle_worker if order else handle_worker
-        args = (
-            (in_queue, out_queue, mapper, out_order)
-            if order
-            else (in_queue, out_queue, mapper)
-        )
         workers = []
         for i in range(process_num):
-            worker = Thread(target=target, args=args)
+            worker = worker_class(
+                target=handle_worker, args=(in_queue, out_queue, mapper)
+            )
             worker.daemon = True
             workers.append(worker)
         for w in workers:
             w.start()
+        # start a read worker in a thread, after forking the handle_workers
+        t = Thread(
+            target=read_worker, args=(reader, in_queue, slots, stop, errors)
+        )
+        t.daemon = True
+        t.start()
 
-        sample = out_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            yield sample
-            sample = out_queue.get()
-        finish = 1
-        while finish < process_num:
-            sample = out_queue.get()
-            if isinstance(sample, XmapEndSignal):
-                finish += 1
-            else:
-                yield sample
+        reorder_buffer = {}
+        out_order = 0
+        finish = 0
+        try:
+            while finish < process_num:
+                try:
+                    sample = out_queue.get(timeout=1)
+                except Empty:
+                    if use_process:
+                        for w in workers:
+                            if w.exitcode not in (None, 0):
+                                raise RuntimeError(
+                                    "xmap_readers worker (pid {}) exited "
+                                    "unexpectedly with exit code {}".format(
+                                        w.pid, w.exitcode
+                                    )
+                                )
+                    continue
+                if isinstance(sample, XmapEndSignal):
+                    finish += 1
+                    continue
+                i, r = sample
+                if isinstance(r, _XmapWorkerError):
+                    r.reraise()
+                if use_shared_memory:
+                    r = _from_shared_memory(r)
+                if not order:
+                    slots.release()
+                    yield r
+                    continue
+                reorder_buffer[i] = r
+                while out_order in reorder_buffer:
+                    r = reorder_buffer.pop(out_order)
+                    out_order += 1
+                    slots.release()
+                    yield r
+            if errors:
+                raise errors[0][1].with_traceback(errors[0][2])
+        finally:
+            stop.set()
+            if use_process:
+                for w in workers:
+                    if w.is_alive():
+                        w.terminate()
+                for w in workers:
+                    w.join()
+                while True:
+                    try:
+                        sample = out_queue.get_nowait()
+                    except Empty:
+                        break
+                    if use_shared_memory and not isinstance(
+                        sample, XmapEndSignal
+                    ):
+                        _release_shared_memory(sample[1])
+                in_queue.cancel_join_thread()
+                out_queue.cancel_join_thread()
 
     return xreader
 
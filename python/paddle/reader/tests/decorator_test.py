@@ -17,6 +17,8 @@ import sys
 import time
 import unittest
 
+import numpy as np
+
 import paddle.reader
 
 __all__ = []
@@ -153,6 +155,64 @@ class TestXmap(unittest.TestCase):
                             self.assertEqual(e, mapper(idx))
 
 
+class TestXmapOrdered(unittest.TestCase):
+    def test_xmap_process(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            return np.full([256, 256], x, dtype='float32'), x
+
+        for order in (True, False):
+            reader = paddle.reader.xmap_readers(
+                mapper, reader_creator_10(0), 4, 2, order, use_process=True
+            )
+            result = list(reader())
+            if not order:
+                result.sort(key=lambda x: x[1])
+            for idx, (array, e) in enumerate(result):
+                self.assertEqual(e, idx)
+                np.testing.assert_array_equal(array, mapper(idx)[0])
+
+    def test_backpressure(self):
+        read = []
+
+        def reader():
+            for i in range(100):
+                read.append(i)
+                yield i
+
+        xreader = paddle.reader.xmap_readers(lambda x: x, reader, 2, 3, True)()
+        self.assertEqual(next(xreader), 0)
+        time.sleep(0.2)
+        # at most buffer_size + process_num samples are in flight
+        self.assertLessEqual(len(read), 1 + 3 + 2)
+        xreader.close()
+
+    def test_mapper_error(self):
+        def mapper(x):
+            if x == 5:
+                raise UnicodeDecodeError('utf-8', b'\xff', 0, 1, "bad sample")
+            return x
+
+        # the original exception is raised in thread mode
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 2, True
+        )
+        with self.assertRaises(UnicodeDecodeError) as ctx:
+            list(reader())
+        self.assertEqual(ctx.exception.reason, "bad sample")
+
+        if sys.platform != 'win32':
+            reader = paddle.reader.xmap_readers(
+                mapper, reader_creator_10(0), 2, 2, True, True
+            )
+            with self.assertRaises(RuntimeError) as ctx:
+                list(reader())
+            self.assertIn("UnicodeDecodeError", str(ctx.exception))
+            self.assertIn("bad sample", str(ctx.exception))
+
+
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
         self.samples = []
@@ -14,8 +14,10 @@
 
 import errno
 import inspect
+import json
 import logging
 import os
+import struct
 import warnings
 
 import numpy as np
@@ -34,6 +36,7 @@ from paddle.fluid.executor import global_scope
 from paddle.fluid.framework import Parameter, static_only
 from paddle.fluid.io import append_fetch_ops, prepend_feed_ops
 from paddle.fluid.log_helper import get_logger
+from paddle.fluid.proto import framework_pb2
 
 __all__ = []
 
@@ -420,6 +423,178 @@ def _serialize_persistables(program, executor):
     return global_scope().find_var(out_var_name).get_bytes()
 
 
+# the size of the chunks to write persistables to file
+_PERSISTABLES_CHUNK_SIZE = 64 << 20
+
+
+def _persistable_index_path(path):
+    return path + ".index"
+
+
+def _save_persistables_to_file(program, executor, path, save_index=False):
+    """
+    Save persistables of the given program to the file in the same format as
+    `_serialize_persistables`, by writing the tensors one by one in chunks
+    rather than the whole serialized bytes. If `save_index` is True, the
+    offsets of the tensors in the file are saved to `path + ".index"`,
+    otherwise the index left by an earlier save is removed.
+
+    Returns:
+        bool: False if there is no persistable to save.
+    """
+    vars_ = [
+        var
+        for var in filter(is_persistable, program.list_vars())
+        if var.type != core.VarDesc.VarType.RAW
+    ]
+    index_path = _persistable_index_path(path)
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    if any(var.type != core.VarDesc.VarType.LOD_TENSOR for var in vars_):
+        # NOTE: only LoDTensors are serialized one by one, fall back to
+        # save_combine for the others
+        params_bytes = _serialize_persistables(program, executor)
+        if params_bytes is None:
+            return False
+        save_to_file(path, params_bytes)
+        return True
+    if len(vars_) == 0:
+        warnings.warn(
+            "no variable in your model, please ensure there are any "
+            "variables in your model to save"
+        )
+        return False
+
+    index = []
+    scope = global_scope()
+    with open(path, "wb") as f:
+        for name in sorted(var.name for var in vars_):
+            var = scope.find_var(name)
+            if var is None or not var.get_tensor()._is_initialized():
+                raise ValueError(
+                    "The persistable variable '{}' to be saved is not "
+                    "initialized.".format(name)
+                )
+            data = memoryview(core.save_lod_tensor_to_memory(var.get_tensor()))
+            index.append([name, f.tell(), len(data)])
+            for start in range(0, len(data), _PERSISTABLES_CHUNK_SIZE):
+                f.write(data[start : start + _PERSISTABLES_CHUNK_SIZE])
+            del data
+        file_size = f.tell()
+    if save_index:
+        with open(index_path, "w") as f:
+            json.dump(
+                {"version": 1, "file_size": file_size, "tensors": index}, f
+            )
+    return True
+
+
+def _read_serialized_tensor(f):
+    """
+    Read the bytes of a LoDTensor serialized by `SerializeToStream` from the
+    current position of the file.
+    """
+
+    def _read(size):
+        data = f.read(size)
+        if len(data) != size:
+            raise EOFError("The persistables file is truncated.")
+        return data
+
+    # version and lod_level
+    parts = [_read(4), _read(8)]
+    (lod_level,) = struct.unpack("<Q", parts[-1])
+    for _ in range(lod_level):
+        parts.append(_read(8))
+        parts.append(_read(struct.unpack("<Q", parts[-1])[0]))
+    # version and size of the tensor desc
+    parts.append(_read(4))
+    parts.append(_read(4))
+    parts.append(_read(struct.unpack("<i", parts[-1])[0]))
+    desc = framework_pb2.VarType.TensorDesc()
+    desc.ParseFromString(parts[-1])
+    numel = int(np.prod(desc.dims, dtype="int64"))
+    parts.append(
+        _read(numel * core.size_of_dtype(core.VarDesc.VarType(desc.data_type)))
+    )
+    return b"".join(parts)
+
+
+def _load_persistables_from_file(program, path, executor, names=None):
+    """
+    Load persistables of the given program from the file saved by
+    `_save_persistables_to_file` or `save_to_file`, reading the tensors one
+    by one rather than the whole file. If `names` is given, only these
+    persistables are loaded, and the others are skipped by the offsets saved
+    in `path + ".index"` if it exists and matches the size of the file.
+    """
+    vars_ = [
+        var
+        for var in filter(is_persistable, program.list_vars())
+        if var.type
+        not in [core.VarDesc.VarType.RAW, core.VarDesc.VarType.SELECTED_ROWS]
+    ]
+    if any(var.type != core.VarDesc.VarType.LOD_TENSOR for var in vars_):
+        assert names is None, "Only LoDTensors can be loaded by names."
+        return deserialize_persistables(program, load_from_file(path), executor)
+    load_vars = {var.name: var for var in vars_}
+    if names is not None:
+        missing = set(names) - set(load_vars)
+        if missing:
+            raise ValueError(
+                "The persistables {} are not in the program.".format(
+                    sorted(missing)
+                )
+            )
+        load_vars = {name: load_vars[name] for name in names}
+
+    index = None
+    index_path = _persistable_index_path(path)
+    if names is not None and os.path.exists(index_path):
+        with open(index_path, "r") as f:
+            index_info = json.load(f)
+        if index_info.get("file_size") == os.path.getsize(path):
+            index = {
+                name: (offset, length)
+                for name, offset, length in index_info["tensors"]
+            }
+
+    scope = global_scope()
+
+    def _load(name, data):
+        tensor = core.LoDTensor()
+        core.load_lod_tensor_from_memory(tensor, data)
+        scope.var(name).get_tensor()._copy_from(tensor, executor.place)
+        var = load_vars[name]
+        if isinstance(var, Parameter):
+            origin_shape = tuple(var.desc.get_shape())
+            new_shape = tuple(tensor.shape())
+            if new_shape != origin_shape:
+                raise RuntimeError(
+                    "Shape mismatch, program needs a parameter with shape ({}), "
+                    "but the loaded parameter ('{}') has a shape of ({}).".format(
+                        origin_shape, name, new_shape
+                    )
+                )
+
+    with open(path, "rb") as f:
+        if index is not None and all(name in index for name in load_vars):
+            for name in load_vars:
+                offset, length = index[name]
+                f.seek(offset)
+                _load(name, f.read(length))
+            return
+        for name in sorted(var.name for var in vars_):
+            data = _read_serialized_tensor(f)
+            if name in load_vars:
+                _load(name, data)
+        if names is None and f.read(1):
+            raise RuntimeError(
+                "The persistables file '{}' has more data than the "
+                "persistables of the program.".format(path)
+            )
+
+
 def save_to_file(path, content):
     """
     Save content to given path.
@@ -472,12 +647,14 @@ def save_inference_model(
         fetch_vars(Variable | list[Variable]): Variables returned by inference.
         executor(Executor): The executor that saves the inference model. You can refer
                             to :ref:`api_guide_executor_en` for more details.
-        kwargs: Supported keys including 'program' and "clip_extra". Attention please, kwargs is used for backward compatibility mainly.
+        kwargs: Supported keys including 'program', "clip_extra" and "save_index". Attention please, kwargs is used for backward compatibility mainly.
 
             - program(Program): specify a program if you don't want to use default main program.
 
             - clip_extra(bool): the flag indicating whether to clip extra information for every operator. Default: True.
 
+            - save_index(bool): the flag indicating whether to save the offsets of the parameters in modelname.pdiparams to modelname.pdiparams.index, which allows loading a subset of the parameters. Default: False.
+
     Returns:
         None
 
@@ -541,11 +718,14 @@ def save_inference_model(
         program._remove_training_info(clip_extra=clip_extra)
     )
     save_to_file(model_path, program_bytes)
-    # serialize and save params
-    params_bytes = _serialize_persistables(program, executor)
-    # program may not contain any parameter and just compute operation
-    if params_bytes is not None:
-        save_to_file(params_path, params_bytes)
+    # save params, program may not contain any parameter and just compute
+    # operation, in which case no params file is saved
+    _save_persistables_to_file(
+        program,
+        executor,
+        params_path,
+        save_index=kwargs.get('save_index', False),
+    )
 
 
 @static_only
@@ -750,9 +930,10 @@ def load_inference_model(path_prefix, executor, **kwargs):
           - Set to None when reading the model from memory.
         executor(Executor): The executor to run for loading inference model.
                             See :ref:`api_guide_executor_en` for more details about it.
-        kwargs: Supported keys including 'model_filename', 'params_filename'.Attention please, kwargs is used for backward compatibility mainly.
+        kwargs: Supported keys including 'model_filename', 'params_filename' and 'params_names'.Attention please, kwargs is used for backward compatibility mainly.
           - model_filename(str): specify model_filename if you don't want to use default name.
           - params_filename(str): specify params_filename if you don't want to use default name.
+          - params_names(list[str]): specify the names of the parameters to load if you only want to load a subset of them, the others are left uninitialized. The offsets saved by `save_inference_model` with `save_index=True` are used to skip the others if available. Default: None, which means loading all parameters.
 
     Returns:
         list: The return of this API is a list with three elements:
@@ -802,10 +983,11 @@ def load_inference_model(path_prefix, executor, **kwargs):
             # program to get the inference result.
     """
     # check kwargs
-    supported_args = ('model_filename', 'params_filename')
+    supported_args = ('model_filename', 'params_filename', 'params_names')
     deprecated_args = ('pserver_endpoints',)
     caller = inspect.currentframe().f_code.co_name
     _check_args(caller, kwargs, supported_args, deprecated_args)
+    params_names = kwargs.pop('params_names', None)
 
     # load from memory
     if path_prefix is None:
@@ -816,6 +998,10 @@ def load_inference_model(path_prefix, executor, **kwargs):
             raise ValueError(
                 "params_filename cannot be None when path_prefix is None."
             )
+        if params_names is not None:
+            raise ValueError(
+                "params_names is not supported when path_prefix is None."
+            )
         load_dirname = ''
         program_bytes = model_filename
         params_bytes = params_filename
@@ -864,13 +1050,17 @@ def load_inference_model(path_prefix, executor, **kwargs):
         # load params data
         params_path = os.path.join(load_dirname, params_filename)
         params_bytes = None
-        if os.path.exists(params_path):
-            params_bytes = load_from_file(params_path)
 
     # deserialize bytes to program
     program = deserialize_program(program_bytes)
-    # deserialize bytes to params
-    deserialize_persistables(program, params_bytes, executor)
+    if path_prefix is not None and os.path.exists(params_path):
+        # load params from file tensor by tensor
+        _load_persistables_from_file(
+            program, params_path, executor, names=params_names
+        )
+    else:
+        # deserialize bytes to params
+        deserialize_persistables(program, params_bytes, executor)
 
     feed_target_names = program.desc.get_feed_target_names()
     fetch_target_names = program.desc.get_fetch_target_names()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -115,6 +117,36 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(elem[0].shape[0] == params)
         self.assertTrue(0 <= elem[1] <= 2)
 
+    def test_feat_cache(self):
+        archive = {
+            'url': 'https://bj.bcebos.com/paddleaudio/datasets/TESS_Toronto_emotional_speech_set_lite.zip',
+            'md5': '9ffb5e3adf28d4d6b787fa94bd59b975',
+        }  # small part of TESS dataset for test.
+        with tempfile.TemporaryDirectory() as cache_dir:
+            tess_dataset = paddle.audio.datasets.TESS(
+                mode='dev',
+                feat_type='mfcc',
+                n_mfcc=40,
+                archive=archive,
+                feat_cache_dir=cache_dir,
+            )
+            feat, label = tess_dataset[0]
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            cached_feat, cached_label = tess_dataset[0]
+            np.testing.assert_array_equal(cached_feat.numpy(), feat.numpy())
+            self.assertEqual(cached_label, label)
+
+        # extractors are shared by items with the same config
+        get_extractor = paddle.audio.datasets.dataset._get_feature_extractor
+        self.assertIs(
+            get_extractor('mfcc', 16000, {'n_mfcc': 40}),
+            get_extractor('mfcc', 16000, {'n_mfcc': 40}),
+        )
+        self.assertIsNot(
+            get_extractor('mfcc', 16000, {'n_mfcc': 40}),
+            get_extractor('mfcc', 16000, {'n_mfcc': 64}),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
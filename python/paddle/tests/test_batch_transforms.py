@@ -0,0 +1,138 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.vision import transforms as T
+
+
+class TestBatchTransforms(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.images = np.random.randint(0, 256, [4, 3, 20, 24]).astype('uint8')
+        self.mean = np.array([0.485, 0.456, 0.406], dtype='float32')
+        self.std = np.array([0.229, 0.224, 0.225], dtype='float32')
+
+    def per_sample(self, transform, seed):
+        # the per-sample random parameters are drawn in the same order
+        np.random.seed(seed)
+        return transform(paddle.to_tensor(self.images)).numpy()
+
+    def test_crop_flip_normalize(self):
+        transform = T.BatchCompose(
+            [
+                T.BatchRandomCrop((12, 16)),
+                T.BatchRandomHorizontalFlip(),
+                T.BatchRandomVerticalFlip(),
+                T.BatchToTensor(),
+                T.BatchNormalize(self.mean, self.std),
+            ]
+        )
+        np.random.seed(2022)
+        n = self.images.shape[0]
+        tops = np.random.randint(0, 20 - 12 + 1, size=n)
+        lefts = np.random.randint(0, 24 - 16 + 1, size=n)
+        hflips = np.random.random(n) < 0.5
+        vflips = np.random.random(n) < 0.5
+        expected = []
+        for i in range(n):
+            img = self.images[i, :, tops[i] : tops[i] + 12]
+            img = img[:, :, lefts[i] : lefts[i] + 16]
+            if hflips[i]:
+                img = img[:, :, ::-1]
+            if vflips[i]:
+                img = img[:, ::-1, :]
+            img = img.astype('float32') / 255.0
+            expected.append(
+                (img - self.mean.reshape([3, 1, 1]))
+                / self.std.reshape([3, 1, 1])
+            )
+        result = self.per_sample(transform, 2022)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, np.stack(expected), rtol=1e-5)
+
+    def test_center_crop(self):
+        result = T.BatchCenterCrop(10)(paddle.to_tensor(self.images))
+        self.assertEqual(result.dtype, paddle.uint8)
+        np.testing.assert_array_equal(
+            result.numpy(), self.images[:, :, 5:15, 7:17]
+        )
+
+    def test_resize(self):
+        images = paddle.to_tensor(self.images)
+        result = T.BatchResize((10, 12))(images)
+        self.assertEqual(result.shape, [4, 3, 10, 12])
+        self.assertEqual(result.dtype, paddle.uint8)
+        result = T.BatchResize(10)(images)
+        self.assertEqual(result.shape, [4, 3, 10, 12])
+
+        # the same as resizing the whole batch
+        expected = paddle.nn.functional.interpolate(
+            images.astype('float32'),
+            size=(10, 12),
+            mode='bilinear',
+            align_corners=False,
+        )
+        result = T.BatchCompose([T.BatchResize((10, 12)), T.BatchToTensor()])(
+            images
+        )
+        np.testing.assert_allclose(
+            result.numpy(), expected.numpy() / 255.0, rtol=1e-4, atol=1e-5
+        )
+
+    def test_random_resized_crop(self):
+        transform = T.BatchCompose(
+            [T.BatchRandomResizedCrop((8, 8)), T.BatchToTensor()]
+        )
+        result = transform(self.images)
+        self.assertEqual(result.shape, [4, 3, 8, 8])
+        self.assertTrue(float(result.min()) >= 0.0)
+        self.assertTrue(float(result.max()) <= 1.0)
+
+        top, left, h, w = T.BatchRandomResizedCrop(8)._get_params(100, 20, 24)
+        self.assertTrue(np.all((top >= 0) & (top + h <= 20)))
+        self.assertTrue(np.all((left >= 0) & (left + w <= 24)))
+
+    def test_color_jitter(self):
+        images = paddle.to_tensor(self.images)
+        result = T.BatchColorJitter(0.4, 0.4, 0.4, 0.4)(images)
+        self.assertEqual(result.shape, images.shape)
+        self.assertEqual(result.dtype, paddle.uint8)
+
+        result = T.BatchColorJitter()(images)
+        np.testing.assert_array_equal(result.numpy(), self.images)
+
+        images = images.astype('float32') / 255.0
+        np.random.seed(1)
+        result = T.BatchColorJitter(brightness=0.5)(images)
+        np.random.seed(1)
+        factors = np.random.uniform(0.5, 1.5, size=[4, 1, 1, 1])
+        np.testing.assert_allclose(
+            result.numpy(),
+            np.clip(images.numpy() * factors, 0, 1),
+            rtol=1e-5,
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            T.BatchRandomCrop(32)(self.images)
+        with self.assertRaises(ValueError):
+            T.BatchToTensor()(self.images[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
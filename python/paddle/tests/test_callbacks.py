@@ -37,7 +37,7 @@ class MnistDataset(MNIST):
 
     def __getitem__(self, idx):
         img, label = self.images[idx], self.labels[idx]
-        img = np.reshape(img, [1, 28, 28])
+        img = np.reshape(img, [1, 28, 28]).astype('float32')
         if self.return_label:
             return img, np.array(self.labels[idx]).astype('int64')
         return (img,)
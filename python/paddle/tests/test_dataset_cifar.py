@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
+import pickle
+import tarfile
+import tempfile
 import unittest
 
 import numpy as np
@@ -19,6 +24,42 @@ import numpy as np
 from paddle.vision.datasets import Cifar10, Cifar100
 
 
+class TestCifar10Parse(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.temp_dir.name, 'cifar.tar.gz')
+        self.images = np.random.randint(0, 256, [6, 3072]).astype('uint8')
+        self.labels = np.random.randint(0, 10, [6])
+        with tarfile.open(self.data_file, 'w:gz') as tar:
+            for i, name in enumerate(['data_batch_1', 'data_batch_2']):
+                batch = {
+                    b'data': self.images[i * 3 : i * 3 + 3],
+                    b'labels': self.labels[i * 3 : i * 3 + 3].tolist(),
+                }
+                content = pickle.dumps(batch)
+                info = tarfile.TarInfo('cifar/' + name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_main(self):
+        for use_mmap in [False, True, True]:
+            cifar = Cifar10(
+                data_file=self.data_file, backend='cv2', use_mmap=use_mmap
+            )
+            self.assertEqual(len(cifar), 6)
+            for i in range(len(cifar)):
+                data, label = cifar[i]
+                np.testing.assert_array_equal(
+                    data,
+                    self.images[i].reshape([3, 32, 32]).transpose([1, 2, 0]),
+                )
+                self.assertEqual(label.dtype, np.int64)
+                self.assertEqual(int(label), self.labels[i])
+
+
 class TestCifar10Train(unittest.TestCase):
     def test_main(self):
         cifar = Cifar10(mode='train')
@@ -0,0 +1,163 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle.dataset.common as common
+from paddle.text.datasets import Imdb, Imikolov, token_cache
+
+
+def make_tar(path, files):
+    with tarfile.open(path, 'w:gz') as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+class TestRaggedArray(unittest.TestCase):
+    def test_ragged_array(self):
+        seqs = [[1, 2], [], [3, 4, 5]]
+        ragged = token_cache.RaggedArray.from_lists(seqs)
+        self.assertEqual(len(ragged), 3)
+        self.assertEqual(ragged.tokens.dtype, np.int32)
+        for i, seq in enumerate(seqs):
+            self.assertEqual(ragged[i].tolist(), seq)
+        self.assertEqual(ragged[-1].tolist(), [3, 4, 5])
+
+        marked = ragged.add_markers(8, 9)
+        self.assertEqual(
+            [marked[i].tolist() for i in range(3)],
+            [[8, 1, 2, 9], [8, 9], [8, 3, 4, 5, 9]],
+        )
+
+    def test_list_view(self):
+        ragged = token_cache.RaggedArray.from_lists([[8, 1, 9], [8, 9]])
+        self.assertEqual(
+            list(token_cache.RaggedListView(ragged)), [[8, 1, 9], [8, 9]]
+        )
+        view = token_cache.RaggedListView(ragged, tail=1)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view[0], [8, 1])
+        self.assertEqual(view[-1], [8])
+        view = token_cache.RaggedListView(ragged, head=1)
+        self.assertEqual(view[:], [[1, 9], [9]])
+        with self.assertRaises(IndexError):
+            view[2]
+
+    def test_encode(self):
+        texts = [b'a b c', b'a a', b''] * 10
+        word_freq = token_cache.count_words(bytes.split, texts, 2)
+        self.assertEqual(word_freq[b'a'], 30)
+        ragged = token_cache.encode(
+            bytes.split, texts, {b'a': 0, b'b': 1}, 2, num_workers=2
+        )
+        self.assertEqual(len(ragged), len(texts))
+        self.assertEqual(ragged[3].tolist(), [0, 1, 2])
+        self.assertEqual(ragged[4].tolist(), [0, 0])
+        self.assertEqual(ragged[5].tolist(), [])
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_home = common.DATA_HOME
+        common.DATA_HOME = os.path.join(self.temp_dir.name, 'data_home')
+
+    def tearDown(self):
+        common.DATA_HOME = self.data_home
+        self.temp_dir.cleanup()
+
+    def test_save_load(self):
+        data_file = os.path.join(self.temp_dir.name, 'data')
+        with open(data_file, 'wb') as f:
+            f.write(b'data')
+        cache_dir = token_cache.get_cache_dir('test', data_file, size=1)
+        self.assertIsNone(token_cache.load_cache(cache_dir))
+
+        ragged = token_cache.RaggedArray.from_lists([[1], [2, 3]])
+        token_cache.save_cache(
+            cache_dir, {'vocab': 1}, {'ids': ragged, 'labels': np.arange(2)}
+        )
+        meta, arrays = token_cache.load_cache(cache_dir)
+        self.assertEqual(meta, {'vocab': 1})
+        self.assertIsInstance(arrays['ids'].tokens, np.memmap)
+        self.assertEqual(arrays['ids'][1].tolist(), [2, 3])
+        self.assertEqual(arrays['labels'].tolist(), [0, 1])
+
+        self.assertNotEqual(
+            cache_dir, token_cache.get_cache_dir('test', data_file, size=2)
+        )
+
+    def test_imikolov(self):
+        data_file = os.path.join(self.temp_dir.name, 'imikolov.tgz')
+        text = b'the cat sat\nthe dog\n\nthe cat\n'
+        make_tar(
+            data_file,
+            {
+                './simple-examples/data/ptb.train.txt': text * 5,
+                './simple-examples/data/ptb.valid.txt': text,
+                './simple-examples/data/ptb.test.txt': text,
+            },
+        )
+        for _ in range(2):
+            ngram = Imikolov(
+                data_file, 'NGRAM', 2, 'test', min_word_freq=3, download=False
+            )
+            self.assertEqual(len(ngram), 11)
+            the, cat = ngram.word_idx[b'the'], ngram.word_idx[b'cat']
+            self.assertEqual(
+                [int(w) for w in ngram[0]], [ngram.word_idx['<s>'], the]
+            )
+            self.assertEqual([int(w) for w in ngram[1]], [the, cat])
+
+            seq = Imikolov(
+                data_file, 'SEQ', 3, 'test', min_word_freq=3, download=False
+            )
+            self.assertEqual(len(seq), 3)
+            src, trg = seq[0]
+            self.assertEqual(src.dtype, np.int64)
+            self.assertEqual(src[1:].tolist(), trg[:-1].tolist())
+            self.assertEqual(trg[-1], seq.word_idx['<e>'])
+
+    def test_imdb(self):
+        data_file = os.path.join(self.temp_dir.name, 'imdb.tgz')
+        files = {}
+        for mode in ['train', 'test']:
+            for i in range(4):
+                files['aclImdb/{}/pos/{}.txt'.format(mode, i)] = b'Good, good!'
+                files['aclImdb/{}/neg/{}.txt'.format(mode, i)] = b'Bad. bad x'
+        make_tar(data_file, files)
+        for mode in ['train', 'test', 'train']:
+            imdb = Imdb(data_file, mode, cutoff=10, download=False)
+            self.assertEqual(len(imdb), 8)
+            doc, label = imdb[0]
+            self.assertEqual(doc.tolist(), [imdb.word_idx[b'good']] * 2)
+            self.assertEqual(label.tolist(), [0])
+            doc, label = imdb[7]
+            self.assertEqual(
+                doc.tolist(),
+                [imdb.word_idx[b'bad']] * 2 + [imdb.word_idx['<unk>']],
+            )
+            self.assertEqual(label.tolist(), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
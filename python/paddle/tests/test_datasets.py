@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import os
 import shutil
+import struct
 import tempfile
 import unittest
 
@@ -95,6 +97,55 @@ class TestFolderDatasets(unittest.TestCase):
             _check_exists_and_download('temp_paddle', None, None, None, False)
 
 
+class TestMNISTParse(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.images = np.random.randint(0, 256, [7, 28, 28]).astype('uint8')
+        self.labels = np.random.randint(0, 10, [7]).astype('uint8')
+        self.image_path = os.path.join(self.temp_dir.name, 'images-idx3.gz')
+        self.label_path = os.path.join(self.temp_dir.name, 'labels-idx1.gz')
+        with gzip.open(self.image_path, 'wb') as f:
+            f.write(struct.pack('>IIII', 0x803, 7, 28, 28))
+            f.write(self.images.tobytes())
+        with gzip.open(self.label_path, 'wb') as f:
+            f.write(struct.pack('>II', 0x801, 7))
+            f.write(self.labels.tobytes())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_main(self):
+        for use_mmap in [False, True, True]:
+            mnist = MNIST(
+                image_path=self.image_path,
+                label_path=self.label_path,
+                backend='cv2',
+                use_mmap=use_mmap,
+            )
+            self.assertEqual(len(mnist), 7)
+            self.assertEqual(mnist.images.dtype, np.uint8)
+            for i in range(len(mnist)):
+                image, label = mnist[i]
+                self.assertEqual(image.dtype, np.float32)
+                np.testing.assert_array_equal(image, self.images[i])
+                self.assertEqual(label.dtype, np.int64)
+                self.assertEqual(label.shape, (1,))
+                self.assertEqual(int(label), self.labels[i])
+                # updating the returned label does not change the dataset
+                label[0] = -1
+                self.assertEqual(int(mnist[i][1]), self.labels[i])
+        # the decompressed files are cached
+        self.assertTrue(os.path.exists(self.image_path[: -len('.gz')]))
+
+        mnist = MNIST(
+            image_path=self.image_path,
+            label_path=self.label_path,
+            backend='pil',
+        )
+        image, label = mnist[3]
+        np.testing.assert_array_equal(np.array(image), self.images[3])
+
+
 class TestMNISTTest(unittest.TestCase):
     def test_main(self):
         transform = T.Transpose()
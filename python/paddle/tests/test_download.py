@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import http.server
 import os
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+import paddle.utils.download as download
 from paddle.utils.download import get_path_from_url, get_weights_path_from_url
 
 
@@ -158,5 +164,163 @@ class TestDownload(unittest.TestCase):
                 )
 
 
+class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    # serve self.server.content, with "Range: bytes=start-[end]" supported
+    # if self.server.accept_ranges is True, and a broken connection after
+    # self.server.break_after bytes once, the first self.server.fail_times
+    # requests fail with code 503
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.headers.get('Range'))
+            fail = server.fail_times > 0
+            server.fail_times -= 1
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+        content = server.content
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get('Range')
+        if server.accept_ranges and range_header:
+            first, last = range_header[len('bytes=') :].split('-')
+            start = int(first)
+            end = int(last) if last else end
+            if start > end:
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                'Content-Range',
+                'bytes {}-{}/{}'.format(start, end, len(content)),
+            )
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        body = content[start : end + 1]
+        with server.lock:
+            break_after = server.break_after
+            server.break_after = None
+        if break_after is not None:
+            self.wfile.write(body[:break_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRangeDownload(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), RangeRequestHandler
+        )
+        self.server.content = os.urandom(300000)
+        self.server.accept_ranges = True
+        self.server.break_after = None
+        self.server.fail_times = 0
+        self.server.requests = []
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{}/weights.pdparams'.format(
+            self.server.server_address[1]
+        )
+        self.md5sum = hashlib.md5(self.server.content).hexdigest()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_home = download.DOWNLOAD_CACHE_HOME
+        self.min_part_size = download.DOWNLOAD_MIN_PART_SIZE
+        download.DOWNLOAD_CACHE_HOME = os.path.join(self.temp_dir.name, 'cache')
+        download.DOWNLOAD_MIN_PART_SIZE = 64 * 1024
+
+    def tearDown(self):
+        download.DOWNLOAD_CACHE_HOME = self.cache_home
+        download.DOWNLOAD_MIN_PART_SIZE = self.min_part_size
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.temp_dir.cleanup()
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_parallel_download(self):
+        path = os.path.join(self.temp_dir.name, 'a')
+        fullname = download._download(self.url, path, self.md5sum)
+        self.assertEqual(self.read(fullname), self.server.content)
+        # 1 probe and 4 parts
+        self.assertEqual(len(self.server.requests), 5)
+
+        # the other paths are linked to the cached file
+        path = os.path.join(self.temp_dir.name, 'b')
+        fullname = download._download(self.url, path, self.md5sum)
+        self.assertEqual(self.read(fullname), self.server.content)
+        self.assertEqual(len(self.server.requests), 5)
+
+        with self.assertRaises(RuntimeError):
+            download._download(
+                self.url, os.path.join(self.temp_dir.name, 'c'), '0' * 32
+            )
+        # the parts failing the md5 check are removed, and downloaded again
+        # by every retry
+        self.assertEqual(
+            len(self.server.requests), 5 + 5 * download.DOWNLOAD_RETRY_LIMIT
+        )
+        for _, _, names in os.walk(self.temp_dir.name):
+            self.assertEqual([name for name in names if '_tmp' in name], [])
+
+    def test_retry_error_code(self):
+        self.server.fail_times = 2
+        path = os.path.join(self.temp_dir.name, 'a')
+        fullname = download._download(self.url, path, self.md5sum)
+        self.assertEqual(self.read(fullname), self.server.content)
+
+    def test_resume(self):
+        for accept_ranges in [True, False]:
+            self.server.accept_ranges = accept_ranges
+            download.DOWNLOAD_MIN_PART_SIZE = 1024 * 1024
+            fullname = os.path.join(
+                self.temp_dir.name, str(accept_ranges), 'weights.pdparams'
+            )
+            self.server.break_after = 2 * download.DOWNLOAD_CHUNK_SIZE
+            self.server.requests = []
+            self.assertEqual(
+                download._download_file(self.url, fullname), fullname
+            )
+            self.assertEqual(self.read(fullname), self.server.content)
+            self.assertFalse(os.path.exists(fullname + '_tmp'))
+            # restarted from the beginning if the server ignores the range
+            self.assertEqual(
+                self.server.requests, ['bytes=0-', 'bytes=131072-']
+            )
+
+    def test_download_once(self):
+        path = os.path.join(self.temp_dir.name, 'a')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fullnames = list(
+                executor.map(
+                    lambda md5sum: download._download(self.url, path, md5sum),
+                    [self.md5sum, None] * 4,
+                )
+            )
+        for fullname in fullnames:
+            self.assertEqual(self.read(fullname), self.server.content)
+        self.assertEqual(len(self.server.requests), 5)
+
+        # no lock file is left next to the downloaded or cached files
+        locks_dir = os.path.join(download.DOWNLOAD_CACHE_HOME, 'locks')
+        for root, _, names in os.walk(self.temp_dir.name):
+            if root != locks_dir:
+                self.assertEqual(
+                    [name for name in names if name.endswith('.lock')], []
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
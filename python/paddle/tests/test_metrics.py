@@ -354,6 +354,63 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_random(self):
+        num_thresholds = 200
+        x = np.random.random((1000, 2)).astype('float32')
+        y = np.random.randint(2, size=(1000, 1))
+
+        stat_pos = np.zeros(num_thresholds + 1)
+        stat_neg = np.zeros(num_thresholds + 1)
+        for i, lbl in enumerate(y):
+            bin_idx = int(x[i, 1] * num_thresholds)
+            if lbl:
+                stat_pos[bin_idx] += 1.0
+            else:
+                stat_neg[bin_idx] += 1.0
+        tot_pos, tot_neg, auc = 0.0, 0.0, 0.0
+        for idx in range(num_thresholds, -1, -1):
+            tot_pos_prev, tot_neg_prev = tot_pos, tot_neg
+            tot_pos += stat_pos[idx]
+            tot_neg += stat_neg[idx]
+            auc += paddle.metric.Auc.trapezoid_area(
+                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+            )
+        expected = auc / tot_pos / tot_neg
+
+        m = paddle.metric.Auc(num_thresholds=num_thresholds)
+        m.update(x[:500], y[:500])
+        m.update(x[500:], y[500:])
+        np.testing.assert_array_equal(m._stat_pos, stat_pos)
+        np.testing.assert_array_equal(m._stat_neg, stat_neg)
+        self.assertAlmostEqual(m.accumulate(), expected)
+
+        m = paddle.metric.Auc(num_thresholds=num_thresholds, on_device=True)
+        m.update(paddle.to_tensor(x[:500]), paddle.to_tensor(y[:500]))
+        m.update(x[500:], y[500:])
+        self.assertAlmostEqual(m.accumulate(), expected)
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
+
+class TestOnDevice(unittest.TestCase):
+    def test_precision_recall(self):
+        x = np.array([0.1, 0.5, 0.6, 0.7, 0.2, 1.2]).reshape(-1, 1)
+        y = np.array([1, 0, 1, 1, 1, 0]).reshape(-1, 1)
+        for metric_cls in [paddle.metric.Precision, paddle.metric.Recall]:
+            expected = metric_cls()
+            expected.update(x, y)
+            expected.update(x[:3], y[:3])
+
+            m = metric_cls(on_device=True)
+            m.update(paddle.to_tensor(x), paddle.to_tensor(y))
+            m.update(x[:3], y[:3])
+            self.assertAlmostEqual(m.accumulate(), expected.accumulate())
+            self.assertEqual(m.tp, expected.tp)
+
+            m.update(paddle.to_tensor(x), paddle.to_tensor(y))
+            m.reset()
+            self.assertEqual(m.accumulate(), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -134,7 +134,7 @@ class MnistDataset(MNIST):
 
     def __getitem__(self, idx):
         img, label = self.images[idx], self.labels[idx]
-        img = np.reshape(img, [1, 28, 28])
+        img = np.reshape(img, [1, 28, 28]).astype('float32')
         if self.return_label:
             return img, np.array(self.labels[idx]).astype('int64')
         return (img,)
@@ -956,6 +956,66 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_fit_defer_sync(self):
+        paddle.disable_static(paddle.CPUPlace())
+        data = np.random.random(size=(40, 20)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+        dataset = paddle.io.TensorDataset(
+            [paddle.to_tensor(data), paddle.to_tensor(label)]
+        )
+
+        # the length of the loader of an iterable dataset is unknown
+        class IterableData(paddle.io.IterableDataset):
+            def __iter__(self):
+                for i in range(len(data)):
+                    yield data[i], label[i]
+
+        class RecordLogs(paddle.callbacks.Callback):
+            def __init__(self):
+                self.epoch_logs = []
+
+            def on_epoch_end(self, epoch, logs=None):
+                self.epoch_logs.append(dict(logs))
+
+        iterable_loader = paddle.io.DataLoader(
+            IterableData(), batch_size=4, return_list=True
+        )
+        for train_data in [dataset, iterable_loader]:
+            results = []
+            for defer_sync in [False, True]:
+                self.set_seed()
+                net = MyModel()
+                optim = paddle.optimizer.SGD(
+                    learning_rate=0.001, parameters=net.parameters()
+                )
+                model = Model(net)
+                model.prepare(
+                    optim,
+                    loss=CrossEntropyLoss(reduction="sum"),
+                    metrics=Accuracy(),
+                )
+                record = RecordLogs()
+                model.fit(
+                    train_data,
+                    batch_size=4,
+                    epochs=2,
+                    log_freq=3,
+                    shuffle=False,
+                    callbacks=[record],
+                    verbose=0,
+                    defer_sync=defer_sync,
+                )
+                self.assertFalse(model._defer_sync)
+                self.assertEqual(model._adapter._deferred_metric_outs, [])
+                results.append(record.epoch_logs)
+
+            for expect, logs in zip(*results):
+                np.testing.assert_allclose(
+                    logs['loss'], expect['loss'], rtol=1e-6
+                )
+                np.testing.assert_allclose(logs['acc'], expect['acc'])
+        paddle.enable_static()
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
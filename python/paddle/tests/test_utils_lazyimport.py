@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
 import unittest
 
 from paddle.utils.lazy_import import try_import
@@ -42,5 +44,36 @@ class TestUtilsLazyImport(unittest.TestCase):
         self.func_test_lazy_import()
 
 
+class TestLazySubmodules(unittest.TestCase):
+    def run_python(self, code):
+        return subprocess.check_output(
+            [sys.executable, '-c', code], universal_newlines=True
+        ).strip()
+
+    def test_not_imported_by_default(self):
+        out = self.run_python(
+            'import sys, paddle; '
+            'print(sorted(m for m in ("paddle.vision", "paddle.text", '
+            '"paddle.audio", "paddle.hapi") if m in sys.modules))'
+        )
+        self.assertEqual(out, '[]')
+
+    def test_public_api(self):
+        out = self.run_python(
+            'import paddle; from paddle import Model, summary; '
+            'from paddle.vision.transforms import ToTensor; '
+            'print(paddle.Model is Model, paddle.hapi.Model is Model, '
+            'paddle.summary is summary, paddle.text.__name__, '
+            '"vision" in dir(paddle), "Model" in dir(paddle))'
+        )
+        self.assertEqual(out, 'True True True paddle.text True True')
+
+    def test_unknown_attribute(self):
+        import paddle
+
+        with self.assertRaises(AttributeError):
+            paddle.not_a_paddle_module
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,12 +22,22 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL = 'https://dataset.bj.bcebos.com/imdb%2FaclImdb_v1.tar.gz'
 MD5 = '7c2ac02c03563afcf9b574c7e56c153a'
 
 
+_PUNCTUATION = string.punctuation.encode('latin-1')
+
+
+def _tokenize(doc):
+    # newline and punctuations removal and ad-hoc tokenization.
+    return doc.rstrip(b'\n\r').translate(None, _PUNCTUATION).lower().split()
+
+
 class Imdb(Dataset):
     """
     Implementation of `IMDB <https://www.imdb.com/interfaces/>`_ dataset.
@@ -87,64 +97,71 @@ class Imdb(Dataset):
                 data_file, URL, MD5, 'imdb', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
-
-        # read dataset into memory
-        self._load_anno()
-
-    def _build_work_dict(self, cutoff):
-        word_freq = collections.defaultdict(int)
+        # NOTE: the word dictionary and the word ids of both modes are built
+        # once and cached as flat int32 arrays, later runs memory map them.
+        cache_dir = token_cache.get_cache_dir(
+            'imdb', self.data_file, cutoff=cutoff
+        )
+        cache = token_cache.load_cache(cache_dir)
+        if cache is None:
+            cache = self._build_cache(cutoff)
+            token_cache.save_cache(cache_dir, *cache)
+        meta, arrays = cache
+
+        self.word_idx = meta['word_idx']
+        # docs[i] is the word ids of the i-th document
+        self.docs = arrays[self.mode + '_docs']
+        self.labels = arrays[self.mode + '_labels']
+
+    def _read_docs(self):
         pattern = re.compile(r"aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
-        for doc in self._tokenize(pattern):
-            for word in doc:
-                word_freq[word] += 1
-
-        # Not sure if we should prune less-frequent words here.
-        word_freq = [x for x in word_freq.items() if x[1] > cutoff]
-
-        dictionary = sorted(word_freq, key=lambda x: (-x[1], x[0]))
-        words, _ = list(zip(*dictionary))
-        word_idx = dict(list(zip(words, range(len(words)))))
-        word_idx['<unk>'] = len(words)
-        return word_idx
-
-    def _tokenize(self, pattern):
-        data = []
+        docs = collections.defaultdict(list)
         with tarfile.open(self.data_file) as tarf:
             tf = tarf.next()
             while tf is not None:
-                if bool(pattern.match(tf.name)):
-                    # newline and punctuations removal and ad-hoc tokenization.
-                    data.append(
-                        tarf.extractfile(tf)
-                        .read()
-                        .rstrip(b'\n\r')
-                        .translate(None, string.punctuation.encode('latin-1'))
-                        .lower()
-                        .split()
+                match = pattern.match(tf.name)
+                if match:
+                    docs[(match.group(1), match.group(4))].append(
+                        tarf.extractfile(tf).read()
                     )
                 tf = tarf.next()
+        return docs
 
-        return data
+    def _build_cache(self, cutoff):
+        num_workers = token_cache.default_num_workers()
+        docs = self._read_docs()
 
-    def _load_anno(self):
-        pos_pattern = re.compile(r"aclImdb/{}/pos/.*\.txt$".format(self.mode))
-        neg_pattern = re.compile(r"aclImdb/{}/neg/.*\.txt$".format(self.mode))
+        # Build a word dictionary from the corpus
+        word_freq = token_cache.count_words(
+            _tokenize,
+            [doc for texts in docs.values() for doc in texts],
+            num_workers,
+        )
+        # Not sure if we should prune less-frequent words here.
+        word_freq = [x for x in word_freq.items() if x[1] > cutoff]
 
-        UNK = self.word_idx['<unk>']
+        dictionary = sorted(word_freq, key=lambda x: (-x[1], x[0]))
+        words, _ = list(zip(*dictionary))
+        word_idx = dict(list(zip(words, range(len(words)))))
+        word_idx['<unk>'] = len(words)
 
-        self.docs = []
-        self.labels = []
-        for doc in self._tokenize(pos_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(0)
-        for doc in self._tokenize(neg_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(1)
+        arrays = {}
+        for mode in ['train', 'test']:
+            texts = docs[(mode, 'pos')] + docs[(mode, 'neg')]
+            arrays[mode + '_docs'] = token_cache.encode(
+                _tokenize, texts, word_idx, word_idx['<unk>'], num_workers
+            )
+            arrays[mode + '_labels'] = np.array(
+                [0] * len(docs[(mode, 'pos')]) + [1] * len(docs[(mode, 'neg')]),
+                dtype='int64',
+            )
+        return {'word_idx': word_idx}, arrays
 
     def __getitem__(self, idx):
-        return (np.array(self.docs[idx]), np.array([self.labels[idx]]))
+        return (
+            np.array(self.docs[idx], dtype='int64'),
+            np.array([self.labels[idx]]),
+        )
 
     def __len__(self):
         return len(self.docs)
@@ -20,12 +20,18 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL = 'https://dataset.bj.bcebos.com/imikolov%2Fsimple-examples.tgz'
 MD5 = '30177ea32e27c525793142b6bf2c8e2d'
 
 
+def _tokenize(line):
+    return line.strip().split()
+
+
 class Imikolov(Dataset):
     """
     Implementation of imikolov dataset.
@@ -104,10 +110,24 @@ class Imikolov(Dataset):
                 data_file, URL, MD5, 'imikolov', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(min_word_freq)
-
-        # read dataset into memory
+        if self.data_type == 'NGRAM':
+            assert self.window_size > -1, 'Invalid gram length'
+
+        # NOTE: the word dictionary and the word ids of the sentences are
+        # built once and cached as flat int32 arrays, later runs memory map
+        # them. The NGRAM/SEQ samples are views into the sentences.
+        cache_dir = token_cache.get_cache_dir(
+            'imikolov', self.data_file, min_word_freq=min_word_freq
+        )
+        cache = token_cache.load_cache(cache_dir)
+        if cache is None:
+            cache = self._build_cache()
+            token_cache.save_cache(cache_dir, *cache)
+        meta, arrays = cache
+
+        self.word_idx = meta['word_idx']
+        # sentences[i] is the word ids of '<s>', the i-th sentence and '<e>'
+        self.sentences = arrays[self.mode]
         self._load_anno()
 
     def word_count(self, f, word_freq=None):
@@ -122,56 +142,78 @@ class Imikolov(Dataset):
 
         return word_freq
 
-    def _build_work_dict(self, cutoff):
-        train_filename = './simple-examples/data/ptb.train.txt'
-        test_filename = './simple-examples/data/ptb.valid.txt'
-        with tarfile.open(self.data_file) as tf:
-            trainf = tf.extractfile(train_filename)
-            testf = tf.extractfile(test_filename)
-            word_freq = self.word_count(testf, self.word_count(trainf))
-            if '<unk>' in word_freq:
-                # remove <unk> for now, since we will set it as last index
-                del word_freq['<unk>']
-
-            word_freq = [
-                x for x in word_freq.items() if x[1] > self.min_word_freq
-            ]
-
-            word_freq_sorted = sorted(word_freq, key=lambda x: (-x[1], x[0]))
-            words, _ = list(zip(*word_freq_sorted))
-            word_idx = dict(list(zip(words, range(len(words)))))
-            word_idx['<unk>'] = len(words)
+    def _build_work_dict(self, lines):
+        word_freq = token_cache.count_words(
+            _tokenize, lines, token_cache.default_num_workers()
+        )
+        word_freq['<s>'] += len(lines)
+        word_freq['<e>'] += len(lines)
+        if '<unk>' in word_freq:
+            # remove <unk> for now, since we will set it as last index
+            del word_freq['<unk>']
+
+        word_freq = [x for x in word_freq.items() if x[1] > self.min_word_freq]
+
+        word_freq_sorted = sorted(word_freq, key=lambda x: (-x[1], x[0]))
+        words, _ = list(zip(*word_freq_sorted))
+        word_idx = dict(list(zip(words, range(len(words)))))
+        word_idx['<unk>'] = len(words)
 
         return word_idx
 
-    def _load_anno(self):
-        self.data = []
+    def _build_cache(self):
+        lines = {}
         with tarfile.open(self.data_file) as tf:
-            filename = './simple-examples/data/ptb.{}.txt'.format(self.mode)
-            f = tf.extractfile(filename)
-
-            UNK = self.word_idx['<unk>']
-            for l in f:
-                if self.data_type == 'NGRAM':
-                    assert self.window_size > -1, 'Invalid gram length'
-                    l = ['<s>'] + l.strip().split() + ['<e>']
-                    if len(l) >= self.window_size:
-                        l = [self.word_idx.get(w, UNK) for w in l]
-                        for i in range(self.window_size, len(l) + 1):
-                            self.data.append(tuple(l[i - self.window_size : i]))
-                elif self.data_type == 'SEQ':
-                    l = l.strip().split()
-                    l = [self.word_idx.get(w, UNK) for w in l]
-                    src_seq = [self.word_idx['<s>']] + l
-                    trg_seq = l + [self.word_idx['<e>']]
-                    if self.window_size > 0 and len(src_seq) > self.window_size:
-                        continue
-                    self.data.append((src_seq, trg_seq))
-                else:
-                    assert False, 'Unknow data type'
+            for name in ['train', 'valid', 'test']:
+                filename = './simple-examples/data/ptb.{}.txt'.format(name)
+                lines[name] = tf.extractfile(filename).readlines()
+
+        # Build a word dictionary from the corpus
+        word_idx = self._build_work_dict(lines['train'] + lines['valid'])
+
+        arrays = {}
+        for mode in ['train', 'test']:
+            sentences = token_cache.encode(
+                _tokenize,
+                lines[mode],
+                word_idx,
+                word_idx['<unk>'],
+                token_cache.default_num_workers(),
+            )
+            arrays[mode] = sentences.add_markers(
+                word_idx['<s>'], word_idx['<e>']
+            )
+        return {'word_idx': word_idx}, arrays
+
+    def _load_anno(self):
+        lengths = self.sentences.lengths()
+        starts = self.sentences.offsets[:-1]
+        if self.data_type == 'NGRAM':
+            # one sample for each window of the sentences that are long enough
+            num_grams = np.where(
+                lengths >= self.window_size, lengths - self.window_size + 1, 0
+            )
+            sample_starts = np.repeat(starts, num_grams)
+            sample_starts += np.arange(len(sample_starts)) - np.repeat(
+                np.cumsum(num_grams) - num_grams, num_grams
+            )
+            self._samples = sample_starts
+        elif self.data_type == 'SEQ':
+            # source is '<s>' + sentence and target is sentence + '<e>'
+            if self.window_size > 0:
+                self._samples = np.nonzero(lengths - 1 <= self.window_size)[0]
+            else:
+                self._samples = np.arange(len(self.sentences))
+        else:
+            assert False, 'Unknow data type'
 
     def __getitem__(self, idx):
-        return tuple([np.array(d) for d in self.data[idx]])
+        if self.data_type == 'NGRAM':
+            start = self._samples[idx]
+            gram = self.sentences.tokens[start : start + self.window_size]
+            return tuple([np.array(w, dtype='int64') for w in gram])
+        sentence = np.array(self.sentences[self._samples[idx]], dtype='int64')
+        return sentence[:-1], sentence[1:]
 
     def __len__(self):
-        return len(self.data)
+        return len(self._samples)
@@ -0,0 +1,276 @@
+#   Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import functools
+import hashlib
+import itertools
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import warnings
+
+import numpy as np
+
+import paddle.dataset.common as common
+
+__all__ = []
+
+# NOTE: bump it whenever the tokenization or the layout of the cache changes.
+CACHE_VERSION = 1
+
+_META_FILE = 'meta.pkl'
+
+
+class RaggedArray:
+    """
+    A list of int sequences stored as one flat int32 ``tokens`` array plus an
+    int64 ``offsets`` array of ``len(self) + 1`` entries, sequence ``i`` is
+    ``tokens[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self, tokens, offsets):
+        self.tokens = tokens
+        self.offsets = offsets
+
+    @classmethod
+    def from_lengths(cls, tokens, lengths):
+        offsets = np.zeros(len(lengths) + 1, dtype='int64')
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(np.asarray(tokens, dtype='int32'), offsets)
+
+    @classmethod
+    def from_lists(cls, seqs):
+        lengths = [len(seq) for seq in seqs]
+        tokens = np.fromiter(
+            itertools.chain.from_iterable(seqs),
+            dtype='int32',
+            count=sum(lengths),
+        )
+        return cls.from_lengths(tokens, lengths)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        return self.tokens[self.offsets[idx] : self.offsets[idx + 1]]
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def add_markers(self, start_id, end_id):
+        """Return a new RaggedArray with start_id/end_id around each sequence."""
+        lengths = self.lengths()
+        out = RaggedArray.from_lengths(
+            np.empty(len(self.tokens) + 2 * len(self), dtype='int32'),
+            lengths + 2,
+        )
+        starts = out.offsets[:-1]
+        out.tokens[starts] = start_id
+        out.tokens[out.offsets[1:] - 1] = end_id
+        # positions of the original tokens in the new flat array
+        body_pos = np.repeat(starts + 1 - self.offsets[:-1], lengths)
+        body_pos += np.arange(len(self.tokens), dtype='int64')
+        out.tokens[body_pos] = self.tokens
+        return out
+
+
+class RaggedListView:
+    """
+    A read-only list-like view of a RaggedArray, whose item ``i`` is the list
+    of ids of sequence ``i`` without ``head`` ids at the front and ``tail``
+    ids at the back, it keeps the former list attributes of datasets.
+    """
+
+    def __init__(self, ragged, head=0, tail=0):
+        self._ragged = ragged
+        self._head = head
+        self._tail = tail
+
+    def __len__(self):
+        return len(self._ragged)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < -len(self) or idx >= len(self):
+            raise IndexError("index {} out of range".format(idx))
+        seq = self._ragged[idx]
+        return seq[self._head : len(seq) - self._tail].tolist()
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+def get_cache_dir(name, data_file, **config):
+    """
+    The cache directory of dataset ``name`` built from ``data_file`` with
+    ``config``, it changes when the data file is replaced.
+    """
+    stat = os.stat(data_file)
+    key = repr(
+        (
+            CACHE_VERSION,
+            os.path.abspath(data_file),
+            stat.st_size,
+            stat.st_mtime_ns,
+            sorted(config.items()),
+        )
+    )
+    return os.path.join(
+        common.DATA_HOME,
+        name,
+        'cache',
+        hashlib.md5(key.encode('utf-8')).hexdigest(),
+    )
+
+
+def load_cache(cache_dir):
+    """
+    Load the cache saved by :func:`save_cache` with memory mapped arrays,
+    return ``(meta, arrays)`` or None if there is no cache.
+    """
+    meta_file = os.path.join(cache_dir, _META_FILE)
+    if not os.path.exists(meta_file):
+        return None
+    with open(meta_file, 'rb') as f:
+        info = pickle.load(f)
+
+    def _load(name):
+        return np.load(os.path.join(cache_dir, name), mmap_mode='r')
+
+    arrays = {}
+    for name in info['ragged']:
+        arrays[name] = RaggedArray(
+            _load(name + '.tokens.npy'), _load(name + '.offsets.npy')
+        )
+    for name in info['dense']:
+        arrays[name] = _load(name + '.npy')
+    return info['meta'], arrays
+
+
+def save_cache(cache_dir, meta, arrays):
+    """
+    Save ``meta`` (picklable) and ``arrays`` (RaggedArray or numpy array) into
+    ``cache_dir``. The directory is written aside and renamed into place, so
+    concurrent readers never see a partial cache. Failing to write the cache
+    only emits a warning.
+    """
+    parent = os.path.dirname(cache_dir)
+    try:
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent)
+    except OSError as e:
+        warnings.warn("Failed to create dataset cache {}: {}".format(parent, e))
+        return
+
+    try:
+        info = {'meta': meta, 'ragged': [], 'dense': []}
+        for name, value in arrays.items():
+            if isinstance(value, RaggedArray):
+                np.save(
+                    os.path.join(tmp_dir, name + '.tokens.npy'), value.tokens
+                )
+                np.save(
+                    os.path.join(tmp_dir, name + '.offsets.npy'), value.offsets
+                )
+                info['ragged'].append(name)
+            else:
+                np.save(os.path.join(tmp_dir, name + '.npy'), value)
+                info['dense'].append(name)
+        with open(os.path.join(tmp_dir, _META_FILE), 'wb') as f:
+            pickle.dump(info, f, protocol=4)
+        os.rename(tmp_dir, cache_dir)
+    except OSError as e:
+        # NOTE: the rename fails if another process saved the cache first
+        if not os.path.exists(os.path.join(cache_dir, _META_FILE)):
+            warnings.warn(
+                "Failed to save dataset cache {}: {}".format(cache_dir, e)
+            )
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def default_num_workers():
+    return min(os.cpu_count() or 1, 8)
+
+
+def _map_chunks(func, items, num_workers):
+    num_chunks = max(num_workers * 4, 1)
+    chunk_size = max((len(items) + num_chunks - 1) // num_chunks, 1)
+    chunks = [
+        items[i : i + chunk_size] for i in range(0, len(items), chunk_size)
+    ]
+    # NOTE: daemonic processes (e.g. DataLoader workers) can not have children
+    if (
+        num_workers > 1
+        and len(chunks) > 1
+        and not multiprocessing.current_process().daemon
+    ):
+        try:
+            with multiprocessing.Pool(num_workers) as pool:
+                return pool.map(func, chunks)
+        except OSError:
+            pass
+    return [func(chunk) for chunk in chunks]
+
+
+def _count_chunk(tokenize, texts):
+    counter = collections.Counter()
+    for text in texts:
+        counter.update(tokenize(text))
+    return counter
+
+
+def _encode_chunk(tokenize, word_idx, unk_id, texts):
+    ids = []
+    lengths = []
+    unk_ids = itertools.repeat(unk_id)
+    for text in texts:
+        words = tokenize(text)
+        ids.extend(map(word_idx.get, words, unk_ids))
+        lengths.append(len(words))
+    return np.asarray(ids, dtype='int32'), lengths
+
+
+def count_words(tokenize, texts, num_workers=1):
+    """
+    Count the words of ``texts`` split by ``tokenize``, which should be a
+    module level function so it can be sent to the worker processes.
+    """
+    word_freq = collections.Counter()
+    for counter in _map_chunks(
+        functools.partial(_count_chunk, tokenize), texts, num_workers
+    ):
+        word_freq.update(counter)
+    return word_freq
+
+
+def encode(tokenize, texts, word_idx, unk_id, num_workers=1):
+    """Convert ``texts`` to a RaggedArray of word ids."""
+    results = _map_chunks(
+        functools.partial(_encode_chunk, tokenize, word_idx, unk_id),
+        texts,
+        num_workers,
+    )
+    tokens = np.concatenate(
+        [ids for ids, _ in results] or [np.empty([0], dtype='int32')]
+    )
+    lengths = list(itertools.chain.from_iterable(l for _, l in results))
+    return RaggedArray.from_lengths(tokens, lengths)
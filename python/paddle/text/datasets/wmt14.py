@@ -19,6 +19,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL_DEV_TEST = (
@@ -107,7 +109,36 @@ class WMT14(Dataset):
         # read dataset into memory
         assert dict_size > 0, "dict_size should be set as positive number"
         self.dict_size = dict_size
-        self._load_data()
+
+        # NOTE: the word ids are built once and cached as flat int32 arrays,
+        # later runs memory map them.
+        cache_dir = token_cache.get_cache_dir(
+            'wmt14', self.data_file, mode=self.mode, dict_size=dict_size
+        )
+        cache = token_cache.load_cache(cache_dir)
+        if cache is None:
+            cache = self._load_data()
+            token_cache.save_cache(cache_dir, *cache)
+        meta, arrays = cache
+
+        self.src_dict = meta['src_dict']
+        self.trg_dict = meta['trg_dict']
+        self._src_ids = arrays['src_ids']
+        # trg_seqs[i] is START + target sequence + END, trg_ids and
+        # trg_ids_next are its first and last len - 1 ids.
+        self.trg_seqs = arrays['trg_seqs']
+
+    @property
+    def src_ids(self):
+        return token_cache.RaggedListView(self._src_ids)
+
+    @property
+    def trg_ids(self):
+        return token_cache.RaggedListView(self.trg_seqs, tail=1)
+
+    @property
+    def trg_ids_next(self):
+        return token_cache.RaggedListView(self.trg_seqs, head=1)
 
     def _load_data(self):
         def __to_dict(fd, size):
@@ -119,9 +150,8 @@ class WMT14(Dataset):
                     break
             return out_dict
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_ids_list = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = [
                 each_item.name
@@ -129,14 +159,14 @@ class WMT14(Dataset):
                 if each_item.name.endswith("src.dict")
             ]
             assert len(names) == 1
-            self.src_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            src_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
             names = [
                 each_item.name
                 for each_item in f
                 if each_item.name.endswith("trg.dict")
             ]
             assert len(names) == 1
-            self.trg_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            trg_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
 
             file_name = "{}/{}".format(self.mode, self.mode)
             names = [
@@ -153,33 +183,40 @@ class WMT14(Dataset):
                     src_seq = line_split[0]  # one source sequence
                     src_words = src_seq.split()
                     src_ids = [
-                        self.src_dict.get(w, UNK_IDX)
+                        src_dict.get(w, UNK_IDX)
                         for w in [START] + src_words + [END]
                     ]
 
                     trg_seq = line_split[1]  # one target sequence
                     trg_words = trg_seq.split()
-                    trg_ids = [self.trg_dict.get(w, UNK_IDX) for w in trg_words]
+                    trg_ids = [trg_dict.get(w, UNK_IDX) for w in trg_words]
 
                     # remove sequence whose length > 80 in training mode
                     if len(src_ids) > 80 or len(trg_ids) > 80:
                         continue
-                    trg_ids_next = trg_ids + [self.trg_dict[END]]
-                    trg_ids = [self.trg_dict[START]] + trg_ids
 
-                    self.src_ids.append(src_ids)
-                    self.trg_ids.append(trg_ids)
-                    self.trg_ids_next.append(trg_ids_next)
+                    src_ids_list.append(src_ids)
+                    trg_seqs.append(
+                        [trg_dict[START]] + trg_ids + [trg_dict[END]]
+                    )
+
+        meta = {'src_dict': src_dict, 'trg_dict': trg_dict}
+        arrays = {
+            'src_ids': token_cache.RaggedArray.from_lists(src_ids_list),
+            'trg_seqs': token_cache.RaggedArray.from_lists(trg_seqs),
+        }
+        return meta, arrays
 
     def __getitem__(self, idx):
+        trg_seq = self.trg_seqs[idx]
         return (
-            np.array(self.src_ids[idx]),
-            np.array(self.trg_ids[idx]),
-            np.array(self.trg_ids_next[idx]),
+            np.array(self._src_ids[idx], dtype='int64'),
+            np.array(trg_seq[:-1], dtype='int64'),
+            np.array(trg_seq[1:], dtype='int64'),
         )
 
     def __len__(self):
-        return len(self.src_ids)
+        return len(self._src_ids)
 
     def get_dict(self, reverse=False):
         """
@@ -24,6 +24,8 @@ import paddle
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 DATA_URL = "http://paddlemodels.bj.bcebos.com/wmt/wmt16.tar.gz"
@@ -144,8 +146,38 @@ class WMT16(Dataset):
             "de" if lang == "en" else "en", trg_dict_size
         )
 
-        # load data
-        self.data = self._load_data()
+        # NOTE: the word ids are built once and cached as flat int32 arrays,
+        # later runs memory map them.
+        cache_dir = token_cache.get_cache_dir(
+            'wmt16',
+            self.data_file,
+            mode=self.mode,
+            lang=lang,
+            src_dict_size=src_dict_size,
+            trg_dict_size=trg_dict_size,
+        )
+        cache = token_cache.load_cache(cache_dir)
+        if cache is None:
+            cache = self._load_data()
+            token_cache.save_cache(cache_dir, *cache)
+        _, arrays = cache
+
+        self._src_ids = arrays['src_ids']
+        # trg_seqs[i] is START + target sequence + END, trg_ids and
+        # trg_ids_next are its first and last len - 1 ids.
+        self.trg_seqs = arrays['trg_seqs']
+
+    @property
+    def src_ids(self):
+        return token_cache.RaggedListView(self._src_ids)
+
+    @property
+    def trg_ids(self):
+        return token_cache.RaggedListView(self.trg_seqs, tail=1)
+
+    @property
+    def trg_ids_next(self):
+        return token_cache.RaggedListView(self.trg_seqs, head=1)
 
     def _load_dict(self, lang, dict_size, reverse=False):
         dict_path = os.path.join(
@@ -203,9 +235,8 @@ class WMT16(Dataset):
         src_col = 0 if self.lang == "en" else 1
         trg_col = 1 - src_col
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_ids_list = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile("wmt16/{}".format(self.mode)):
                 line = line.decode()
@@ -222,22 +253,25 @@ class WMT16(Dataset):
                 trg_words = line_split[trg_col].split()
                 trg_ids = [self.trg_dict.get(w, unk_id) for w in trg_words]
 
-                trg_ids_next = trg_ids + [end_id]
-                trg_ids = [start_id] + trg_ids
+                src_ids_list.append(src_ids)
+                trg_seqs.append([start_id] + trg_ids + [end_id])
 
-                self.src_ids.append(src_ids)
-                self.trg_ids.append(trg_ids)
-                self.trg_ids_next.append(trg_ids_next)
+        arrays = {
+            'src_ids': token_cache.RaggedArray.from_lists(src_ids_list),
+            'trg_seqs': token_cache.RaggedArray.from_lists(trg_seqs),
+        }
+        return {}, arrays
 
     def __getitem__(self, idx):
+        trg_seq = self.trg_seqs[idx]
         return (
-            np.array(self.src_ids[idx]),
-            np.array(self.trg_ids[idx]),
-            np.array(self.trg_ids_next[idx]),
+            np.array(self._src_ids[idx], dtype='int64'),
+            np.array(trg_seq[:-1], dtype='int64'),
+            np.array(trg_seq[1:], dtype='int64'),
         )
 
     def __len__(self):
-        return len(self.src_ids)
+        return len(self._src_ids)
 
     def get_dict(self, lang, reverse=False):
         """
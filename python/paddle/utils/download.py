@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import glob
 import hashlib
 import os
 import os.path as osp
@@ -19,11 +20,19 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
 try:
     from tqdm import tqdm
 except:
@@ -60,6 +69,16 @@ WEIGHTS_HOME = osp.expanduser("~/.cache/paddle/hapi/weights")
 
 DOWNLOAD_RETRY_LIMIT = 3
 
+# Downloaded files with md5sum are shared by their md5sum in the cache
+DOWNLOAD_CACHE_HOME = osp.expanduser("~/.cache/paddle/download")
+
+# Files larger than 2 * DOWNLOAD_MIN_PART_SIZE are downloaded in parts by
+# at most DOWNLOAD_NUM_WORKERS parallel range requests
+DOWNLOAD_NUM_WORKERS = 8
+DOWNLOAD_MIN_PART_SIZE = 16 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 60
+
 
 def is_url(path):
     """
@@ -145,7 +164,7 @@ def get_path_from_url(
     # machines in the case of multiple machines. Different ips will download
     # data, and the same ip will only download data once.
     unique_endpoints = _get_unique_endpoints(ParallelEnv().trainer_endpoints[:])
-    if osp.exists(fullpath) and check_exist and _md5check(fullpath, md5sum):
+    if check_exist and _is_downloaded(fullpath, md5sum):
         logger.info("Found {}".format(fullpath))
     else:
         if ParallelEnv().current_endpoint in unique_endpoints:
@@ -163,12 +182,148 @@ def get_path_from_url(
     return fullpath
 
 
-def _get_download(url, fullname):
-    # using requests.get method
+def _parse_total_size(req):
+    # total size of a 206 response, e.g. "Content-Range: bytes 0-1023/4096"
+    content_range = req.headers.get('content-range', '')
+    total_size = content_range.rsplit('/', 1)[-1]
+    return int(total_size) if total_size.isdigit() else None
+
+
+def _get_range(url, part_name, start, end, pbar, pbar_lock):
+    # download bytes [start, end] of url to part_name, resuming from the
+    # bytes already in part_name
+    size = end - start + 1
+    offset = osp.getsize(part_name) if osp.exists(part_name) else 0
+    if offset > size:
+        os.remove(part_name)
+        offset = 0
+    if offset == size:
+        return
+    req = requests.get(
+        url,
+        stream=True,
+        headers={'Range': 'bytes={}-{}'.format(start + offset, end)},
+        timeout=DOWNLOAD_TIMEOUT,
+    )
+    if req.status_code != 206:
+        raise IOError(
+            "Downloading range of {} failed with code "
+            "{}!".format(url, req.status_code)
+        )
+    with open(part_name, 'ab') as f:
+        for chunk in req.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            with pbar_lock:
+                pbar.update(len(chunk))
+    if osp.getsize(part_name) != size:
+        raise IOError("Incomplete range of {}".format(url))
+
+
+def _get_parallel_download(url, tmp_fullname, total_size, num_parts, md5):
+    part_size = (total_size + num_parts - 1) // num_parts
+    ranges = [
+        (start, min(start + part_size, total_size) - 1)
+        for start in range(0, total_size, part_size)
+    ]
+    # NOTE: the range is a part of the name, so a part is resumed by the
+    # retry, or a later call, only if it is split in the same way.
+    part_names = [
+        '{}.{}-{}'.format(tmp_fullname, start, end) for start, end in ranges
+    ]
+    pbar_lock = threading.Lock()
+    with tqdm(total=total_size) as pbar:
+        done = sum(osp.getsize(name) for name in part_names if osp.exists(name))
+        pbar.update(done)
+        with ThreadPoolExecutor(max_workers=num_parts) as executor:
+            futures = [
+                executor.submit(
+                    _get_range, url, name, start, end, pbar, pbar_lock
+                )
+                for name, (start, end) in zip(part_names, ranges)
+            ]
+            for future in futures:
+                future.result()
+
+    # join the parts in order, and hash them while copying
+    with open(tmp_fullname, 'wb') as f:
+        for name in part_names:
+            with open(name, 'rb') as part:
+                for chunk in iter(lambda: part.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    md5.update(chunk)
+                    f.write(chunk)
+
+
+def _remove_parts(tmp_fullname):
+    # remove the parts left by the parallel download
+    for name in glob.glob(glob.escape(tmp_fullname) + '.*-*'):
+        os.remove(name)
+
+
+def _get_download(url, fullname, md5sum=None):
+    # using requests.get method, ranges of large files are downloaded in
+    # parallel if the server supports them
     fname = osp.basename(fullname)
+    # For protecting download interupted, download to
+    # tmp_fullname firstly, move tmp_fullname to fullname
+    # after download finished, and resume from tmp_fullname
+    # if it is interupted
+    tmp_fullname = fullname + "_tmp"
+    offset = osp.getsize(tmp_fullname) if osp.exists(tmp_fullname) else 0
+    md5 = hashlib.md5()
     try:
-        req = requests.get(url, stream=True)
-    except Exception as e:  # requests.exceptions.ConnectionError
+        req = requests.get(
+            url,
+            stream=True,
+            headers={'Range': 'bytes={}-'.format(offset)},
+            timeout=DOWNLOAD_TIMEOUT,
+        )
+        if req.status_code == 206:
+            total_size = _parse_total_size(req)
+        elif req.status_code == 200:
+            # the server ignores the range, restart from the beginning
+            offset = 0
+            total_size = req.headers.get('content-length')
+            total_size = int(total_size) if total_size else None
+        elif req.status_code == 416 and offset > 0:
+            # the partial file is not a prefix of the file any more
+            os.remove(tmp_fullname)
+            return False
+        else:
+            raise IOError(
+                "Downloading from {} failed with code "
+                "{}!".format(url, req.status_code)
+            )
+
+        num_parts = 0
+        if req.status_code == 206 and offset == 0 and total_size:
+            num_parts = min(
+                DOWNLOAD_NUM_WORKERS, total_size // DOWNLOAD_MIN_PART_SIZE
+            )
+        if num_parts > 1:
+            req.close()
+            _get_parallel_download(
+                url, tmp_fullname, total_size, num_parts, md5
+            )
+        else:
+            if offset > 0:
+                logger.info("Resuming {} from {} bytes".format(fname, offset))
+                with open(tmp_fullname, 'rb') as f:
+                    for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        md5.update(chunk)
+            with open(tmp_fullname, 'ab' if offset > 0 else 'wb') as f:
+                with tqdm(total=total_size) as pbar:
+                    pbar.update(offset)
+                    for chunk in req.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE
+                    ):
+                        if chunk:
+                            md5.update(chunk)
+                            f.write(chunk)
+                            pbar.update(len(chunk))
+            if total_size and osp.getsize(tmp_fullname) != total_size:
+                raise IOError("Incomplete download of {}".format(url))
+    except (requests.exceptions.RequestException, IOError) as e:
+        # NOTE: the downloaded bytes are kept, and resumed by the retry
         logger.info(
             "Downloading {} from {} failed with exception {}".format(
                 fname, url, str(e)
@@ -176,33 +331,23 @@ def _get_download(url, fullname):
         )
         return False
 
-    if req.status_code != 200:
-        raise RuntimeError(
-            "Downloading from {} failed with code "
-            "{}!".format(url, req.status_code)
+    if md5sum is not None and md5.hexdigest() != md5sum:
+        logger.info(
+            "File {} md5 check failed, {}(calc) != "
+            "{}(base)".format(fullname, md5.hexdigest(), md5sum)
         )
-
-    # For protecting download interupted, download to
-    # tmp_fullname firstly, move tmp_fullname to fullname
-    # after download finished
-    tmp_fullname = fullname + "_tmp"
-    total_size = req.headers.get('content-length')
-    with open(tmp_fullname, 'wb') as f:
-        if total_size:
-            with tqdm(total=(int(total_size) + 1023) // 1024) as pbar:
-                for chunk in req.iter_content(chunk_size=1024):
-                    f.write(chunk)
-                    pbar.update(1)
-        else:
-            for chunk in req.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
+        # NOTE: the parts are complete, they must be removed too, or the
+        # retry would join the same corrupt bytes again.
+        os.remove(tmp_fullname)
+        _remove_parts(tmp_fullname)
+        return False
     shutil.move(tmp_fullname, fullname)
+    _remove_parts(tmp_fullname)
 
     return fullname
 
 
-def _wget_download(url, fullname):
+def _wget_download(url, fullname, md5sum=None):
     # using wget to download url
     tmp_fullname = fullname + "_tmp"
     # –user-agent
@@ -221,6 +366,9 @@ def _wget_download(url, fullname):
             )
         )
 
+    if not _md5check(tmp_fullname, md5sum):
+        os.remove(tmp_fullname)
+        return False
     shutil.move(tmp_fullname, fullname)
 
     return fullname
@@ -232,41 +380,138 @@ _download_methods = {
 }
 
 
-def _download(url, path, md5sum=None, method='get'):
+class _FileLock:
+    """
+    Exclusive lock between the processes of a machine, held on a lock file.
     """
-    Download from url, save to path.
 
-    url (str): download url
-    path (str): download to given path
-    md5sum (str): md5 sum of download package
-    method (str): which download method to use. Support `wget` and `get`. Default is `get`.
+    def __init__(self, path):
+        self._path = path
+        self._fd = None
+
+    def __enter__(self):
+        os.makedirs(osp.dirname(self._path), exist_ok=True)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds
+                    continue
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # NOTE: the lock file is not removed, otherwise another process may
+        # lock the removed file while a third one creates a new one.
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        os.close(self._fd)
+        self._fd = None
+
+
+def _cache_path(md5sum):
+    return osp.join(DOWNLOAD_CACHE_HOME, md5sum[:2], md5sum)
+
+
+def _lock_path(path):
+    # the lock files are kept under DOWNLOAD_CACHE_HOME rather than next to
+    # the downloaded files, named by the md5 of the absolute path
+    name = hashlib.md5(osp.abspath(path).encode()).hexdigest()
+    return osp.join(DOWNLOAD_CACHE_HOME, "locks", name + ".lock")
+
+
+def _is_downloaded(fullname, md5sum=None):
+    if not osp.exists(fullname):
+        return False
+    # NOTE: the files in the cache are verified before they are added,
+    # so a file linked to one of them is not checked again.
+    if md5sum is not None:
+        cache_path = _cache_path(md5sum)
+        if osp.exists(cache_path) and osp.samefile(fullname, cache_path):
+            return True
+    return _md5check(fullname, md5sum)
+
+
+def _link_or_copy(src, dst):
+    tmp_dst = dst + "_tmp"
+    if osp.exists(tmp_dst):
+        os.remove(tmp_dst)
+    try:
+        os.link(src, tmp_dst)
+    except OSError:
+        # e.g. src and dst are in different file systems
+        shutil.copyfile(src, tmp_dst)
+    os.replace(tmp_dst, dst)
+
+
+def _fetch(url, fullname, md5sum=None, method='get'):
+    # download url to fullname, which is verified by md5sum
+    for retry_cnt in range(DOWNLOAD_RETRY_LIMIT):
+        if _download_methods[method](url, fullname, md5sum):
+            return fullname
+        time.sleep(1)
+    raise RuntimeError(
+        "Download from {} failed. " "Retry limit reached".format(url)
+    )
+
+
+def _download_file(url, fullname, md5sum=None, method='get'):
+    """
+    Download from url, save to fullname.
 
+    The processes of a machine downloading the same fullname are serialized
+    by a lock file under DOWNLOAD_CACHE_HOME, so it is downloaded once. If
+    md5sum is given, the file is also kept in the cache indexed by md5sum
+    under DOWNLOAD_CACHE_HOME, and hard linked (or copied) to the fullname
+    of the later downloads.
     """
     assert method in _download_methods, 'make sure `{}` implemented'.format(
         method
     )
 
-    if not osp.exists(path):
-        os.makedirs(path)
+    dirname = osp.dirname(fullname)
+    if dirname and not osp.exists(dirname):
+        os.makedirs(dirname, exist_ok=True)
 
-    fname = osp.split(url)[-1]
-    fullname = osp.join(path, fname)
-    retry_cnt = 0
+    with _FileLock(_lock_path(fullname)):
+        if _is_downloaded(fullname, md5sum):
+            return fullname
 
-    logger.info("Downloading {} from {}".format(fname, url))
-    while not (osp.exists(fullname) and _md5check(fullname, md5sum)):
-        if retry_cnt < DOWNLOAD_RETRY_LIMIT:
-            retry_cnt += 1
-        else:
-            raise RuntimeError(
-                "Download from {} failed. " "Retry limit reached".format(url)
-            )
+        logger.info(
+            "Downloading {} from {}".format(osp.basename(fullname), url)
+        )
+        if md5sum is None:
+            return _fetch(url, fullname, method=method)
+
+        cache_path = _cache_path(md5sum)
+        os.makedirs(osp.dirname(cache_path), exist_ok=True)
+        with _FileLock(_lock_path(cache_path)):
+            if not osp.exists(cache_path):
+                _fetch(url, cache_path, md5sum, method=method)
+        _link_or_copy(cache_path, fullname)
+    return fullname
 
-        if not _download_methods[method](url, fullname):
-            time.sleep(1)
-            continue
 
-    return fullname
+def _download(url, path, md5sum=None, method='get'):
+    """
+    Download from url, save to path.
+
+    url (str): download url
+    path (str): download to given path
+    md5sum (str): md5 sum of download package
+    method (str): which download method to use. Support `wget` and `get`. Default is `get`.
+
+    """
+    fname = osp.split(url)[-1]
+    fullname = osp.join(path, fname)
+    return _download_file(url, fullname, md5sum, method=method)
 
 
 def _md5check(fullname, md5sum=None):
@@ -14,6 +14,7 @@
 """Lazy imports for heavy dependencies."""
 
 import importlib
+import sys
 
 __all__ = []
 
@@ -39,3 +40,46 @@ def try_import(module_name, err_msg=None):
                 "manually installed (usually with `pip install {}`). "
             ).format(module_name, install_name)
         raise ImportError(err_msg)
+
+
+def lazy_module_getattr(module_name, submodules, attributes=None):
+    """
+    Build the module level ``__getattr__`` and ``__dir__`` of PEP 562 for
+    ``module_name``, so that its heavy submodules are only imported on the
+    first access.
+
+    Args:
+        module_name(str): the ``__name__`` of the module being built.
+        submodules(list[str]): submodules imported on first attribute access,
+            e.g. ``paddle.vision``.
+        attributes(dict[str, str], optional): attributes re-exported from a
+            lazy submodule, mapping the attribute name to the submodule name.
+            Default: None.
+
+    Returns:
+        tuple, the ``(__getattr__, __dir__)`` functions of the module.
+    """
+    submodules = frozenset(submodules)
+    attributes = dict(attributes or {})
+    module = sys.modules[module_name]
+
+    def __getattr__(name):
+        if name in submodules:
+            value = importlib.import_module('{}.{}'.format(module_name, name))
+        elif name in attributes:
+            submodule = importlib.import_module(
+                '{}.{}'.format(module_name, attributes[name])
+            )
+            value = getattr(submodule, name)
+        else:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(module_name, name)
+            )
+        # NOTE: cache it, so later accesses do not go through __getattr__.
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | submodules | set(attributes))
+
+    return __getattr__, __dir__
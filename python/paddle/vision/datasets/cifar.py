@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pickle
 import tarfile
 
@@ -53,6 +54,9 @@ class Cifar10(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_mmap (bool, optional): Whether to cache the decoded images next to
+            :attr:`data_file`, and memory-map them instead of reading them into
+            memory. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of Cifar10 dataset.
@@ -110,6 +114,7 @@ class Cifar10(Dataset):
         transform=None,
         download=True,
         backend=None,
+        use_mmap=False,
     ):
         assert mode.lower() in [
             'train',
@@ -139,6 +144,7 @@ class Cifar10(Dataset):
             )
 
         self.transform = transform
+        self.use_mmap = use_mmap
 
         # read dataset into memory
         self._load_data()
@@ -151,7 +157,16 @@ class Cifar10(Dataset):
         self.flag = MODE_FLAG_MAP[self.mode + '10']
 
     def _load_data(self):
-        self.data = []
+        # NOTE: the images are kept as one uint8 array, and the cache of
+        # the labels is written last to mark the cache complete.
+        cache_prefix = '{}.{}'.format(self.data_file, self.flag)
+        if self.use_mmap and os.path.exists(cache_prefix + '.labels.npy'):
+            self.images = np.load(cache_prefix + '.images.npy', mmap_mode='r')
+            self.labels = np.load(cache_prefix + '.labels.npy')
+            return
+
+        images = []
+        labels = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = (
                 each_item.name for each_item in f if self.flag in each_item.name
@@ -163,18 +178,35 @@ class Cifar10(Dataset):
                 batch = pickle.load(f.extractfile(name), encoding='bytes')
 
                 data = batch[b'data']
-                labels = batch.get(b'labels', batch.get(b'fine_labels', None))
-                assert labels is not None
-                for sample, label in zip(data, labels):
-                    self.data.append((sample, label))
+                batch_labels = batch.get(
+                    b'labels', batch.get(b'fine_labels', None)
+                )
+                assert batch_labels is not None
+                images.append(np.asarray(data, dtype='uint8'))
+                labels.append(np.asarray(batch_labels, dtype='int64'))
+        self.images = np.concatenate(images)
+        self.labels = np.concatenate(labels)
+
+        if self.use_mmap:
+            for suffix, array in [
+                ('.images.npy', self.images),
+                ('.labels.npy', self.labels),
+            ]:
+                tmp_path = '{}{}.tmp{}'.format(
+                    cache_prefix, suffix, os.getpid()
+                )
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, array)
+                os.replace(tmp_path, cache_prefix + suffix)
+            self.images = np.load(cache_prefix + '.images.npy', mmap_mode='r')
 
     def __getitem__(self, idx):
-        image, label = self.data[idx]
+        image, label = self.images[idx], self.labels[idx]
         image = np.reshape(image, [3, 32, 32])
         image = image.transpose([1, 2, 0])
 
         if self.backend == 'pil':
-            image = Image.fromarray(image.astype('uint8'))
+            image = Image.fromarray(image)
         if self.transform is not None:
             image = self.transform(image)
 
@@ -184,7 +216,7 @@ class Cifar10(Dataset):
         return image.astype(self.dtype), np.array(label).astype('int64')
 
     def __len__(self):
-        return len(self.data)
+        return len(self.labels)
 
 
 class Cifar100(Cifar10):
@@ -202,6 +234,9 @@ class Cifar100(Cifar10):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_mmap (bool, optional): Whether to cache the decoded images next to
+            :attr:`data_file`, and memory-map them instead of reading them into
+            memory. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of Cifar100 dataset.
@@ -259,8 +294,11 @@ class Cifar100(Cifar10):
         transform=None,
         download=True,
         backend=None,
+        use_mmap=False,
     ):
-        super().__init__(data_file, mode, transform, download, backend)
+        super().__init__(
+            data_file, mode, transform, download, backend, use_mmap
+        )
 
     def _init_url_md5_flag(self):
         self.data_url = CIFAR100_URL
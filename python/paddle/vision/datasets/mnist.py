@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import gzip
-import struct
+import os
 
 import numpy as np
 from PIL import Image
@@ -24,6 +24,56 @@ from paddle.io import Dataset
 
 __all__ = []
 
+# data types of the IDX file format, indexed by the third byte of its magic
+_IDX_DTYPES = {
+    0x08: np.uint8,
+    0x09: np.int8,
+    0x0B: np.dtype('>i2'),
+    0x0C: np.dtype('>i4'),
+    0x0D: np.dtype('>f4'),
+    0x0E: np.dtype('>f8'),
+}
+
+
+def _parse_idx_header(header):
+    dtype = _IDX_DTYPES[header[2]]
+    ndim = header[3]
+    shape = tuple(np.frombuffer(header, dtype='>u4', count=ndim, offset=4))
+    return dtype, [int(dim) for dim in shape], 4 + 4 * ndim
+
+
+def _load_idx(path, use_mmap=False):
+    """
+    Load an (optionally gzipped) IDX file as a numpy array. If use_mmap is
+    True, the decompressed file is cached next to path and memory-mapped.
+    """
+    if not use_mmap:
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            buf = f.read()
+        dtype, shape, offset = _parse_idx_header(buf[:32])
+        return np.frombuffer(
+            buf, dtype=dtype, count=int(np.prod(shape)), offset=offset
+        ).reshape(shape)
+
+    raw_path = path
+    if path.endswith('.gz'):
+        raw_path = path[: -len('.gz')]
+        if not os.path.exists(raw_path):
+            tmp_path = '{}.tmp{}'.format(raw_path, os.getpid())
+            with gzip.open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                while True:
+                    chunk = src.read(1 << 20)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+            os.replace(tmp_path, raw_path)
+    with open(raw_path, 'rb') as f:
+        dtype, shape, offset = _parse_idx_header(f.read(32))
+    return np.memmap(
+        raw_path, dtype=dtype, mode='r', offset=offset, shape=tuple(shape)
+    )
+
 
 class MNIST(Dataset):
     """
@@ -42,6 +92,9 @@ class MNIST(Dataset):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_mmap (bool, optional): Whether to cache the decompressed files next to
+            :attr:`image_path` and :attr:`label_path`, and memory-map them instead of
+            reading them into memory. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of MNIST dataset.
@@ -109,6 +162,7 @@ class MNIST(Dataset):
         transform=None,
         download=True,
         backend=None,
+        use_mmap=False,
     ):
         assert mode.lower() in [
             'train',
@@ -161,76 +215,38 @@ class MNIST(Dataset):
             )
 
         self.transform = transform
+        self.use_mmap = use_mmap
 
         # read dataset into memory
         self._parse_dataset()
 
         self.dtype = paddle.get_default_dtype()
 
-    def _parse_dataset(self, buffer_size=100):
-        self.images = []
-        self.labels = []
-        with gzip.GzipFile(self.image_path, 'rb') as image_file:
-            img_buf = image_file.read()
-            with gzip.GzipFile(self.label_path, 'rb') as label_file:
-                lab_buf = label_file.read()
-
-                step_label = 0
-                offset_img = 0
-                # read from Big-endian
-                # get file info from magic byte
-                # image file : 16B
-                magic_byte_img = '>IIII'
-                magic_img, image_num, rows, cols = struct.unpack_from(
-                    magic_byte_img, img_buf, offset_img
-                )
-                offset_img += struct.calcsize(magic_byte_img)
-
-                offset_lab = 0
-                # label file : 8B
-                magic_byte_lab = '>II'
-                magic_lab, label_num = struct.unpack_from(
-                    magic_byte_lab, lab_buf, offset_lab
-                )
-                offset_lab += struct.calcsize(magic_byte_lab)
-
-                while True:
-                    if step_label >= label_num:
-                        break
-                    fmt_label = '>' + str(buffer_size) + 'B'
-                    labels = struct.unpack_from(fmt_label, lab_buf, offset_lab)
-                    offset_lab += struct.calcsize(fmt_label)
-                    step_label += buffer_size
-
-                    fmt_images = '>' + str(buffer_size * rows * cols) + 'B'
-                    images_temp = struct.unpack_from(
-                        fmt_images, img_buf, offset_img
-                    )
-                    images = np.reshape(
-                        images_temp, (buffer_size, rows * cols)
-                    ).astype('float32')
-                    offset_img += struct.calcsize(fmt_images)
-
-                    for i in range(buffer_size):
-                        self.images.append(images[i, :])
-                        self.labels.append(
-                            np.array([labels[i]]).astype('int64')
-                        )
+    def _parse_dataset(self):
+        # NOTE: the images are kept as one uint8 array and converted to
+        # float lazily in __getitem__
+        images = _load_idx(self.image_path, self.use_mmap)
+        labels = _load_idx(self.label_path, self.use_mmap)
+        self.images = images.reshape([images.shape[0], -1])
+        self.labels = labels.reshape([-1, 1]).astype('int64')
 
     def __getitem__(self, idx):
-        image, label = self.images[idx], self.labels[idx]
+        # NOTE: copy the label, as it is a view of self.labels
+        image, label = self.images[idx], self.labels[idx].copy()
         image = np.reshape(image, [28, 28])
 
         if self.backend == 'pil':
-            image = Image.fromarray(image.astype('uint8'), mode='L')
+            image = Image.fromarray(image, mode='L')
+        else:
+            image = image.astype('float32')
 
         if self.transform is not None:
             image = self.transform(image)
 
         if self.backend == 'pil':
-            return image, label.astype('int64')
+            return image, label
 
-        return image.astype(self.dtype), label.astype('int64')
+        return image.astype(self.dtype), label
 
     def __len__(self):
         return len(self.labels)
@@ -253,6 +269,9 @@ class FashionMNIST(MNIST):
             PIL.Image or numpy.ndarray. Should be one of {'pil', 'cv2'}.
             If this option is not set, will get backend from :ref:`paddle.vision.get_image_backend <api_vision_image_get_image_backend>`,
             default backend is 'pil'. Default: None.
+        use_mmap (bool, optional): Whether to cache the decompressed files next to
+            :attr:`image_path` and :attr:`label_path`, and memory-map them instead of
+            reading them into memory. Default: False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of FashionMNIST dataset.
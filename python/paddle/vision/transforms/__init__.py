@@ -34,6 +34,17 @@ from .transforms import RandomPerspective  # noqa: F401
 from .transforms import Grayscale  # noqa: F401
 from .transforms import ToTensor  # noqa: F401
 from .transforms import RandomErasing  # noqa: F401
+from .batch_transforms import BaseBatchTransform  # noqa: F401
+from .batch_transforms import BatchCompose  # noqa: F401
+from .batch_transforms import BatchToTensor  # noqa: F401
+from .batch_transforms import BatchNormalize  # noqa: F401
+from .batch_transforms import BatchResize  # noqa: F401
+from .batch_transforms import BatchCenterCrop  # noqa: F401
+from .batch_transforms import BatchRandomCrop  # noqa: F401
+from .batch_transforms import BatchRandomResizedCrop  # noqa: F401
+from .batch_transforms import BatchRandomHorizontalFlip  # noqa: F401
+from .batch_transforms import BatchRandomVerticalFlip  # noqa: F401
+from .batch_transforms import BatchColorJitter  # noqa: F401
 from .functional import to_tensor  # noqa: F401
 from .functional import hflip  # noqa: F401
 from .functional import vflip  # noqa: F401
@@ -74,6 +85,17 @@ __all__ = [  # noqa
     'Grayscale',
     'ToTensor',
     'RandomErasing',
+    'BaseBatchTransform',
+    'BatchCompose',
+    'BatchToTensor',
+    'BatchNormalize',
+    'BatchResize',
+    'BatchCenterCrop',
+    'BatchRandomCrop',
+    'BatchRandomResizedCrop',
+    'BatchRandomHorizontalFlip',
+    'BatchRandomVerticalFlip',
+    'BatchColorJitter',
     'to_tensor',
     'hflip',
     'vflip',
@@ -0,0 +1,553 @@
+# Copyright (c) 2022 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import numbers
+import random
+
+import numpy as np
+
+import paddle
+import paddle.nn.functional as F
+
+from . import functional_tensor as F_t
+from .transforms import _check_input
+
+__all__ = []
+
+
+def _setup_size(size, name='size'):
+    if isinstance(size, numbers.Number):
+        return int(size), int(size)
+    if not isinstance(size, (list, tuple)) or len(size) != 2:
+        raise TypeError(
+            "{} should be an int or a list/tuple of (height, width), but "
+            "got {}".format(name, size)
+        )
+    return int(size[0]), int(size[1])
+
+
+class _BatchPlan:
+    """
+    The pending transforms of a batch of images with shape (N x C x H x W).
+
+    Crops, flips and resizes are composed into an affine map of each sample,
+    from the output coordinates to the input ones, both normalized to
+    [-1, 1]. ToTensor and Normalize are composed into a scale and a bias of
+    each channel. So the chain of them is applied by one grid_sample and one
+    multiply-add on the whole batch.
+    """
+
+    def __init__(self, images):
+        self.reset(images)
+
+    def reset(self, images):
+        if isinstance(images, np.ndarray):
+            images = paddle.to_tensor(images)
+        F_t._assert_image_tensor(images, 'CHW')
+        if images.ndim != 4:
+            raise ValueError(
+                "The batch of images should be 4-D (N x C x H x W), but "
+                "received {}-D".format(images.ndim)
+            )
+        self.images = images
+        self.size = tuple(images.shape[2:])
+        self.theta = np.tile(np.eye(3), (images.shape[0], 1, 1))
+        self.geometric = False
+        self.resampled = False
+        self.interpolation = 'nearest'
+        self.scale = None
+        self.bias = None
+        self.to_float = False
+
+    @property
+    def batch_size(self):
+        return self.images.shape[0]
+
+    @property
+    def num_channels(self):
+        return self.images.shape[1]
+
+    def _transform(self, matrix):
+        self.theta = np.matmul(self.theta, matrix)
+        self.geometric = True
+
+    def crop(self, top, left, height, width, size=None, interpolation=None):
+        """Crop the window of each sample, and resize it to size if given."""
+        in_h, in_w = self.size
+        n = self.batch_size
+        top, left, height, width = [
+            np.broadcast_to(np.asarray(v, dtype='float64'), (n,))
+            for v in (top, left, height, width)
+        ]
+        matrix = np.zeros([n, 3, 3])
+        matrix[:, 0, 0] = width / in_w
+        matrix[:, 0, 2] = (2 * left + width) / in_w - 1
+        matrix[:, 1, 1] = height / in_h
+        matrix[:, 1, 2] = (2 * top + height) / in_h - 1
+        matrix[:, 2, 2] = 1
+        self._transform(matrix)
+        if size is None:
+            assert (
+                len(set(height)) == 1 and len(set(width)) == 1
+            ), "The crops of different sizes should be resized."
+            self.size = (int(height[0]), int(width[0]))
+        else:
+            self.size = tuple(size)
+            if np.any(height != size[0]) or np.any(width != size[1]):
+                self.resampled = True
+                self.interpolation = interpolation
+
+    def flip(self, mask, horizontal=True):
+        matrix = np.tile(np.eye(3), (self.batch_size, 1, 1))
+        matrix[np.asarray(mask, dtype=bool), 0 if horizontal else 1] *= -1
+        self._transform(matrix)
+
+    def resize(self, size, interpolation):
+        size = tuple(size)
+        if size != self.size:
+            self.size = size
+            self.geometric = True
+            self.resampled = True
+            self.interpolation = interpolation
+
+    def affine(self, scale, bias):
+        """Compose x * scale + bias of each channel."""
+        scale = np.broadcast_to(
+            np.asarray(scale, 'float64'), (self.num_channels,)
+        )
+        bias = np.broadcast_to(
+            np.asarray(bias, 'float64'), (self.num_channels,)
+        )
+        if self.scale is None:
+            self.scale, self.bias = scale, bias
+        else:
+            self.scale, self.bias = self.scale * scale, self.bias * scale + bias
+        self.to_float = True
+
+    def to_tensor(self):
+        # NOTE: the same as F.to_tensor, only uint8 images are scaled
+        if self.images.dtype == paddle.uint8 and not self.to_float:
+            self.affine(1.0 / 255.0, 0.0)
+        self.to_float = True
+
+    def _window(self):
+        # The top and left of the crop shared by all samples, or None if the
+        # samples are flipped, resized or cropped differently.
+        if self.resampled or not np.all(self.theta == self.theta[:1]):
+            return None
+        (in_h, in_w), (h, w) = self.images.shape[2:], self.size
+        theta = self.theta[0]
+        if not np.allclose([theta[0, 0] * in_w, theta[1, 1] * in_h], [w, h]):
+            return None
+        left = ((theta[0, 2] + 1) * in_w - w) / 2
+        top = ((theta[1, 2] + 1) * in_h - h) / 2
+        if not np.allclose([left, top], np.round([left, top])):
+            return None
+        return int(round(top)), int(round(left))
+
+    def apply(self):
+        images = self.images
+        dtype = images.dtype
+        if self.geometric:
+            window = self._window()
+            if window is not None:
+                top, left = window
+                images = images[
+                    :, :, top : top + self.size[0], left : left + self.size[1]
+                ]
+            else:
+                theta = paddle.to_tensor(
+                    self.theta[:, :2].astype('float32'), place=images.place
+                )
+                grid = F.affine_grid(
+                    theta,
+                    [self.batch_size, self.num_channels] + list(self.size),
+                    align_corners=False,
+                )
+                images = F.grid_sample(
+                    images.astype('float32'),
+                    grid,
+                    mode=self.interpolation if self.resampled else 'nearest',
+                    padding_mode='border',
+                    align_corners=False,
+                )
+        if self.scale is not None:
+            scale = paddle.to_tensor(
+                self.scale.astype('float32'), place=images.place
+            ).reshape([1, -1, 1, 1])
+            bias = paddle.to_tensor(
+                self.bias.astype('float32'), place=images.place
+            ).reshape([1, -1, 1, 1])
+            images = images.astype('float32') * scale + bias
+        elif self.to_float:
+            images = images.astype('float32')
+        elif images.dtype != dtype:
+            if dtype == paddle.uint8:
+                images = images.round().clip(0, 255)
+            images = images.astype(dtype)
+        self.reset(images)
+        return images
+
+
+class BaseBatchTransform:
+    """
+    Base class of the transforms applied to a batch of images after
+    collation, i.e. a paddle.Tensor or numpy.ndarray with shape
+    (N x C x H x W), whose random parameters are drawn for each sample.
+
+    A transform records itself into the pending transforms of the batch by
+    ``_fuse``, which are applied together by ``BatchCompose``. The transforms
+    which can not be fused rewrite ``_apply_batch`` instead.
+    """
+
+    def __call__(self, images):
+        plan = _BatchPlan(images)
+        self._fuse(plan)
+        return plan.apply()
+
+    def _fuse(self, plan):
+        plan.reset(self._apply_batch(plan.apply()))
+
+    def _apply_batch(self, images):
+        raise NotImplementedError
+
+
+class BatchCompose(BaseBatchTransform):
+    """
+    Composes several batch transforms together, the consecutive crops,
+    flips, resizes, ToTensor and Normalize of them are applied in one pass.
+
+    Args:
+        transforms (list|tuple): List/Tuple of batch transforms to compose.
+
+    Examples:
+
+        .. code-block:: python
+
+            import paddle
+            from paddle.vision.transforms import (
+                BatchCompose,
+                BatchNormalize,
+                BatchRandomCrop,
+                BatchRandomHorizontalFlip,
+                BatchToTensor,
+            )
+
+            transform = BatchCompose([
+                BatchRandomCrop(224),
+                BatchRandomHorizontalFlip(),
+                BatchToTensor(),
+                BatchNormalize(mean=[0.485, 0.456, 0.406],
+                               std=[0.229, 0.224, 0.225]),
+            ])
+
+            images = paddle.randint(0, 256, [8, 3, 256, 256]).astype('uint8')
+            images = transform(images)
+            print(images.shape, images.dtype)
+            # [8, 3, 224, 224] paddle.float32
+    """
+
+    def __init__(self, transforms):
+        self.transforms = transforms
+
+    def _fuse(self, plan):
+        for t in self.transforms:
+            t._fuse(plan)
+
+    def __repr__(self):
+        format_string = self.__class__.__name__ + '('
+        for t in self.transforms:
+            format_string += '\n'
+            format_string += '    {0}'.format(t)
+        format_string += '\n)'
+        return format_string
+
+
+class BatchToTensor(BaseBatchTransform):
+    """Convert a batch of images to float32, the uint8 ones are scaled from
+    [0, 255] to [0.0, 1.0]. The layout is kept as (N x C x H x W)."""
+
+    def _fuse(self, plan):
+        plan.to_tensor()
+
+
+class BatchNormalize(BaseBatchTransform):
+    """Normalize each channel of a batch of images by
+    ``output[channel] = (input[channel] - mean[channel]) / std[channel]``.
+
+    Args:
+        mean (int|float|list|tuple, optional): Means of the channels.
+        std (int|float|list|tuple, optional): Standard deviations of the channels.
+    """
+
+    def __init__(self, mean=0.0, std=1.0):
+        self.mean = mean
+        self.std = std
+
+    def _fuse(self, plan):
+        mean = np.broadcast_to(
+            np.asarray(self.mean, 'float64'), (plan.num_channels,)
+        )
+        std = np.broadcast_to(
+            np.asarray(self.std, 'float64'), (plan.num_channels,)
+        )
+        plan.affine(1.0 / std, -mean / std)
+
+
+class BatchResize(BaseBatchTransform):
+    """Resize a batch of images to the given size.
+
+    Args:
+        size (int|list|tuple): Target size of the images. If size is a
+            (height, width) sequence, the images are resized to it. If size
+            is an int, the smaller edge of the images is resized to it.
+        interpolation (str, optional): 'nearest' or 'bilinear'. Default: 'bilinear'.
+    """
+
+    def __init__(self, size, interpolation='bilinear'):
+        assert interpolation in ('nearest', 'bilinear')
+        self.size = size
+        self.interpolation = interpolation
+
+    def _fuse(self, plan):
+        h, w = plan.size
+        if isinstance(self.size, int):
+            if w < h:
+                size = (int(self.size * h / w), self.size)
+            else:
+                size = (self.size, int(self.size * w / h))
+        else:
+            size = _setup_size(self.size)
+        plan.resize(size, self.interpolation)
+
+
+class BatchCenterCrop(BaseBatchTransform):
+    """Crop a batch of images at the center.
+
+    Args:
+        size (int|list|tuple): Target size of the crop, a (height, width)
+            sequence or an int for a square crop.
+    """
+
+    def __init__(self, size):
+        self.size = _setup_size(size)
+
+    def _fuse(self, plan):
+        (h, w), (th, tw) = plan.size, self.size
+        top = int(round((h - th) / 2.0))
+        left = int(round((w - tw) / 2.0))
+        plan.crop(top, left, th, tw)
+
+
+class BatchRandomCrop(BaseBatchTransform):
+    """Crop each image of a batch at a random location.
+
+    Args:
+        size (int|list|tuple): Target size of the crop, a (height, width)
+            sequence or an int for a square crop.
+    """
+
+    def __init__(self, size):
+        self.size = _setup_size(size)
+
+    def _fuse(self, plan):
+        (h, w), (th, tw) = plan.size, self.size
+        if h < th or w < tw:
+            raise ValueError(
+                "Required crop size {} is larger then input image size {}".format(
+                    (th, tw), (h, w)
+                )
+            )
+        n = plan.batch_size
+        top = np.random.randint(0, h - th + 1, size=n)
+        left = np.random.randint(0, w - tw + 1, size=n)
+        plan.crop(top, left, th, tw)
+
+
+class BatchRandomResizedCrop(BaseBatchTransform):
+    """Crop each image of a batch to a random size and aspect ratio, and
+    resize the crops to the given size, the same as RandomResizedCrop.
+
+    Args:
+        size (int|list|tuple): Target size of the images, with (height, width) shape.
+        scale (list|tuple, optional): Scale range of the crops relatively to
+            the images. Default: (0.08, 1.0).
+        ratio (list|tuple, optional): Range of aspect ratio of the crops. Default: (0.75, 1.33).
+        interpolation (str, optional): 'nearest' or 'bilinear'. Default: 'bilinear'.
+    """
+
+    def __init__(
+        self,
+        size,
+        scale=(0.08, 1.0),
+        ratio=(3.0 / 4, 4.0 / 3),
+        interpolation='bilinear',
+    ):
+        assert scale[0] <= scale[1], "scale should be of kind (min, max)"
+        assert ratio[0] <= ratio[1], "ratio should be of kind (min, max)"
+        assert interpolation in ('nearest', 'bilinear')
+        self.size = _setup_size(size)
+        self.scale = scale
+        self.ratio = ratio
+        self.interpolation = interpolation
+
+    def _get_params(self, n, height, width, attempts=10):
+        area = height * width
+        target_area = np.random.uniform(*self.scale, size=(n, attempts)) * area
+        log_ratio = tuple(math.log(x) for x in self.ratio)
+        aspect_ratio = np.exp(np.random.uniform(*log_ratio, size=(n, attempts)))
+        w = np.round(np.sqrt(target_area * aspect_ratio)).astype('int64')
+        h = np.round(np.sqrt(target_area / aspect_ratio)).astype('int64')
+        valid = (0 < w) & (w <= width) & (0 < h) & (h <= height)
+        # the first valid attempt of each sample
+        first = np.argmax(valid, axis=1)
+        w = w[np.arange(n), first]
+        h = h[np.arange(n), first]
+
+        # Fallback to central crop
+        in_ratio = float(width) / float(height)
+        if in_ratio < min(self.ratio):
+            fallback_w = width
+            fallback_h = int(round(fallback_w / min(self.ratio)))
+        elif in_ratio > max(self.ratio):
+            fallback_h = height
+            fallback_w = int(round(fallback_h * max(self.ratio)))
+        else:
+            fallback_w = width
+            fallback_h = height
+        found = valid.any(axis=1)
+        w = np.where(found, w, fallback_w)
+        h = np.where(found, h, fallback_h)
+        top = np.where(
+            found,
+            np.random.randint(0, height - h + 1),
+            (height - fallback_h) // 2,
+        )
+        left = np.where(
+            found,
+            np.random.randint(0, width - w + 1),
+            (width - fallback_w) // 2,
+        )
+        return top, left, h, w
+
+    def _fuse(self, plan):
+        top, left, h, w = self._get_params(plan.batch_size, *plan.size)
+        plan.crop(top, left, h, w, self.size, self.interpolation)
+
+
+class BatchRandomHorizontalFlip(BaseBatchTransform):
+    """Horizontally flip each image of a batch with the probability prob.
+
+    Args:
+        prob (float, optional): Probability of the images being flipped. Default: 0.5
+    """
+
+    def __init__(self, prob=0.5):
+        assert 0 <= prob <= 1, "probability must be between 0 and 1"
+        self.prob = prob
+
+    def _fuse(self, plan):
+        plan.flip(np.random.random(plan.batch_size) < self.prob)
+
+
+class BatchRandomVerticalFlip(BaseBatchTransform):
+    """Vertically flip each image of a batch with the probability prob.
+
+    Args:
+        prob (float, optional): Probability of the images being flipped. Default: 0.5
+    """
+
+    def __init__(self, prob=0.5):
+        assert 0 <= prob <= 1, "probability must be between 0 and 1"
+        self.prob = prob
+
+    def _fuse(self, plan):
+        plan.flip(
+            np.random.random(plan.batch_size) < self.prob, horizontal=False
+        )
+
+
+class BatchColorJitter(BaseBatchTransform):
+    """Randomly change the brightness, contrast, saturation and hue of each
+    image of a batch, the arguments are the same as ColorJitter. The factors
+    are drawn for each image, and the order of the adjustments is drawn for
+    each batch.
+
+    Args:
+        brightness (float, optional): How much to jitter brightness. Default: 0.
+        contrast (float, optional): How much to jitter contrast. Default: 0.
+        saturation (float, optional): How much to jitter saturation. Default: 0.
+        hue (float, optional): How much to jitter hue. Default: 0.
+    """
+
+    def __init__(self, brightness=0, contrast=0, saturation=0, hue=0):
+        self.brightness = _check_input(brightness, 'brightness')
+        self.contrast = _check_input(contrast, 'contrast')
+        self.saturation = _check_input(saturation, 'saturation')
+        self.hue = _check_input(
+            hue, 'hue', center=0, bound=(-0.5, 0.5), clip_first_on_zero=False
+        )
+
+    def _factors(self, value, n):
+        return paddle.to_tensor(
+            np.random.uniform(value[0], value[1], size=[n, 1, 1, 1]).astype(
+                'float32'
+            )
+        )
+
+    def _apply_batch(self, images):
+        dtype = images.dtype
+        max_value = 1.0 if paddle.is_floating_point(images) else 255.0
+        img = images.astype('float32')
+        n, channels = img.shape[:2]
+        assert channels in [1, 3], "channels of input should be either 1 or 3."
+
+        adjustments = []
+        if self.brightness is not None:
+            factor = self._factors(self.brightness, n)
+            adjustments.append(lambda img, factor=factor: img * factor)
+        if self.contrast is not None:
+            factor = self._factors(self.contrast, n)
+
+            def adjust_contrast(img, factor=factor):
+                gray = F_t.to_grayscale(img) if channels == 3 else img
+                mean = gray.mean(axis=[1, 2, 3], keepdim=True)
+                return mean + factor * (img - mean)
+
+            adjustments.append(adjust_contrast)
+        if self.saturation is not None and channels == 3:
+            factor = self._factors(self.saturation, n)
+
+            def adjust_saturation(img, factor=factor):
+                gray = F_t.to_grayscale(img)
+                return gray + factor * (img - gray)
+
+            adjustments.append(adjust_saturation)
+        if self.hue is not None and channels == 3:
+            factor = self._factors(self.hue, n).squeeze(1)
+
+            def adjust_hue(img, factor=factor):
+                h, s, v = F_t._rgb_to_hsv(img / max_value).unbind(axis=1)
+                h = h + factor
+                h = h - h.floor()
+                img = F_t._hsv_to_rgb(paddle.stack([h, s, v], axis=1))
+                return img * max_value
+
+            adjustments.append(adjust_hue)
+
+        random.shuffle(adjustments)
+        for adjust in adjustments:
+            img = adjust(img).clip(0, max_value)
+        return img.astype(dtype)